@@ -1,5 +1,5 @@
 from datetime import datetime
-from typing import TypeVar
+from typing import Any, TypeVar
 import logging
 
 from motor.motor_asyncio import (
@@ -14,12 +14,20 @@ from bson.codec_options import CodecOptions
 T = TypeVar("T", bound=BaseModel)
 
 class Database:
-    def __init__(self) -> None:
-        """Creates a Database instance, creates a connection to the Mongo DB"""
+    def __init__(self, event_listeners: list[Any] | None = None) -> None:
+        """Creates a Database instance, creates a connection to the Mongo DB
+
+        Args:
+            event_listeners (list[Any] | None, optional): pymongo monitoring
+                listeners to attach to this instance's client. Defaults to None.
+        """
         with open("/app/database/db_server.txt", "r", encoding="utf8") as serverFile:
             serverName = serverFile.read().strip()
 
-            self.client = AsyncIOMotorClient(serverName, 27017)
+            if event_listeners:
+                self.client = AsyncIOMotorClient(serverName, 27017, event_listeners=event_listeners)
+            else:
+                self.client = AsyncIOMotorClient(serverName, 27017)
 
             self.current_db: AsyncIOMotorDatabase | None = None
 
@@ -3,9 +3,13 @@ from __future__ import annotations
 from motor.motor_asyncio import AsyncIOMotorCollection
 
 from ..database.database import Database
+from .instrumentation import FEED_PROFILING_ENABLED, feed_profiler
 
-# Create a dedicated database connection for feed-reader data.
-mongodb = Database()
+# Create a dedicated database connection for feed-reader data, with the
+# profiler's command listener attached so feeds queries can be timed.
+mongodb = Database(
+    event_listeners=[feed_profiler.command_listener] if FEED_PROFILING_ENABLED else None
+)
 mongodb.set_database("feeds_database")
 
 feed_sources_collection: AsyncIOMotorCollection | None = mongodb.get_collection(
@@ -23,6 +27,24 @@ feed_categories_collection: AsyncIOMotorCollection | None = mongodb.get_collecti
 user_article_states_collection: AsyncIOMotorCollection | None = mongodb.get_collection(
     "user_article_states"
 )
+user_article_state_versions_collection: AsyncIOMotorCollection | None = mongodb.get_collection(
+    "user_article_state_versions"
+)
+user_feed_unread_counters_collection: AsyncIOMotorCollection | None = mongodb.get_collection(
+    "user_feed_unread_counters"
+)
+feed_opml_import_jobs_collection: AsyncIOMotorCollection | None = mongodb.get_collection(
+    "feed_opml_import_jobs"
+)
+feed_daily_rollups_collection: AsyncIOMotorCollection | None = mongodb.get_collection(
+    "feed_daily_rollups"
+)
+feed_maintenance_state_collection: AsyncIOMotorCollection | None = mongodb.get_collection(
+    "feed_maintenance_state"
+)
+feed_article_archive_collection: AsyncIOMotorCollection | None = mongodb.get_collection(
+    "feed_article_archive"
+)
 
 __all__ = [
     "mongodb",
@@ -31,4 +53,10 @@ __all__ = [
     "user_feed_subscriptions_collection",
     "feed_categories_collection",
     "user_article_states_collection",
+    "user_article_state_versions_collection",
+    "user_feed_unread_counters_collection",
+    "feed_opml_import_jobs_collection",
+    "feed_daily_rollups_collection",
+    "feed_maintenance_state_collection",
+    "feed_article_archive_collection",
 ]
@@ -0,0 +1,230 @@
+"""Bounded per-worker caches with a cross-worker invalidation channel.
+
+Each uvicorn worker keeps its own :class:`LruTtlCache`. Mutations publish an
+invalidation document to a capped Mongo collection which every worker tails,
+so an entry evicted by one worker is evicted by all of them well before its
+TTL would have expired.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections import OrderedDict
+from collections.abc import Callable
+from datetime import UTC, datetime, timedelta
+import logging
+import time
+from typing import Generic, Protocol, TypeVar
+from uuid import uuid4
+
+from motor.motor_asyncio import AsyncIOMotorCollection
+from pymongo import CursorType
+from pymongo.errors import CollectionInvalid
+
+from . import mongodb
+
+K = TypeVar("K")
+V = TypeVar("V")
+
+INVALIDATIONS_COLLECTION_NAME = "feed_cache_invalidations"
+INVALIDATIONS_CAPPED_SIZE_BYTES = 1024 * 1024
+INVALIDATIONS_CAPPED_MAX_DOCUMENTS = 10_000
+INVALIDATIONS_RETRY_DELAY_SECONDS = 1.0
+
+_WORKER_START_KIND = "worker-start"
+_INVALIDATE_KIND = "invalidate"
+
+
+class KeyedCache(Protocol[K, V]):
+    """Minimal cache interface used by feed payload caches."""
+
+    def get(self, key: K) -> V | None: ...
+
+    def set(self, key: K, value: V) -> None: ...
+
+    def invalidate(self, key: K) -> None: ...
+
+    def clear(self) -> None: ...
+
+
+class LruTtlCache(Generic[K, V]):
+    """In-process cache with a fixed entry budget, LRU eviction and a TTL."""
+
+    def __init__(
+        self,
+        max_entries: int,
+        ttl: timedelta,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.max_entries = max(1, int(max_entries))
+        self.ttl_seconds = max(0.0, ttl.total_seconds())
+        self._clock = clock
+        self._entries: OrderedDict[K, tuple[float, V]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._entries
+
+    def get(self, key: K) -> V | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        expires_at, value = entry
+        if self._clock() >= expires_at:
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: K, value: V) -> None:
+        self._entries[key] = (self._clock() + self.ttl_seconds, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, key: K) -> None:
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+class CacheInvalidationChannel:
+    """Publish and tail cache invalidations through a capped collection.
+
+    Documents carry a *namespace* so several caches can share the collection.
+    A ``None`` key means "drop every entry". On each (re)connect the local
+    cache is cleared, because invalidations published while the tail was down
+    cannot be replayed reliably.
+    """
+
+    def __init__(
+        self,
+        namespace: str,
+        on_invalidate: Callable[[str | None], None],
+        collection_name: str = INVALIDATIONS_COLLECTION_NAME,
+    ) -> None:
+        self.namespace = namespace
+        self.collection_name = collection_name
+        self.worker_id = uuid4().hex
+        self._on_invalidate = on_invalidate
+        self._listener_task: asyncio.Task[None] | None = None
+        self._publish_tasks: set[asyncio.Task[None]] = set()
+
+    def _collection(self) -> AsyncIOMotorCollection | None:
+        return mongodb.get_collection(self.collection_name)
+
+    async def ensure_collection(self) -> None:
+        if mongodb.current_db is None:
+            logging.error("No DB connection")
+            return
+
+        try:
+            await mongodb.current_db.create_collection(
+                self.collection_name,
+                capped=True,
+                size=INVALIDATIONS_CAPPED_SIZE_BYTES,
+                max=INVALIDATIONS_CAPPED_MAX_DOCUMENTS,
+            )
+        except CollectionInvalid:
+            pass
+
+    async def start(self) -> None:
+        await self.ensure_collection()
+        if self._listener_task is None or self._listener_task.done():
+            self._listener_task = asyncio.create_task(
+                self._tail_loop(),
+                name=f"feeds-cache-invalidations-{self.namespace}",
+            )
+
+    async def stop(self) -> None:
+        task = self._listener_task
+        self._listener_task = None
+        if task is not None:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+
+        if len(self._publish_tasks) > 0:
+            await asyncio.gather(*self._publish_tasks, return_exceptions=True)
+
+    def publish(self, key: str | None) -> None:
+        """Schedule an invalidation for other workers without blocking the caller."""
+
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+
+        task = loop.create_task(self._insert(_INVALIDATE_KIND, key))
+        self._publish_tasks.add(task)
+        task.add_done_callback(self._publish_tasks.discard)
+
+    async def _insert(self, kind: str, key: str | None) -> None:
+        collection = self._collection()
+        if collection is None:
+            return
+
+        try:
+            await collection.insert_one(
+                {
+                    "namespace": self.namespace,
+                    "kind": kind,
+                    "key": key,
+                    "origin": self.worker_id,
+                    "created_at": datetime.now(UTC),
+                }
+            )
+        except Exception as exc:  # noqa: BLE001
+            logging.warning(f"Feed cache invalidation publish failed: {exc}")
+
+    def _apply(self, doc: dict) -> None:
+        if doc.get("kind") != _INVALIDATE_KIND or doc.get("origin") == self.worker_id:
+            return
+
+        key = doc.get("key")
+        self._on_invalidate(key if isinstance(key, str) else None)
+
+    async def _tail_loop(self) -> None:
+        while True:
+            collection = self._collection()
+            if collection is None:
+                return
+
+            try:
+                started_at = datetime.now(UTC) - timedelta(seconds=1)
+                # Seed a document so the tailable query has a match and stays open.
+                await self._insert(_WORKER_START_KIND, None)
+                self._on_invalidate(None)
+
+                cursor = collection.find(
+                    {
+                        "namespace": self.namespace,
+                        "created_at": {"$gte": started_at},
+                    },
+                    cursor_type=CursorType.TAILABLE_AWAIT,
+                )
+                while cursor.alive:
+                    async for doc in cursor:
+                        self._apply(doc)
+                    await asyncio.sleep(0.1)
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:  # noqa: BLE001
+                logging.warning(f"Feed cache invalidation tail failed: {exc}")
+
+            await asyncio.sleep(INVALIDATIONS_RETRY_DELAY_SECONDS)
+
+
+__all__ = [
+    "CacheInvalidationChannel",
+    "INVALIDATIONS_COLLECTION_NAME",
+    "KeyedCache",
+    "LruTtlCache",
+]
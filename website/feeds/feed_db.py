@@ -1,45 +1,82 @@
 from __future__ import annotations
 
+import asyncio
+import base64
+import hashlib
+import json
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterable, Mapping
+from dataclasses import asdict, dataclass
 import logging
 from datetime import UTC, datetime, timedelta
 from html import unescape
+import os
+from pathlib import Path
 import re
+import time
 from typing import Any, Literal, cast
+from uuid import uuid4
 import xml.etree.ElementTree as ET
+import zlib
 from urllib.parse import urljoin, urlparse, urlunparse
 
 import aiohttp
-from bson import ObjectId
-from defusedxml import ElementTree as DefusedElementTree
+from bson import Binary, ObjectId
 from defusedxml.common import DefusedXmlException
-from pymongo import ASCENDING, DESCENDING
-from pymongo.errors import DuplicateKeyError
+from motor.motor_asyncio import AsyncIOMotorCollection
+from pymongo import ASCENDING, DESCENDING, DeleteOne, ReturnDocument, UpdateOne
+from pymongo.errors import BulkWriteError, DuplicateKeyError
 
 from ..utils.html_sanitizer import sanitize_html
 from . import feed_utils
+from .counts_cache import CacheInvalidationChannel, KeyedCache, LruTtlCache
+from .http_client import get_feed_http_session
+from .indexes import FEED_INDEX_REGISTRY, FeedIndexSpec, missing_index_specs, summarize_explain_plan
+from .instrumentation import profiled
+from .read_state import ArticleTimestampColumn, UserArticleStateSnapshot
+from .reader_events import reader_event_bus
+from .search_index import ArticleSearchIndex, read_segment_file, write_segment_file
 from . import (
+    feed_article_archive_collection,
     feed_articles_collection,
     feed_categories_collection,
+    feed_daily_rollups_collection,
+    feed_maintenance_state_collection,
+    feed_opml_import_jobs_collection,
     feed_sources_collection,
+    user_article_state_versions_collection,
     user_article_states_collection,
     user_feed_subscriptions_collection,
+    user_feed_unread_counters_collection,
 )
 from .models import (
+    FeedArticleBulkStateRequest,
+    FeedArticleBulkStateResponse,
     FeedArticleCard,
     FeedArticleListResponse,
     FeedArticleStatusItem,
     FeedCategoryDocument,
     FeedCategoryListResponse,
     FeedCategorySummary,
+    FeedIndexReport,
+    FeedIndexStatus,
+    FeedOpmlImportJob,
     FeedOpmlImportOptions,
     FeedOpmlImportResult,
+    FeedQueryPlan,
+    FeedReaderPushDelta,
     FeedReaderSyncRequest,
     FeedReaderSyncResponse,
     FeedSidebarMetaResponse,
+    FeedSidebarVisibilityDelta,
+    FeedArticleArchiveCounts,
+    FeedArticleArchiveStatus,
+    FeedSourceConsolidationCounts,
+    FeedSourceConsolidationStatus,
     FeedStatsDailyPoint,
     FeedStatsOverall,
     FeedStatsResponse,
     FeedStatsRow,
+    UserFeedUnreadCounterDocument,
 )
 
 
@@ -47,22 +84,108 @@ READ_VISIBILITY_WINDOW = timedelta(minutes=2)
 RECENTLY_READ_WINDOW = timedelta(days=7)
 FEED_VALIDATION_MAX_REDIRECTS = 5
 FEED_VALIDATION_REDIRECT_STATUSES = {301, 302, 303, 307, 308}
+FEED_VALIDATION_TIMEOUT = aiohttp.ClientTimeout(12)
+FEED_VALIDATION_HEADERS = {
+    "Accept": "application/rss+xml, application/atom+xml, application/xml, text/xml;q=0.9,*/*;q=0.8"
+}
+FEED_VALIDATION_MAX_BYTES = 2 * 1024 * 1024
+FEED_VALIDATION_CHUNK_BYTES = 16 * 1024
+OPML_IMPORT_BATCH_SIZE = 200
+OPML_IMPORT_VALIDATION_CONCURRENCY = 8
+OPML_IMPORT_JOB_RETENTION = timedelta(days=1)
+FEED_SOURCE_CONSOLIDATION_MARKER_ID = "feed_source_consolidation"
+FEED_SOURCE_CONSOLIDATION_INTERVAL = timedelta(minutes=10)
+FEED_SOURCE_CONSOLIDATION_LEASE = timedelta(minutes=5)
+FEED_SOURCE_CONSOLIDATION_MAX_URLS = 50
+FEED_SOURCE_CONSOLIDATION_BATCH_SIZE = 500
+FEED_ARTICLE_ARCHIVE_MARKER_ID = "feed_article_archive"
+FEED_ARTICLE_ARCHIVE_INTERVAL = timedelta(minutes=30)
+FEED_ARTICLE_ARCHIVE_LEASE = timedelta(minutes=10)
+FEED_ARTICLE_ARCHIVE_GRACE = timedelta(days=1)
+FEED_ARTICLE_ARCHIVE_BATCH_SIZE = 500
+FEED_ARTICLE_ARCHIVE_MAX_BATCHES = 10
+FEED_ARTICLE_ARCHIVE_SWEEP_INTERVAL = timedelta(days=1)
+FEED_ARTICLE_ARCHIVE_KEEP_BODIES = os.getenv("FEEDS_ARCHIVE_KEEP_BODIES", "1").strip() not in {"", "0", "false"}
+FEED_DAILY_ROLLUP_MARKER_ID = "feed_daily_rollups"
+FEED_DAILY_ROLLUP_CATCH_UP_WINDOW = timedelta(days=2)
+FEED_DAILY_ROLLUP_MAINTENANCE_INTERVAL = timedelta(hours=1)
+FEED_DAILY_ROLLUP_BACKFILL_BATCH_SIZE = 500
+
+FeedDailyRollupField = Literal["published", "read", "opened", "saved"]
 TRUNCATED_SUMMARY_PARAGRAPH_LIMIT = 5
 SEARCH_QUERY_MAX_LENGTH = 160
 FEED_ARTICLE_TEXT_INDEX_CACHE_TTL = timedelta(minutes=10)
-CATEGORY_COUNTS_CACHE_TTL = timedelta(seconds=2)
+FEED_INDEX_EXPLAIN_SAMPLE_SIZE = 100
+CATEGORY_COUNTS_CACHE_TTL = timedelta(seconds=60)
+CATEGORY_COUNTS_CACHE_MAX_ENTRIES = 512
+FEED_INGEST_WATCH_INTERVAL = timedelta(seconds=2)
+UNREAD_COUNTER_RECONCILE_INTERVAL = timedelta(minutes=15)
+USER_ARTICLE_STATE_CACHE_TTL = timedelta(minutes=30)
+USER_ARTICLE_STATE_CACHE_MAX_ENTRIES = 256
+USER_ARTICLE_STATE_DELTA_OVERLAP = timedelta(seconds=5)
+USER_ARTICLE_STATE_PROJECTION = {
+    "_id": 0,
+    "article_id": 1,
+    "is_read": 1,
+    "read_at": 1,
+    "is_saved": 1,
+    "saved_at": 1,
+}
 HEAD_PROBE_MAX_LIMIT = 20
-FEED_ARTICLE_TEXT_INDEX_KEYS: list[tuple[str, str]] = [
-    ("title", "text"),
-    ("summary_html", "text"),
-]
+FEED_BULK_STATE_MAX_ARTICLES = 5000
+RENDERED_ARTICLE_CACHE_TTL = timedelta(hours=6)
+RENDERED_ARTICLE_CACHE_MAX_ENTRIES = 4096
+RENDERED_ARTICLE_CONTENT_FIELDS = (
+    "title",
+    "canonical_url",
+    "link",
+    "author",
+    "summary_html",
+    "media_image_url",
+    "published_at",
+)
+READER_PUSH_KEEPALIVE_SECONDS = 25.0
+READER_PUSH_DEBOUNCE_SECONDS = 0.25
 SEARCH_TERM_IRREGULAR_VARIANTS: dict[str, tuple[str, ...]] = {
     "run": ("run", "runs", "running", "ran"),
 }
+FEED_SEARCH_INDEX_ENABLED = os.getenv("FEEDS_SEARCH_INDEX_ENABLED", "1").strip() not in {"", "0", "false"}
+FEED_SEARCH_INDEX_SEGMENT_PATH = os.getenv("FEEDS_SEARCH_INDEX_SEGMENT_PATH", "").strip()
+FEED_SEARCH_INDEX_SYNC_INTERVAL = timedelta(minutes=1)
+FEED_SEARCH_INDEX_SYNC_OVERLAP = timedelta(minutes=5)
+FEED_SEARCH_INDEX_REBUILD_INTERVAL = timedelta(days=1)
+FEED_SEARCH_INDEX_SEGMENT_SAVE_INTERVAL = timedelta(minutes=15)
+FEED_SEARCH_INDEX_BATCH_SIZE = 1000
+FEED_SEARCH_INDEX_MAX_MATCHES = 5000
+FEED_SEARCH_INDEX_PROJECTION = {"feed_id": 1, "title": 1, "summary_html": 1, "published_at": 1}
 
 _feed_article_text_index_available_cache: bool | None = None
 _feed_article_text_index_checked_at: datetime | None = None
-_category_counts_cache: dict[str, tuple[datetime, FeedCategoryListResponse]] = {}
+_feed_search_index: ArticleSearchIndex | None = None
+_feed_search_index_watermark: datetime | None = None
+_feed_search_index_built_at: datetime | None = None
+_feed_search_index_saved_at: datetime | None = None
+_feed_search_index_task: asyncio.Task[None] | None = None
+_opml_import_tasks: set[asyncio.Task[None]] = set()
+_feed_daily_rollup_task: asyncio.Task[None] | None = None
+_feed_source_consolidation_task: asyncio.Task[None] | None = None
+_feed_source_unique_index_ready = False
+_feed_article_archive_task: asyncio.Task[None] | None = None
+_feed_ingest_watch_task: asyncio.Task[None] | None = None
+_feed_ingest_marker: datetime | None = None
+_feed_ingest_marker_ids: set[ObjectId] = set()
+_user_article_state_cache: KeyedCache[str, UserArticleStateSnapshot] = LruTtlCache(
+    max_entries=USER_ARTICLE_STATE_CACHE_MAX_ENTRIES,
+    ttl=USER_ARTICLE_STATE_CACHE_TTL,
+)
+_category_counts_cache: KeyedCache[str, FeedCategoryListResponse] = LruTtlCache(
+    max_entries=CATEGORY_COUNTS_CACHE_MAX_ENTRIES,
+    ttl=CATEGORY_COUNTS_CACHE_TTL,
+)
+_rendered_article_cache: KeyedCache[tuple[ObjectId, bytes, bool], RenderedArticleContent] = LruTtlCache(
+    max_entries=RENDERED_ARTICLE_CACHE_MAX_ENTRIES,
+    ttl=RENDERED_ARTICLE_CACHE_TTL,
+)
 
 SUMMARY_ANCHOR_HREF_RE = re.compile(
     r'(?P<prefix>\bhref\s*=\s*)(?P<quote>["\']?)(?P<href>[^"\'\s>]+)(?P=quote)',
@@ -94,7 +217,11 @@ def normalize_article_search_query(search_query: str | None) -> str:
 
 
 def parse_article_search_components(search_query: str) -> list[tuple[str, str]]:
-    """Parse normalized search text into ordered term/phrase components."""
+    """Parse normalized search text into ordered term/prefix/phrase components.
+
+    A trailing ``*`` turns the last word of an unquoted token into a prefix
+    component, so ``econom*`` matches "economy" and "economics".
+    """
 
     components: list[tuple[str, str]] = []
     seen_components: set[tuple[str, str]] = set()
@@ -119,12 +246,14 @@ def parse_article_search_components(search_query: str) -> list[tuple[str, str]]:
         if not isinstance(token_group, str):
             continue
 
-        for token in re.findall(r"[A-Za-z0-9]+", token_group):
+        tokens = re.findall(r"[A-Za-z0-9]+", token_group)
+        for token_index, token in enumerate(tokens):
             normalized_token = token.casefold().strip()
             if normalized_token == "":
                 continue
 
-            token_component = ("term", normalized_token)
+            is_prefix = token_index == len(tokens) - 1 and token_group.endswith(f"{token}*")
+            token_component = ("prefix" if is_prefix else "term", normalized_token)
             if token_component in seen_components:
                 continue
 
@@ -212,6 +341,9 @@ def build_search_component_regex(component_kind: str, component_value: str) -> s
 
         return rf"\b{'\\s+'.join(re.escape(token) for token in phrase_tokens)}\b"
 
+    if component_kind == "prefix":
+        return rf"\b{re.escape(normalized_value.casefold())}"
+
     term_variants = sorted(
         {re.escape(value) for value in build_search_term_variants(normalized_value)},
         key=len,
@@ -284,6 +416,11 @@ def build_article_text_search_filter(search_query: str | None) -> dict[str, Any]
 
     components = parse_article_search_components(normalized)
 
+    # $text only matches whole stemmed words, so prefix queries use the regex
+    # fallback instead.
+    if any(component_kind == "prefix" for component_kind, _ in components):
+        return build_article_fallback_search_filter(normalized)
+
     text_query_filter: dict[str, Any] = {
         "$text": {
             "$search": normalized,
@@ -318,8 +455,18 @@ def build_article_search_filter(
     search_query: str | None,
     *,
     use_text_search: bool,
+    feed_ids: Iterable[ObjectId] | None = None,
 ) -> dict[str, Any] | None:
-    """Build article search filter using text search when available."""
+    """Build article search filter using the in-process index or text search.
+
+    When *feed_ids* is given and the search index is ready, matches are
+    resolved in memory and returned as an ``_id`` filter.
+    """
+
+    if feed_ids is not None:
+        indexed_article_ids = search_feed_article_index(search_query, feed_ids)
+        if indexed_article_ids is not None:
+            return {"_id": {"$in": indexed_article_ids}}
 
     if use_text_search:
         return build_article_text_search_filter(search_query)
@@ -353,6 +500,210 @@ def merge_article_search_filter(
     }
 
 
+def _feed_index_collections() -> dict[str, AsyncIOMotorCollection | None]:
+    return {
+        "feed_sources": feed_sources_collection,
+        "feed_articles": feed_articles_collection,
+        "user_feed_subscriptions": user_feed_subscriptions_collection,
+        "feed_categories": feed_categories_collection,
+        "user_article_states": user_article_states_collection,
+        "user_feed_unread_counters": user_feed_unread_counters_collection,
+        "feed_opml_import_jobs": feed_opml_import_jobs_collection,
+        "feed_daily_rollups": feed_daily_rollups_collection,
+        "feed_article_archive": feed_article_archive_collection,
+    }
+
+
+async def _missing_feed_indexes() -> list[FeedIndexSpec]:
+    """Return the declared indexes that their collections do not have yet."""
+
+    missing: list[FeedIndexSpec] = []
+    for collection_name, collection in _feed_index_collections().items():
+        specs = [spec for spec in FEED_INDEX_REGISTRY if spec.collection == collection_name]
+        if collection is None or len(specs) == 0:
+            continue
+
+        try:
+            index_info = await collection.index_information()
+        except Exception as ex:
+            logging.warning("Unable to inspect %s indexes: %s", collection_name, ex)
+            continue
+
+        missing.extend(missing_index_specs(specs, index_info))
+
+    return missing
+
+
+async def ensure_feed_indexes() -> None:
+    """Create every declared feeds index that is missing.
+
+    Indexes are matched by key pattern, so existing ones are left alone. A
+    failure (for example, duplicates blocking a unique index) is logged and the
+    remaining indexes are still created. Deferred indexes are left to their
+    owning service.
+    """
+
+    global _feed_article_text_index_available_cache
+
+    if any(collection is None for collection in _feed_index_collections().values()):
+        logging.error("No DB connection")
+        return
+
+    collections = _feed_index_collections()
+    for spec in await _missing_feed_indexes():
+        if spec.deferred:
+            continue
+
+        collection = collections[spec.collection]
+        if collection is None:
+            continue
+
+        options: dict[str, Any] = dict(spec.options)
+        if spec.unique:
+            options["unique"] = True
+
+        try:
+            await collection.create_index(list(spec.keys), name=spec.name, **options)
+        except Exception as ex:
+            logging.warning("Unable to create %s index %s: %s", spec.collection, spec.name, ex)
+            continue
+
+        if spec.is_text:
+            _feed_article_text_index_available_cache = None
+
+
+async def _explain_feed_query(
+    name: str,
+    collection: AsyncIOMotorCollection,
+    command: dict[str, Any],
+) -> FeedQueryPlan:
+    try:
+        explain = await collection.database.command(
+            {"explain": command, "verbosity": "executionStats"}
+        )
+    except Exception as ex:
+        return FeedQueryPlan(name=name, collection=collection.name, error=str(ex))
+
+    plan = FeedQueryPlan(name=name, collection=collection.name, **summarize_explain_plan(explain))
+    if plan.collection_scan:
+        logging.warning(f"Feeds query {name} on {collection.name} uses a collection scan: {plan.stages}")
+    return plan
+
+
+@profiled
+async def get_feed_index_report(user_id: str) -> FeedIndexReport:
+    """Compare the declared index set with the live collections and explain the hot queries.
+
+    The unread listing page, the recently-read count and the sidebar state
+    pipelines are explained for *user_id* with the same builders the reader
+    uses, so the plans reflect that user's real subscriptions.
+    """
+
+    missing = await _missing_feed_indexes()
+    missing_names = {(spec.collection, spec.name) for spec in missing}
+    indexes = [
+        FeedIndexStatus(
+            collection=spec.collection,
+            name=spec.name,
+            keys=[f"{field_name}:{direction}" for field_name, direction in spec.keys],
+            unique=spec.unique,
+            deferred=spec.deferred,
+            present=(spec.collection, spec.name) not in missing_names,
+        )
+        for spec in FEED_INDEX_REGISTRY
+    ]
+
+    if (
+        feed_articles_collection is None
+        or user_article_states_collection is None
+        or user_feed_subscriptions_collection is None
+    ):
+        return FeedIndexReport(indexes=indexes, missing_count=len(missing))
+
+    feed_ids = [
+        sub["feed_id"]
+        for sub in await list_user_subscription_docs(user_id)
+        if isinstance(sub.get("feed_id"), ObjectId)
+    ]
+    recently_read_query = build_recently_read_state_query(user_id, recently_read_cutoff())
+    recently_read_ids = [
+        doc["article_id"]
+        async for doc in user_article_states_collection.find(
+            recently_read_query,
+            {"article_id": 1},
+        ).limit(FEED_INDEX_EXPLAIN_SAMPLE_SIZE)
+        if "article_id" in doc
+    ]
+    dated_query, undated_query = build_article_segment_queries(
+        {"feed_id": {"$in": feed_ids}, "is_deleted": False}
+    )
+    unread_stages = build_unread_article_join_stages(user_id)
+
+    plans = await asyncio.gather(
+        _explain_feed_query(
+            "list_cards_for_feed_ids:dated",
+            feed_articles_collection,
+            {
+                "aggregate": feed_articles_collection.name,
+                "pipeline": build_article_segment_pipeline("dated", dated_query, ASCENDING, unread_stages, 0, 11),
+                "cursor": {},
+            },
+        ),
+        _explain_feed_query(
+            "list_cards_for_feed_ids:undated",
+            feed_articles_collection,
+            {
+                "aggregate": feed_articles_collection.name,
+                "pipeline": build_article_segment_pipeline("undated", undated_query, ASCENDING, unread_stages, 0, 11),
+                "cursor": {},
+            },
+        ),
+        _explain_feed_query(
+            "count_recently_read:states",
+            user_article_states_collection,
+            {
+                "find": user_article_states_collection.name,
+                "filter": recently_read_query,
+                "projection": {"article_id": 1},
+            },
+        ),
+        _explain_feed_query(
+            "count_recently_read:articles",
+            feed_articles_collection,
+            {
+                "find": feed_articles_collection.name,
+                "filter": {"_id": {"$in": recently_read_ids}},
+                "projection": {"feed_id": 1},
+            },
+        ),
+        _explain_feed_query(
+            "sidebar:recently_read",
+            user_article_states_collection,
+            {
+                "aggregate": user_article_states_collection.name,
+                "pipeline": build_sidebar_state_feed_pipeline(recently_read_query, feed_ids),
+                "cursor": {},
+            },
+        ),
+        _explain_feed_query(
+            "sidebar:saved",
+            user_article_states_collection,
+            {
+                "aggregate": user_article_states_collection.name,
+                "pipeline": build_sidebar_state_feed_pipeline({"user_id": user_id, "is_saved": True}, feed_ids),
+                "cursor": {},
+            },
+        ),
+    )
+
+    return FeedIndexReport(
+        indexes=indexes,
+        missing_count=len(missing),
+        plans=list(plans),
+        collection_scan_count=sum(1 for plan in plans if plan.collection_scan),
+    )
+
+
 async def feed_articles_text_search_available() -> bool:
     """Return True when feed_articles has a usable text index."""
 
@@ -397,22 +748,243 @@ async def feed_articles_text_search_available() -> bool:
         if has_text_index:
             break
 
-    if not has_text_index:
-        try:
-            await feed_articles_collection.create_index(
-                FEED_ARTICLE_TEXT_INDEX_KEYS,
-                default_language="english",
-                weights={"title": 8, "summary_html": 2},
-            )
-            has_text_index = True
-        except Exception as ex:
-            logging.warning("Unable to create feed article text index: %s", ex)
-
     _feed_article_text_index_available_cache = has_text_index
     _feed_article_text_index_checked_at = now
     return has_text_index
 
 
+def feed_search_index_ready() -> bool:
+    """Return True once this worker has a built or loaded search index."""
+
+    return _feed_search_index is not None
+
+
+def search_feed_article_index(
+    search_query: str | None,
+    feed_ids: Iterable[ObjectId],
+) -> list[ObjectId] | None:
+    """Return the newest indexed article ids matching *search_query*.
+
+    Returns None when the index is not ready or the query has no searchable
+    components, so callers fall back to the Mongo search filters. Search
+    results are listed newest first, so matches are capped at
+    ``FEED_SEARCH_INDEX_MAX_MATCHES`` in that order rather than by score.
+    """
+
+    index = _feed_search_index
+    if index is None:
+        return None
+
+    components = parse_article_search_components(normalize_article_search_query(search_query))
+    if len(components) == 0:
+        return None
+
+    matches = index.search(
+        components,
+        expand_term=build_search_term_variants,
+        feed_ids={str(feed_id) for feed_id in feed_ids},
+        limit=FEED_SEARCH_INDEX_MAX_MATCHES,
+        order="newest",
+    )
+    return [ObjectId(article_id) for article_id, _ in matches]
+
+
+def _index_feed_article_docs(index: ArticleSearchIndex, article_docs: list[dict[str, Any]]) -> None:
+    for article_doc in article_docs:
+        index.add_article(
+            str(article_doc["_id"]),
+            str(article_doc.get("feed_id")),
+            article_doc.get("title"),
+            article_doc.get("summary_html"),
+            _as_utc_datetime(article_doc.get("published_at")),
+        )
+
+
+async def _build_feed_search_index() -> ArticleSearchIndex:
+    """Index every live article, tokenizing each batch off the event loop."""
+
+    if feed_articles_collection is None:
+        raise RuntimeError("Feed articles collection is not available.")
+
+    index = ArticleSearchIndex()
+    batch: list[dict[str, Any]] = []
+    async for article_doc in feed_articles_collection.find(
+        {"is_deleted": False},
+        FEED_SEARCH_INDEX_PROJECTION,
+    ).batch_size(FEED_SEARCH_INDEX_BATCH_SIZE):
+        batch.append(article_doc)
+        if len(batch) >= FEED_SEARCH_INDEX_BATCH_SIZE:
+            await asyncio.to_thread(_index_feed_article_docs, index, batch)
+            batch = []
+
+    if len(batch) > 0:
+        await asyncio.to_thread(_index_feed_article_docs, index, batch)
+
+    return index
+
+
+async def _catch_up_feed_search_index(index: ArticleSearchIndex, since: datetime) -> None:
+    """Apply articles fetched, moved or soft-deleted since *since* to the live index.
+
+    Articles repointed to a canonical source by duplicate consolidation carry
+    ``feed_moved_at`` and are re-indexed under their new ``feed_id``.
+    """
+
+    if feed_articles_collection is None:
+        return
+
+    lower_bound = since - FEED_SEARCH_INDEX_SYNC_OVERLAP
+    batch: list[dict[str, Any]] = []
+    async for article_doc in feed_articles_collection.find(
+        {
+            "$or": [{"fetched_at": {"$gte": lower_bound}}, {"feed_moved_at": {"$gte": lower_bound}}],
+            "is_deleted": False,
+        },
+        FEED_SEARCH_INDEX_PROJECTION,
+    ).batch_size(FEED_SEARCH_INDEX_BATCH_SIZE):
+        batch.append(article_doc)
+        if len(batch) >= FEED_SEARCH_INDEX_BATCH_SIZE:
+            _index_feed_article_docs(index, batch)
+            batch = []
+            await asyncio.sleep(0)
+    _index_feed_article_docs(index, batch)
+
+    async for article_doc in feed_articles_collection.find(
+        {"is_deleted": True, "deleted_at": {"$gte": lower_bound}},
+        {"_id": 1},
+    ):
+        index.remove_article(str(article_doc["_id"]))
+
+
+async def _save_feed_search_index_segment() -> None:
+    global _feed_search_index_saved_at
+
+    index = _feed_search_index
+    if FEED_SEARCH_INDEX_SEGMENT_PATH == "" or index is None:
+        return
+
+    try:
+        await asyncio.to_thread(
+            write_segment_file,
+            Path(FEED_SEARCH_INDEX_SEGMENT_PATH),
+            index,
+            _feed_search_index_watermark,
+        )
+        _feed_search_index_saved_at = utc_now()
+    except Exception as exc:  # noqa: BLE001
+        logging.warning(f"Feed search index segment save failed: {exc}")
+
+
+async def _load_feed_search_index_segment() -> None:
+    global _feed_search_index
+    global _feed_search_index_watermark
+    global _feed_search_index_built_at
+    global _feed_search_index_saved_at
+
+    if FEED_SEARCH_INDEX_SEGMENT_PATH == "":
+        return
+
+    try:
+        index, watermark = await asyncio.to_thread(read_segment_file, Path(FEED_SEARCH_INDEX_SEGMENT_PATH))
+    except FileNotFoundError:
+        return
+    except Exception as exc:  # noqa: BLE001
+        logging.warning(f"Feed search index segment load failed: {exc}")
+        return
+
+    if watermark is None:
+        return
+
+    now = utc_now()
+    _feed_search_index = index
+    _feed_search_index_watermark = watermark
+    _feed_search_index_built_at = now
+    _feed_search_index_saved_at = now
+
+
+async def sync_feed_search_index() -> None:
+    """Build, load or incrementally update this worker's search index.
+
+    The first pass loads the on-disk segment when one is configured, otherwise
+    it indexes every live article. Later passes apply articles fetched or
+    soft-deleted since the previous pass, and a full rebuild runs daily to drop
+    articles the retention job purged while the worker was not watching.
+    """
+
+    global _feed_search_index
+    global _feed_search_index_watermark
+    global _feed_search_index_built_at
+
+    if feed_articles_collection is None:
+        return
+
+    if _feed_search_index is None:
+        await _load_feed_search_index_segment()
+
+    index = _feed_search_index
+    watermark = _feed_search_index_watermark
+    started_at = utc_now()
+    if (
+        index is None
+        or watermark is None
+        or _feed_search_index_built_at is None
+        or started_at - _feed_search_index_built_at >= FEED_SEARCH_INDEX_REBUILD_INTERVAL
+    ):
+        rebuilt_index = await _build_feed_search_index()
+        _feed_search_index = rebuilt_index
+        _feed_search_index_watermark = started_at
+        _feed_search_index_built_at = started_at
+        await _save_feed_search_index_segment()
+        return
+
+    await _catch_up_feed_search_index(index, watermark)
+    _feed_search_index_watermark = started_at
+    if (
+        _feed_search_index_saved_at is None
+        or started_at - _feed_search_index_saved_at >= FEED_SEARCH_INDEX_SEGMENT_SAVE_INTERVAL
+    ):
+        await _save_feed_search_index_segment()
+
+
+async def _feed_search_index_sync_loop() -> None:
+    while True:
+        try:
+            await sync_feed_search_index()
+        except Exception as exc:  # noqa: BLE001
+            logging.warning(f"Feed search index sync failed: {exc}")
+        await asyncio.sleep(FEED_SEARCH_INDEX_SYNC_INTERVAL.total_seconds())
+
+
+async def start_feed_search_index_sync() -> None:
+    global _feed_search_index_task
+
+    if not FEED_SEARCH_INDEX_ENABLED:
+        return
+
+    if _feed_search_index_task is None or _feed_search_index_task.done():
+        _feed_search_index_task = asyncio.create_task(
+            _feed_search_index_sync_loop(),
+            name="feeds-search-index-sync",
+        )
+
+
+async def stop_feed_search_index_sync() -> None:
+    global _feed_search_index_task
+
+    task = _feed_search_index_task
+    _feed_search_index_task = None
+    if task is None:
+        return
+
+    task.cancel()
+    try:
+        await task
+    except asyncio.CancelledError:
+        pass
+
+    await _save_feed_search_index_segment()
+
+
 def format_datetime_utc_iso(value: Any) -> str:
     """Return an ISO-8601 UTC timestamp string for admin UI fields."""
 
@@ -650,62 +1222,145 @@ def build_article_summary_html(
     return truncated, sanitized, True
 
 
-async def validate_feed_url(feed_url: str) -> tuple[str, str]:
+@dataclass(frozen=True)
+class RenderedArticleContent:
+    """User-independent card fields rendered from one article document."""
+
+    title: str
+    link: str
+    author: str | None
+    summary_html: str | None
+    full_summary_html: str | None
+    is_summary_truncated: bool
+    media_image_url: str | None
+    published_at: datetime | None
+
+
+def article_content_hash(article_doc: dict[str, Any]) -> bytes:
+    """Return a digest of the article fields that feed a rendered card."""
+
+    digest = hashlib.blake2b(digest_size=16)
+    for field in RENDERED_ARTICLE_CONTENT_FIELDS:
+        value = article_doc.get(field)
+        if value is not None:
+            digest.update(str(value).encode("utf-8", "surrogatepass"))
+        digest.update(b"\x00")
+    return digest.digest()
+
+
+def render_article_content(
+    article_doc: dict[str, Any],
+    *,
+    truncate_on_display: bool = False,
+) -> RenderedArticleContent:
+    """Return rendered card content, reusing the cached render when unchanged.
+
+    Renders are keyed by article ID, a hash of the rendered fields and the
+    truncation flag, so an edited article or a feed switching truncation on or
+    off gets a fresh entry and nothing has to be invalidated.
+    """
+
+    article_id = article_doc.get("_id")
+    cache_key: tuple[ObjectId, bytes, bool] | None = None
+    if isinstance(article_id, ObjectId):
+        cache_key = (article_id, article_content_hash(article_doc), truncate_on_display)
+        cached = _rendered_article_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+    summary_html, full_summary_html, is_summary_truncated = build_article_summary_html(
+        article_doc,
+        truncate_on_display=truncate_on_display,
+    )
+    content = RenderedArticleContent(
+        title=str(article_doc.get("title", "Untitled")),
+        link=normalize_article_navigation_link(article_doc.get("canonical_url") or article_doc.get("link")),
+        author=str(article_doc.get("author", "")).strip() or None,
+        summary_html=summary_html,
+        full_summary_html=full_summary_html,
+        is_summary_truncated=is_summary_truncated,
+        media_image_url=normalize_article_link(article_doc.get("media_image_url")) or None,
+        published_at=article_doc.get("published_at"),
+    )
+    if cache_key is not None:
+        _rendered_article_cache.set(cache_key, content)
+    return content
+
+
+def build_article_card(
+    content: RenderedArticleContent,
+    *,
+    article_id: ObjectId,
+    feed_id: ObjectId,
+    feed_title: str,
+    category: FeedCategoryDocument,
+    is_read: bool,
+    read_at: datetime | None,
+    is_saved: bool,
+    saved_at: datetime | None,
+) -> FeedArticleCard:
+    """Merge one user's state and the category styling into rendered content."""
+
+    return FeedArticleCard(
+        article_id=str(article_id),
+        feed_id=str(feed_id),
+        title=content.title,
+        link=content.link,
+        author=content.author,
+        summary_html=content.summary_html,
+        full_summary_html=content.full_summary_html,
+        is_summary_truncated=content.is_summary_truncated,
+        media_image_url=content.media_image_url,
+        published_at=content.published_at,
+        feed_title=feed_title,
+        category_id=str(category.id),
+        category_name=category.name,
+        category_color_hex=category.color_hex,
+        is_read=is_read,
+        read_at=read_at,
+        is_saved=is_saved,
+        saved_at=saved_at,
+    )
+
+
+async def validate_feed_url(
+    feed_url: str,
+    session: aiohttp.ClientSession | None = None,
+) -> tuple[str, str]:
     """Validate a feed URL by fetching and parsing minimal XML metadata.
 
+    The response is parsed incrementally and reading stops as soon as the feed
+    header is available, so large feeds are never buffered in full.
+
+    Args:
+        feed_url: Raw URL provided by a user or OPML document.
+        session: Optional client session; defaults to the app-lifetime pooled
+            session, falling back to a one-off session outside the app.
+
     Returns:
         Tuple of normalized URL and best-effort source title.
     """
 
     normalized_url = normalize_feed_url(feed_url)
-    if not feed_utils.is_public_http_url(normalized_url):
+    if not await feed_utils.is_public_http_url_async(normalized_url):
         raise ValueError("Feed URL must resolve to a public host.")
 
-    timeout = aiohttp.ClientTimeout(12)
-    headers = {
-        "Accept": "application/rss+xml, application/atom+xml, application/xml, text/xml;q=0.9,*/*;q=0.8"
-    }
-
-    payload = b""
-    current_url = normalized_url
+    resolved_session = session or get_feed_http_session()
 
     try:
-        async with aiohttp.ClientSession(timeout=timeout, headers=headers) as session:
-            for _ in range(FEED_VALIDATION_MAX_REDIRECTS + 1):
-                async with session.get(current_url, allow_redirects=False) as response:
-                    if response.status in FEED_VALIDATION_REDIRECT_STATUSES:
-                        redirect_location = str(response.headers.get("Location", "")).strip()
-                        if redirect_location == "":
-                            raise ValueError("Feed URL returned an invalid redirect response.")
-
-                        redirected_url = normalize_feed_url(urljoin(current_url, redirect_location))
-                        if not feed_utils.is_public_http_url(redirected_url):
-                            raise ValueError("Feed URL redirects to a non-public host.")
-
-                        current_url = redirected_url
-                        continue
-
-                    if response.status >= 400:
-                        raise ValueError(f"Feed URL returned HTTP {response.status}.")
-
-                    # Canonicalize the final URL so equivalent inputs dedupe to one source.
-                    final_url = str(response.url).strip()
-                    if final_url != "":
-                        normalized_url = normalize_feed_url(final_url)
-                        if not feed_utils.is_public_http_url(normalized_url):
-                            raise ValueError("Feed URL resolved to a non-public host.")
-
-                    payload = await response.read()
-                    break
-            else:
-                raise ValueError(
-                    f"Feed URL redirected too many times (>{FEED_VALIDATION_MAX_REDIRECTS})."
+        if resolved_session is None:
+            async with aiohttp.ClientSession() as owned_session:
+                normalized_url, root = await _fetch_feed_validation_header(
+                    owned_session,
+                    normalized_url,
                 )
+        else:
+            normalized_url, root = await _fetch_feed_validation_header(
+                resolved_session,
+                normalized_url,
+            )
     except aiohttp.ClientError as exc:
         raise ValueError(f"Unable to fetch feed URL: {exc}") from exc
-
-    try:
-        root = DefusedElementTree.fromstring(payload)
     except (ET.ParseError, DefusedXmlException) as exc:
         raise ValueError("Feed URL did not return valid XML.") from exc
 
@@ -716,6 +1371,64 @@ async def validate_feed_url(feed_url: str) -> tuple[str, str]:
     return normalized_url, title
 
 
+async def _read_feed_header(response: aiohttp.ClientResponse) -> ET.Element:
+    """Stream a feed response into the header parser, capped at FEED_VALIDATION_MAX_BYTES."""
+
+    parser = feed_utils.FeedHeaderParser()
+    bytes_read = 0
+    async for chunk in response.content.iter_chunked(FEED_VALIDATION_CHUNK_BYTES):
+        bytes_read += len(chunk)
+        if parser.feed(chunk):
+            break
+
+        if bytes_read >= FEED_VALIDATION_MAX_BYTES:
+            max_size_kib = FEED_VALIDATION_MAX_BYTES // 1024
+            raise ValueError(f"Feed header was not found in the first {max_size_kib} KiB.")
+
+    return parser.close()
+
+
+async def _fetch_feed_validation_header(
+    session: aiohttp.ClientSession,
+    normalized_url: str,
+) -> tuple[str, ET.Element]:
+    """Follow public-only redirects and return the final URL and parsed feed header."""
+
+    current_url = normalized_url
+    for _ in range(FEED_VALIDATION_MAX_REDIRECTS + 1):
+        async with session.get(
+            current_url,
+            allow_redirects=False,
+            headers=FEED_VALIDATION_HEADERS,
+            timeout=FEED_VALIDATION_TIMEOUT,
+        ) as response:
+            if response.status in FEED_VALIDATION_REDIRECT_STATUSES:
+                redirect_location = str(response.headers.get("Location", "")).strip()
+                if redirect_location == "":
+                    raise ValueError("Feed URL returned an invalid redirect response.")
+
+                redirected_url = normalize_feed_url(urljoin(current_url, redirect_location))
+                if not await feed_utils.is_public_http_url_async(redirected_url):
+                    raise ValueError("Feed URL redirects to a non-public host.")
+
+                current_url = redirected_url
+                continue
+
+            if response.status >= 400:
+                raise ValueError(f"Feed URL returned HTTP {response.status}.")
+
+            # Canonicalize the final URL so equivalent inputs dedupe to one source.
+            final_url = str(response.url).strip()
+            if final_url != "":
+                normalized_url = normalize_feed_url(final_url)
+                if not await feed_utils.is_public_http_url_async(normalized_url):
+                    raise ValueError("Feed URL resolved to a non-public host.")
+
+            return normalized_url, await _read_feed_header(response)
+
+    raise ValueError(f"Feed URL redirected too many times (>{FEED_VALIDATION_MAX_REDIRECTS}).")
+
+
 def _is_bbc_feed_source_url(source_url: str) -> bool:
     """Return True when source URL points to BBC's feeds host."""
 
@@ -889,162 +1602,278 @@ def _updated_timestamp(value: Any) -> datetime:
     return _as_utc_datetime(value) or datetime.min.replace(tzinfo=UTC)
 
 
-async def _merge_user_article_state(
-    target_article_id: ObjectId,
-    source_article_id: ObjectId,
+@dataclass
+class FeedSourceConsolidationMetrics:
+    """Counters for one duplicate-source consolidation pass."""
+
+    duplicate_urls: int = 0
+    sources_removed: int = 0
+    subscriptions_moved: int = 0
+    subscriptions_merged: int = 0
+    articles_moved: int = 0
+    articles_merged: int = 0
+    states_moved: int = 0
+    states_merged: int = 0
+    elapsed_seconds: float = 0.0
+
+
+def _merged_article_state(
+    target_state: dict[str, Any],
+    source_state: dict[str, Any],
+) -> dict[str, Any]:
+    """Return the combined open/read/save flags and latest timestamps."""
+
+    return {
+        "is_opened": bool(target_state.get("is_opened")) or bool(source_state.get("is_opened")),
+        "opened_at": _latest_datetime(
+            _as_utc_datetime(target_state.get("opened_at")),
+            _as_utc_datetime(source_state.get("opened_at")),
+        ),
+        "is_read": bool(target_state.get("is_read")) or bool(source_state.get("is_read")),
+        "read_at": _latest_datetime(
+            _as_utc_datetime(target_state.get("read_at")),
+            _as_utc_datetime(source_state.get("read_at")),
+        ),
+        "is_saved": bool(target_state.get("is_saved")) or bool(source_state.get("is_saved")),
+        "saved_at": _latest_datetime(
+            _as_utc_datetime(target_state.get("saved_at")),
+            _as_utc_datetime(source_state.get("saved_at")),
+        ),
+    }
+
+
+async def _bulk_write_batches(
+    collection: AsyncIOMotorCollection,
+    operations: list[Any],
+    *,
+    ordered: bool = True,
 ) -> None:
-    """Merge per-user state from source article into target article."""
+    """Run write operations in fixed-size ``bulk_write`` batches.
 
-    if (
-        user_article_states_collection is None
-        or target_article_id == source_article_id
-    ):
+    Unordered batches ignore duplicate-key errors so a write racing the backend
+    worker is left for the next consolidation pass.
+    """
+
+    for start in range(0, len(operations), FEED_SOURCE_CONSOLIDATION_BATCH_SIZE):
+        batch = operations[start : start + FEED_SOURCE_CONSOLIDATION_BATCH_SIZE]
+        try:
+            await collection.bulk_write(batch, ordered=ordered)
+        except BulkWriteError as exc:
+            write_errors = exc.details.get("writeErrors", [])
+            if ordered or any(error.get("code") != 11000 for error in write_errors):
+                raise
+
+
+async def _merge_user_article_states(
+    article_targets: dict[ObjectId, ObjectId],
+    metrics: FeedSourceConsolidationMetrics,
+) -> None:
+    """Merge per-user state from duplicate articles into their target articles."""
+
+    if user_article_states_collection is None or len(article_targets) == 0:
         return
 
-    cursor = user_article_states_collection.find({"article_id": source_article_id})
-    now = utc_now()
+    source_states = [
+        dict(doc)
+        async for doc in user_article_states_collection.find(
+            {"article_id": {"$in": list(article_targets)}}
+        )
+    ]
+    if len(source_states) == 0:
+        return
 
-    async for source_state in cursor:
+    user_ids = list(
+        {state.get("user_id") for state in source_states if isinstance(state.get("user_id"), str)}
+    )
+    target_states: dict[tuple[str, ObjectId], dict[str, Any]] = {}
+    async for doc in user_article_states_collection.find(
+        {
+            "user_id": {"$in": user_ids},
+            "article_id": {"$in": list(set(article_targets.values()))},
+        }
+    ):
+        target_states[(doc["user_id"], doc["article_id"])] = dict(doc)
+
+    now = utc_now()
+    operations: list[UpdateOne | DeleteOne] = []
+    for source_state in source_states:
         source_state_id = source_state.get("_id")
         user_id = source_state.get("user_id")
+        target_article_id = article_targets.get(source_state.get("article_id"))
 
-        if not isinstance(source_state_id, ObjectId) or not isinstance(user_id, str):
+        if (
+            not isinstance(source_state_id, ObjectId)
+            or not isinstance(user_id, str)
+            or target_article_id is None
+        ):
             continue
 
-        target_state = await user_article_states_collection.find_one(
-            {
-                "user_id": user_id,
-                "article_id": target_article_id,
-            }
-        )
-
+        target_state = target_states.get((user_id, target_article_id))
         if target_state is None:
-            await user_article_states_collection.update_one(
-                {"_id": source_state_id},
-                {
-                    "$set": {
-                        "article_id": target_article_id,
-                        "updated_at": now,
-                    }
-                },
+            operations.append(
+                UpdateOne(
+                    {"_id": source_state_id},
+                    {"$set": {"article_id": target_article_id, "updated_at": now}},
+                )
             )
+            target_states[(user_id, target_article_id)] = {
+                **source_state,
+                "article_id": target_article_id,
+            }
+            metrics.states_moved += 1
             continue
 
-        source_is_opened = bool(source_state.get("is_opened"))
-        source_is_read = bool(source_state.get("is_read"))
-        source_is_saved = bool(source_state.get("is_saved"))
-        target_is_opened = bool(target_state.get("is_opened"))
-        target_is_read = bool(target_state.get("is_read"))
-        target_is_saved = bool(target_state.get("is_saved"))
-
-        source_opened_at = _as_utc_datetime(source_state.get("opened_at"))
-        target_opened_at = _as_utc_datetime(target_state.get("opened_at"))
-        source_read_at = _as_utc_datetime(source_state.get("read_at"))
-        target_read_at = _as_utc_datetime(target_state.get("read_at"))
-        source_saved_at = _as_utc_datetime(source_state.get("saved_at"))
-        target_saved_at = _as_utc_datetime(target_state.get("saved_at"))
-
-        merged_is_opened = target_is_opened or source_is_opened
-        merged_is_read = target_is_read or source_is_read
-        merged_is_saved = target_is_saved or source_is_saved
-        merged_opened_at = _latest_datetime(target_opened_at, source_opened_at)
-        merged_read_at = _latest_datetime(target_read_at, source_read_at)
-        merged_saved_at = _latest_datetime(target_saved_at, source_saved_at)
-
-        await user_article_states_collection.update_one(
-            {"_id": target_state["_id"]},
-            {
-                "$set": {
-                    "is_opened": merged_is_opened,
-                    "opened_at": merged_opened_at,
-                    "is_read": merged_is_read,
-                    "read_at": merged_read_at,
-                    "is_saved": merged_is_saved,
-                    "saved_at": merged_saved_at,
-                    "updated_at": now,
-                }
-            },
+        merged_state = _merged_article_state(target_state, source_state)
+        operations.append(
+            UpdateOne(
+                {"_id": target_state["_id"]},
+                {"$set": {**merged_state, "updated_at": now}},
+            )
         )
-        await user_article_states_collection.delete_one({"_id": source_state_id})
+        operations.append(DeleteOne({"_id": source_state_id}))
+        target_states[(user_id, target_article_id)] = {**target_state, **merged_state}
+        metrics.states_merged += 1
+
+    await _bulk_write_batches(user_article_states_collection, operations)
+    await _bump_user_article_state_versions(user_ids)
+
+
+def _article_identity(article_doc: dict[str, Any]) -> tuple[str, str] | None:
+    """Return the strongest stable identity used to match duplicate articles."""
+
+    canonical_url = normalize_article_link(article_doc.get("canonical_url"))
+    if canonical_url != "":
+        return "url", canonical_url
+
+    external_id = str(article_doc.get("external_id", "")).strip()
+    if external_id != "" and external_id.lower() not in {"none", "null", "undefined"}:
+        return "external_id", external_id
+
+    dedupe_key = str(article_doc.get("dedupe_key", "")).strip()
+    if dedupe_key != "":
+        return "dedupe_key", dedupe_key
+
+    return None
+
+
+async def _load_canonical_article_identities(
+    canonical_feed_id: ObjectId,
+    identities: list[tuple[str, str]],
+) -> dict[tuple[str, str], ObjectId]:
+    """Return canonical-feed article IDs matching any of *identities*."""
+
+    if feed_articles_collection is None or len(identities) == 0:
+        return {}
+
+    urls = [value for kind, value in identities if kind == "url"]
+    external_ids = [value for kind, value in identities if kind == "external_id"]
+    dedupe_keys = [value for kind, value in identities if kind == "dedupe_key"]
+    clauses: list[dict[str, Any]] = []
+    if len(urls) > 0:
+        clauses.extend([{"canonical_url": {"$in": urls}}, {"link": {"$in": urls}}])
+    if len(external_ids) > 0:
+        clauses.append({"external_id": {"$in": external_ids}})
+    if len(dedupe_keys) > 0:
+        clauses.append({"dedupe_key": {"$in": dedupe_keys}})
+
+    matches: dict[tuple[str, str], ObjectId] = {}
+    async for doc in feed_articles_collection.find(
+        {"feed_id": canonical_feed_id, "$or": clauses},
+        {"canonical_url": 1, "link": 1, "external_id": 1, "dedupe_key": 1},
+    ):
+        article_id = doc["_id"]
+        for kind, field in (
+            ("url", "canonical_url"),
+            ("url", "link"),
+            ("external_id", "external_id"),
+            ("dedupe_key", "dedupe_key"),
+        ):
+            value = doc.get(field)
+            if isinstance(value, str) and value != "":
+                matches.setdefault((kind, value), article_id)
+
+    return matches
 
 
 async def _merge_duplicate_feed_articles(
     canonical_feed_id: ObjectId,
     duplicate_feed_ids: list[ObjectId],
+    metrics: FeedSourceConsolidationMetrics,
 ) -> None:
-    """Move duplicate-source articles into canonical feed and merge states."""
+    """Move duplicate-source articles into canonical feed and merge states.
+
+    Articles the canonical feed does not have yet are repointed in place, so
+    their user state stays attached. Articles it already has are deleted after
+    their user state is merged into the canonical copy.
+    """
 
     if feed_articles_collection is None or len(duplicate_feed_ids) == 0:
         return
 
-    cursor = feed_articles_collection.find({"feed_id": {"$in": duplicate_feed_ids}})
+    cursor = feed_articles_collection.find(
+        {"feed_id": {"$in": duplicate_feed_ids}},
+        {"canonical_url": 1, "external_id": 1, "dedupe_key": 1},
+    ).batch_size(FEED_SOURCE_CONSOLIDATION_BATCH_SIZE)
 
+    batch: list[dict[str, Any]] = []
     async for article_doc in cursor:
-        source_article_id = article_doc.get("_id")
-        canonical_url = normalize_article_link(article_doc.get("canonical_url"))
-        external_id = str(article_doc.get("external_id", "")).strip()
-        dedupe_key = str(article_doc.get("dedupe_key", "")).strip()
+        batch.append(article_doc)
+        if len(batch) >= FEED_SOURCE_CONSOLIDATION_BATCH_SIZE:
+            await _merge_duplicate_article_batch(canonical_feed_id, batch, metrics)
+            batch = []
 
-        if not isinstance(source_article_id, ObjectId):
-            continue
+    await _merge_duplicate_article_batch(canonical_feed_id, batch, metrics)
 
-        if canonical_url != "":
-            target_lookup: dict[str, Any] = {
-                "feed_id": canonical_feed_id,
-                "$or": [
-                    {"canonical_url": canonical_url},
-                    {"link": canonical_url},
-                ],
-            }
-        elif external_id != "" and external_id.lower() not in {"none", "null", "undefined"}:
-            target_lookup = {
-                "feed_id": canonical_feed_id,
-                "external_id": external_id,
-            }
-        elif dedupe_key != "":
-            target_lookup = {
-                "feed_id": canonical_feed_id,
-                "dedupe_key": dedupe_key,
-            }
-        else:
-            # No stable identity; keep historical row to avoid unsafe merges.
-            continue
 
-        target_article = await feed_articles_collection.find_one(
-            target_lookup,
-            {"_id": 1},
-        )
+async def _merge_duplicate_article_batch(
+    canonical_feed_id: ObjectId,
+    article_docs: list[dict[str, Any]],
+    metrics: FeedSourceConsolidationMetrics,
+) -> None:
+    if feed_articles_collection is None or len(article_docs) == 0:
+        return
 
-        if target_article is None:
-            cloned_article = dict(article_doc)
-            cloned_article.pop("_id", None)
-            cloned_article["feed_id"] = canonical_feed_id
+    identities = {
+        article_doc["_id"]: _article_identity(article_doc)
+        for article_doc in article_docs
+    }
+    canonical_matches = await _load_canonical_article_identities(
+        canonical_feed_id,
+        [identity for identity in identities.values() if identity is not None],
+    )
 
-            try:
-                insert_result = await feed_articles_collection.insert_one(cloned_article)
-                target_article_id = insert_result.inserted_id
-            except DuplicateKeyError:
-                existing_target = await feed_articles_collection.find_one(
-                    target_lookup,
-                    {"_id": 1},
-                )
-                target_article_id = (
-                    existing_target.get("_id")
-                    if isinstance(existing_target, dict)
-                    else None
+    now = utc_now()
+    move_operations: list[UpdateOne] = []
+    article_targets: dict[ObjectId, ObjectId] = {}
+    for article_id, identity in identities.items():
+        target_article_id = canonical_matches.get(identity) if identity is not None else None
+        if target_article_id is None:
+            # feed_moved_at lets every worker's search index catch-up pick up the new feed_id.
+            move_operations.append(
+                UpdateOne(
+                    {"_id": article_id},
+                    {"$set": {"feed_id": canonical_feed_id, "feed_moved_at": now}},
                 )
-        else:
-            target_article_id = target_article.get("_id")
+            )
+            if identity is not None:
+                # Later duplicates of the same article merge into this one.
+                canonical_matches[identity] = article_id
+            metrics.articles_moved += 1
+            continue
 
-        if isinstance(target_article_id, ObjectId):
-            await _merge_user_article_state(target_article_id, source_article_id)
+        article_targets[article_id] = target_article_id
+        metrics.articles_merged += 1
 
-        await feed_articles_collection.delete_one({"_id": source_article_id})
+    await _bulk_write_batches(feed_articles_collection, move_operations, ordered=False)
+    await _merge_user_article_states(article_targets, metrics)
+    if len(article_targets) > 0:
+        await feed_articles_collection.delete_many({"_id": {"$in": list(article_targets)}})
 
 
 async def _merge_duplicate_subscriptions(
     canonical_feed_id: ObjectId,
     duplicate_feed_ids: list[ObjectId],
+    metrics: FeedSourceConsolidationMetrics,
 ) -> None:
     """Repoint duplicate feed subscriptions to canonical feed, user-safe."""
 
@@ -1052,11 +1881,27 @@ async def _merge_duplicate_subscriptions(
         return
 
     now = utc_now()
-    cursor = user_feed_subscriptions_collection.find(
-        {"feed_id": {"$in": duplicate_feed_ids}}
-    ).sort([("updated_at", DESCENDING), ("_id", ASCENDING)])
+    duplicate_subs = [
+        dict(doc)
+        async for doc in user_feed_subscriptions_collection.find(
+            {"feed_id": {"$in": duplicate_feed_ids}}
+        ).sort([("updated_at", DESCENDING), ("_id", ASCENDING)])
+    ]
+    if len(duplicate_subs) == 0:
+        return
+
+    canonical_subs: dict[str, dict[str, Any]] = {
+        doc["user_id"]: dict(doc)
+        async for doc in user_feed_subscriptions_collection.find(
+            {
+                "feed_id": canonical_feed_id,
+                "user_id": {"$in": list({sub.get("user_id") for sub in duplicate_subs})},
+            }
+        )
+    }
 
-    async for sub_doc in cursor:
+    operations: list[UpdateOne | DeleteOne] = []
+    for sub_doc in duplicate_subs:
         sub_id = sub_doc.get("_id")
         user_id = sub_doc.get("user_id")
         category_id = sub_doc.get("category_id")
@@ -1064,23 +1909,16 @@ async def _merge_duplicate_subscriptions(
         if not isinstance(sub_id, ObjectId) or not isinstance(user_id, str):
             continue
 
-        canonical_sub = await user_feed_subscriptions_collection.find_one(
-            {
-                "user_id": user_id,
-                "feed_id": canonical_feed_id,
-            }
-        )
-
+        canonical_sub = canonical_subs.get(user_id)
         if canonical_sub is None:
-            await user_feed_subscriptions_collection.update_one(
-                {"_id": sub_id},
-                {
-                    "$set": {
-                        "feed_id": canonical_feed_id,
-                        "updated_at": now,
-                    }
-                },
+            operations.append(
+                UpdateOne(
+                    {"_id": sub_id},
+                    {"$set": {"feed_id": canonical_feed_id, "updated_at": now}},
+                )
             )
+            canonical_subs[user_id] = sub_doc
+            metrics.subscriptions_moved += 1
             continue
 
         incoming_updated = _updated_timestamp(sub_doc.get("updated_at"))
@@ -1091,25 +1929,32 @@ async def _merge_duplicate_subscriptions(
             and incoming_updated > canonical_updated
             and canonical_sub.get("category_id") != category_id
         ):
-            await user_feed_subscriptions_collection.update_one(
-                {"_id": canonical_sub["_id"]},
-                {
-                    "$set": {
-                        "category_id": category_id,
-                        "updated_at": now,
-                    }
-                },
+            operations.append(
+                UpdateOne(
+                    {"_id": canonical_sub["_id"]},
+                    {"$set": {"category_id": category_id, "updated_at": now}},
+                )
             )
+            canonical_sub["category_id"] = category_id
+
+        operations.append(DeleteOne({"_id": sub_id}))
+        metrics.subscriptions_merged += 1
 
-        await user_feed_subscriptions_collection.delete_one({"_id": sub_id})
+    await _bulk_write_batches(user_feed_subscriptions_collection, operations)
 
 
-async def consolidate_duplicate_feed_sources(normalized_url: str) -> dict[str, Any] | None:
+async def consolidate_duplicate_feed_sources(
+    normalized_url: str,
+    metrics: FeedSourceConsolidationMetrics | None = None,
+) -> dict[str, Any] | None:
     """Merge duplicate source docs for one normalized URL into a canonical source."""
 
-    if feed_sources_collection is None:
+    if feed_sources_collection is None or feed_articles_collection is None:
         return None
 
+    if metrics is None:
+        metrics = FeedSourceConsolidationMetrics()
+
     source_docs = [
         dict(doc)
         async for doc in feed_sources_collection.find(
@@ -1138,207 +1983,637 @@ async def consolidate_duplicate_feed_sources(normalized_url: str) -> dict[str, A
     if len(duplicate_source_ids) == 0:
         return canonical_source
 
-    await _merge_duplicate_subscriptions(canonical_source_id, duplicate_source_ids)
-    await _merge_duplicate_feed_articles(canonical_source_id, duplicate_source_ids)
-
-    await feed_sources_collection.delete_many({"_id": {"$in": duplicate_source_ids}})
+    metrics.duplicate_urls += 1
+    await _merge_duplicate_subscriptions(canonical_source_id, duplicate_source_ids, metrics)
+    await _merge_duplicate_feed_articles(canonical_source_id, duplicate_source_ids, metrics)
+    await drop_unread_counters({canonical_source_id, *duplicate_source_ids})
+    invalidate_all_category_counts_cache()
+
+    # Sources keep any article whose move lost a race with the backend worker;
+    # the next pass merges it and then removes the source.
+    remaining_feed_ids = set(
+        await feed_articles_collection.distinct(
+            "feed_id",
+            {"feed_id": {"$in": duplicate_source_ids}},
+        )
+    )
+    removable_source_ids = [
+        source_id for source_id in duplicate_source_ids if source_id not in remaining_feed_ids
+    ]
+    if len(removable_source_ids) > 0:
+        delete_result = await feed_sources_collection.delete_many({"_id": {"$in": removable_source_ids}})
+        metrics.sources_removed += int(delete_result.deleted_count)
 
     refreshed = await feed_sources_collection.find_one({"_id": canonical_source_id})
     return dict(refreshed) if refreshed is not None else canonical_source
 
 
-async def opportunistic_consolidate_duplicate_sources(max_urls: int = 2) -> None:
-    """Consolidate a small batch of duplicate normalized URLs.
+async def ensure_feed_source_indexes() -> bool:
+    """Create the unique ``normalized_url`` index once no duplicates remain.
 
-    This is intentionally bounded so request-path healing remains lightweight.
+    Returns False while duplicate sources still block the unique index; the
+    consolidation service retries after each pass.
     """
 
-    if feed_sources_collection is None or max_urls <= 0:
-        return
+    global _feed_source_unique_index_ready
 
-    pipeline: list[dict[str, Any]] = [
-        {
-            "$group": {
-                "_id": "$normalized_url",
-                "count": {"$sum": 1},
-            }
-        },
-        {
-            "$match": {
-                "_id": {"$type": "string"},
-                "count": {"$gt": 1},
-            }
-        },
-        {"$limit": int(max_urls)},
-    ]
+    if feed_sources_collection is None:
+        logging.error("No DB connection")
+        return False
 
-    duplicate_rows = [doc async for doc in feed_sources_collection.aggregate(pipeline)]
+    if _feed_source_unique_index_ready:
+        return True
 
-    for row in duplicate_rows:
-        normalized_url = row.get("_id")
-        if not isinstance(normalized_url, str) or normalized_url.strip() == "":
-            continue
-        await consolidate_duplicate_feed_sources(normalized_url.strip())
+    index_info = await feed_sources_collection.index_information()
+    for meta in index_info.values():
+        if meta.get("unique") and list(meta.get("key", [])) == [("normalized_url", 1)]:
+            _feed_source_unique_index_ready = True
+            return True
 
+    try:
+        await feed_sources_collection.create_index(
+            [("normalized_url", ASCENDING)],
+            name="feed_source_normalized_url_unique",
+            unique=True,
+        )
+    except Exception as ex:
+        logging.warning("Unable to create unique feed source URL index: %s", ex)
+        return False
 
-async def ensure_category(user_id: str, category_name: str) -> tuple[FeedCategoryDocument, bool]:
-    """Ensure a user category exists and return the document and creation flag."""
+    _feed_source_unique_index_ready = True
+    return True
 
-    if feed_categories_collection is None:
-        raise RuntimeError("Feed categories collection is not available.")
 
-    trimmed_name = category_name.strip()
-    if trimmed_name == "":
-        raise ValueError("Category name is required.")
+async def _acquire_feed_maintenance_lease(marker_id: str, lease: timedelta, now: datetime) -> bool:
+    """Claim a cross-worker maintenance lease in ``feed_maintenance_state``."""
 
-    existing_doc = await feed_categories_collection.find_one(
-        {"user_id": user_id, "name": trimmed_name}
-    )
-    if existing_doc is not None:
-        return FeedCategoryDocument.model_validate(existing_doc), False
+    if feed_maintenance_state_collection is None:
+        return False
 
-    max_sort_doc = await feed_categories_collection.find_one(
-        {"user_id": user_id}, sort=[("sort_order", DESCENDING)]
-    )
-    next_sort_order = int(max_sort_doc.get("sort_order", -1)) + 1 if max_sort_doc else 0
+    try:
+        await feed_maintenance_state_collection.find_one_and_update(
+            {
+                "_id": marker_id,
+                "$or": [
+                    {"lease_until": None},
+                    {"lease_until": {"$lt": now}},
+                ],
+            },
+            {"$set": {"lease_until": now + lease}},
+            upsert=True,
+        )
+    except DuplicateKeyError:
+        return False
 
-    category_doc = FeedCategoryDocument(
-        user_id=user_id,
-        name=trimmed_name,
-        muted=False,
-        color_hex=deterministic_category_color(trimmed_name),
-        sort_order=next_sort_order,
-        created_at=utc_now(),
-        updated_at=utc_now(),
-    )
+    return True
 
-    insert_result = await feed_categories_collection.insert_one(
-        category_doc.model_dump(by_alias=True, exclude={"id"})
-    )
-    category_doc.id = insert_result.inserted_id
-    return category_doc, True
 
+async def run_feed_source_consolidation() -> FeedSourceConsolidationMetrics | None:
+    """Merge a bounded batch of duplicate sources and record pass metrics.
 
-async def ensure_feed_source(normalized_url: str, source_title: str) -> dict[str, Any]:
-    """Ensure a deduplicated source exists for a normalized URL."""
+    Only one worker runs a pass at a time. Returns None when another worker
+    holds the lease.
+    """
 
-    if feed_sources_collection is None:
-        raise RuntimeError("Feed sources collection is not available.")
+    if feed_sources_collection is None or feed_maintenance_state_collection is None:
+        return None
 
-    existing_doc = await consolidate_duplicate_feed_sources(normalized_url)
-    if existing_doc is not None:
-        existing = dict(existing_doc)
+    started_at = utc_now()
+    if not await _acquire_feed_maintenance_lease(
+        FEED_SOURCE_CONSOLIDATION_MARKER_ID,
+        FEED_SOURCE_CONSOLIDATION_LEASE,
+        started_at,
+    ):
+        return None
 
-        if source_title.strip() != "" and existing.get("title", "") != source_title.strip():
-            await feed_sources_collection.update_one(
-                {"_id": existing["_id"]},
-                {
-                    "$set": {
-                        "title": source_title.strip(),
-                        "updated_at": utc_now(),
-                    }
-                },
+    started = time.perf_counter()
+    metrics = FeedSourceConsolidationMetrics()
+    duplicate_rows: list[dict[str, Any]] = []
+    try:
+        duplicate_rows = [
+            row
+            async for row in feed_sources_collection.aggregate(
+                [
+                    {"$group": {"_id": "$normalized_url", "count": {"$sum": 1}}},
+                    {"$match": {"_id": {"$type": "string"}, "count": {"$gt": 1}}},
+                    {"$limit": FEED_SOURCE_CONSOLIDATION_MAX_URLS},
+                ]
             )
-            existing = {**existing, "title": source_title.strip()}
+        ]
 
-        return existing
+        for row in duplicate_rows:
+            normalized_url = row["_id"].strip()
+            if normalized_url != "":
+                await consolidate_duplicate_feed_sources(normalized_url, metrics)
+    finally:
+        metrics.elapsed_seconds = round(time.perf_counter() - started, 3)
+        await feed_maintenance_state_collection.update_one(
+            {"_id": FEED_SOURCE_CONSOLIDATION_MARKER_ID},
+            {
+                "$set": {
+                    "last_run_at": started_at,
+                    "last_run": asdict(metrics),
+                    "lease_until": None,
+                },
+                "$inc": {
+                    f"totals.{field}": value
+                    for field, value in asdict(metrics).items()
+                },
+            },
+        )
 
-    new_source = {
-        "normalized_url": normalized_url,
-        "title": source_title.strip() or normalized_url,
-        "image_url": None,
-        "etag": None,
-        "last_modified": None,
-        "last_fetched_at": None,
-        "next_refresh_at": None,
-        "refresh_interval_seconds": None,
-        "fetch_status": "new",
-        "last_error": None,
-        "next_retry_at": None,
-        "force_refresh_requested_at": None,
-        "created_at": utc_now(),
-        "updated_at": utc_now(),
-    }
-    try:
-        result = await feed_sources_collection.insert_one(new_source)
-        new_source["_id"] = result.inserted_id
-    except DuplicateKeyError:
-        pass
+    if len(duplicate_rows) < FEED_SOURCE_CONSOLIDATION_MAX_URLS:
+        await ensure_feed_source_indexes()
 
-    existing_after_insert = await consolidate_duplicate_feed_sources(normalized_url)
-    if existing_after_insert is not None:
-        existing = dict(existing_after_insert)
+    return metrics
 
-        if source_title.strip() != "" and existing.get("title", "") != source_title.strip():
-            await feed_sources_collection.update_one(
-                {"_id": existing["_id"]},
-                {
-                    "$set": {
-                        "title": source_title.strip(),
-                        "updated_at": utc_now(),
-                    }
-                },
-            )
-            existing = {**existing, "title": source_title.strip()}
 
-        return existing
+async def get_feed_source_consolidation_status() -> FeedSourceConsolidationStatus:
+    """Return the last consolidation pass and lifetime totals for admins."""
 
-    raise RuntimeError("Unable to ensure feed source document.")
+    if feed_maintenance_state_collection is None:
+        raise RuntimeError("Feed maintenance state collection is not available.")
 
+    marker = await feed_maintenance_state_collection.find_one(
+        {"_id": FEED_SOURCE_CONSOLIDATION_MARKER_ID}
+    )
+    marker = marker or {}
+    return FeedSourceConsolidationStatus(
+        last_run_at=marker.get("last_run_at"),
+        last_run=FeedSourceConsolidationCounts.model_validate(marker.get("last_run") or {}),
+        totals=FeedSourceConsolidationCounts.model_validate(marker.get("totals") or {}),
+        unique_url_index_ready=_feed_source_unique_index_ready,
+    )
 
-async def request_immediate_feed_refresh(feed_ids: set[ObjectId]) -> None:
-    """Flag sources for an immediate backend refresh cycle.
 
-    This sets a force-refresh marker consumed by the backend worker and clears
-    retry deferrals so newly-added/imported subscriptions are fetched quickly.
-    """
+async def _feed_source_consolidation_loop() -> None:
+    while True:
+        try:
+            await run_feed_source_consolidation()
+        except Exception as exc:  # noqa: BLE001
+            logging.warning(f"Feed source consolidation failed: {exc}")
+        await asyncio.sleep(FEED_SOURCE_CONSOLIDATION_INTERVAL.total_seconds())
 
-    if feed_sources_collection is None or len(feed_ids) == 0:
-        return
 
-    now = utc_now()
-    await feed_sources_collection.update_many(
-        {"_id": {"$in": list(feed_ids)}},
-        {
-            "$set": {
-                "force_refresh_requested_at": now,
-                "next_retry_at": None,
-                "next_refresh_at": now,
-                "updated_at": now,
-            }
-        },
-    )
+async def start_feed_source_consolidation() -> None:
+    global _feed_source_consolidation_task
 
+    if _feed_source_consolidation_task is None or _feed_source_consolidation_task.done():
+        _feed_source_consolidation_task = asyncio.create_task(
+            _feed_source_consolidation_loop(),
+            name="feeds-source-consolidation",
+        )
 
-async def create_or_update_subscription(
-    user_id: str,
-    normalized_url: str,
-    source_title: str,
-    category_name: str,
-    duplicate_policy: str = "skip",
-) -> tuple[dict[str, Any], bool]:
-    """Create or update a subscription for a user.
 
-    Returns:
-        Tuple of subscription document and whether a new subscription was created.
-    """
+async def stop_feed_source_consolidation() -> None:
+    global _feed_source_consolidation_task
 
-    if user_feed_subscriptions_collection is None:
-        raise RuntimeError("Feed subscriptions collection is not available.")
+    task = _feed_source_consolidation_task
+    _feed_source_consolidation_task = None
+    if task is None:
+        return
 
-    category_doc, _ = await ensure_category(user_id, category_name)
-    source_doc = await ensure_feed_source(normalized_url, source_title)
+    task.cancel()
+    try:
+        await task
+    except asyncio.CancelledError:
+        pass
 
-    existing_doc = await user_feed_subscriptions_collection.find_one(
-        {"user_id": user_id, "feed_id": source_doc["_id"]}
-    )
 
-    if existing_doc is not None:
-        existing = dict(existing_doc)
+@dataclass
+class FeedArticleArchiveMetrics:
+    """Counters for one archival pass (also the shape of the lifetime totals)."""
 
-        if duplicate_policy == "refresh" and existing.get("category_id") != category_doc.id:
-            await user_feed_subscriptions_collection.update_one(
-                {"_id": existing["_id"]},
+    articles_archived: int = 0
+    body_bytes_removed: int = 0
+    archived_body_bytes: int = 0
+    orphans_removed: int = 0
+    elapsed_seconds: float = 0.0
+
+
+def _compress_article_body(summary_html: str) -> bytes:
+    return zlib.compress(summary_html.encode("utf-8"), 6)
+
+
+def _decompress_article_body(value: Any) -> str | None:
+    if not isinstance(value, bytes | bytearray):
+        return None
+
+    try:
+        return zlib.decompress(bytes(value)).decode("utf-8")
+    except (zlib.error, UnicodeDecodeError):
+        return None
+
+
+def _build_archive_operations(
+    article_docs: list[dict[str, Any]],
+    archived_at: datetime,
+    metrics: FeedArticleArchiveMetrics,
+) -> tuple[list[UpdateOne], list[UpdateOne]]:
+    """Return ``(archive upserts, hot-collection stub updates)`` for one batch."""
+
+    archive_operations: list[UpdateOne] = []
+    stub_operations: list[UpdateOne] = []
+    for article_doc in article_docs:
+        article_id = article_doc["_id"]
+        archive_doc: dict[str, Any] = {
+            "feed_id": article_doc.get("feed_id"),
+            "published_at": article_doc.get("published_at"),
+            "fetched_at": article_doc.get("fetched_at"),
+            "deleted_at": article_doc.get("deleted_at"),
+            "archived_at": archived_at,
+        }
+        summary_html = article_doc.get("summary_html")
+        if isinstance(summary_html, str) and summary_html != "":
+            metrics.body_bytes_removed += len(summary_html.encode("utf-8"))
+            if FEED_ARTICLE_ARCHIVE_KEEP_BODIES:
+                compressed = _compress_article_body(summary_html)
+                metrics.archived_body_bytes += len(compressed)
+                archive_doc["summary_z"] = Binary(compressed)
+
+        archive_operations.append(UpdateOne({"_id": article_id}, {"$set": archive_doc}, upsert=True))
+        stub_operations.append(
+            UpdateOne(
+                {"_id": article_id, "archived_at": {"$exists": False}},
+                {"$set": {"archived_at": archived_at}, "$unset": {"summary_html": ""}},
+            )
+        )
+
+    return archive_operations, stub_operations
+
+
+async def _sweep_feed_article_archive(metrics: FeedArticleArchiveMetrics) -> None:
+    """Drop archive rows whose hot stub the retention worker has purged."""
+
+    if feed_article_archive_collection is None or feed_articles_collection is None:
+        return
+
+    last_id: ObjectId | None = None
+    while True:
+        archive_filter: dict[str, Any] = {} if last_id is None else {"_id": {"$gt": last_id}}
+        archive_ids = [
+            doc["_id"]
+            async for doc in feed_article_archive_collection.find(archive_filter, {"_id": 1})
+            .sort("_id", ASCENDING)
+            .limit(FEED_ARTICLE_ARCHIVE_BATCH_SIZE)
+        ]
+        if len(archive_ids) == 0:
+            return
+
+        live_ids = {
+            doc["_id"]
+            async for doc in feed_articles_collection.find({"_id": {"$in": archive_ids}}, {"_id": 1})
+        }
+        orphan_ids = [article_id for article_id in archive_ids if article_id not in live_ids]
+        if len(orphan_ids) > 0:
+            result = await feed_article_archive_collection.delete_many({"_id": {"$in": orphan_ids}})
+            metrics.orphans_removed += int(result.deleted_count)
+
+        last_id = archive_ids[-1]
+
+
+async def run_feed_article_archival() -> FeedArticleArchiveMetrics | None:
+    """Move bodies of soft-deleted articles into ``feed_article_archive``.
+
+    Soft-deleted articles older than :data:`FEED_ARTICLE_ARCHIVE_GRACE` keep a
+    slim stub in ``feed_articles`` (identity, feed, dates and state flags) so
+    the ingest worker's dedupe and hard-purge rules see them unchanged, while
+    the ``summary_html`` body moves to the archive, zlib-compressed. Once a day
+    the pass also drops archive rows whose stub has been purged. Only one
+    worker runs a pass at a time; returns None when another holds the lease.
+    """
+
+    if (
+        feed_articles_collection is None
+        or feed_article_archive_collection is None
+        or feed_maintenance_state_collection is None
+    ):
+        return None
+
+    started_at = utc_now()
+    if not await _acquire_feed_maintenance_lease(
+        FEED_ARTICLE_ARCHIVE_MARKER_ID,
+        FEED_ARTICLE_ARCHIVE_LEASE,
+        started_at,
+    ):
+        return None
+
+    started = time.perf_counter()
+    metrics = FeedArticleArchiveMetrics()
+    marker = await feed_maintenance_state_collection.find_one(
+        {"_id": FEED_ARTICLE_ARCHIVE_MARKER_ID},
+        {"last_sweep_at": 1},
+    )
+    last_sweep_at = _as_utc_datetime((marker or {}).get("last_sweep_at"))
+    swept = False
+
+    try:
+        for _ in range(FEED_ARTICLE_ARCHIVE_MAX_BATCHES):
+            article_docs = [
+                doc
+                async for doc in feed_articles_collection.find(
+                    {
+                        "is_deleted": True,
+                        "deleted_at": {"$lt": started_at - FEED_ARTICLE_ARCHIVE_GRACE},
+                        "archived_at": {"$exists": False},
+                    },
+                    {
+                        "feed_id": 1,
+                        "published_at": 1,
+                        "fetched_at": 1,
+                        "deleted_at": 1,
+                        "summary_html": 1,
+                    },
+                ).limit(FEED_ARTICLE_ARCHIVE_BATCH_SIZE)
+            ]
+            if len(article_docs) == 0:
+                break
+
+            archive_operations, stub_operations = await asyncio.to_thread(
+                _build_archive_operations,
+                article_docs,
+                started_at,
+                metrics,
+            )
+            # Write the archive first so a body is never dropped before it is stored.
+            await _bulk_upsert(feed_article_archive_collection, archive_operations)
+            await feed_articles_collection.bulk_write(stub_operations, ordered=False)
+            metrics.articles_archived += len(article_docs)
+
+        if last_sweep_at is None or started_at - last_sweep_at >= FEED_ARTICLE_ARCHIVE_SWEEP_INTERVAL:
+            await _sweep_feed_article_archive(metrics)
+            swept = True
+    finally:
+        metrics.elapsed_seconds = round(time.perf_counter() - started, 3)
+        marker_set: dict[str, Any] = {
+            "last_run_at": started_at,
+            "last_run": asdict(metrics),
+            "lease_until": None,
+        }
+        if swept:
+            marker_set["last_sweep_at"] = started_at
+        await feed_maintenance_state_collection.update_one(
+            {"_id": FEED_ARTICLE_ARCHIVE_MARKER_ID},
+            {
+                "$set": marker_set,
+                "$inc": {
+                    f"totals.{field}": value
+                    for field, value in asdict(metrics).items()
+                },
+            },
+        )
+
+    return metrics
+
+
+@profiled
+async def hydrate_archived_article_bodies(article_docs: list[dict[str, Any]]) -> None:
+    """Restore archived ``summary_html`` bodies onto article documents in place.
+
+    Only documents carrying ``archived_at`` without a body are looked up, in a
+    single ``$in`` query, so listings of live articles pay nothing.
+    """
+
+    if feed_article_archive_collection is None:
+        return
+
+    pending = {
+        doc["_id"]: doc
+        for doc in article_docs
+        if doc.get("archived_at") is not None
+        and doc.get("summary_html") is None
+        and isinstance(doc.get("_id"), ObjectId)
+    }
+    if len(pending) == 0:
+        return
+
+    async for archive_doc in feed_article_archive_collection.find(
+        {"_id": {"$in": list(pending)}},
+        {"summary_z": 1},
+    ):
+        body = _decompress_article_body(archive_doc.get("summary_z"))
+        if body is not None:
+            pending[archive_doc["_id"]]["summary_html"] = body
+
+
+async def get_feed_article_archive_status() -> FeedArticleArchiveStatus:
+    """Return the last archival pass and lifetime totals for admins."""
+
+    if feed_maintenance_state_collection is None:
+        raise RuntimeError("Feed maintenance state collection is not available.")
+
+    marker = await feed_maintenance_state_collection.find_one({"_id": FEED_ARTICLE_ARCHIVE_MARKER_ID})
+    marker = marker or {}
+    return FeedArticleArchiveStatus(
+        last_run_at=marker.get("last_run_at"),
+        last_sweep_at=marker.get("last_sweep_at"),
+        last_run=FeedArticleArchiveCounts.model_validate(marker.get("last_run") or {}),
+        totals=FeedArticleArchiveCounts.model_validate(marker.get("totals") or {}),
+    )
+
+
+async def _feed_article_archive_loop() -> None:
+    while True:
+        try:
+            await run_feed_article_archival()
+        except Exception as exc:  # noqa: BLE001
+            logging.warning(f"Feed article archival failed: {exc}")
+        await asyncio.sleep(FEED_ARTICLE_ARCHIVE_INTERVAL.total_seconds())
+
+
+async def start_feed_article_archival() -> None:
+    global _feed_article_archive_task
+
+    if _feed_article_archive_task is None or _feed_article_archive_task.done():
+        _feed_article_archive_task = asyncio.create_task(
+            _feed_article_archive_loop(),
+            name="feeds-article-archive",
+        )
+
+
+async def stop_feed_article_archival() -> None:
+    global _feed_article_archive_task
+
+    task = _feed_article_archive_task
+    _feed_article_archive_task = None
+    if task is None:
+        return
+
+    task.cancel()
+    try:
+        await task
+    except asyncio.CancelledError:
+        pass
+
+
+async def ensure_category(user_id: str, category_name: str) -> tuple[FeedCategoryDocument, bool]:
+    """Ensure a user category exists and return the document and creation flag."""
+
+    if feed_categories_collection is None:
+        raise RuntimeError("Feed categories collection is not available.")
+
+    trimmed_name = category_name.strip()
+    if trimmed_name == "":
+        raise ValueError("Category name is required.")
+
+    existing_doc = await feed_categories_collection.find_one(
+        {"user_id": user_id, "name": trimmed_name}
+    )
+    if existing_doc is not None:
+        return FeedCategoryDocument.model_validate(existing_doc), False
+
+    max_sort_doc = await feed_categories_collection.find_one(
+        {"user_id": user_id}, sort=[("sort_order", DESCENDING)]
+    )
+    next_sort_order = int(max_sort_doc.get("sort_order", -1)) + 1 if max_sort_doc else 0
+
+    category_doc = FeedCategoryDocument(
+        user_id=user_id,
+        name=trimmed_name,
+        muted=False,
+        color_hex=deterministic_category_color(trimmed_name),
+        sort_order=next_sort_order,
+        created_at=utc_now(),
+        updated_at=utc_now(),
+    )
+
+    insert_result = await feed_categories_collection.insert_one(
+        category_doc.model_dump(by_alias=True, exclude={"id"})
+    )
+    category_doc.id = insert_result.inserted_id
+    return category_doc, True
+
+
+def _new_feed_source_document(
+    normalized_url: str,
+    source_title: str,
+    now: datetime,
+) -> dict[str, Any]:
+    """Return the initial document for a source the backend has not fetched yet."""
+
+    return {
+        "normalized_url": normalized_url,
+        "title": source_title.strip() or normalized_url,
+        "image_url": None,
+        "etag": None,
+        "last_modified": None,
+        "last_fetched_at": None,
+        "next_refresh_at": None,
+        "refresh_interval_seconds": None,
+        "fetch_status": "new",
+        "last_error": None,
+        "next_retry_at": None,
+        "force_refresh_requested_at": None,
+        "created_at": now,
+        "updated_at": now,
+    }
+
+
+async def _find_canonical_feed_source(normalized_url: str) -> dict[str, Any] | None:
+    """Return the oldest source for a normalized URL.
+
+    Any duplicates created before the unique URL index existed are merged into
+    this source by the background consolidation service.
+    """
+
+    if feed_sources_collection is None:
+        return None
+
+    async for doc in feed_sources_collection.find({"normalized_url": normalized_url}).sort(
+        [("created_at", ASCENDING), ("_id", ASCENDING)]
+    ).limit(1):
+        return dict(doc)
+
+    return None
+
+
+async def ensure_feed_source(normalized_url: str, source_title: str) -> dict[str, Any]:
+    """Ensure a deduplicated source exists for a normalized URL."""
+
+    if feed_sources_collection is None:
+        raise RuntimeError("Feed sources collection is not available.")
+
+    existing_doc = await _find_canonical_feed_source(normalized_url)
+    if existing_doc is None:
+        new_source = _new_feed_source_document(normalized_url, source_title, utc_now())
+        try:
+            await feed_sources_collection.insert_one(new_source)
+        except DuplicateKeyError:
+            pass
+
+        existing_doc = await _find_canonical_feed_source(normalized_url)
+        if existing_doc is None:
+            raise RuntimeError("Unable to ensure feed source document.")
+
+    existing = dict(existing_doc)
+    if source_title.strip() != "" and existing.get("title", "") != source_title.strip():
+        await feed_sources_collection.update_one(
+            {"_id": existing["_id"]},
+            {
+                "$set": {
+                    "title": source_title.strip(),
+                    "updated_at": utc_now(),
+                }
+            },
+        )
+        existing = {**existing, "title": source_title.strip()}
+
+    return existing
+
+
+async def request_immediate_feed_refresh(feed_ids: set[ObjectId]) -> None:
+    """Flag sources for an immediate backend refresh cycle.
+
+    This sets a force-refresh marker consumed by the backend worker and clears
+    retry deferrals so newly-added/imported subscriptions are fetched quickly.
+    """
+
+    if feed_sources_collection is None or len(feed_ids) == 0:
+        return
+
+    now = utc_now()
+    await feed_sources_collection.update_many(
+        {"_id": {"$in": list(feed_ids)}},
+        {
+            "$set": {
+                "force_refresh_requested_at": now,
+                "next_retry_at": None,
+                "next_refresh_at": now,
+                "updated_at": now,
+            }
+        },
+    )
+
+
+async def create_or_update_subscription(
+    user_id: str,
+    normalized_url: str,
+    source_title: str,
+    category_name: str,
+    duplicate_policy: str = "skip",
+) -> tuple[dict[str, Any], bool]:
+    """Create or update a subscription for a user.
+
+    Returns:
+        Tuple of subscription document and whether a new subscription was created.
+    """
+
+    if user_feed_subscriptions_collection is None:
+        raise RuntimeError("Feed subscriptions collection is not available.")
+
+    category_doc, _ = await ensure_category(user_id, category_name)
+    source_doc = await ensure_feed_source(normalized_url, source_title)
+
+    existing_doc = await user_feed_subscriptions_collection.find_one(
+        {"user_id": user_id, "feed_id": source_doc["_id"]}
+    )
+
+    if existing_doc is not None:
+        existing = dict(existing_doc)
+
+        if duplicate_policy == "refresh" and existing.get("category_id") != category_doc.id:
+            await user_feed_subscriptions_collection.update_one(
+                {"_id": existing["_id"]},
                 {
                     "$set": {
                         "category_id": category_doc.id,
@@ -1542,6 +2817,9 @@ async def update_subscription_details(
     if refresh_source and isinstance(source_id, ObjectId):
         await request_immediate_feed_refresh({source_id})
 
+    if isinstance(existing_feed_id, ObjectId) and existing_feed_id != source_id:
+        await drop_unread_counters({existing_feed_id}, user_id=user_id)
+
     if updated_subscription is not None:
         invalidate_category_counts_cache(user_id)
     return dict(updated_subscription) if updated_subscription is not None else None
@@ -1558,12 +2836,19 @@ async def delete_subscription(user_id: str, subscription_id: str) -> bool:
     except Exception:
         return False
 
-    result = await user_feed_subscriptions_collection.delete_one(
-        {"_id": subscription_object_id, "user_id": user_id}
+    deleted_subscription = await user_feed_subscriptions_collection.find_one_and_delete(
+        {"_id": subscription_object_id, "user_id": user_id},
+        projection={"feed_id": 1},
     )
-    if result.deleted_count > 0:
-        invalidate_category_counts_cache(user_id)
-    return result.deleted_count > 0
+    if deleted_subscription is None:
+        return False
+
+    feed_id = deleted_subscription.get("feed_id")
+    if isinstance(feed_id, ObjectId):
+        await drop_unread_counters({feed_id}, user_id=user_id)
+
+    invalidate_category_counts_cache(user_id)
+    return True
 
 
 async def list_category_documents(user_id: str) -> list[FeedCategoryDocument]:
@@ -1654,325 +2939,1020 @@ async def load_sources_map(feed_ids: set[ObjectId]) -> dict[ObjectId, dict[str,
     return source_map
 
 
-def resolve_head_probe_limit(page_size: int) -> int:
-    """Return the capped article-window size used for reader head probes."""
+async def resolve_sources_map(
+    source_ids: set[ObjectId],
+    preloaded_sources_map: dict[ObjectId, dict[str, Any]] | None = None,
+) -> dict[ObjectId, dict[str, Any]]:
+    """Return sources for *source_ids*, only querying those not already preloaded."""
 
-    normalized_page_size = max(1, int(page_size))
-    return min(max(normalized_page_size * 2, normalized_page_size), HEAD_PROBE_MAX_LIMIT)
+    if preloaded_sources_map is None:
+        return await load_sources_map(source_ids)
 
+    missing_source_ids = {
+        source_id for source_id in source_ids if source_id not in preloaded_sources_map
+    }
+    if len(missing_source_ids) == 0:
+        return preloaded_sources_map
 
-def invalidate_category_counts_cache(user_id: str) -> None:
-    """Drop cached sidebar category counts for a user."""
+    return {**preloaded_sources_map, **await load_sources_map(missing_source_ids)}
 
-    _category_counts_cache.pop(user_id, None)
 
+@dataclass
+class ReaderScope:
+    """Request-scoped snapshot of the reader data shared by one sync pass.
 
-async def build_categories_with_counts(
-    user_id: str,
-    categories: list[FeedCategoryDocument],
-    subscriptions: list[dict[str, Any]],
-    read_state_ids: set[ObjectId],
-) -> FeedCategoryListResponse:
-    """Build sidebar categories and unread counters from preloaded scope data."""
+    Each collection is read once while the scope is built; helpers that accept
+    preloaded values reuse it instead of re-querying the same documents.
+    """
 
-    if user_feed_subscriptions_collection is None:
-        return FeedCategoryListResponse(
-            all_unread_count=0,
-            recently_read_count=0,
-            saved_count=0,
-            categories=[],
+    user_id: str
+    categories: list[FeedCategoryDocument]
+    subscriptions: list[dict[str, Any]]
+    sources_map: dict[ObjectId, dict[str, Any]]
+    unread_counters: dict[ObjectId, int]
+
+    @property
+    def feed_ids(self) -> list[ObjectId]:
+        return list(
+            dict.fromkeys(
+                sub["feed_id"]
+                for sub in self.subscriptions
+                if isinstance(sub.get("feed_id"), ObjectId)
+            )
         )
 
-    feed_to_category = {
-        sub["feed_id"]: sub["category_id"] for sub in subscriptions if "feed_id" in sub and "category_id" in sub
-    }
+    @property
+    def categories_map(self) -> dict[ObjectId, FeedCategoryDocument]:
+        return {
+            category.id: category for category in self.categories if category.id is not None
+        }
 
-    category_summaries: list[FeedCategorySummary] = []
-    all_unread_count = 0
 
-    for category in categories:
-        category_feed_ids = [
-            feed_id
-            for feed_id, category_id in feed_to_category.items()
-            if category.id is not None and category_id == category.id
-        ]
-        unread_count = await count_unread_articles_for_feed_ids(category_feed_ids, read_state_ids)
-
-        if not category.muted:
-            all_unread_count += unread_count
-
-        if category.id is None:
-            continue
+@profiled
+async def load_reader_scope(user_id: str) -> ReaderScope:
+    """Load the categories, subscriptions, sources and unread counters for a user."""
 
-        category_summaries.append(
-            FeedCategorySummary(
-                category_id=str(category.id),
-                name=category.name,
-                unread_count=unread_count,
-                muted=category.muted,
-                color_hex=category.color_hex,
-                sort_order=category.sort_order,
-            )
+    categories, subscriptions = await asyncio.gather(
+        list_category_documents(user_id),
+        list_user_subscription_docs(user_id),
+    )
+    feed_ids = list(
+        dict.fromkeys(
+            sub["feed_id"]
+            for sub in subscriptions
+            if isinstance(sub.get("feed_id"), ObjectId)
         )
+    )
+    sources_map = await load_sources_map(set(feed_ids))
+    unread_counters = await load_unread_counters(
+        user_id,
+        feed_ids,
+        preloaded_sources_map=sources_map,
+    )
 
-    recently_read_count = await count_recently_read(user_id, feed_to_category, categories)
-    saved_count = await count_saved_articles(user_id, feed_to_category)
-
-    return FeedCategoryListResponse(
-        all_unread_count=all_unread_count,
-        recently_read_count=recently_read_count,
-        saved_count=saved_count,
-        categories=category_summaries,
+    return ReaderScope(
+        user_id=user_id,
+        categories=categories,
+        subscriptions=subscriptions,
+        sources_map=sources_map,
+        unread_counters=unread_counters,
     )
 
 
-async def get_categories_with_counts(user_id: str) -> FeedCategoryListResponse:
-    """Return sidebar categories and unread counters for a user."""
+def resolve_head_probe_limit(page_size: int) -> int:
+    """Return the capped article-window size used for reader head probes."""
 
-    now = utc_now()
-    cached_entry = _category_counts_cache.get(user_id)
-    if (
-        cached_entry is not None
-        and now - cached_entry[0] <= CATEGORY_COUNTS_CACHE_TTL
-    ):
-        return cached_entry[1]
+    normalized_page_size = max(1, int(page_size))
+    return min(max(normalized_page_size * 2, normalized_page_size), HEAD_PROBE_MAX_LIMIT)
 
-    categories = await list_category_documents(user_id)
-    subscriptions = await list_user_subscription_docs(user_id)
-    read_state_ids = await get_read_article_id_set(user_id)
-    payload = await build_categories_with_counts(
-        user_id,
-        categories,
-        subscriptions,
-        read_state_ids,
-    )
-    _category_counts_cache[user_id] = (now, payload)
-    return payload
 
+def _apply_category_counts_invalidation(user_id: str | None) -> None:
+    """Apply an invalidation received from another worker."""
 
-async def get_read_article_id_set(user_id: str) -> set[ObjectId]:
-    """Return article IDs that are marked as read for the user."""
+    if user_id is None:
+        _category_counts_cache.clear()
+    else:
+        _category_counts_cache.invalidate(user_id)
+    reader_event_bus.notify(user_id)
 
-    if user_article_states_collection is None:
-        return set()
 
-    cursor = user_article_states_collection.find(
-        {"user_id": user_id, "is_read": True}, {"article_id": 1}
-    )
-    return {doc["article_id"] async for doc in cursor if "article_id" in doc}
+_category_counts_invalidations = CacheInvalidationChannel(
+    "category_counts",
+    _apply_category_counts_invalidation,
+)
 
 
-async def get_read_article_visibility_sets(
-    user_id: str,
-) -> tuple[set[ObjectId], set[ObjectId]]:
-    """Return article IDs split into recent-read and expired-read sets."""
+async def start_category_counts_invalidation_listener() -> None:
+    await _category_counts_invalidations.start()
 
-    if user_article_states_collection is None:
-        return set(), set()
 
-    now = utc_now()
-    recent_read_ids: set[ObjectId] = set()
-    expired_read_ids: set[ObjectId] = set()
+async def stop_category_counts_invalidation_listener() -> None:
+    await _category_counts_invalidations.stop()
 
-    cursor = user_article_states_collection.find(
-        {"user_id": user_id, "is_read": True},
-        {"article_id": 1, "read_at": 1},
-    )
 
-    async for doc in cursor:
-        article_id = doc.get("article_id")
-        if not isinstance(article_id, ObjectId):
-            continue
+def invalidate_category_counts_cache(user_id: str) -> None:
+    """Drop cached sidebar category counts for a user on every worker."""
 
-        if is_read_within_visibility_window(doc.get("read_at"), reference_time=now):
-            recent_read_ids.add(article_id)
-        else:
-            expired_read_ids.add(article_id)
+    _category_counts_cache.invalidate(user_id)
+    _category_counts_invalidations.publish(user_id)
+    reader_event_bus.notify(user_id)
 
-    return recent_read_ids, expired_read_ids
 
+def invalidate_all_category_counts_cache() -> None:
+    """Drop cached sidebar category counts for all users on every worker."""
 
-async def get_saved_article_id_set(
-    user_id: str,
-) -> set[ObjectId]:
-    """Return article IDs that are marked as saved for the user."""
+    _category_counts_cache.clear()
+    _category_counts_invalidations.publish(None)
+    reader_event_bus.notify(None)
 
-    if user_article_states_collection is None:
-        return set()
-    cursor = user_article_states_collection.find(
-        {"user_id": user_id, "is_saved": True},
-        {"article_id": 1},
+
+async def _latest_feed_source_fetch_at() -> datetime | None:
+    if feed_sources_collection is None:
+        return None
+
+    latest = await feed_sources_collection.find_one(
+        {"last_fetched_at": {"$ne": None}},
+        {"last_fetched_at": 1},
+        sort=[("last_fetched_at", DESCENDING)],
     )
-    return {doc["article_id"] async for doc in cursor if "article_id" in doc}
+    return _as_utc_datetime(latest.get("last_fetched_at")) if latest is not None else None
 
 
-async def count_saved_articles(
-    user_id: str,
-    feed_to_category: dict[ObjectId, ObjectId],
-) -> int:
-    """Count saved articles for feeds the user is subscribed to."""
+async def poll_feed_ingest_changes() -> list[ObjectId]:
+    """Refresh subscribers of feeds fetched since the last poll.
 
-    if feed_articles_collection is None:
-        return 0
+    The backend ingest worker writes articles and ``last_fetched_at`` but does
+    not publish invalidations, so every web worker watches
+    ``feed_sources.last_fetched_at`` itself. Each subscriber's cached sidebar
+    counts are dropped and their open reader push streams are woken; stale
+    unread counters then reconcile against the new fetch marker on the next
+    read. Returns the feeds fetched since the previous poll.
+    """
 
-    feed_ids = list(feed_to_category.keys())
-    if len(feed_ids) == 0:
-        return 0
+    global _feed_ingest_marker, _feed_ingest_marker_ids
 
-    saved_article_ids = await get_saved_article_id_set(user_id)
-    if len(saved_article_ids) == 0:
-        return 0
+    if feed_sources_collection is None or user_feed_subscriptions_collection is None:
+        return []
 
-    return await feed_articles_collection.count_documents(
-        {
-            "_id": {"$in": list(saved_article_ids)},
-            "feed_id": {"$in": feed_ids},
-            "is_deleted": False,
+    if _feed_ingest_marker is None:
+        _feed_ingest_marker = await _latest_feed_source_fetch_at() or utc_now()
+        _feed_ingest_marker_ids = {
+            feed_id
+            for feed_id in await feed_sources_collection.distinct(
+                "_id",
+                {"last_fetched_at": _feed_ingest_marker},
+            )
+            if isinstance(feed_id, ObjectId)
         }
+        return []
+
+    fetched_feed_ids: list[ObjectId] = []
+    newest_marker = _feed_ingest_marker
+    newest_marker_ids = set(_feed_ingest_marker_ids)
+    async for doc in feed_sources_collection.find(
+        {"last_fetched_at": {"$gte": _feed_ingest_marker}},
+        {"last_fetched_at": 1},
+    ):
+        feed_id = doc.get("_id")
+        fetched_at = _as_utc_datetime(doc.get("last_fetched_at"))
+        if not isinstance(feed_id, ObjectId) or fetched_at is None:
+            continue
+        # Sources stamped exactly at the marker were handled by the previous poll.
+        if fetched_at == _feed_ingest_marker and feed_id in _feed_ingest_marker_ids:
+            continue
+
+        fetched_feed_ids.append(feed_id)
+        if fetched_at > newest_marker:
+            newest_marker = fetched_at
+            newest_marker_ids = {feed_id}
+        elif fetched_at == newest_marker:
+            newest_marker_ids.add(feed_id)
+
+    if len(fetched_feed_ids) == 0:
+        return []
+
+    _feed_ingest_marker = newest_marker
+    _feed_ingest_marker_ids = newest_marker_ids
+
+    subscriber_ids = await user_feed_subscriptions_collection.distinct(
+        "user_id",
+        {"feed_id": {"$in": fetched_feed_ids}},
     )
+    for subscriber_id in subscriber_ids:
+        if isinstance(subscriber_id, str):
+            _category_counts_cache.invalidate(subscriber_id)
+            reader_event_bus.notify(subscriber_id)
 
+    return fetched_feed_ids
 
-async def count_unread_articles_for_feed_ids(
-    feed_ids: list[ObjectId],
-    read_state_ids: set[ObjectId],
-) -> int:
-    """Count unread articles for a set of feeds."""
 
-    if feed_articles_collection is None or len(feed_ids) == 0:
-        return 0
+async def _feed_ingest_watch_loop() -> None:
+    while True:
+        try:
+            await poll_feed_ingest_changes()
+        except Exception as exc:  # noqa: BLE001
+            logging.warning(f"Feed ingest watch failed: {exc}")
+        await asyncio.sleep(FEED_INGEST_WATCH_INTERVAL.total_seconds())
 
-    query: dict[str, Any] = {
-        "feed_id": {"$in": feed_ids},
-        "is_deleted": False,
-    }
 
-    if len(read_state_ids) > 0:
-        query["_id"] = {"$nin": list(read_state_ids)}
+async def start_feed_ingest_watch() -> None:
+    global _feed_ingest_watch_task
 
-    return await feed_articles_collection.count_documents(query)
+    if _feed_ingest_watch_task is None or _feed_ingest_watch_task.done():
+        _feed_ingest_watch_task = asyncio.create_task(
+            _feed_ingest_watch_loop(),
+            name="feeds-ingest-watch",
+        )
 
 
-async def count_recently_read(
-    user_id: str,
-    feed_to_category: dict[ObjectId, ObjectId],
-    categories: list[FeedCategoryDocument],
-) -> int:
-    """Count recently-read articles in the last seven days."""
+async def stop_feed_ingest_watch() -> None:
+    global _feed_ingest_watch_task
 
-    if user_article_states_collection is None or feed_articles_collection is None:
-        return 0
+    task = _feed_ingest_watch_task
+    _feed_ingest_watch_task = None
+    if task is None:
+        return
 
-    muted_category_ids = {
-        category.id for category in categories if category.id is not None and category.muted
-    }
+    task.cancel()
+    try:
+        await task
+    except asyncio.CancelledError:
+        pass
 
-    threshold = recently_read_cutoff()
-    state_cursor = user_article_states_collection.find(
-        {
-            "user_id": user_id,
-            "is_read": True,
-            "read_at": {"$gte": threshold},
-        },
-        {"article_id": 1},
-    )
-    article_ids = [doc["article_id"] async for doc in state_cursor if "article_id" in doc]
 
-    if len(article_ids) == 0:
-        return 0
+def build_unread_article_join_stages(user_id: str) -> list[dict[str, Any]]:
+    """Return aggregation stages that drop articles the user has marked read.
 
-    article_cursor = feed_articles_collection.find(
+    The join probes ``user_article_states`` per candidate article through the
+    ``(user_id, article_id, is_read)`` index, so the user's read history is never
+    loaded into Python or shipped back to the server as an ``$nin`` list.
+    """
+
+    return [
         {
-            "_id": {"$in": article_ids},
+            "$lookup": {
+                "from": "user_article_states",
+                "localField": "_id",
+                "foreignField": "article_id",
+                "pipeline": [
+                    {"$match": {"user_id": user_id, "is_read": True}},
+                    {"$project": {"_id": 1}},
+                    {"$limit": 1},
+                ],
+                "as": "read_states",
+            }
         },
-        {"feed_id": 1},
-    )
+        {"$match": {"read_states.0": {"$exists": False}}},
+        {"$project": {"read_states": 0}},
+    ]
 
-    count = 0
-    async for article_doc in article_cursor:
-        feed_id = article_doc.get("feed_id")
-        if not isinstance(feed_id, ObjectId):
-            continue
 
-        category_id = feed_to_category.get(feed_id)
-        if category_id in muted_category_ids:
-            continue
-        count += 1
+def unread_counter_is_current(
+    counter_doc: UserFeedUnreadCounterDocument | None,
+    source_marker: datetime | None,
+    reference_time: datetime | None = None,
+) -> bool:
+    """Return whether a stored unread counter can be served without reconciling.
 
-    return count
+    A counter is stale when it is missing, when the feed has been fetched since
+    it was last reconciled, or when it is older than the reconcile interval so
+    that retention sweeps run outside this process are eventually picked up.
+    """
 
+    if counter_doc is None:
+        return False
 
-async def get_article_list(
+    if _as_utc_datetime(counter_doc.source_marker) != _as_utc_datetime(source_marker):
+        return False
+
+    reconciled_at = _as_utc_datetime(counter_doc.reconciled_at)
+    if reconciled_at is None:
+        return False
+
+    now = reference_time or utc_now()
+    return now - reconciled_at <= UNREAD_COUNTER_RECONCILE_INTERVAL
+
+
+async def count_unread_articles_by_feed(
     user_id: str,
-    category_filter: str,
-    status_filter: str,
-    feed_filter: str | None = None,
-    search_query: str | None = None,
-    require_search_query: bool = False,
-    offset: int = 0,
-    limit: int = 10,
-    ids_only: bool = False,
-    preloaded_categories: list[FeedCategoryDocument] | None = None,
-    preloaded_subscriptions: list[dict[str, Any]] | None = None,
-    preloaded_read_state_ids: set[ObjectId] | None = None,
-) -> FeedArticleListResponse:
-    """Return filtered article cards for the feed reader view."""
+    feed_ids: list[ObjectId],
+) -> dict[ObjectId, int]:
+    """Count unread articles per feed by joining read states in the database."""
 
-    normalized_offset = max(0, int(offset))
-    normalized_limit = max(1, int(limit))
-    normalized_search_query = normalize_article_search_query(search_query)
+    if feed_articles_collection is None or len(feed_ids) == 0:
+        return {}
 
-    normalized_status: Literal["unread", "read", "all"]
-    if status_filter in {"unread", "read", "all"}:
-        normalized_status = cast(Literal["unread", "read", "all"], status_filter)
-    else:
-        normalized_status = "unread"
+    pipeline: list[dict[str, Any]] = [
+        {
+            "$match": {
+                "feed_id": {"$in": feed_ids},
+                "is_deleted": False,
+            }
+        },
+        {"$project": {"_id": 1, "feed_id": 1}},
+        *build_unread_article_join_stages(user_id),
+        {"$group": {"_id": "$feed_id", "count": {"$sum": 1}}},
+    ]
 
-    if require_search_query and normalized_search_query == "":
-        response_status: Literal["unread", "read", "all"]
-        if category_filter == "recently-read":
-            response_status = "read"
-        elif category_filter == "saved":
-            response_status = "all"
-        else:
-            response_status = normalized_status
+    counts: dict[ObjectId, int] = {feed_id: 0 for feed_id in feed_ids}
+    async for row in feed_articles_collection.aggregate(pipeline):
+        feed_id = row.get("_id")
+        if isinstance(feed_id, ObjectId):
+            counts[feed_id] = int(row.get("count", 0))
 
-        return FeedArticleListResponse(
-            category=category_filter,
-            status=response_status,
-            articles=[],
-            article_ids=[],
-            offset=normalized_offset,
-            limit=normalized_limit,
-            has_more=False,
-            next_offset=normalized_offset,
-        )
+    return counts
 
-    use_text_search = False
-    if normalized_search_query != "":
-        use_text_search = await feed_articles_text_search_available()
 
-    newest_first = normalized_search_query != ""
+async def _load_unread_counter_docs(
+    user_id: str,
+    feed_ids: list[ObjectId],
+) -> dict[ObjectId, UserFeedUnreadCounterDocument]:
+    if user_feed_unread_counters_collection is None:
+        return {}
 
-    categories = (
-        preloaded_categories
-        if preloaded_categories is not None
-        else await list_category_documents(user_id)
-    )
-    subscriptions = (
-        preloaded_subscriptions
-        if preloaded_subscriptions is not None
-        else await list_user_subscription_docs(user_id)
-    )
+    counter_docs: dict[ObjectId, UserFeedUnreadCounterDocument] = {}
+    async for doc in user_feed_unread_counters_collection.find(
+        {"user_id": user_id, "feed_id": {"$in": feed_ids}}
+    ):
+        counter_doc = UserFeedUnreadCounterDocument.model_validate(doc)
+        counter_docs[counter_doc.feed_id] = counter_doc
 
-    selected_feed_id: ObjectId | None = None
-    if isinstance(feed_filter, str) and feed_filter.strip() != "":
-        try:
-            selected_feed_id = ObjectId(feed_filter.strip())
-        except Exception:
-            selected_feed_id = None
+    return counter_docs
 
-    feed_to_category = {
-        sub["feed_id"]: sub["category_id"]
+
+async def _load_source_markers(feed_ids: list[ObjectId]) -> dict[ObjectId, datetime | None]:
+    if feed_sources_collection is None:
+        return {}
+
+    source_markers: dict[ObjectId, datetime | None] = {}
+    async for doc in feed_sources_collection.find(
+        {"_id": {"$in": feed_ids}},
+        {"last_fetched_at": 1},
+    ):
+        source_id = doc.get("_id")
+        if isinstance(source_id, ObjectId):
+            source_markers[source_id] = _as_utc_datetime(doc.get("last_fetched_at"))
+
+    return source_markers
+
+
+@profiled
+async def load_unread_counters(
+    user_id: str,
+    feed_ids: list[ObjectId],
+    preloaded_sources_map: dict[ObjectId, dict[str, Any]] | None = None,
+) -> dict[ObjectId, int]:
+    """Return per-feed unread counters, reconciling any stale rows first."""
+
+    if len(feed_ids) == 0:
+        return {}
+
+    if user_feed_unread_counters_collection is None:
+        return await count_unread_articles_by_feed(user_id, feed_ids)
+
+    if preloaded_sources_map is not None:
+        counter_docs = await _load_unread_counter_docs(user_id, feed_ids)
+        source_markers = {
+            feed_id: _as_utc_datetime(preloaded_sources_map.get(feed_id, {}).get("last_fetched_at"))
+            for feed_id in feed_ids
+        }
+    else:
+        counter_docs, source_markers = await asyncio.gather(
+            _load_unread_counter_docs(user_id, feed_ids),
+            _load_source_markers(feed_ids),
+        )
+
+    now = utc_now()
+    counters: dict[ObjectId, int] = {}
+    stale_feed_ids: list[ObjectId] = []
+    for feed_id in feed_ids:
+        counter_doc = counter_docs.get(feed_id)
+        if counter_doc is not None and unread_counter_is_current(
+            counter_doc, source_markers.get(feed_id), now
+        ):
+            counters[feed_id] = max(0, counter_doc.unread_count)
+        else:
+            stale_feed_ids.append(feed_id)
+
+    if len(stale_feed_ids) == 0:
+        return counters
+
+    reconciled_counts = await count_unread_articles_by_feed(user_id, stale_feed_ids)
+    operations: list[UpdateOne] = []
+    for feed_id in stale_feed_ids:
+        counter_doc = UserFeedUnreadCounterDocument(
+            user_id=user_id,
+            feed_id=feed_id,
+            unread_count=reconciled_counts.get(feed_id, 0),
+            source_marker=source_markers.get(feed_id),
+            reconciled_at=now,
+            updated_at=now,
+        )
+        counters[feed_id] = counter_doc.unread_count
+        operations.append(
+            UpdateOne(
+                {"user_id": user_id, "feed_id": feed_id},
+                {
+                    "$set": counter_doc.model_dump(
+                        include={"unread_count", "source_marker", "reconciled_at", "updated_at"}
+                    ),
+                    "$setOnInsert": counter_doc.model_dump(include={"user_id", "feed_id"}),
+                },
+                upsert=True,
+            )
+        )
+
+    try:
+        await user_feed_unread_counters_collection.bulk_write(operations, ordered=False)
+    except BulkWriteError:
+        # A concurrent reconcile inserted the same row first; its value is equivalent.
+        pass
+
+    return counters
+
+
+async def _load_article_feed_ref(article_id: ObjectId) -> tuple[ObjectId | None, bool]:
+    """Return an article's feed ID and soft-delete flag, or (None, False) when missing."""
+
+    if feed_articles_collection is None:
+        return None, False
+
+    article_doc = await feed_articles_collection.find_one(
+        {"_id": article_id},
+        {"feed_id": 1, "is_deleted": 1},
+    )
+    if article_doc is None or not isinstance(article_doc.get("feed_id"), ObjectId):
+        return None, False
+
+    return article_doc["feed_id"], bool(article_doc.get("is_deleted"))
+
+
+async def adjust_unread_counter_for_article(
+    user_id: str,
+    article_id: ObjectId,
+    delta: int,
+    preloaded_feed_ref: tuple[ObjectId | None, bool] | None = None,
+) -> None:
+    """Apply a read-state transition to the owning feed's unread counter."""
+
+    if user_feed_unread_counters_collection is None or delta == 0:
+        return
+
+    feed_id, is_deleted = preloaded_feed_ref or await _load_article_feed_ref(article_id)
+    if feed_id is None or is_deleted:
+        return
+
+    # Missing rows are left for the next reconcile rather than seeded from a delta.
+    await user_feed_unread_counters_collection.update_one(
+        {"user_id": user_id, "feed_id": feed_id},
+        {
+            "$inc": {"unread_count": int(delta)},
+            "$set": {"updated_at": utc_now()},
+        },
+    )
+
+
+async def _bulk_adjust_unread_counters(user_id: str, counter_deltas: dict[ObjectId, int]) -> None:
+    """Apply per-feed unread counter deltas for one user in a single bulk write."""
+
+    if user_feed_unread_counters_collection is None:
+        return
+
+    now = utc_now()
+    operations = [
+        UpdateOne(
+            {"user_id": user_id, "feed_id": feed_id},
+            {"$inc": {"unread_count": int(delta)}, "$set": {"updated_at": now}},
+        )
+        for feed_id, delta in counter_deltas.items()
+        if delta != 0
+    ]
+    if len(operations) > 0:
+        await user_feed_unread_counters_collection.bulk_write(operations, ordered=False)
+
+
+async def drop_unread_counters(
+    feed_ids: set[ObjectId],
+    user_id: str | None = None,
+) -> None:
+    """Remove counter rows so they are rebuilt from scratch on next read."""
+
+    if user_feed_unread_counters_collection is None or len(feed_ids) == 0:
+        return
+
+    query: dict[str, Any] = {"feed_id": {"$in": list(feed_ids)}}
+    if user_id is not None:
+        query["user_id"] = user_id
+
+    await user_feed_unread_counters_collection.delete_many(query)
+
+
+async def record_feed_articles_ingested(
+    feed_id: ObjectId,
+    article_count: int,
+    fetched_at: datetime | None = None,
+) -> None:
+    """Increment every subscriber's unread counter after new articles land.
+
+    Called by the ingest path once newly inserted articles are committed. Passing
+    the *fetched_at* written to the source's ``last_fetched_at`` keeps the
+    counters current so readers do not need to reconcile them.
+    """
+
+    if user_feed_unread_counters_collection is None:
+        return
+
+    update_set: dict[str, Any] = {"updated_at": utc_now()}
+    if fetched_at is not None:
+        update_set["source_marker"] = _as_utc_datetime(fetched_at)
+
+    update: dict[str, Any] = {"$set": update_set}
+    if article_count > 0:
+        update["$inc"] = {"unread_count": int(article_count)}
+
+    await user_feed_unread_counters_collection.update_many({"feed_id": feed_id}, update)
+    invalidate_all_category_counts_cache()
+
+
+async def record_feed_articles_removed(feed_id: ObjectId, article_ids: list[ObjectId]) -> None:
+    """Decrement subscriber counters for soft-deleted or purged articles.
+
+    Each subscriber only loses the removed articles they had not yet read.
+    """
+
+    if (
+        user_feed_unread_counters_collection is None
+        or user_article_states_collection is None
+        or len(article_ids) == 0
+    ):
+        return
+
+    read_counts: dict[str, int] = {}
+    async for row in user_article_states_collection.aggregate(
+        [
+            {"$match": {"article_id": {"$in": article_ids}, "is_read": True}},
+            {"$group": {"_id": "$user_id", "count": {"$sum": 1}}},
+        ]
+    ):
+        row_user_id = row.get("_id")
+        if isinstance(row_user_id, str):
+            read_counts[row_user_id] = int(row.get("count", 0))
+
+    now = utc_now()
+    operations: list[UpdateOne] = []
+    async for doc in user_feed_unread_counters_collection.find(
+        {"feed_id": feed_id},
+        {"user_id": 1},
+    ):
+        counter_user_id = doc.get("user_id")
+        if not isinstance(counter_user_id, str):
+            continue
+        unread_removed = len(article_ids) - read_counts.get(counter_user_id, 0)
+        if unread_removed <= 0:
+            continue
+        operations.append(
+            UpdateOne(
+                {"_id": doc["_id"]},
+                {
+                    "$inc": {"unread_count": -unread_removed},
+                    "$set": {"updated_at": now},
+                },
+            )
+        )
+
+    if len(operations) > 0:
+        await user_feed_unread_counters_collection.bulk_write(operations, ordered=False)
+    invalidate_all_category_counts_cache()
+
+
+async def build_categories_with_counts(
+    user_id: str,
+    categories: list[FeedCategoryDocument],
+    subscriptions: list[dict[str, Any]],
+    unread_counters: dict[ObjectId, int] | None = None,
+) -> FeedCategoryListResponse:
+    """Build sidebar categories and unread counters from preloaded scope data."""
+
+    if user_feed_subscriptions_collection is None:
+        return FeedCategoryListResponse(
+            all_unread_count=0,
+            recently_read_count=0,
+            saved_count=0,
+            categories=[],
+        )
+
+    feed_to_category = {
+        sub["feed_id"]: sub["category_id"] for sub in subscriptions if "feed_id" in sub and "category_id" in sub
+    }
+
+    if unread_counters is None:
+        unread_counters = await load_unread_counters(user_id, list(feed_to_category.keys()))
+
+    category_summaries: list[FeedCategorySummary] = []
+    all_unread_count = 0
+
+    for category in categories:
+        category_feed_ids = [
+            feed_id
+            for feed_id, category_id in feed_to_category.items()
+            if category.id is not None and category_id == category.id
+        ]
+        unread_count = sum(unread_counters.get(feed_id, 0) for feed_id in category_feed_ids)
+
+        if not category.muted:
+            all_unread_count += unread_count
+
+        if category.id is None:
+            continue
+
+        category_summaries.append(
+            FeedCategorySummary(
+                category_id=str(category.id),
+                name=category.name,
+                unread_count=unread_count,
+                muted=category.muted,
+                color_hex=category.color_hex,
+                sort_order=category.sort_order,
+            )
+        )
+
+    recently_read_count, saved_count = await asyncio.gather(
+        count_recently_read(user_id, feed_to_category, categories),
+        count_saved_articles(user_id, feed_to_category),
+    )
+
+    return FeedCategoryListResponse(
+        all_unread_count=all_unread_count,
+        recently_read_count=recently_read_count,
+        saved_count=saved_count,
+        categories=category_summaries,
+    )
+
+
+@profiled
+async def get_cached_categories_with_counts(
+    user_id: str,
+    categories: list[FeedCategoryDocument],
+    subscriptions: list[dict[str, Any]],
+    unread_counters: dict[ObjectId, int] | None = None,
+) -> FeedCategoryListResponse:
+    """Return cached sidebar counts, building them from preloaded data on a miss."""
+
+    payload = _category_counts_cache.get(user_id)
+    if payload is None:
+        payload = await build_categories_with_counts(
+            user_id,
+            categories,
+            subscriptions,
+            unread_counters=unread_counters,
+        )
+        _category_counts_cache.set(user_id, payload)
+    return payload
+
+
+@profiled
+async def get_categories_with_counts(user_id: str) -> FeedCategoryListResponse:
+    """Return sidebar categories and unread counters for a user."""
+
+    cached_payload = _category_counts_cache.get(user_id)
+    if cached_payload is not None:
+        return cached_payload
+
+    categories, subscriptions = await asyncio.gather(
+        list_category_documents(user_id),
+        list_user_subscription_docs(user_id),
+    )
+    return await get_cached_categories_with_counts(user_id, categories, subscriptions)
+
+
+async def _load_user_article_state_version(user_id: str) -> int:
+    """Return the user's read-state version, or ``0`` before their first write."""
+
+    if user_article_state_versions_collection is None:
+        return 0
+
+    version_doc = await user_article_state_versions_collection.find_one(
+        {"_id": user_id},
+        {"_id": 0, "version": 1},
+    )
+    if version_doc is None:
+        return 0
+
+    return int(version_doc.get("version") or 0)
+
+
+async def _bump_user_article_state_versions(user_ids: Iterable[str]) -> None:
+    """Advance the read-state version of each user after a state write.
+
+    The counter lives in Mongo so a write on one worker moves the version every
+    other worker compares its cached snapshot against.
+    """
+
+    if user_article_state_versions_collection is None:
+        return
+
+    now = utc_now()
+    operations = [
+        UpdateOne(
+            {"_id": user_id},
+            {"$inc": {"version": 1}, "$set": {"updated_at": now}},
+            upsert=True,
+        )
+        for user_id in sorted(set(user_ids))
+    ]
+    await _bulk_write_batches(user_article_state_versions_collection, operations, ordered=False)
+
+
+@profiled
+async def get_user_article_state_snapshot(user_id: str) -> UserArticleStateSnapshot:
+    """Return the user's compact read/saved columns, shared across requests.
+
+    Snapshots are cached per worker and keyed by the user's read-state version,
+    a counter every read/saved write advances. When the version moves, only
+    documents updated since the snapshot was last refreshed are folded in;
+    entries are fully reloaded once their TTL lapses so states deleted by
+    retention are eventually dropped.
+    """
+
+    if user_article_states_collection is None:
+        return UserArticleStateSnapshot(0, None)
+
+    version = await _load_user_article_state_version(user_id)
+    snapshot = _user_article_state_cache.get(user_id)
+    if snapshot is not None and snapshot.version == version:
+        return snapshot
+
+    refreshed_at = utc_now()
+    if snapshot is not None and snapshot.marker is not None and version > snapshot.version:
+        async for state_doc in user_article_states_collection.find(
+            {
+                "user_id": user_id,
+                "updated_at": {"$gte": snapshot.marker - USER_ARTICLE_STATE_DELTA_OVERLAP},
+            },
+            USER_ARTICLE_STATE_PROJECTION,
+        ):
+            snapshot.apply_state_document(state_doc)
+        snapshot.version = version
+        snapshot.marker = refreshed_at
+        return snapshot
+
+    state_docs = [
+        state_doc
+        async for state_doc in user_article_states_collection.find(
+            {"user_id": user_id, "$or": [{"is_read": True}, {"is_saved": True}]},
+            USER_ARTICLE_STATE_PROJECTION,
+        )
+    ]
+    snapshot = UserArticleStateSnapshot.from_state_documents(version, refreshed_at, state_docs)
+    _user_article_state_cache.set(user_id, snapshot)
+    return snapshot
+
+
+async def get_read_article_id_set(user_id: str) -> ArticleTimestampColumn:
+    """Return article IDs that are marked as read for the user."""
+
+    return (await get_user_article_state_snapshot(user_id)).read
+
+
+async def get_read_article_visibility_sets(
+    user_id: str,
+) -> tuple[ArticleTimestampColumn, ArticleTimestampColumn]:
+    """Return article IDs split into recent-read and expired-read sets."""
+
+    now = utc_now()
+    read_column = (await get_user_article_state_snapshot(user_id)).read
+    recent_read_ids = read_column.ids_where(
+        lambda read_at: is_read_within_visibility_window(read_at, reference_time=now)
+    )
+    expired_read_ids = read_column.ids_where(
+        lambda read_at: not is_read_within_visibility_window(read_at, reference_time=now)
+    )
+
+    return recent_read_ids, expired_read_ids
+
+
+async def get_recent_read_article_id_set(
+    user_id: str,
+    reference_time: datetime | None = None,
+) -> set[ObjectId]:
+    """Return article IDs read inside the read-visibility window."""
+
+    if user_article_states_collection is None:
+        return set()
+
+    cursor = user_article_states_collection.find(
+        {
+            "user_id": user_id,
+            "is_read": True,
+            "read_at": {"$gte": read_visibility_cutoff(reference_time)},
+        },
+        {"article_id": 1},
+    )
+    return {
+        doc["article_id"]
+        async for doc in cursor
+        if isinstance(doc.get("article_id"), ObjectId)
+    }
+
+
+async def get_saved_article_id_set(
+    user_id: str,
+) -> set[ObjectId]:
+    """Return article IDs that are marked as saved for the user."""
+
+    if user_article_states_collection is None:
+        return set()
+    cursor = user_article_states_collection.find(
+        {"user_id": user_id, "is_saved": True},
+        {"article_id": 1},
+    )
+    return {doc["article_id"] async for doc in cursor if "article_id" in doc}
+
+
+async def count_saved_articles(
+    user_id: str,
+    feed_to_category: dict[ObjectId, ObjectId],
+) -> int:
+    """Count saved articles for feeds the user is subscribed to."""
+
+    if feed_articles_collection is None:
+        return 0
+
+    feed_ids = list(feed_to_category.keys())
+    if len(feed_ids) == 0:
+        return 0
+
+    saved_article_ids = await get_saved_article_id_set(user_id)
+    if len(saved_article_ids) == 0:
+        return 0
+
+    return await feed_articles_collection.count_documents(
+        {
+            "_id": {"$in": list(saved_article_ids)},
+            "feed_id": {"$in": feed_ids},
+            "is_deleted": False,
+        }
+    )
+
+
+async def count_unread_articles_for_feed_ids(
+    user_id: str,
+    feed_ids: list[ObjectId],
+) -> int:
+    """Count unread articles for a set of feeds."""
+
+    if feed_articles_collection is None or len(feed_ids) == 0:
+        return 0
+
+    pipeline: list[dict[str, Any]] = [
+        {
+            "$match": {
+                "feed_id": {"$in": feed_ids},
+                "is_deleted": False,
+            }
+        },
+        {"$project": {"_id": 1}},
+        *build_unread_article_join_stages(user_id),
+        {"$count": "total"},
+    ]
+
+    async for row in feed_articles_collection.aggregate(pipeline):
+        return int(row.get("total", 0))
+    return 0
+
+
+def build_recently_read_state_query(user_id: str, threshold: datetime) -> dict[str, Any]:
+    """Return the ``user_article_states`` filter for articles read since *threshold*."""
+
+    return {
+        "user_id": user_id,
+        "is_read": True,
+        "read_at": {"$gte": threshold},
+    }
+
+
+async def count_recently_read(
+    user_id: str,
+    feed_to_category: dict[ObjectId, ObjectId],
+    categories: list[FeedCategoryDocument],
+) -> int:
+    """Count recently-read articles in the last seven days."""
+
+    if user_article_states_collection is None or feed_articles_collection is None:
+        return 0
+
+    muted_category_ids = {
+        category.id for category in categories if category.id is not None and category.muted
+    }
+
+    state_cursor = user_article_states_collection.find(
+        build_recently_read_state_query(user_id, recently_read_cutoff()),
+        {"article_id": 1},
+    )
+    article_ids = [doc["article_id"] async for doc in state_cursor if "article_id" in doc]
+
+    if len(article_ids) == 0:
+        return 0
+
+    article_cursor = feed_articles_collection.find(
+        {
+            "_id": {"$in": article_ids},
+        },
+        {"feed_id": 1},
+    )
+
+    count = 0
+    async for article_doc in article_cursor:
+        feed_id = article_doc.get("feed_id")
+        if not isinstance(feed_id, ObjectId):
+            continue
+
+        category_id = feed_to_category.get(feed_id)
+        if category_id in muted_category_ids:
+            continue
+        count += 1
+
+    return count
+
+
+@profiled
+async def get_article_list(
+    user_id: str,
+    category_filter: str,
+    status_filter: str,
+    feed_filter: str | None = None,
+    search_query: str | None = None,
+    require_search_query: bool = False,
+    offset: int = 0,
+    limit: int = 10,
+    ids_only: bool = False,
+    cursor: str | None = None,
+    preloaded_categories: list[FeedCategoryDocument] | None = None,
+    preloaded_subscriptions: list[dict[str, Any]] | None = None,
+    preloaded_sources_map: dict[ObjectId, dict[str, Any]] | None = None,
+) -> FeedArticleListResponse:
+    """Return filtered article cards for the feed reader view.
+
+    Category and "all" listings page by the opaque keyset *cursor* when one is
+    given; recently-read and saved listings still page by *offset*.
+    """
+
+    normalized_offset = max(0, int(offset))
+    normalized_limit = max(1, int(limit))
+    normalized_search_query = normalize_article_search_query(search_query)
+
+    normalized_status: Literal["unread", "read", "all"]
+    if status_filter in {"unread", "read", "all"}:
+        normalized_status = cast(Literal["unread", "read", "all"], status_filter)
+    else:
+        normalized_status = "unread"
+
+    if require_search_query and normalized_search_query == "":
+        response_status: Literal["unread", "read", "all"]
+        if category_filter == "recently-read":
+            response_status = "read"
+        elif category_filter == "saved":
+            response_status = "all"
+        else:
+            response_status = normalized_status
+
+        return FeedArticleListResponse(
+            category=category_filter,
+            status=response_status,
+            articles=[],
+            article_ids=[],
+            offset=normalized_offset,
+            limit=normalized_limit,
+            has_more=False,
+            next_offset=normalized_offset,
+        )
+
+    use_text_search = False
+    if normalized_search_query != "" and not feed_search_index_ready():
+        use_text_search = await feed_articles_text_search_available()
+
+    newest_first = normalized_search_query != ""
+
+    categories = (
+        preloaded_categories
+        if preloaded_categories is not None
+        else await list_category_documents(user_id)
+    )
+    subscriptions = (
+        preloaded_subscriptions
+        if preloaded_subscriptions is not None
+        else await list_user_subscription_docs(user_id)
+    )
+
+    selected_feed_id: ObjectId | None = None
+    if isinstance(feed_filter, str) and feed_filter.strip() != "":
+        try:
+            selected_feed_id = ObjectId(feed_filter.strip())
+        except Exception:
+            selected_feed_id = None
+
+    feed_to_category = {
+        sub["feed_id"]: sub["category_id"]
         for sub in subscriptions
         if "feed_id" in sub and "category_id" in sub
     }
@@ -1997,6 +3977,7 @@ async def get_article_list(
             use_text_search=use_text_search,
             offset=normalized_offset,
             limit=normalized_limit,
+            preloaded_sources_map=preloaded_sources_map,
         )
         return _feed_article_list_response(
             category="recently-read",
@@ -2021,6 +4002,7 @@ async def get_article_list(
             newest_first=newest_first,
             offset=normalized_offset,
             limit=normalized_limit,
+            preloaded_sources_map=preloaded_sources_map,
         )
         return _feed_article_list_response(
             category="saved",
@@ -2088,19 +4070,16 @@ async def get_article_list(
             ids_only=ids_only,
         )
 
-    read_state_ids = (
-        preloaded_read_state_ids
-        if preloaded_read_state_ids is not None
-        else await get_read_article_id_set(user_id)
-    )
     recent_read_state_ids: set[ObjectId] = set()
     if normalized_status == "read":
-        recent_read_state_ids, _ = await get_read_article_visibility_sets(user_id)
+        recent_read_state_ids = await get_recent_read_article_id_set(user_id)
+
+    decoded_cursor = decode_article_cursor(cursor)
 
     if ids_only:
-        article_ids, has_more = await list_article_ids_for_feed_ids(
+        article_ids, has_more, next_cursor = await list_article_ids_for_feed_ids(
+            user_id=user_id,
             allowed_feed_ids=allowed_feed_ids,
-            read_state_ids=read_state_ids,
             recent_read_state_ids=recent_read_state_ids,
             search_query=normalized_search_query,
             use_text_search=use_text_search,
@@ -2108,6 +4087,7 @@ async def get_article_list(
             status_filter=normalized_status,
             offset=normalized_offset,
             limit=normalized_limit,
+            cursor=decoded_cursor,
         )
         return _feed_article_list_response(
             category=category_filter,
@@ -2118,15 +4098,15 @@ async def get_article_list(
             limit=normalized_limit,
             has_more=has_more,
             ids_only=True,
+            next_cursor=next_cursor,
         )
 
-    cards, has_more = await list_cards_for_feed_ids(
+    cards, has_more, next_cursor = await list_cards_for_feed_ids(
         user_id=user_id,
         allowed_feed_ids=allowed_feed_ids,
         categories_by_id=categories_by_id,
         feed_to_category=feed_to_category,
         truncated_feed_ids=truncated_feed_ids,
-        read_state_ids=read_state_ids,
         recent_read_state_ids=recent_read_state_ids,
         search_query=normalized_search_query,
         use_text_search=use_text_search,
@@ -2134,6 +4114,8 @@ async def get_article_list(
         status_filter=normalized_status,
         offset=normalized_offset,
         limit=normalized_limit,
+        cursor=decoded_cursor,
+        preloaded_sources_map=preloaded_sources_map,
     )
 
     return _feed_article_list_response(
@@ -2145,6 +4127,7 @@ async def get_article_list(
         limit=normalized_limit,
         has_more=has_more,
         ids_only=False,
+        next_cursor=next_cursor,
     )
 
 
@@ -2160,93 +4143,51 @@ async def list_user_subscription_docs(user_id: str) -> list[dict[str, Any]]:
     ]
 
 
-async def get_user_read_map(user_id: str) -> dict[ObjectId, datetime | None]:
+async def get_user_read_map(user_id: str) -> Mapping[ObjectId, datetime | None]:
     """Return article read timestamps keyed by article ID."""
 
-    if user_article_states_collection is None:
-        return {}
-
-    cursor = user_article_states_collection.find(
-        {"user_id": user_id, "is_read": True},
-        {"article_id": 1, "read_at": 1},
-    )
-
-    read_map: dict[ObjectId, datetime | None] = {}
-    async for doc in cursor:
-        article_id = doc.get("article_id")
-        if not isinstance(article_id, ObjectId):
-            continue
-        read_map[article_id] = doc.get("read_at")
-
-    return read_map
+    return (await get_user_article_state_snapshot(user_id)).read
 
 
-async def get_user_saved_map(user_id: str) -> dict[ObjectId, datetime | None]:
+async def get_user_saved_map(user_id: str) -> Mapping[ObjectId, datetime | None]:
     """Return article saved timestamps keyed by article ID."""
 
-    if user_article_states_collection is None:
-        return {}
-
-    cursor = user_article_states_collection.find(
-        {"user_id": user_id, "is_saved": True},
-        {"article_id": 1, "saved_at": 1},
-    )
-
-    saved_map: dict[ObjectId, datetime | None] = {}
-    async for doc in cursor:
-        article_id = doc.get("article_id")
-        if not isinstance(article_id, ObjectId):
-            continue
-        saved_map[article_id] = doc.get("saved_at")
-
-    return saved_map
+    return (await get_user_article_state_snapshot(user_id)).saved
 
 
+@profiled
 async def get_user_state_maps_for_article_ids(
     user_id: str,
     article_ids: list[ObjectId],
 ) -> tuple[dict[ObjectId, datetime | None], dict[ObjectId, datetime | None]]:
-    """Return read/saved timestamp maps scoped to explicit article IDs."""
+    """Return read/saved timestamp maps scoped to explicit article IDs.
+
+    Lookups are answered from the user's cached state snapshot.
+    """
 
     if user_article_states_collection is None or len(article_ids) == 0:
         return {}, {}
 
-    unique_article_ids = list(dict.fromkeys(article_ids))
-
-    cursor = user_article_states_collection.find(
-        {
-            "user_id": user_id,
-            "article_id": {"$in": unique_article_ids},
-        },
-        {
-            "article_id": 1,
-            "is_read": 1,
-            "read_at": 1,
-            "is_saved": 1,
-            "saved_at": 1,
-        },
-    )
+    snapshot = await get_user_article_state_snapshot(user_id)
 
     read_map: dict[ObjectId, datetime | None] = {}
     saved_map: dict[ObjectId, datetime | None] = {}
 
-    async for doc in cursor:
-        article_id = doc.get("article_id")
-        if not isinstance(article_id, ObjectId):
-            continue
-
-        if bool(doc.get("is_read")):
-            read_map[article_id] = doc.get("read_at")
+    for article_id in dict.fromkeys(article_ids):
+        if article_id in snapshot.read:
+            read_map[article_id] = snapshot.read[article_id]
 
-        if bool(doc.get("is_saved")):
-            saved_map[article_id] = doc.get("saved_at")
+        if article_id in snapshot.saved:
+            saved_map[article_id] = snapshot.saved[article_id]
 
     return read_map, saved_map
 
 
+@profiled
 async def get_article_read_statuses(
     user_id: str,
     article_ids: list[str],
+    preloaded_feed_ids: list[ObjectId] | None = None,
 ) -> list[FeedArticleStatusItem]:
     """Return read/save-state for explicit article IDs visible to the user."""
 
@@ -2278,15 +4219,18 @@ async def get_article_read_statuses(
     if len(ordered_unique_ids) == 0:
         return []
 
-    subscription_cursor = user_feed_subscriptions_collection.find(
-        {"user_id": user_id},
-        {"feed_id": 1},
-    )
-    allowed_feed_ids = [
-        doc.get("feed_id")
-        async for doc in subscription_cursor
-        if isinstance(doc.get("feed_id"), ObjectId)
-    ]
+    if preloaded_feed_ids is not None:
+        allowed_feed_ids = list(preloaded_feed_ids)
+    else:
+        subscription_cursor = user_feed_subscriptions_collection.find(
+            {"user_id": user_id},
+            {"feed_id": 1},
+        )
+        allowed_feed_ids = [
+            doc.get("feed_id")
+            async for doc in subscription_cursor
+            if isinstance(doc.get("feed_id"), ObjectId)
+        ]
 
     if len(allowed_feed_ids) == 0:
         return []
@@ -2343,13 +4287,105 @@ async def get_article_read_statuses(
     ]
 
 
-async def list_cards_for_feed_ids(
+def encode_article_cursor(
+    segment: Literal["dated", "undated"],
+    published_at: datetime | None,
+    article_id: ObjectId,
+) -> str:
+    """Encode an opaque keyset cursor for the article list sort position."""
+
+    payload: dict[str, Any] = {"s": "d" if segment == "dated" else "u", "i": str(article_id)}
+    resolved_published_at = _as_utc_datetime(published_at)
+    if segment == "dated" and resolved_published_at is not None:
+        payload["p"] = resolved_published_at.isoformat()
+
+    raw = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_article_cursor(
+    cursor: str | None,
+) -> tuple[Literal["dated", "undated"], datetime | None, ObjectId] | None:
+    """Decode an article keyset cursor, returning None when it is malformed."""
+
+    if not isinstance(cursor, str) or cursor.strip() == "":
+        return None
+
+    token = cursor.strip()
+    try:
+        raw = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4))
+        payload = json.loads(raw.decode("utf-8"))
+        article_id = ObjectId(str(payload["i"]))
+    except Exception:
+        return None
+
+    if not isinstance(payload, dict):
+        return None
+
+    if payload.get("s") == "u":
+        return "undated", None, article_id
+
+    if payload.get("s") != "d":
+        return None
+
+    try:
+        published_at = _as_utc_datetime(datetime.fromisoformat(str(payload["p"])))
+    except Exception:
+        return None
+
+    if published_at is None:
+        return None
+
+    return "dated", published_at, article_id
+
+
+def build_article_segment_queries(base_query: dict[str, Any]) -> tuple[dict[str, Any], dict[str, Any]]:
+    """Split an article filter into its dated and undated listing segments."""
+
+    dated_query: dict[str, Any] = {
+        **base_query,
+        "published_at": {"$type": "date"},
+    }
+    undated_query: dict[str, Any] = {
+        **base_query,
+        "$or": [
+            {"published_at": None},
+            {"published_at": {"$exists": False}},
+        ],
+    }
+    return dated_query, undated_query
+
+
+def build_article_segment_pipeline(
+    segment: Literal["dated", "undated"],
+    segment_query: dict[str, Any],
+    sort_direction: int,
+    filter_stages: list[dict[str, Any]],
+    skip: int,
+    limit: int,
+    projection_stages: list[dict[str, Any]] | None = None,
+) -> list[dict[str, Any]]:
+    """Return the aggregation that reads one page of a listing segment."""
+
+    sort_spec = (
+        {"published_at": sort_direction, "_id": sort_direction}
+        if segment == "dated"
+        else {"_id": sort_direction}
+    )
+    return [
+        {"$match": segment_query},
+        {"$sort": sort_spec},
+        *filter_stages,
+        *([{"$skip": skip}] if skip > 0 else []),
+        {"$limit": limit},
+        *(projection_stages or []),
+    ]
+
+
+@profiled
+async def select_feed_article_docs(
     user_id: str,
     allowed_feed_ids: list[ObjectId],
-    categories_by_id: dict[ObjectId, FeedCategoryDocument],
-    feed_to_category: dict[ObjectId, ObjectId],
-    truncated_feed_ids: set[ObjectId],
-    read_state_ids: set[ObjectId],
     recent_read_state_ids: set[ObjectId],
     search_query: str,
     use_text_search: bool,
@@ -2357,94 +4393,208 @@ async def list_cards_for_feed_ids(
     status_filter: str,
     offset: int,
     limit: int,
-) -> tuple[list[FeedArticleCard], bool]:
-    """Return article cards for feed IDs with status filtering."""
+    cursor: tuple[Literal["dated", "undated"], datetime | None, ObjectId] | None = None,
+    projection: dict[str, Any] | None = None,
+) -> tuple[list[dict[str, Any]], bool, str | None]:
+    """Return one page of article documents across the dated and undated segments.
+
+    With a keyset *cursor* the page starts strictly after that sort position and
+    needs neither a count nor a skip; *offset* is only used when no cursor is given.
+    """
 
     if feed_articles_collection is None or len(allowed_feed_ids) == 0:
-        return [], False
+        return [], False, None
 
-    base_query = {
+    base_query: dict[str, Any] = {
         "feed_id": {"$in": allowed_feed_ids},
         "is_deleted": False,
     }
 
+    filter_stages: list[dict[str, Any]] = []
     if status_filter == "read":
         if len(recent_read_state_ids) == 0:
-            return [], False
+            return [], False, None
         base_query["_id"] = {"$in": list(recent_read_state_ids)}
-    elif status_filter == "unread" and len(read_state_ids) > 0:
+    elif status_filter == "unread":
         # Fresh unread/category page loads exclude read items immediately.
         # The client intentionally keeps already-rendered cards visible until
         # the user performs a full page refresh.
-        base_query["_id"] = {"$nin": list(read_state_ids)}
+        filter_stages = build_unread_article_join_stages(user_id)
 
     search_filter = build_article_search_filter(
         search_query,
         use_text_search=use_text_search,
+        feed_ids=allowed_feed_ids,
     )
 
     # Show oldest-first by default, while keeping search results newest-first.
     sort_direction = DESCENDING if newest_first else ASCENDING
+    after_operator = "$lt" if newest_first else "$gt"
 
-    dated_query = {
-        **base_query,
-        "published_at": {"$type": "date"},
-    }
-    undated_query = {
-        **base_query,
-        "$or": [
-            {"published_at": None},
-            {"published_at": {"$exists": False}},
-        ],
-    }
+    dated_query, undated_query = build_article_segment_queries(base_query)
+
+    if cursor is not None:
+        cursor_segment, cursor_published_at, cursor_article_id = cursor
+        if cursor_segment == "dated":
+            dated_query["$and"] = [
+                {
+                    "$or": [
+                        {"published_at": {after_operator: cursor_published_at}},
+                        {
+                            "published_at": cursor_published_at,
+                            "_id": {after_operator: cursor_article_id},
+                        },
+                    ]
+                }
+            ]
+        else:
+            undated_query["$and"] = [{"_id": {after_operator: cursor_article_id}}]
 
     dated_query = merge_article_search_filter(dated_query, search_filter)
     undated_query = merge_article_search_filter(undated_query, search_filter)
 
-    dated_total = await feed_articles_collection.count_documents(dated_query)
-    dated_skip = min(offset, dated_total)
-    undated_skip = max(0, offset - dated_total)
+    projection_stages: list[dict[str, Any]] = (
+        [{"$project": {**projection, "published_at": 1}}] if projection is not None else []
+    )
+
+    selected_docs: list[dict[str, Any]] = []
+    dated_selected_count = 0
+
+    if cursor is None or cursor[0] == "dated":
+        dated_docs = [
+            dict(doc)
+            async for doc in feed_articles_collection.aggregate(
+                build_article_segment_pipeline(
+                    "dated",
+                    dated_query,
+                    sort_direction,
+                    filter_stages,
+                    skip=offset if cursor is None else 0,
+                    limit=limit + 1,
+                    projection_stages=projection_stages,
+                )
+            )
+        ]
+
+        selected_docs = list(dated_docs[:limit])
+        dated_selected_count = len(selected_docs)
+        if len(dated_docs) > limit:
+            return selected_docs, True, _next_article_cursor(selected_docs, dated_selected_count, cursor)
+
+        if cursor is None and len(dated_docs) == 0 and offset > 0:
+            # Offset paging that starts past the dated segment needs its size.
+            dated_total = 0
+            async for row in feed_articles_collection.aggregate(
+                [
+                    {"$match": dated_query},
+                    *filter_stages,
+                    {"$count": "total"},
+                ]
+            ):
+                dated_total = int(row.get("total", 0))
+            undated_skip = max(0, offset - dated_total)
+        else:
+            # The dated segment ended inside this page, so the undated one starts at zero.
+            undated_skip = 0
+    else:
+        undated_skip = 0
 
-    dated_docs = [
-        doc
-        async for doc in feed_articles_collection.find(dated_query)
-        .sort([("published_at", sort_direction), ("_id", sort_direction)])
-        .skip(dated_skip)
-        .limit(limit + 1)
+    # A full page that exhausts the dated segment still probes the undated one
+    # so has_more stays accurate at the boundary.
+    remaining_limit = limit - len(selected_docs)
+    undated_docs = [
+        dict(doc)
+        async for doc in feed_articles_collection.aggregate(
+            build_article_segment_pipeline(
+                "undated",
+                undated_query,
+                sort_direction,
+                filter_stages,
+                skip=undated_skip,
+                limit=remaining_limit + 1,
+                projection_stages=projection_stages,
+            )
+        )
     ]
 
-    selected_docs: list[Any] = list(dated_docs[:limit])
-    has_more = len(dated_docs) > limit
-
-    if not has_more and len(selected_docs) < limit:
-        remaining_limit = limit - len(selected_docs)
-        undated_docs = [
-            doc
-            async for doc in feed_articles_collection.find(undated_query)
-            .sort("_id", sort_direction)
-            .skip(undated_skip)
-            .limit(remaining_limit + 1)
-        ]
+    selected_docs.extend(undated_docs[:remaining_limit])
+    has_more = len(undated_docs) > remaining_limit
+    return selected_docs, has_more, _next_article_cursor(selected_docs, dated_selected_count, cursor)
+
+
+def _next_article_cursor(
+    selected_docs: list[dict[str, Any]],
+    dated_selected_count: int,
+    cursor: tuple[Literal["dated", "undated"], datetime | None, ObjectId] | None,
+) -> str | None:
+    """Return the cursor positioned after the last selected document."""
+
+    if len(selected_docs) == 0:
+        if cursor is None:
+            return None
+        return encode_article_cursor(*cursor)
+
+    last_doc = selected_docs[-1]
+    article_id = last_doc.get("_id")
+    if not isinstance(article_id, ObjectId):
+        return None
+
+    if len(selected_docs) <= dated_selected_count:
+        return encode_article_cursor("dated", last_doc.get("published_at"), article_id)
+
+    return encode_article_cursor("undated", None, article_id)
 
-        selected_docs.extend(undated_docs[:remaining_limit])
-        has_more = len(undated_docs) > remaining_limit
+
+@profiled
+async def list_cards_for_feed_ids(
+    user_id: str,
+    allowed_feed_ids: list[ObjectId],
+    categories_by_id: dict[ObjectId, FeedCategoryDocument],
+    feed_to_category: dict[ObjectId, ObjectId],
+    truncated_feed_ids: set[ObjectId],
+    recent_read_state_ids: set[ObjectId],
+    search_query: str,
+    use_text_search: bool,
+    newest_first: bool,
+    status_filter: str,
+    offset: int,
+    limit: int,
+    cursor: tuple[Literal["dated", "undated"], datetime | None, ObjectId] | None = None,
+    preloaded_sources_map: dict[ObjectId, dict[str, Any]] | None = None,
+) -> tuple[list[FeedArticleCard], bool, str | None]:
+    """Return article cards for feed IDs with status filtering."""
+
+    selected_docs, has_more, next_cursor = await select_feed_article_docs(
+        user_id=user_id,
+        allowed_feed_ids=allowed_feed_ids,
+        recent_read_state_ids=recent_read_state_ids,
+        search_query=search_query,
+        use_text_search=use_text_search,
+        newest_first=newest_first,
+        status_filter=status_filter,
+        offset=offset,
+        limit=limit,
+        cursor=cursor,
+    )
 
     if len(selected_docs) == 0:
-        return [], has_more
+        return [], has_more, next_cursor
 
     source_ids: set[ObjectId] = {
         feed_id
         for feed_id in [doc.get("feed_id") for doc in selected_docs]
         if isinstance(feed_id, ObjectId)
     }
-    source_map = await load_sources_map(source_ids)
-
     article_ids: list[ObjectId] = [
         article_id
         for article_id in [doc.get("_id") for doc in selected_docs]
         if isinstance(article_id, ObjectId)
     ]
-    read_map, saved_map = await get_user_state_maps_for_article_ids(user_id, article_ids)
+    source_map, (read_map, saved_map), _ = await asyncio.gather(
+        resolve_sources_map(source_ids, preloaded_sources_map),
+        get_user_state_maps_for_article_ids(user_id, article_ids),
+        hydrate_archived_article_bodies(selected_docs),
+    )
 
     cards: list[FeedArticleCard] = []
 
@@ -2470,27 +4620,18 @@ async def list_cards_for_feed_ids(
         read_at = read_map.get(article_id)
         is_saved = article_id in saved_map
         saved_at = saved_map.get(article_id)
-        summary_html, full_summary_html, is_summary_truncated = build_article_summary_html(
+        content = render_article_content(
             article_doc,
             truncate_on_display=feed_id in truncated_feed_ids,
         )
 
         cards.append(
-            FeedArticleCard(
-                article_id=str(article_id),
-                feed_id=str(feed_id),
-                title=str(article_doc.get("title", "Untitled")),
-                link=normalize_article_navigation_link(article_doc.get("canonical_url") or article_doc.get("link")),
-                author=str(article_doc.get("author", "")).strip() or None,
-                summary_html=summary_html,
-                full_summary_html=full_summary_html,
-                is_summary_truncated=is_summary_truncated,
-                media_image_url=normalize_article_link(article_doc.get("media_image_url")) or None,
-                published_at=article_doc.get("published_at"),
+            build_article_card(
+                content,
+                article_id=article_id,
+                feed_id=feed_id,
                 feed_title=source_title,
-                category_id=str(category.id),
-                category_name=category.name,
-                category_color_hex=category.color_hex,
+                category=category,
                 is_read=is_read,
                 read_at=read_at,
                 is_saved=is_saved,
@@ -2498,12 +4639,13 @@ async def list_cards_for_feed_ids(
             )
         )
 
-    return cards, has_more
+    return cards, has_more, next_cursor
 
 
+@profiled
 async def list_article_ids_for_feed_ids(
+    user_id: str,
     allowed_feed_ids: list[ObjectId],
-    read_state_ids: set[ObjectId],
     recent_read_state_ids: set[ObjectId],
     search_query: str,
     use_text_search: bool,
@@ -2511,81 +4653,31 @@ async def list_article_ids_for_feed_ids(
     status_filter: str,
     offset: int,
     limit: int,
-) -> tuple[list[str], bool]:
+    cursor: tuple[Literal["dated", "undated"], datetime | None, ObjectId] | None = None,
+) -> tuple[list[str], bool, str | None]:
     """Return article IDs for feed IDs with status filtering."""
 
-    if feed_articles_collection is None or len(allowed_feed_ids) == 0:
-        return [], False
-
-    base_query = {
-        "feed_id": {"$in": allowed_feed_ids},
-        "is_deleted": False,
-    }
-
-    if status_filter == "read":
-        if len(recent_read_state_ids) == 0:
-            return [], False
-        base_query["_id"] = {"$in": list(recent_read_state_ids)}
-    elif status_filter == "unread" and len(read_state_ids) > 0:
-        base_query["_id"] = {"$nin": list(read_state_ids)}
-
-    search_filter = build_article_search_filter(
-        search_query,
+    selected_docs, has_more, next_cursor = await select_feed_article_docs(
+        user_id=user_id,
+        allowed_feed_ids=allowed_feed_ids,
+        recent_read_state_ids=recent_read_state_ids,
+        search_query=search_query,
         use_text_search=use_text_search,
+        newest_first=newest_first,
+        status_filter=status_filter,
+        offset=offset,
+        limit=limit,
+        cursor=cursor,
+        projection={"_id": 1},
     )
 
-    sort_direction = DESCENDING if newest_first else ASCENDING
-
-    dated_query = {
-        **base_query,
-        "published_at": {"$type": "date"},
-    }
-    undated_query = {
-        **base_query,
-        "$or": [
-            {"published_at": None},
-            {"published_at": {"$exists": False}},
-        ],
-    }
-
-    dated_query = merge_article_search_filter(dated_query, search_filter)
-    undated_query = merge_article_search_filter(undated_query, search_filter)
-
-    dated_total = await feed_articles_collection.count_documents(dated_query)
-    dated_skip = min(offset, dated_total)
-    undated_skip = max(0, offset - dated_total)
-
-    dated_docs = [
-        doc
-        async for doc in feed_articles_collection.find(dated_query, {"_id": 1})
-        .sort([("published_at", sort_direction), ("_id", sort_direction)])
-        .skip(dated_skip)
-        .limit(limit + 1)
-    ]
-
-    selected_docs: list[Any] = list(dated_docs[:limit])
-    has_more = len(dated_docs) > limit
-
-    if not has_more and len(selected_docs) < limit:
-        remaining_limit = limit - len(selected_docs)
-        undated_docs = [
-            doc
-            async for doc in feed_articles_collection.find(undated_query, {"_id": 1})
-            .sort("_id", sort_direction)
-            .skip(undated_skip)
-            .limit(remaining_limit + 1)
-        ]
-
-        selected_docs.extend(undated_docs[:remaining_limit])
-        has_more = len(undated_docs) > remaining_limit
-
     article_ids = [
         str(article_id)
         for article_id in [doc.get("_id") for doc in selected_docs]
         if isinstance(article_id, ObjectId)
     ]
 
-    return article_ids, has_more
+    return article_ids, has_more, next_cursor
 
 
 def _feed_article_list_response(
@@ -2597,6 +4689,7 @@ def _feed_article_list_response(
     limit: int,
     has_more: bool,
     ids_only: bool,
+    next_cursor: str | None = None,
 ) -> FeedArticleListResponse:
     """Build a normalized article-list API payload."""
 
@@ -2612,9 +4705,11 @@ def _feed_article_list_response(
         limit=limit,
         has_more=has_more,
         next_offset=offset + resolved_count,
+        next_cursor=next_cursor,
     )
 
 
+@profiled
 async def list_recently_read_cards(
     user_id: str,
     categories_by_id: dict[ObjectId, FeedCategoryDocument],
@@ -2625,6 +4720,7 @@ async def list_recently_read_cards(
     use_text_search: bool,
     offset: int,
     limit: int,
+    preloaded_sources_map: dict[ObjectId, dict[str, Any]] | None = None,
 ) -> tuple[list[FeedArticleCard], bool]:
     """Return recently-read cards from the last seven days."""
 
@@ -2654,6 +4750,7 @@ async def list_recently_read_cards(
     search_filter = build_article_search_filter(
         search_query,
         use_text_search=use_text_search,
+        feed_ids=eligible_feed_ids,
     )
 
     if use_text_search and isinstance(search_filter, dict) and "$text" in search_filter:
@@ -2686,15 +4783,8 @@ async def list_recently_read_cards(
         if isinstance(search_filter, dict):
             lookup_pipeline.append({"$match": search_filter})
 
-    threshold = recently_read_cutoff()
     pipeline: list[dict[str, Any]] = [
-        {
-            "$match": {
-                "user_id": user_id,
-                "is_read": True,
-                "read_at": {"$gte": threshold},
-            }
-        },
+        {"$match": build_recently_read_state_query(user_id, recently_read_cutoff())},
         {"$sort": {"read_at": DESCENDING, "_id": DESCENDING}},
         {
             "$lookup": {
@@ -2737,8 +4827,13 @@ async def list_recently_read_cards(
         if isinstance(feed_id, ObjectId):
             source_ids.add(feed_id)
 
-    source_map = await load_sources_map(source_ids)
-    _, saved_map = await get_user_state_maps_for_article_ids(user_id, article_ids)
+    source_map, (_, saved_map), _ = await asyncio.gather(
+        resolve_sources_map(source_ids, preloaded_sources_map),
+        get_user_state_maps_for_article_ids(user_id, article_ids),
+        hydrate_archived_article_bodies(
+            [row["article"] for row in paged_rows if isinstance(row.get("article"), dict)]
+        ),
+    )
 
     cards: list[FeedArticleCard] = []
 
@@ -2765,27 +4860,18 @@ async def list_recently_read_cards(
 
         read_at_value = row.get("read_at")
         read_at = read_at_value if isinstance(read_at_value, datetime) else None
-        summary_html, full_summary_html, is_summary_truncated = build_article_summary_html(
+        content = render_article_content(
             article_doc,
             truncate_on_display=feed_id in truncated_feed_ids,
         )
 
         cards.append(
-            FeedArticleCard(
-                article_id=str(article_id),
-                feed_id=str(feed_id),
-                title=str(article_doc.get("title", "Untitled")),
-                link=normalize_article_navigation_link(article_doc.get("canonical_url") or article_doc.get("link")),
-                author=str(article_doc.get("author", "")).strip() or None,
-                summary_html=summary_html,
-                full_summary_html=full_summary_html,
-                is_summary_truncated=is_summary_truncated,
-                media_image_url=normalize_article_link(article_doc.get("media_image_url")) or None,
-                published_at=article_doc.get("published_at"),
+            build_article_card(
+                content,
+                article_id=article_id,
+                feed_id=feed_id,
                 feed_title=source_title,
-                category_id=str(category.id),
-                category_name=category.name,
-                category_color_hex=category.color_hex,
+                category=category,
                 is_read=True,
                 read_at=read_at,
                 is_saved=article_id in saved_map,
@@ -2796,6 +4882,7 @@ async def list_recently_read_cards(
     return cards, has_more
 
 
+@profiled
 async def list_saved_cards(
     user_id: str,
     categories_by_id: dict[ObjectId, FeedCategoryDocument],
@@ -2807,6 +4894,7 @@ async def list_saved_cards(
     newest_first: bool,
     offset: int,
     limit: int,
+    preloaded_sources_map: dict[ObjectId, dict[str, Any]] | None = None,
 ) -> tuple[list[FeedArticleCard], bool]:
     """Return user-saved article cards ordered by article age or search recency."""
 
@@ -2830,6 +4918,7 @@ async def list_saved_cards(
     search_filter = build_article_search_filter(
         search_query,
         use_text_search=use_text_search,
+        feed_ids=eligible_feed_ids,
     )
 
     if use_text_search and isinstance(search_filter, dict) and "$text" in search_filter:
@@ -2929,8 +5018,13 @@ async def list_saved_cards(
         if isinstance(feed_id, ObjectId):
             source_ids.add(feed_id)
 
-    source_map = await load_sources_map(source_ids)
-    read_map, _ = await get_user_state_maps_for_article_ids(user_id, article_ids)
+    source_map, (read_map, _), _ = await asyncio.gather(
+        resolve_sources_map(source_ids, preloaded_sources_map),
+        get_user_state_maps_for_article_ids(user_id, article_ids),
+        hydrate_archived_article_bodies(
+            [row["article"] for row in paged_rows if isinstance(row.get("article"), dict)]
+        ),
+    )
 
     cards: list[FeedArticleCard] = []
 
@@ -2957,27 +5051,18 @@ async def list_saved_cards(
 
         saved_at_value = row.get("saved_at")
         saved_at = saved_at_value if isinstance(saved_at_value, datetime) else None
-        summary_html, full_summary_html, is_summary_truncated = build_article_summary_html(
+        content = render_article_content(
             article_doc,
             truncate_on_display=feed_id in truncated_feed_ids,
         )
 
         cards.append(
-            FeedArticleCard(
-                article_id=str(article_id),
-                feed_id=str(feed_id),
-                title=str(article_doc.get("title", "Untitled")),
-                link=normalize_article_navigation_link(article_doc.get("canonical_url") or article_doc.get("link")),
-                author=str(article_doc.get("author", "")).strip() or None,
-                summary_html=summary_html,
-                full_summary_html=full_summary_html,
-                is_summary_truncated=is_summary_truncated,
-                media_image_url=normalize_article_link(article_doc.get("media_image_url")) or None,
-                published_at=article_doc.get("published_at"),
+            build_article_card(
+                content,
+                article_id=article_id,
+                feed_id=feed_id,
                 feed_title=source_title,
-                category_id=str(category.id),
-                category_name=category.name,
-                category_color_hex=category.color_hex,
+                category=category,
                 is_read=article_id in read_map,
                 read_at=read_map.get(article_id),
                 is_saved=True,
@@ -2988,6 +5073,7 @@ async def list_saved_cards(
     return cards, has_more
 
 
+@profiled
 async def mark_article_read(user_id: str, article_id: str) -> bool:
     """Mark an article as read for a user."""
 
@@ -3001,7 +5087,7 @@ async def mark_article_read(user_id: str, article_id: str) -> bool:
 
     now = utc_now()
 
-    await user_article_states_collection.update_one(
+    previous_state = await user_article_states_collection.find_one_and_update(
         {"user_id": user_id, "article_id": article_object_id},
         {
             "$set": {
@@ -3013,13 +5099,24 @@ async def mark_article_read(user_id: str, article_id: str) -> bool:
                 "created_at": now,
             },
         },
+        projection={"is_read": 1},
         upsert=True,
+        return_document=ReturnDocument.BEFORE,
     )
 
+    if previous_state is None or not bool(previous_state.get("is_read")):
+        feed_ref = await _load_article_feed_ref(article_object_id)
+        await asyncio.gather(
+            adjust_unread_counter_for_article(user_id, article_object_id, -1, feed_ref),
+            _adjust_user_feed_daily_rollup(user_id, feed_ref, now, "read", 1),
+        )
+
+    await _bump_user_article_state_versions([user_id])
     invalidate_category_counts_cache(user_id)
     return True
 
 
+@profiled
 async def mark_article_opened(user_id: str, article_id: str) -> bool:
     """Mark an article as explicitly opened for a user."""
 
@@ -3033,7 +5130,7 @@ async def mark_article_opened(user_id: str, article_id: str) -> bool:
 
     now = utc_now()
 
-    await user_article_states_collection.update_one(
+    previous_state = await user_article_states_collection.find_one_and_update(
         {"user_id": user_id, "article_id": article_object_id},
         {
             "$set": {
@@ -3045,9 +5142,21 @@ async def mark_article_opened(user_id: str, article_id: str) -> bool:
                 "created_at": now,
             },
         },
+        projection={"is_opened": 1, "opened_at": 1},
         upsert=True,
+        return_document=ReturnDocument.BEFORE,
     )
 
+    if previous_state is None or not bool(previous_state.get("is_opened")):
+        opened_at = previous_state.get("opened_at") if previous_state is not None else None
+        await _adjust_user_feed_daily_rollup(
+            user_id,
+            await _load_article_feed_ref(article_object_id),
+            opened_at or now,
+            "opened",
+            1,
+        )
+
     await user_article_states_collection.update_one(
         {
             "user_id": user_id,
@@ -3068,6 +5177,7 @@ async def mark_article_opened(user_id: str, article_id: str) -> bool:
     return True
 
 
+@profiled
 async def mark_article_unread(user_id: str, article_id: str) -> bool:
     """Mark an article as unread for a user."""
 
@@ -3081,7 +5191,7 @@ async def mark_article_unread(user_id: str, article_id: str) -> bool:
 
     now = utc_now()
 
-    await user_article_states_collection.update_one(
+    previous_state = await user_article_states_collection.find_one_and_update(
         {"user_id": user_id, "article_id": article_object_id},
         {
             "$set": {
@@ -3092,13 +5202,30 @@ async def mark_article_unread(user_id: str, article_id: str) -> bool:
                 "created_at": now,
             },
         },
+        projection={"is_read": 1, "read_at": 1},
         upsert=True,
+        return_document=ReturnDocument.BEFORE,
     )
 
+    if previous_state is not None and bool(previous_state.get("is_read")):
+        feed_ref = await _load_article_feed_ref(article_object_id)
+        await asyncio.gather(
+            adjust_unread_counter_for_article(user_id, article_object_id, 1, feed_ref),
+            _adjust_user_feed_daily_rollup(
+                user_id,
+                feed_ref,
+                previous_state.get("read_at"),
+                "read",
+                -1,
+            ),
+        )
+
+    await _bump_user_article_state_versions([user_id])
     invalidate_category_counts_cache(user_id)
     return True
 
 
+@profiled
 async def mark_article_saved(user_id: str, article_id: str) -> bool:
     """Mark an article as saved for a user."""
 
@@ -3112,7 +5239,7 @@ async def mark_article_saved(user_id: str, article_id: str) -> bool:
 
     now = utc_now()
 
-    await user_article_states_collection.update_one(
+    previous_state = await user_article_states_collection.find_one_and_update(
         {"user_id": user_id, "article_id": article_object_id},
         {
             "$set": {
@@ -3125,13 +5252,34 @@ async def mark_article_saved(user_id: str, article_id: str) -> bool:
                 "created_at": now,
             },
         },
+        projection={"saved_at": 1},
         upsert=True,
+        return_document=ReturnDocument.BEFORE,
+    )
+
+    # Stats file a save under its latest saved_at, so a re-save moves it to today.
+    previous_saved_day = _rollup_day_key(
+        previous_state.get("saved_at") if previous_state is not None else None
     )
+    if previous_saved_day != _rollup_day_key(now):
+        feed_ref = await _load_article_feed_ref(article_object_id)
+        await asyncio.gather(
+            _adjust_user_feed_daily_rollup(user_id, feed_ref, now, "saved", 1),
+            _adjust_user_feed_daily_rollup(
+                user_id,
+                feed_ref,
+                previous_state.get("saved_at") if previous_state is not None else None,
+                "saved",
+                -1,
+            ),
+        )
 
+    await _bump_user_article_state_versions([user_id])
     invalidate_category_counts_cache(user_id)
     return True
 
 
+@profiled
 async def mark_article_unsaved(user_id: str, article_id: str) -> bool:
     """Mark an article as not saved for a user."""
 
@@ -3160,10 +5308,253 @@ async def mark_article_unsaved(user_id: str, article_id: str) -> bool:
         upsert=True,
     )
 
+    await _bump_user_article_state_versions([user_id])
     invalidate_category_counts_cache(user_id)
     return True
 
 
+_BULK_STATE_FIELDS: dict[str, tuple[str, bool]] = {
+    "read": ("is_read", True),
+    "unread": ("is_read", False),
+    "save": ("is_saved", True),
+    "unsave": ("is_saved", False),
+}
+
+
+def _bulk_state_change_stages(user_id: str, action: str) -> list[dict[str, Any]]:
+    """Return join stages keeping only articles the action would change."""
+
+    state_field, target_value = _BULK_STATE_FIELDS[action]
+    if action == "read":
+        return build_unread_article_join_stages(user_id)
+
+    return [
+        {
+            "$lookup": {
+                "from": "user_article_states",
+                "localField": "_id",
+                "foreignField": "article_id",
+                "pipeline": [
+                    {"$match": {"user_id": user_id, state_field: True}},
+                    {"$project": {"_id": 1}},
+                    {"$limit": 1},
+                ],
+                "as": "matching_states",
+            }
+        },
+        {"$match": {"matching_states.0": {"$exists": not target_value}}},
+        {"$project": {"matching_states": 0}},
+    ]
+
+
+async def _select_bulk_state_articles(
+    user_id: str,
+    payload: FeedArticleBulkStateRequest,
+) -> tuple[list[dict[str, Any]], bool]:
+    """Return ``(article docs, has_more)`` targeted by a bulk state request."""
+
+    if feed_articles_collection is None:
+        return [], False
+
+    projection = {"_id": 1, "feed_id": 1, "is_deleted": 1}
+
+    if len(payload.article_ids) > 0:
+        if len(payload.article_ids) > FEED_BULK_STATE_MAX_ARTICLES:
+            raise ValueError(f"At most {FEED_BULK_STATE_MAX_ARTICLES} article IDs can be changed at once.")
+
+        article_ids: list[ObjectId] = []
+        for raw_article_id in payload.article_ids:
+            try:
+                article_ids.append(ObjectId(raw_article_id))
+            except Exception as exc:
+                raise ValueError("Invalid article ID.") from exc
+
+        article_docs = await feed_articles_collection.find(
+            {"_id": {"$in": list(dict.fromkeys(article_ids))}},
+            projection,
+        ).to_list(length=None)
+        return article_docs, False
+
+    if payload.category is None and payload.feed_id is None:
+        raise ValueError("Provide article IDs or a category or feed filter.")
+
+    categories, subscriptions = await asyncio.gather(
+        list_category_documents(user_id),
+        list_user_subscription_docs(user_id),
+    )
+    feed_to_category = {
+        sub["feed_id"]: sub["category_id"]
+        for sub in subscriptions
+        if isinstance(sub.get("feed_id"), ObjectId) and isinstance(sub.get("category_id"), ObjectId)
+    }
+
+    category_filter = payload.category or "all"
+    if category_filter == "all":
+        allowed_category_ids = {
+            category.id for category in categories if category.id is not None and not category.muted
+        }
+    else:
+        try:
+            allowed_category_ids = {ObjectId(category_filter)}
+        except Exception as exc:
+            raise ValueError("Invalid category ID.") from exc
+
+    feed_ids = [
+        feed_id for feed_id, category_id in feed_to_category.items() if category_id in allowed_category_ids
+    ]
+    if payload.feed_id is not None:
+        try:
+            selected_feed_id = ObjectId(payload.feed_id)
+        except Exception as exc:
+            raise ValueError("Invalid feed ID.") from exc
+        feed_ids = [feed_id for feed_id in feed_ids if feed_id == selected_feed_id]
+
+    if len(feed_ids) == 0:
+        return [], False
+
+    article_match: dict[str, Any] = {"feed_id": {"$in": feed_ids}, "is_deleted": False}
+    if payload.older_than is not None:
+        older_than = _as_utc_datetime(payload.older_than)
+        article_match["$or"] = [
+            {"published_at": {"$lt": older_than}},
+            {"published_at": None, "fetched_at": {"$lt": older_than}},
+        ]
+
+    pipeline: list[dict[str, Any]] = [
+        {"$match": article_match},
+        {"$project": projection},
+        *_bulk_state_change_stages(user_id, payload.action),
+        {"$limit": FEED_BULK_STATE_MAX_ARTICLES + 1},
+    ]
+    article_docs = await feed_articles_collection.aggregate(pipeline).to_list(length=None)
+    has_more = len(article_docs) > FEED_BULK_STATE_MAX_ARTICLES
+    return article_docs[:FEED_BULK_STATE_MAX_ARTICLES], has_more
+
+
+@profiled
+async def apply_bulk_article_state(
+    user_id: str,
+    payload: FeedArticleBulkStateRequest,
+) -> FeedArticleBulkStateResponse:
+    """Apply one read/saved state change to many articles.
+
+    The state writes go out as a single unordered ``bulk_write`` of upserts,
+    each filtered on the state it changes so a transition already applied by a
+    concurrent request is not counted twice. Unread counters and daily rollups
+    are adjusted from the transitions that were actually written, with one
+    ``bulk_write`` each, and the category-count cache is invalidated once.
+    Filter requests change at most :data:`FEED_BULK_STATE_MAX_ARTICLES`
+    articles per call and report ``has_more`` so the client can repeat the
+    call.
+    """
+
+    if user_article_states_collection is None:
+        return FeedArticleBulkStateResponse(action=payload.action, matched_count=0, changed_count=0)
+
+    article_docs, has_more = await _select_bulk_state_articles(user_id, payload)
+    article_refs: dict[ObjectId, tuple[ObjectId | None, bool]] = {
+        doc["_id"]: (doc.get("feed_id"), bool(doc.get("is_deleted")))
+        for doc in article_docs
+        if isinstance(doc.get("_id"), ObjectId) and isinstance(doc.get("feed_id"), ObjectId)
+    }
+    if len(article_refs) == 0:
+        return FeedArticleBulkStateResponse(action=payload.action, matched_count=0, changed_count=0)
+
+    previous_states: dict[ObjectId, dict[str, Any]] = {}
+    async for state_doc in user_article_states_collection.find(
+        {"user_id": user_id, "article_id": {"$in": list(article_refs)}},
+        {"_id": 0, "article_id": 1, "is_read": 1, "read_at": 1, "is_saved": 1, "saved_at": 1},
+    ):
+        previous_states[state_doc["article_id"]] = state_doc
+
+    state_field, target_value = _BULK_STATE_FIELDS[payload.action]
+    now = utc_now()
+    today = _rollup_day_key(now)
+    state_set: dict[str, Any] = {state_field: target_value, "updated_at": now}
+    state_set_on_insert: dict[str, Any] = {"created_at": now}
+    if payload.action == "read":
+        state_set["read_at"] = now
+    elif payload.action == "save":
+        state_set["saved_at"] = now
+    if state_field != "is_read":
+        state_set_on_insert["is_read"] = False
+
+    operations: list[UpdateOne] = []
+    transitions: list[tuple[ObjectId | None, bool, dict[str, Any]]] = []
+    for article_id, (feed_id, is_deleted) in article_refs.items():
+        previous_state = previous_states.get(article_id, {})
+        if bool(previous_state.get(state_field)) == target_value:
+            continue
+
+        operations.append(
+            UpdateOne(
+                {"user_id": user_id, "article_id": article_id, state_field: {"$ne": target_value}},
+                {"$set": state_set, "$setOnInsert": state_set_on_insert},
+                upsert=True,
+            )
+        )
+        transitions.append((feed_id, is_deleted, previous_state))
+
+    if len(operations) == 0:
+        return FeedArticleBulkStateResponse(
+            action=payload.action,
+            matched_count=len(article_refs),
+            changed_count=0,
+            has_more=has_more,
+        )
+
+    upserted_indexes, unchanged_indexes = await _bulk_conditional_upsert(
+        user_article_states_collection,
+        operations,
+    )
+
+    changed_count = 0
+    counter_deltas: dict[ObjectId, int] = {}
+    rollup_deltas: dict[tuple[ObjectId, str | None, FeedDailyRollupField], int] = {}
+
+    def add_rollup(feed_id: ObjectId, event_at: Any, field: FeedDailyRollupField, delta: int) -> None:
+        key = (feed_id, _rollup_day_key(event_at), field)
+        rollup_deltas[key] = rollup_deltas.get(key, 0) + delta
+
+    for index, (feed_id, is_deleted, previous_state) in enumerate(transitions):
+        # A missing state reads as False, so inserting one only changes a True target.
+        if index in unchanged_indexes or (index in upserted_indexes and not target_value):
+            continue
+
+        changed_count += 1
+        if feed_id is None:
+            continue
+
+        if payload.action == "read":
+            if not is_deleted:
+                counter_deltas[feed_id] = counter_deltas.get(feed_id, 0) - 1
+            add_rollup(feed_id, now, "read", 1)
+        elif payload.action == "unread":
+            if not is_deleted:
+                counter_deltas[feed_id] = counter_deltas.get(feed_id, 0) + 1
+            add_rollup(feed_id, previous_state.get("read_at"), "read", -1)
+        elif payload.action == "save":
+            # Match mark_article_saved: a save is filed under its latest saved_at.
+            previous_saved_at = previous_state.get("saved_at")
+            if _rollup_day_key(previous_saved_at) != today:
+                add_rollup(feed_id, now, "saved", 1)
+                add_rollup(feed_id, previous_saved_at, "saved", -1)
+
+    await asyncio.gather(
+        _bulk_adjust_unread_counters(user_id, counter_deltas),
+        _bulk_adjust_feed_daily_rollups(user_id, rollup_deltas),
+    )
+
+    await _bump_user_article_state_versions([user_id])
+    invalidate_category_counts_cache(user_id)
+    return FeedArticleBulkStateResponse(
+        action=payload.action,
+        matched_count=len(article_refs),
+        changed_count=changed_count,
+        has_more=has_more,
+    )
+
+
 async def set_category_muted(user_id: str, category_id: str, muted: bool) -> FeedCategoryDocument | None:
     """Update category mute state for a user-owned category."""
 
@@ -3281,66 +5672,515 @@ async def reorder_category_sort_order(user_id: str, category_ids: list[str]) ->
             },
         )
 
-    return True
+    return True
+
+
+def parse_opml_entries(opml_bytes: bytes) -> tuple[list[tuple[str, str, str]], list[str]]:
+    """Parse OPML bytes into tuples of (feed_url, title, category_name)."""
+
+    return feed_utils.parse_opml_entries(opml_bytes)
+
+
+def _dedupe_opml_entries(
+    entries: list[tuple[str, str, str]],
+    options: FeedOpmlImportOptions,
+    result: FeedOpmlImportResult,
+) -> list[tuple[str, str, str]]:
+    """Normalize OPML entries and merge repeats of the same feed URL.
+
+    Each URL keeps the position of its first occurrence. Repeats are handled
+    like an existing subscription: skipped under the "skip" policy, and under
+    "refresh" the last non-empty title and the last category win.
+    """
+
+    deduped: dict[str, tuple[str, str, str]] = {}
+    for feed_url, title, category_name in entries:
+        category_to_use = category_name.strip() or options.default_category_name.strip() or "Imported"
+
+        try:
+            normalized_url = normalize_feed_url(feed_url)
+        except ValueError as exc:
+            result.errors.append(f"{feed_url}: {exc}")
+            continue
+
+        _add_opml_entry(deduped, (normalized_url, title.strip(), category_to_use), options, result)
+
+    return list(deduped.values())
+
+
+def _add_opml_entry(
+    entries_by_url: dict[str, tuple[str, str, str]],
+    entry: tuple[str, str, str],
+    options: FeedOpmlImportOptions,
+    result: FeedOpmlImportResult,
+) -> None:
+    """Add *entry* to *entries_by_url*, merging it into an earlier entry for the same URL."""
+
+    normalized_url, title, category_name = entry
+    existing = entries_by_url.get(normalized_url)
+    if existing is None:
+        entries_by_url[normalized_url] = entry
+        return
+
+    if options.duplicate_policy == "skip":
+        result.skipped_duplicates += 1
+        return
+
+    result.existing_subscriptions += 1
+    entries_by_url[normalized_url] = (normalized_url, title or existing[1], category_name)
+
+
+async def _validate_opml_entry(
+    entry: tuple[str, str, str],
+    session: aiohttp.ClientSession,
+    semaphore: asyncio.Semaphore,
+) -> tuple[tuple[str, str, str] | None, str | None]:
+    normalized_url, title, category_name = entry
+    async with semaphore:
+        try:
+            validated_url, fetched_title = await validate_feed_url(normalized_url, session=session)
+        except asyncio.TimeoutError:
+            return None, f"{normalized_url}: Feed URL timed out."
+        except ValueError as exc:
+            return None, f"{normalized_url}: {exc}"
+        except Exception as exc:  # noqa: BLE001
+            # Report anything else against this entry so the rest of the import completes.
+            logging.warning(f"OPML feed validation failed for {normalized_url}: {exc}")
+            return None, f"{normalized_url}: Unable to validate feed URL."
+
+    return (validated_url, title or fetched_title, category_name), None
+
+
+async def _validate_opml_entries(
+    entries: list[tuple[str, str, str]],
+    options: FeedOpmlImportOptions,
+    result: FeedOpmlImportResult,
+) -> list[tuple[str, str, str]]:
+    """Fetch every entry concurrently and drop the ones that are not valid feeds.
+
+    Validation shares the pooled client session and is bounded by
+    ``OPML_IMPORT_VALIDATION_CONCURRENCY``. An entry that fails for any reason
+    is reported in ``result.errors`` and the others still complete. Redirects
+    can canonicalize two entries to the same URL, so the validated list is
+    deduplicated again.
+    """
+
+    semaphore = asyncio.Semaphore(OPML_IMPORT_VALIDATION_CONCURRENCY)
+    shared_session = get_feed_http_session()
+    if shared_session is not None:
+        outcomes = await asyncio.gather(
+            *(_validate_opml_entry(entry, shared_session, semaphore) for entry in entries)
+        )
+    else:
+        async with aiohttp.ClientSession() as session:
+            outcomes = await asyncio.gather(
+                *(_validate_opml_entry(entry, session, semaphore) for entry in entries)
+            )
+
+    validated: dict[str, tuple[str, str, str]] = {}
+    for entry, error in outcomes:
+        if error is not None:
+            result.errors.append(error)
+            continue
+
+        if entry is None:
+            continue
+
+        _add_opml_entry(validated, entry, options, result)
+
+    return list(validated.values())
+
+
+async def _bulk_upsert(
+    collection: AsyncIOMotorCollection,
+    operations: list[UpdateOne],
+) -> int:
+    """Run unordered upserts and return how many documents were inserted.
+
+    Duplicate-key errors from a concurrent import racing on the same upsert
+    key are ignored; callers re-read the affected documents afterwards.
+    """
+
+    if len(operations) == 0:
+        return 0
+
+    try:
+        bulk_result = await collection.bulk_write(operations, ordered=False)
+    except BulkWriteError as exc:
+        write_errors = exc.details.get("writeErrors", [])
+        if any(error.get("code") != 11000 for error in write_errors):
+            raise
+        return int(exc.details.get("nUpserted", 0))
+
+    return int(bulk_result.upserted_count)
+
+
+async def _bulk_conditional_upsert(
+    collection: AsyncIOMotorCollection,
+    operations: list[UpdateOne],
+) -> tuple[set[int], set[int]]:
+    """Run unordered conditional upserts and report what each operation did.
+
+    Each operation filters on the state it changes. When the document already
+    holds the new state the filter misses and the upsert collides with the
+    unique key, so its duplicate-key error marks that operation as a no-op.
+    Returns the indexes of operations that inserted a document and of those
+    that found their change already applied.
+    """
+
+    if len(operations) == 0:
+        return set(), set()
+
+    try:
+        bulk_result = await collection.bulk_write(operations, ordered=False)
+    except BulkWriteError as exc:
+        write_errors = exc.details.get("writeErrors", [])
+        if any(error.get("code") != 11000 for error in write_errors):
+            raise
+        return (
+            {int(upsert["index"]) for upsert in exc.details.get("upserted", [])},
+            {int(error["index"]) for error in write_errors},
+        )
+
+    return set(bulk_result.upserted_ids), set()
+
+
+async def _ensure_categories_bulk(
+    user_id: str,
+    category_names: list[str],
+) -> tuple[dict[str, FeedCategoryDocument], int]:
+    """Create any missing categories in one bulk write and return them by name."""
+
+    if feed_categories_collection is None:
+        raise RuntimeError("Feed categories collection is not available.")
+
+    existing_categories = await list_category_documents(user_id)
+    categories_by_name = {category.name: category for category in existing_categories}
+    next_sort_order = max((category.sort_order for category in existing_categories), default=-1) + 1
+
+    now = utc_now()
+    operations: list[UpdateOne] = []
+    for category_name in dict.fromkeys(category_names):
+        if category_name in categories_by_name:
+            continue
+
+        category_doc = FeedCategoryDocument(
+            user_id=user_id,
+            name=category_name,
+            muted=False,
+            color_hex=deterministic_category_color(category_name),
+            sort_order=next_sort_order,
+            created_at=now,
+            updated_at=now,
+        )
+        next_sort_order += 1
+        operations.append(
+            UpdateOne(
+                {"user_id": user_id, "name": category_name},
+                {"$setOnInsert": category_doc.model_dump(by_alias=True, exclude={"id"})},
+                upsert=True,
+            )
+        )
+
+    if len(operations) == 0:
+        return categories_by_name, 0
+
+    created_count = await _bulk_upsert(feed_categories_collection, operations)
+    categories_by_name = {category.name: category for category in await list_category_documents(user_id)}
+    return categories_by_name, created_count
+
+
+async def _ensure_feed_sources_bulk(
+    entries: list[tuple[str, str, str]],
+) -> dict[str, dict[str, Any]]:
+    """Upsert sources for a batch of normalized URLs and return them by URL."""
+
+    if feed_sources_collection is None:
+        raise RuntimeError("Feed sources collection is not available.")
+
+    urls = [normalized_url for normalized_url, _, _ in entries]
+    sources_by_url: dict[str, dict[str, Any]] = {}
+    # Oldest document wins when duplicates exist; consolidation merges the rest.
+    async for doc in feed_sources_collection.find({"normalized_url": {"$in": urls}}).sort(
+        "_id", ASCENDING
+    ):
+        sources_by_url.setdefault(str(doc.get("normalized_url", "")), dict(doc))
+
+    now = utc_now()
+    operations: list[UpdateOne] = []
+    for normalized_url, title, _ in entries:
+        existing = sources_by_url.get(normalized_url)
+        if existing is None:
+            operations.append(
+                UpdateOne(
+                    {"normalized_url": normalized_url},
+                    {"$setOnInsert": _new_feed_source_document(normalized_url, title, now)},
+                    upsert=True,
+                )
+            )
+        elif title != "" and existing.get("title", "") != title:
+            operations.append(
+                UpdateOne(
+                    {"_id": existing["_id"]},
+                    {"$set": {"title": title, "updated_at": now}},
+                )
+            )
+            existing["title"] = title
+
+    await _bulk_upsert(feed_sources_collection, operations)
+
+    missing_urls = [url for url in urls if url not in sources_by_url]
+    if len(missing_urls) > 0:
+        async for doc in feed_sources_collection.find(
+            {"normalized_url": {"$in": missing_urls}}
+        ).sort("_id", ASCENDING):
+            sources_by_url.setdefault(str(doc.get("normalized_url", "")), dict(doc))
+
+    return sources_by_url
+
+
+async def _import_opml_batch(
+    user_id: str,
+    entries: list[tuple[str, str, str]],
+    categories_by_name: dict[str, FeedCategoryDocument],
+    options: FeedOpmlImportOptions,
+    result: FeedOpmlImportResult,
+) -> None:
+    """Upsert sources and subscriptions for one batch of deduplicated entries."""
+
+    if user_feed_subscriptions_collection is None:
+        raise RuntimeError("Feed subscriptions collection is not available.")
+
+    sources_by_url = await _ensure_feed_sources_bulk(entries)
+
+    resolved: list[tuple[ObjectId, ObjectId]] = []
+    for normalized_url, _, category_name in entries:
+        source_doc = sources_by_url.get(normalized_url)
+        category_doc = categories_by_name.get(category_name)
+        if source_doc is None or category_doc is None or category_doc.id is None:
+            result.errors.append(f"{normalized_url}: Unable to create subscription.")
+            continue
+
+        resolved.append((source_doc["_id"], category_doc.id))
+
+    feed_ids = [feed_id for feed_id, _ in resolved]
+    existing_subscriptions = {
+        doc["feed_id"]: doc
+        async for doc in user_feed_subscriptions_collection.find(
+            {"user_id": user_id, "feed_id": {"$in": feed_ids}},
+            {"feed_id": 1, "category_id": 1},
+        )
+    }
+
+    now = utc_now()
+    operations: list[UpdateOne] = []
+    insert_attempts = 0
+    for feed_id, category_id in resolved:
+        existing = existing_subscriptions.get(feed_id)
+        if existing is None:
+            insert_attempts += 1
+            operations.append(
+                UpdateOne(
+                    {"user_id": user_id, "feed_id": feed_id},
+                    {
+                        "$setOnInsert": {
+                            "user_id": user_id,
+                            "feed_id": feed_id,
+                            "category_id": category_id,
+                            "truncate_on_display": False,
+                            "created_at": now,
+                            "updated_at": now,
+                        }
+                    },
+                    upsert=True,
+                )
+            )
+            continue
+
+        if options.duplicate_policy == "skip":
+            result.skipped_duplicates += 1
+            continue
+
+        result.existing_subscriptions += 1
+        if existing.get("category_id") != category_id:
+            operations.append(
+                UpdateOne(
+                    {"_id": existing["_id"]},
+                    {"$set": {"category_id": category_id, "updated_at": now}},
+                )
+            )
+
+    created_count = await _bulk_upsert(user_feed_subscriptions_collection, operations)
+    result.created_subscriptions += created_count
+    # Upserts that matched a subscription created concurrently are duplicates.
+    if options.duplicate_policy == "skip":
+        result.skipped_duplicates += insert_attempts - created_count
+    else:
+        result.existing_subscriptions += insert_attempts - created_count
+
+    await request_immediate_feed_refresh(set(feed_ids))
+
+
+async def import_opml_entries(
+    user_id: str,
+    entries: list[tuple[str, str, str]],
+    options: FeedOpmlImportOptions,
+    on_progress: Callable[[int], Awaitable[None]] | None = None,
+) -> FeedOpmlImportResult:
+    """Import parsed OPML entries with batched category, source and subscription writes.
+
+    Args:
+        user_id: Importing user.
+        entries: Parsed ``(feed_url, title, category_name)`` tuples.
+        options: Duplicate policy, default category and validation toggle.
+        on_progress: Optional callback receiving the number of processed entries
+            after validation and after each batch.
+    """
+
+    result = FeedOpmlImportResult()
+
+    pending_entries = _dedupe_opml_entries(entries, options, result)
+    if options.validate_urls and len(pending_entries) > 0:
+        pending_entries = await _validate_opml_entries(pending_entries, options, result)
+
+    processed_count = len(entries) - len(pending_entries)
+    if on_progress is not None:
+        await on_progress(processed_count)
+
+    if len(pending_entries) > 0:
+        categories_by_name, result.created_categories = await _ensure_categories_bulk(
+            user_id,
+            [category_name for _, _, category_name in pending_entries],
+        )
+
+        for start in range(0, len(pending_entries), OPML_IMPORT_BATCH_SIZE):
+            batch = pending_entries[start : start + OPML_IMPORT_BATCH_SIZE]
+            await _import_opml_batch(user_id, batch, categories_by_name, options, result)
+
+            processed_count += len(batch)
+            if on_progress is not None:
+                await on_progress(processed_count)
+
+    if (
+        result.created_subscriptions > 0
+        or result.created_categories > 0
+        or result.existing_subscriptions > 0
+    ):
+        invalidate_category_counts_cache(user_id)
+    return result
+
+
+async def import_opml(
+    user_id: str,
+    opml_bytes: bytes,
+    options: FeedOpmlImportOptions,
+) -> FeedOpmlImportResult:
+    """Import OPML content into user categories and subscriptions."""
+
+    entries, parse_errors = parse_opml_entries(opml_bytes)
+    result = await import_opml_entries(user_id, entries, options)
+    result.errors[:0] = parse_errors
+    return result
+
+
+async def _update_opml_import_job(job_id: str, fields: dict[str, Any]) -> None:
+    if feed_opml_import_jobs_collection is None:
+        return
+
+    await feed_opml_import_jobs_collection.update_one(
+        {"_id": job_id},
+        {"$set": {**fields, "updated_at": utc_now()}},
+    )
+
+
+async def _run_opml_import_job(
+    job_id: str,
+    user_id: str,
+    entries: list[tuple[str, str, str]],
+    parse_errors: list[str],
+    options: FeedOpmlImportOptions,
+) -> None:
+    async def _report_progress(processed_count: int) -> None:
+        await _update_opml_import_job(
+            job_id,
+            {"status": "running", "processed_entries": processed_count},
+        )
+
+    try:
+        result = await import_opml_entries(user_id, entries, options, on_progress=_report_progress)
+    except Exception as exc:  # noqa: BLE001
+        logging.warning(f"OPML import job {job_id} failed: {exc}")
+        await _update_opml_import_job(job_id, {"status": "failed", "error": str(exc)})
+        return
 
+    result.errors[:0] = parse_errors
+    await _update_opml_import_job(
+        job_id,
+        {
+            "status": "completed",
+            "processed_entries": len(entries),
+            "result": result.model_dump(),
+        },
+    )
 
-def parse_opml_entries(opml_bytes: bytes) -> tuple[list[tuple[str, str, str]], list[str]]:
-    """Parse OPML bytes into tuples of (feed_url, title, category_name)."""
 
-    return feed_utils.parse_opml_entries(opml_bytes)
+def _opml_import_job_from_doc(doc: dict[str, Any]) -> FeedOpmlImportJob:
+    return FeedOpmlImportJob.model_validate({**doc, "job_id": str(doc.get("_id", ""))})
 
 
-async def import_opml(
+async def start_opml_import_job(
     user_id: str,
     opml_bytes: bytes,
     options: FeedOpmlImportOptions,
-) -> FeedOpmlImportResult:
-    """Import OPML content into user categories and subscriptions."""
+) -> FeedOpmlImportJob:
+    """Parse OPML content and import it in a background task.
 
-    result = FeedOpmlImportResult()
+    Parse errors for the whole document are raised immediately as ``ValueError``;
+    progress and the final :class:`FeedOpmlImportResult` are stored on the job
+    document so any worker can answer :func:`get_opml_import_job` polls.
+    """
+
+    if feed_opml_import_jobs_collection is None:
+        raise RuntimeError("Feed OPML import jobs collection is not available.")
 
     entries, parse_errors = parse_opml_entries(opml_bytes)
-    result.errors.extend(parse_errors)
 
-    created_category_names: set[str] = set()
+    now = utc_now()
+    job_doc = {
+        "_id": uuid4().hex,
+        "user_id": user_id,
+        "status": "pending",
+        "total_entries": len(entries),
+        "processed_entries": 0,
+        "result": None,
+        "error": None,
+        "created_at": now,
+        "updated_at": now,
+        "expires_at": now + OPML_IMPORT_JOB_RETENTION,
+    }
+    await feed_opml_import_jobs_collection.insert_one(job_doc)
 
-    for feed_url, title, category_name in entries:
-        category_to_use = category_name.strip() or options.default_category_name.strip() or "Imported"
+    task = asyncio.create_task(
+        _run_opml_import_job(job_doc["_id"], user_id, entries, parse_errors, options),
+        name=f"feeds-opml-import-{job_doc['_id']}",
+    )
+    _opml_import_tasks.add(task)
+    task.add_done_callback(_opml_import_tasks.discard)
 
-        try:
-            normalized_url = normalize_feed_url(feed_url)
-        except ValueError as exc:
-            result.errors.append(f"{feed_url}: {exc}")
-            continue
+    return _opml_import_job_from_doc(job_doc)
 
-        category_doc, category_created = await ensure_category(user_id, category_to_use)
-        if category_created:
-            created_category_names.add(category_doc.name)
 
-        subscription_doc, created_subscription = await create_or_update_subscription(
-            user_id=user_id,
-            normalized_url=normalized_url,
-            source_title=title,
-            category_name=category_doc.name,
-            duplicate_policy=options.duplicate_policy,
-        )
+async def get_opml_import_job(user_id: str, job_id: str) -> FeedOpmlImportJob | None:
+    """Return an OPML import job owned by the user, or None when unknown."""
 
-        if created_subscription:
-            result.created_subscriptions += 1
-        else:
-            if options.duplicate_policy == "skip":
-                result.skipped_duplicates += 1
-            else:
-                result.existing_subscriptions += 1
+    if feed_opml_import_jobs_collection is None:
+        return None
 
-    result.created_categories = len(created_category_names)
-    if (
-        result.created_subscriptions > 0
-        or result.created_categories > 0
-        or result.existing_subscriptions > 0
-    ):
-        invalidate_category_counts_cache(user_id)
-    return result
+    job_doc = await feed_opml_import_jobs_collection.find_one({"_id": job_id, "user_id": user_id})
+    if job_doc is None:
+        return None
+
+    return _opml_import_job_from_doc(job_doc)
 
 
 async def export_opml(user_id: str) -> str:
@@ -3491,10 +6331,54 @@ def build_sidebar_feed_groups(
     }
 
 
+async def _aggregate_state_feed_id_set(pipeline: list[dict[str, Any]]) -> set[str]:
+    """Run a user-state pipeline grouped by feed ID and return the IDs as strings."""
+
+    if user_article_states_collection is None:
+        return set()
+
+    return {
+        str(doc.get("_id"))
+        async for doc in user_article_states_collection.aggregate(pipeline)
+        if isinstance(doc.get("_id"), ObjectId)
+    }
+
+
+def build_sidebar_state_feed_pipeline(
+    state_match: dict[str, Any],
+    feed_ids: list[ObjectId],
+) -> list[dict[str, Any]]:
+    """Return the pipeline that groups matching user states by live subscribed feed."""
+
+    return [
+        {"$match": state_match},
+        {
+            "$lookup": {
+                "from": "feed_articles",
+                "let": {"article_id": "$article_id"},
+                "pipeline": [
+                    {"$match": {"$expr": {"$eq": ["$_id", "$$article_id"]}}},
+                    {
+                        "$match": {
+                            "is_deleted": False,
+                            "feed_id": {"$in": feed_ids},
+                        }
+                    },
+                    {"$project": {"feed_id": 1}},
+                ],
+                "as": "article_docs",
+            }
+        },
+        {"$unwind": "$article_docs"},
+        {"$group": {"_id": "$article_docs.feed_id"}},
+    ]
+
+
+@profiled
 async def get_sidebar_visible_feed_ids_by_group(
     user_id: str,
     subscriptions: list[dict[str, Any]] | None = None,
-    read_state_ids: set[ObjectId] | None = None,
+    unread_counters: dict[ObjectId, int] | None = None,
 ) -> dict[str, set[str]]:
     """Return visible feed IDs for each sidebar group, independent of selected category.
 
@@ -3545,93 +6429,26 @@ async def get_sidebar_visible_feed_ids_by_group(
 
     threshold = recently_read_cutoff()
 
-    recently_read_pipeline: list[dict[str, Any]] = [
-        {
-            "$match": {
-                "user_id": user_id,
-                "is_read": True,
-                "read_at": {"$gte": threshold},
-            }
-        },
-        {
-            "$lookup": {
-                "from": feed_articles_collection.name,
-                "let": {"article_id": "$article_id"},
-                "pipeline": [
-                    {"$match": {"$expr": {"$eq": ["$_id", "$$article_id"]}}},
-                    {
-                        "$match": {
-                            "is_deleted": False,
-                            "feed_id": {"$in": all_feed_ids},
-                        }
-                    },
-                    {"$project": {"feed_id": 1}},
-                ],
-                "as": "article_docs",
-            }
-        },
-        {"$unwind": "$article_docs"},
-        {"$group": {"_id": "$article_docs.feed_id"}},
-    ]
-
-    recently_read_feed_ids = {
-        str(doc.get("_id"))
-        async for doc in user_article_states_collection.aggregate(recently_read_pipeline)
-        if isinstance(doc.get("_id"), ObjectId)
-    }
-
-    saved_pipeline: list[dict[str, Any]] = [
-        {
-            "$match": {
-                "user_id": user_id,
-                "is_saved": True,
-            }
-        },
-        {
-            "$lookup": {
-                "from": feed_articles_collection.name,
-                "let": {"article_id": "$article_id"},
-                "pipeline": [
-                    {"$match": {"$expr": {"$eq": ["$_id", "$$article_id"]}}},
-                    {
-                        "$match": {
-                            "is_deleted": False,
-                            "feed_id": {"$in": all_feed_ids},
-                        }
-                    },
-                    {"$project": {"feed_id": 1}},
-                ],
-                "as": "article_docs",
-            }
-        },
-        {"$unwind": "$article_docs"},
-        {"$group": {"_id": "$article_docs.feed_id"}},
-    ]
-
-    saved_feed_ids = {
-        str(doc.get("_id"))
-        async for doc in user_article_states_collection.aggregate(saved_pipeline)
-        if isinstance(doc.get("_id"), ObjectId)
-    }
-
-    query: dict[str, Any] = {
-        "feed_id": {"$in": all_feed_ids},
-        "is_deleted": False,
-    }
+    recently_read_pipeline = build_sidebar_state_feed_pipeline(
+        build_recently_read_state_query(user_id, threshold),
+        all_feed_ids,
+    )
+    saved_pipeline = build_sidebar_state_feed_pipeline(
+        {"user_id": user_id, "is_saved": True},
+        all_feed_ids,
+    )
 
-    resolved_read_state_ids = (
-        read_state_ids
-        if read_state_ids is not None
-        else await get_read_article_id_set(user_id)
+    recently_read_feed_ids, saved_feed_ids = await asyncio.gather(
+        _aggregate_state_feed_id_set(recently_read_pipeline),
+        _aggregate_state_feed_id_set(saved_pipeline),
     )
-    if len(resolved_read_state_ids) > 0:
-        query["_id"] = {"$nin": list(resolved_read_state_ids)}
 
-    visible_feed_ids = await feed_articles_collection.distinct("feed_id", query)
+    if unread_counters is None:
+        unread_counters = await load_unread_counters(user_id, all_feed_ids)
     all_visible_feed_ids = {
         str(feed_id)
-        for feed_id in visible_feed_ids
-        if isinstance(feed_id, ObjectId)
+        for feed_id, unread_count in unread_counters.items()
+        if unread_count > 0
     }
 
     visible_by_group: dict[str, set[str]] = {
@@ -3650,6 +6467,7 @@ async def get_sidebar_visible_feed_ids_by_group(
     return visible_by_group
 
 
+@profiled
 async def get_sidebar_feed_groups_for_reader(user_id: str) -> dict[str, Any]:
     """Return live sidebar feed groups for reader pages."""
 
@@ -3657,27 +6475,12 @@ async def get_sidebar_feed_groups_for_reader(user_id: str) -> dict[str, Any]:
     return sidebar_meta.sidebar_feed_groups
 
 
-async def _subscription_rows_from_docs(
+def build_subscription_rows(
     subscriptions: list[dict[str, Any]],
+    categories_map: dict[ObjectId, FeedCategoryDocument],
+    sources_map: dict[ObjectId, dict[str, Any]],
 ) -> list[dict[str, Any]]:
-    """Build sidebar feed-group rows from preloaded subscription docs."""
-
-    if len(subscriptions) == 0:
-        return []
-
-    category_ids = {
-        sub["category_id"]
-        for sub in subscriptions
-        if isinstance(sub.get("category_id"), ObjectId)
-    }
-    feed_ids = {
-        sub["feed_id"]
-        for sub in subscriptions
-        if isinstance(sub.get("feed_id"), ObjectId)
-    }
-
-    categories_map = await load_categories_map(category_ids)
-    sources_map = await load_sources_map(feed_ids)
+    """Build sidebar feed-group rows from preloaded subscription, category and source docs."""
 
     rows: list[dict[str, Any]] = []
     for sub in subscriptions:
@@ -3710,35 +6513,29 @@ async def _subscription_rows_from_docs(
     return rows
 
 
+@profiled
 async def get_sidebar_meta_for_reader(user_id: str) -> FeedSidebarMetaResponse:
     """Return merged sidebar counts and expandable feed groups."""
 
-    categories = await list_category_documents(user_id)
-    subscriptions = await list_user_subscription_docs(user_id)
-    read_state_ids = await get_read_article_id_set(user_id)
-
-    now = utc_now()
-    cached_entry = _category_counts_cache.get(user_id)
-    if (
-        cached_entry is not None
-        and now - cached_entry[0] <= CATEGORY_COUNTS_CACHE_TTL
-    ):
-        categories_payload = cached_entry[1]
-    else:
-        categories_payload = await build_categories_with_counts(
+    scope = await load_reader_scope(user_id)
+    categories_payload, visible_feed_ids_by_group = await asyncio.gather(
+        get_cached_categories_with_counts(
             user_id,
-            categories,
-            subscriptions,
-            read_state_ids,
-        )
-        _category_counts_cache[user_id] = (now, categories_payload)
-
-    visible_feed_ids_by_group = await get_sidebar_visible_feed_ids_by_group(
-        user_id,
-        subscriptions=subscriptions,
-        read_state_ids=read_state_ids,
+            scope.categories,
+            scope.subscriptions,
+            unread_counters=scope.unread_counters,
+        ),
+        get_sidebar_visible_feed_ids_by_group(
+            user_id,
+            subscriptions=scope.subscriptions,
+            unread_counters=scope.unread_counters,
+        ),
+    )
+    subscription_rows = build_subscription_rows(
+        scope.subscriptions,
+        scope.categories_map,
+        scope.sources_map,
     )
-    subscription_rows = await _subscription_rows_from_docs(subscriptions)
     sidebar_feed_groups = build_sidebar_feed_groups(
         subscription_rows,
         visible_feed_ids_by_group=visible_feed_ids_by_group,
@@ -3753,42 +6550,37 @@ async def get_sidebar_meta_for_reader(user_id: str) -> FeedSidebarMetaResponse:
     )
 
 
+async def _load_reader_tail(
+    payload: FeedReaderSyncRequest,
+    article_list_kwargs: dict[str, Any],
+) -> FeedArticleListResponse | None:
+    """Load the page after the client's last card when it has reached the end."""
+
+    if not payload.at_end:
+        return None
+
+    return await get_article_list(
+        **article_list_kwargs,
+        offset=max(0, int(payload.tail_offset)),
+        limit=max(1, int(payload.page_size)),
+        ids_only=False,
+        cursor=payload.tail_cursor,
+    )
+
+
+@profiled
 async def get_reader_live_sync(
     user_id: str,
     payload: FeedReaderSyncRequest,
 ) -> FeedReaderSyncResponse:
-    """Return consolidated reader live-state in a single backend pass."""
-
-    categories = await list_category_documents(user_id)
-    subscriptions = await list_user_subscription_docs(user_id)
-    read_state_ids = await get_read_article_id_set(user_id)
+    """Return consolidated reader live-state in a single backend pass.
 
-    now = utc_now()
-    cached_entry = _category_counts_cache.get(user_id)
-    if (
-        cached_entry is not None
-        and now - cached_entry[0] <= CATEGORY_COUNTS_CACHE_TTL
-    ):
-        categories_payload = cached_entry[1]
-    else:
-        categories_payload = await build_categories_with_counts(
-            user_id,
-            categories,
-            subscriptions,
-            read_state_ids,
-        )
-        _category_counts_cache[user_id] = (now, categories_payload)
+    Categories, subscriptions, sources and unread counters are read once into a
+    :class:`ReaderScope`; the independent count, sidebar, head, tail and status
+    queries then run concurrently against that snapshot.
+    """
 
-    visible_feed_ids_by_group = await get_sidebar_visible_feed_ids_by_group(
-        user_id,
-        subscriptions=subscriptions,
-        read_state_ids=read_state_ids,
-    )
-    subscription_rows = await _subscription_rows_from_docs(subscriptions)
-    sidebar_feed_groups = build_sidebar_feed_groups(
-        subscription_rows,
-        visible_feed_ids_by_group=visible_feed_ids_by_group,
-    )
+    scope = await load_reader_scope(user_id)
 
     article_list_kwargs = {
         "user_id": user_id,
@@ -3797,19 +6589,53 @@ async def get_reader_live_sync(
         "feed_filter": payload.feed_id,
         "search_query": payload.search,
         "require_search_query": payload.require_search_query,
-        "preloaded_categories": categories,
-        "preloaded_subscriptions": subscriptions,
-        "preloaded_read_state_ids": read_state_ids,
+        "preloaded_categories": scope.categories,
+        "preloaded_subscriptions": scope.subscriptions,
+        "preloaded_sources_map": scope.sources_map,
     }
 
     head_limit = resolve_head_probe_limit(payload.page_size)
-    head_ids_payload = await get_article_list(
-        **article_list_kwargs,
-        offset=0,
-        limit=head_limit,
-        ids_only=True,
+    (
+        categories_payload,
+        visible_feed_ids_by_group,
+        head_ids_payload,
+        tail_payload,
+        statuses,
+    ) = await asyncio.gather(
+        get_cached_categories_with_counts(
+            user_id,
+            scope.categories,
+            scope.subscriptions,
+            unread_counters=scope.unread_counters,
+        ),
+        get_sidebar_visible_feed_ids_by_group(
+            user_id,
+            subscriptions=scope.subscriptions,
+            unread_counters=scope.unread_counters,
+        ),
+        get_article_list(
+            **article_list_kwargs,
+            offset=0,
+            limit=head_limit,
+            ids_only=True,
+        ),
+        _load_reader_tail(payload, article_list_kwargs),
+        get_article_read_statuses(
+            user_id,
+            payload.visible_article_ids,
+            preloaded_feed_ids=scope.feed_ids,
+        ),
     )
     head_article_ids = list(head_ids_payload.article_ids)
+    subscription_rows = build_subscription_rows(
+        scope.subscriptions,
+        scope.categories_map,
+        scope.sources_map,
+    )
+    sidebar_feed_groups = build_sidebar_feed_groups(
+        subscription_rows,
+        visible_feed_ids_by_group=visible_feed_ids_by_group,
+    )
 
     head_articles: list[FeedArticleCard] | None = None
     if head_article_ids != payload.current_head_ids:
@@ -3824,24 +6650,13 @@ async def get_reader_live_sync(
     tail_articles: list[FeedArticleCard] | None = None
     tail_has_more: bool | None = None
     tail_next_offset: int | None = None
-    if payload.at_end:
-        tail_offset = max(0, int(payload.tail_offset))
-        tail_limit = max(1, int(payload.page_size))
-        tail_payload = await get_article_list(
-            **article_list_kwargs,
-            offset=tail_offset,
-            limit=tail_limit,
-            ids_only=False,
-        )
+    tail_next_cursor: str | None = None
+    if tail_payload is not None:
         if len(tail_payload.articles) > 0:
             tail_articles = list(tail_payload.articles)
-            tail_has_more = tail_payload.has_more
-            tail_next_offset = tail_payload.next_offset
-        else:
-            tail_has_more = tail_payload.has_more
-            tail_next_offset = tail_payload.next_offset
-
-    statuses = await get_article_read_statuses(user_id, payload.visible_article_ids)
+        tail_has_more = tail_payload.has_more
+        tail_next_offset = tail_payload.next_offset
+        tail_next_cursor = tail_payload.next_cursor
 
     return FeedReaderSyncResponse(
         all_unread_count=categories_payload.all_unread_count,
@@ -3854,12 +6669,173 @@ async def get_reader_live_sync(
         head_articles=head_articles,
         head_has_more=head_ids_payload.has_more,
         head_next_offset=head_ids_payload.next_offset,
+        head_next_cursor=head_ids_payload.next_cursor,
         tail_articles=tail_articles,
         tail_has_more=tail_has_more,
         tail_next_offset=tail_next_offset,
+        tail_next_cursor=tail_next_cursor,
+    )
+
+
+@dataclass
+class ReaderPushState:
+    """What a push stream last told its reader, used to diff the next event."""
+
+    all_unread_count: int
+    recently_read_count: int
+    saved_count: int
+    categories: dict[str, FeedCategorySummary]
+    head_article_ids: list[str]
+    visible_feed_ids_by_group: dict[str, set[str]]
+
+
+@profiled
+async def get_reader_push_state(
+    user_id: str,
+    payload: FeedReaderSyncRequest,
+) -> ReaderPushState:
+    """Load the counters, head IDs and sidebar visibility a push stream diffs."""
+
+    scope = await load_reader_scope(user_id)
+    categories_payload, visible_feed_ids_by_group, head_ids_payload = await asyncio.gather(
+        get_cached_categories_with_counts(
+            user_id,
+            scope.categories,
+            scope.subscriptions,
+            unread_counters=scope.unread_counters,
+        ),
+        get_sidebar_visible_feed_ids_by_group(
+            user_id,
+            subscriptions=scope.subscriptions,
+            unread_counters=scope.unread_counters,
+        ),
+        get_article_list(
+            user_id=user_id,
+            category_filter=payload.category,
+            status_filter=payload.status_filter,
+            feed_filter=payload.feed_id,
+            search_query=payload.search,
+            require_search_query=payload.require_search_query,
+            offset=0,
+            limit=resolve_head_probe_limit(payload.page_size),
+            ids_only=True,
+            preloaded_categories=scope.categories,
+            preloaded_subscriptions=scope.subscriptions,
+            preloaded_sources_map=scope.sources_map,
+        ),
+    )
+
+    return ReaderPushState(
+        all_unread_count=categories_payload.all_unread_count,
+        recently_read_count=categories_payload.recently_read_count,
+        saved_count=categories_payload.saved_count,
+        categories={
+            category.category_id: category for category in categories_payload.categories
+        },
+        head_article_ids=list(head_ids_payload.article_ids),
+        visible_feed_ids_by_group=visible_feed_ids_by_group,
     )
 
 
+def diff_reader_push_state(
+    previous: ReaderPushState | None,
+    current: ReaderPushState,
+) -> FeedReaderPushDelta:
+    """Return only what changed between two push states.
+
+    With no previous state the result is a full snapshot: every counter and
+    category, the current head IDs and every visible sidebar feed.
+    """
+
+    if previous is None:
+        return FeedReaderPushDelta(
+            all_unread_count=current.all_unread_count,
+            recently_read_count=current.recently_read_count,
+            saved_count=current.saved_count,
+            categories=list(current.categories.values()),
+            head_article_ids=list(current.head_article_ids),
+            sidebar_visibility={
+                group: FeedSidebarVisibilityDelta(shown=sorted(feed_ids))
+                for group, feed_ids in current.visible_feed_ids_by_group.items()
+            },
+        )
+
+    delta = FeedReaderPushDelta()
+    if current.all_unread_count != previous.all_unread_count:
+        delta.all_unread_count = current.all_unread_count
+    if current.recently_read_count != previous.recently_read_count:
+        delta.recently_read_count = current.recently_read_count
+    if current.saved_count != previous.saved_count:
+        delta.saved_count = current.saved_count
+
+    delta.categories = [
+        category
+        for category_id, category in current.categories.items()
+        if previous.categories.get(category_id) != category
+    ]
+    delta.removed_category_ids = [
+        category_id for category_id in previous.categories if category_id not in current.categories
+    ]
+
+    previous_head = set(previous.head_article_ids)
+    current_head = set(current.head_article_ids)
+    delta.new_article_ids = [
+        article_id for article_id in current.head_article_ids if article_id not in previous_head
+    ]
+    delta.removed_article_ids = [
+        article_id for article_id in previous.head_article_ids if article_id not in current_head
+    ]
+
+    for group in previous.visible_feed_ids_by_group.keys() | current.visible_feed_ids_by_group.keys():
+        before = previous.visible_feed_ids_by_group.get(group, set())
+        after = current.visible_feed_ids_by_group.get(group, set())
+        if before != after:
+            delta.sidebar_visibility[group] = FeedSidebarVisibilityDelta(
+                shown=sorted(after - before),
+                hidden=sorted(before - after),
+            )
+
+    return delta
+
+
+async def iter_reader_push_deltas(
+    user_id: str,
+    payload: FeedReaderSyncRequest,
+) -> AsyncIterator[FeedReaderPushDelta | None]:
+    """Yield a snapshot, then one delta per batch of reader changes.
+
+    The stream sleeps on the in-process reader event bus, which is woken by
+    local state changes, by the cross-worker category-count invalidation
+    channel and by this worker's feed ingest watch, so an idle reader costs no
+    queries. ``None`` is yielded when
+    nothing changed for :data:`READER_PUSH_KEEPALIVE_SECONDS` so the caller can
+    send a keepalive.
+    """
+
+    with reader_event_bus.subscribe(user_id) as wake:
+        state = await get_reader_push_state(user_id, payload)
+        yield diff_reader_push_state(None, state)
+
+        while True:
+            try:
+                await asyncio.wait_for(wake.wait(), timeout=READER_PUSH_KEEPALIVE_SECONDS)
+            except TimeoutError:
+                yield None
+                continue
+
+            # Let a burst of writes (a mark-all-read, one ingest pass) settle
+            # into a single delta.
+            await asyncio.sleep(READER_PUSH_DEBOUNCE_SECONDS)
+            wake.clear()
+
+            current = await get_reader_push_state(user_id, payload)
+            delta = diff_reader_push_state(state, current)
+            state = current
+            if not delta.is_empty():
+                yield delta
+
+
+@profiled
 async def get_feed_reader_context(
     user_id: str,
     category_filter: str,
@@ -3870,11 +6846,6 @@ async def get_feed_reader_context(
 ) -> dict[str, Any]:
     """Build template context payload for the feed reader page."""
 
-    try:
-        await opportunistic_consolidate_duplicate_sources()
-    except Exception as exc:
-        logging.warning(f"Feed source dedupe pass failed: {exc}")
-
     categories_payload = await get_categories_with_counts(user_id)
     article_payload = await get_article_list(
         user_id,
@@ -3900,6 +6871,7 @@ async def get_feed_reader_context(
         "selected_status": article_payload.status,
         "article_has_more": article_payload.has_more,
         "article_next_offset": article_payload.next_offset,
+        "article_next_cursor": article_payload.next_cursor or "",
         "article_page_size": article_payload.limit,
     }
 
@@ -3920,96 +6892,541 @@ async def get_feed_settings_context(user_id: str) -> dict[str, Any]:
     }
 
 
-async def list_feed_admin_rows() -> list[dict[str, Any]]:
-    """Return global feed refresh/status rows for all currently subscribed feeds."""
+async def list_feed_admin_rows() -> list[dict[str, Any]]:
+    """Return global feed refresh/status rows for all currently subscribed feeds."""
+
+    if user_feed_subscriptions_collection is None:
+        return []
+
+    distinct_feed_ids = await user_feed_subscriptions_collection.distinct("feed_id")
+    feed_ids = [feed_id for feed_id in distinct_feed_ids if isinstance(feed_id, ObjectId)]
+    if len(feed_ids) == 0:
+        return []
+
+    sources_map = await load_sources_map(set(feed_ids))
+
+    article_counts: dict[ObjectId, int] = {}
+    latest_article_times: dict[ObjectId, datetime] = {}
+    if feed_articles_collection is not None:
+        count_cursor = feed_articles_collection.aggregate(
+            [
+                {
+                    "$match": {
+                        "feed_id": {"$in": feed_ids},
+                        "$or": [
+                            {"is_deleted": False},
+                            {"is_deleted": {"$exists": False}},
+                        ],
+                    }
+                },
+                {
+                    "$group": {
+                        "_id": "$feed_id",
+                        "article_count": {"$sum": 1},
+                        "latest_article_at": {
+                            "$max": {
+                                "$ifNull": ["$published_at", "$fetched_at"]
+                            }
+                        },
+                    }
+                },
+            ]
+        )
+
+        async for count_doc in count_cursor:
+            feed_id = count_doc.get("_id")
+            if not isinstance(feed_id, ObjectId):
+                continue
+            article_counts[feed_id] = int(count_doc.get("article_count", 0))
+
+            latest_article_at = _as_utc_datetime(count_doc.get("latest_article_at"))
+            if latest_article_at is not None:
+                latest_article_times[feed_id] = latest_article_at
+
+    rows: list[dict[str, Any]] = []
+    for feed_id in feed_ids:
+        source = sources_map.get(feed_id)
+        if source is None:
+            continue
+
+        feed_name = resolve_source_display_title(source)
+        fetch_status = str(source.get("fetch_status", "new")).strip() or "new"
+
+        rows.append(
+            {
+                "feed_id": str(feed_id),
+                "feed_name": feed_name,
+                "feed_url": str(source.get("normalized_url", "")).strip(),
+                "article_count": int(article_counts.get(feed_id, 0)),
+                "latest_article_at_iso": format_datetime_utc_iso(
+                    latest_article_times.get(feed_id)
+                ),
+                "last_refresh_at_iso": format_datetime_utc_iso(
+                    source.get("last_fetched_at")
+                ),
+                "next_refresh_at_iso": format_datetime_utc_iso(
+                    source.get("next_refresh_at")
+                ),
+                "last_refresh_status": fetch_status,
+                "last_refresh_error": str(source.get("last_error", "")).strip(),
+            }
+        )
+
+    rows.sort(key=lambda row: str(row.get("feed_name", "")).lower())
+    return rows
+
+
+async def get_feed_admin_context(user_id: str) -> dict[str, Any]:
+    """Build template context payload for the feed admin page."""
+
+    context = await get_feed_settings_context(user_id)
+    context["feed_admin_rows"] = await list_feed_admin_rows()
+    return context
+
+
+def _rollup_day_key(value: Any) -> str | None:
+    """Return the UTC day key (YYYY-MM-DD) for a rollup event timestamp."""
+
+    resolved = _as_utc_datetime(value)
+    if resolved is None:
+        return None
+
+    return resolved.date().isoformat()
+
+
+def _rollup_delta_operation(
+    user_id: str | None,
+    feed_id: ObjectId,
+    day: str | None,
+    field: FeedDailyRollupField,
+    delta: int,
+    now: datetime,
+) -> UpdateOne:
+    """Return the update applying *delta* to one rollup row.
+
+    Positive deltas upsert the row; negative deltas never take a count below
+    zero. ``day=None`` addresses the (user, feed) running-total row.
+    """
+
+    row_filter: dict[str, Any] = {"user_id": user_id, "feed_id": feed_id, "day": day}
+    update: dict[str, Any] = {"$inc": {field: int(delta)}, "$set": {"updated_at": now}}
+    if delta > 0:
+        return UpdateOne(row_filter, update, upsert=True)
+
+    return UpdateOne({**row_filter, field: {"$gte": -int(delta)}}, update)
+
+
+async def adjust_feed_daily_rollup(
+    user_id: str | None,
+    feed_id: ObjectId,
+    day: str | None,
+    field: FeedDailyRollupField,
+    delta: int,
+) -> None:
+    """Apply one event to a (user, feed, day) rollup row and its running total.
+
+    Feed-wide counts (``published``) are stored with ``user_id=None``.
+    """
+
+    if feed_daily_rollups_collection is None or day is None or delta == 0:
+        return
+
+    now = utc_now()
+    await _bulk_upsert(
+        feed_daily_rollups_collection,
+        [
+            _rollup_delta_operation(user_id, feed_id, day, field, delta, now),
+            _rollup_delta_operation(user_id, feed_id, None, field, delta, now),
+        ],
+    )
+
+
+async def _bulk_adjust_feed_daily_rollups(
+    user_id: str,
+    rollup_deltas: dict[tuple[ObjectId, str | None, FeedDailyRollupField], int],
+) -> None:
+    """Apply many :func:`adjust_feed_daily_rollup` events in one bulk write."""
+
+    if feed_daily_rollups_collection is None:
+        return
+
+    now = utc_now()
+    operations: list[UpdateOne] = []
+    total_deltas: dict[tuple[ObjectId, FeedDailyRollupField], int] = {}
+    for (feed_id, day, field), delta in rollup_deltas.items():
+        if day is None or delta == 0:
+            continue
+
+        operations.append(_rollup_delta_operation(user_id, feed_id, day, field, delta, now))
+        total_deltas[(feed_id, field)] = total_deltas.get((feed_id, field), 0) + delta
+
+    operations.extend(
+        _rollup_delta_operation(user_id, feed_id, None, field, delta, now)
+        for (feed_id, field), delta in total_deltas.items()
+        if delta != 0
+    )
+    await _bulk_upsert(feed_daily_rollups_collection, operations)
+
+
+async def record_feed_articles_published(
+    feed_id: ObjectId,
+    event_times: list[datetime],
+) -> None:
+    """Add newly ingested articles to the feed-wide published rollups.
+
+    *event_times* holds each article's ``published_at`` (or ``fetched_at`` when
+    undated), matching the day the stats page files the article under.
+    """
+
+    if feed_daily_rollups_collection is None or len(event_times) == 0:
+        return
+
+    day_counts: dict[str, int] = {}
+    for event_time in event_times:
+        day = _rollup_day_key(event_time)
+        if day is not None:
+            day_counts[day] = day_counts.get(day, 0) + 1
+
+    now = utc_now()
+    operations = [
+        _rollup_delta_operation(None, feed_id, day, "published", count, now)
+        for day, count in day_counts.items()
+    ]
+    if len(day_counts) > 0:
+        operations.append(
+            _rollup_delta_operation(None, feed_id, None, "published", sum(day_counts.values()), now)
+        )
+    await _bulk_upsert(feed_daily_rollups_collection, operations)
+
+
+def _rollup_state_pipeline(
+    articles_collection_name: str,
+    event_match: dict[str, Any],
+    event_field: str,
+    since: datetime | None,
+) -> list[dict[str, Any]]:
+    """Group user state events by (user, feed, UTC day) for a rollup backfill."""
+
+    match: dict[str, Any] = dict(event_match)
+    if since is not None:
+        match[event_field] = {"$gte": since}
+    else:
+        match[event_field] = {"$ne": None}
+
+    return [
+        {"$match": match},
+        {
+            "$lookup": {
+                "from": articles_collection_name,
+                "localField": "article_id",
+                "foreignField": "_id",
+                "pipeline": [{"$project": {"feed_id": 1}}],
+                "as": "article_docs",
+            }
+        },
+        {"$unwind": "$article_docs"},
+        {
+            "$group": {
+                "_id": {
+                    "user_id": "$user_id",
+                    "feed_id": "$article_docs.feed_id",
+                    "day": {
+                        "$dateToString": {
+                            "format": "%Y-%m-%d",
+                            "date": f"${event_field}",
+                            "timezone": "UTC",
+                        }
+                    },
+                },
+                "count": {"$sum": 1},
+            }
+        },
+    ]
+
+
+async def _merge_rollup_count_batch(
+    counts: dict[tuple[str | None, ObjectId, str], int],
+    field: FeedDailyRollupField,
+) -> int:
+    """Raise one batch of day rows and add what each gained to its running total."""
+
+    if feed_daily_rollups_collection is None or len(counts) == 0:
+        return 0
+
+    row_filters = [
+        {"user_id": user_id, "feed_id": feed_id, "day": day}
+        for user_id, feed_id, day in counts
+    ]
+    current_counts: dict[tuple[str | None, ObjectId, str], int] = {}
+    async for row in feed_daily_rollups_collection.find(
+        {"$or": row_filters},
+        {"_id": 0, "user_id": 1, "feed_id": 1, "day": 1, field: 1},
+    ):
+        row_key = (row.get("user_id"), row.get("feed_id"), row.get("day"))
+        current_counts[row_key] = int(row.get(field) or 0)
+
+    now = utc_now()
+    operations: list[UpdateOne] = []
+    total_increases: dict[tuple[str | None, ObjectId], int] = {}
+    for row_filter, (key, count) in zip(row_filters, counts.items()):
+        operations.append(
+            UpdateOne(
+                row_filter,
+                {"$max": {field: count}, "$set": {"updated_at": now}},
+                upsert=True,
+            )
+        )
+        increase = count - current_counts.get(key, 0)
+        if increase > 0:
+            total_key = (row_filter["user_id"], row_filter["feed_id"])
+            total_increases[total_key] = total_increases.get(total_key, 0) + increase
+
+    operations.extend(
+        _rollup_delta_operation(user_id, feed_id, None, field, increase, now)
+        for (user_id, feed_id), increase in total_increases.items()
+    )
+    await _bulk_upsert(feed_daily_rollups_collection, operations)
+    return len(counts)
+
+
+async def _merge_rollup_counts(
+    pipeline_source: AsyncIOMotorCollection,
+    pipeline: list[dict[str, Any]],
+    field: FeedDailyRollupField,
+) -> int:
+    """Raise rollup rows to the counts produced by *pipeline* using ``$max``.
+
+    ``$max`` makes the backfill idempotent and never lowers a row, so history
+    for hard-purged articles and already-applied incremental events survives.
+    Whatever a day row gains is added to its running-total row.
+    """
+
+    if feed_daily_rollups_collection is None:
+        return 0
+
+    merged_rows = 0
+    counts: dict[tuple[str | None, ObjectId, str], int] = {}
+    async for doc in pipeline_source.aggregate(pipeline):
+        key = doc.get("_id")
+        if (
+            not isinstance(key, dict)
+            or not isinstance(key.get("feed_id"), ObjectId)
+            or not isinstance(key.get("day"), str)
+        ):
+            continue
+
+        counts[(key.get("user_id"), key["feed_id"], key["day"])] = int(doc.get("count", 0))
+        if len(counts) >= FEED_DAILY_ROLLUP_BACKFILL_BATCH_SIZE:
+            merged_rows += await _merge_rollup_count_batch(counts, field)
+            counts = {}
+
+    return merged_rows + await _merge_rollup_count_batch(counts, field)
+
+
+async def rebuild_feed_daily_rollup_totals() -> int:
+    """Raise every running-total row to the sum of its day rows.
+
+    Totals are otherwise maintained alongside the day rows; this pass gives
+    rollups written before total rows existed their totals. ``$max`` keeps a
+    total that is already higher.
+
+    Returns:
+        Number of running-total rows written.
+    """
+
+    if feed_daily_rollups_collection is None:
+        return 0
+
+    fields = ("published", "read", "opened", "saved")
+    pipeline: list[dict[str, Any]] = [
+        {"$match": {"day": {"$ne": None}}},
+        {
+            "$group": {
+                "_id": {"user_id": "$user_id", "feed_id": "$feed_id"},
+                **{field: {"$sum": f"${field}"} for field in fields},
+            }
+        },
+    ]
+
+    now = utc_now()
+    written_rows = 0
+    operations: list[UpdateOne] = []
+    async for doc in feed_daily_rollups_collection.aggregate(pipeline):
+        key = doc.get("_id")
+        if not isinstance(key, dict) or not isinstance(key.get("feed_id"), ObjectId):
+            continue
+
+        operations.append(
+            UpdateOne(
+                {"user_id": key.get("user_id"), "feed_id": key["feed_id"], "day": None},
+                {
+                    "$max": {field: int(doc.get(field) or 0) for field in fields},
+                    "$set": {"updated_at": now},
+                },
+                upsert=True,
+            )
+        )
+        if len(operations) >= FEED_DAILY_ROLLUP_BACKFILL_BATCH_SIZE:
+            await _bulk_upsert(feed_daily_rollups_collection, operations)
+            written_rows += len(operations)
+            operations = []
+
+    await _bulk_upsert(feed_daily_rollups_collection, operations)
+    return written_rows + len(operations)
+
+
+async def backfill_feed_daily_rollups(since: datetime | None = None) -> int:
+    """Rebuild daily rollups from retained articles and user states.
+
+    Args:
+        since: Only rebuild events at or after this time; None rebuilds all
+            retained history.
+
+    Returns:
+        Number of rollup rows written.
+    """
+
+    if (
+        feed_daily_rollups_collection is None
+        or feed_articles_collection is None
+        or user_article_states_collection is None
+    ):
+        return 0
+
+    published_pipeline: list[dict[str, Any]] = []
+    if since is not None:
+        # Narrow on the indexed fields first; event_at falls back to fetched_at,
+        # so both can qualify an article and the exact test follows the $project.
+        published_pipeline.append(
+            {"$match": {"$or": [{"published_at": {"$gte": since}}, {"fetched_at": {"$gte": since}}]}}
+        )
+    published_pipeline.append(
+        {"$project": {"feed_id": 1, "event_at": {"$ifNull": ["$published_at", "$fetched_at"]}}}
+    )
+    if since is not None:
+        published_pipeline.append({"$match": {"event_at": {"$gte": since}}})
+    published_pipeline.append(
+        {
+            "$group": {
+                "_id": {
+                    "user_id": None,
+                    "feed_id": "$feed_id",
+                    "day": {
+                        "$dateToString": {
+                            "format": "%Y-%m-%d",
+                            "date": "$event_at",
+                            "timezone": "UTC",
+                        }
+                    },
+                },
+                "count": {"$sum": 1},
+            }
+        }
+    )
+
+    written_rows = await _merge_rollup_counts(
+        feed_articles_collection,
+        published_pipeline,
+        "published",
+    )
+    for field, event_match, event_field in (
+        ("read", {"is_read": True}, "read_at"),
+        ("opened", {"is_opened": True}, "opened_at"),
+        ("saved", {}, "saved_at"),
+    ):
+        written_rows += await _merge_rollup_counts(
+            user_article_states_collection,
+            _rollup_state_pipeline(feed_articles_collection.name, event_match, event_field, since),
+            cast(FeedDailyRollupField, field),
+        )
+
+    return written_rows
+
+
+async def run_feed_daily_rollup_maintenance() -> None:
+    """Backfill rollups once, then periodically catch up recent days.
+
+    The first pass rebuilds all retained history and records a marker in
+    ``feed_maintenance_state``; later passes only revisit the last two days to
+    pick up articles ingested by the backend worker. Running totals are
+    rebuilt from the day rows once, the first time the marker lacks
+    ``totals_rebuilt_at``.
+    """
+
+    if feed_maintenance_state_collection is None:
+        return
+
+    marker = await feed_maintenance_state_collection.find_one({"_id": FEED_DAILY_ROLLUP_MARKER_ID})
+    since: datetime | None = None
+    if marker is not None:
+        since = utc_now() - FEED_DAILY_ROLLUP_CATCH_UP_WINDOW
+
+    started_at = utc_now()
+    written_rows = await backfill_feed_daily_rollups(since)
+    marker_update: dict[str, Any] = {
+        "completed_at": utc_now(),
+        "started_at": started_at,
+        "rows_written": written_rows,
+    }
+    if marker is None or marker.get("totals_rebuilt_at") is None:
+        marker_update["totals_rows_written"] = await rebuild_feed_daily_rollup_totals()
+        marker_update["totals_rebuilt_at"] = utc_now()
+
+    await feed_maintenance_state_collection.update_one(
+        {"_id": FEED_DAILY_ROLLUP_MARKER_ID},
+        {"$set": marker_update},
+        upsert=True,
+    )
+
 
-    if user_feed_subscriptions_collection is None:
-        return []
+async def _feed_daily_rollup_maintenance_loop() -> None:
+    while True:
+        try:
+            await run_feed_daily_rollup_maintenance()
+        except Exception as exc:  # noqa: BLE001
+            logging.warning(f"Feed daily rollup maintenance failed: {exc}")
+        await asyncio.sleep(FEED_DAILY_ROLLUP_MAINTENANCE_INTERVAL.total_seconds())
 
-    distinct_feed_ids = await user_feed_subscriptions_collection.distinct("feed_id")
-    feed_ids = [feed_id for feed_id in distinct_feed_ids if isinstance(feed_id, ObjectId)]
-    if len(feed_ids) == 0:
-        return []
 
-    sources_map = await load_sources_map(set(feed_ids))
+async def start_feed_daily_rollup_maintenance() -> None:
+    global _feed_daily_rollup_task
 
-    article_counts: dict[ObjectId, int] = {}
-    latest_article_times: dict[ObjectId, datetime] = {}
-    if feed_articles_collection is not None:
-        count_cursor = feed_articles_collection.aggregate(
-            [
-                {
-                    "$match": {
-                        "feed_id": {"$in": feed_ids},
-                        "$or": [
-                            {"is_deleted": False},
-                            {"is_deleted": {"$exists": False}},
-                        ],
-                    }
-                },
-                {
-                    "$group": {
-                        "_id": "$feed_id",
-                        "article_count": {"$sum": 1},
-                        "latest_article_at": {
-                            "$max": {
-                                "$ifNull": ["$published_at", "$fetched_at"]
-                            }
-                        },
-                    }
-                },
-            ]
+    if _feed_daily_rollup_task is None or _feed_daily_rollup_task.done():
+        _feed_daily_rollup_task = asyncio.create_task(
+            _feed_daily_rollup_maintenance_loop(),
+            name="feeds-daily-rollup-maintenance",
         )
 
-        async for count_doc in count_cursor:
-            feed_id = count_doc.get("_id")
-            if not isinstance(feed_id, ObjectId):
-                continue
-            article_counts[feed_id] = int(count_doc.get("article_count", 0))
-
-            latest_article_at = _as_utc_datetime(count_doc.get("latest_article_at"))
-            if latest_article_at is not None:
-                latest_article_times[feed_id] = latest_article_at
 
-    rows: list[dict[str, Any]] = []
-    for feed_id in feed_ids:
-        source = sources_map.get(feed_id)
-        if source is None:
-            continue
+async def stop_feed_daily_rollup_maintenance() -> None:
+    global _feed_daily_rollup_task
 
-        feed_name = resolve_source_display_title(source)
-        fetch_status = str(source.get("fetch_status", "new")).strip() or "new"
+    task = _feed_daily_rollup_task
+    _feed_daily_rollup_task = None
+    if task is None:
+        return
 
-        rows.append(
-            {
-                "feed_id": str(feed_id),
-                "feed_name": feed_name,
-                "feed_url": str(source.get("normalized_url", "")).strip(),
-                "article_count": int(article_counts.get(feed_id, 0)),
-                "latest_article_at_iso": format_datetime_utc_iso(
-                    latest_article_times.get(feed_id)
-                ),
-                "last_refresh_at_iso": format_datetime_utc_iso(
-                    source.get("last_fetched_at")
-                ),
-                "next_refresh_at_iso": format_datetime_utc_iso(
-                    source.get("next_refresh_at")
-                ),
-                "last_refresh_status": fetch_status,
-                "last_refresh_error": str(source.get("last_error", "")).strip(),
-            }
-        )
+    task.cancel()
+    try:
+        await task
+    except asyncio.CancelledError:
+        pass
 
-    rows.sort(key=lambda row: str(row.get("feed_name", "")).lower())
-    return rows
 
+async def _adjust_user_feed_daily_rollup(
+    user_id: str,
+    feed_ref: tuple[ObjectId | None, bool],
+    event_at: Any,
+    field: FeedDailyRollupField,
+    delta: int,
+) -> None:
+    """Apply a user state transition to the rollup row for the article's feed."""
 
-async def get_feed_admin_context(user_id: str) -> dict[str, Any]:
-    """Build template context payload for the feed admin page."""
+    feed_id, _ = feed_ref
+    if feed_id is None:
+        return
 
-    context = await get_feed_settings_context(user_id)
-    context["feed_admin_rows"] = await list_feed_admin_rows()
-    return context
+    await adjust_feed_daily_rollup(user_id, feed_id, _rollup_day_key(event_at), field, delta)
 
 
 def _safe_percent(numerator: int, denominator: int) -> float:
@@ -4032,25 +7449,22 @@ def _build_day_keys(window_days: int, now: datetime) -> list[str]:
     return day_keys
 
 
+@profiled
 async def get_feed_stats(user_id: str, window_days: int = 30) -> FeedStatsResponse:
     """Return aggregate feed-reader stats overall, by category, and by feed.
 
-    Soft-deleted articles are included so the default 30-day stats window stays
-    accurate after the 7-day reader soft-delete. Hard-purged rows are removed
-    from Mongo and cannot contribute; soft-deleted docs are retained for 30 days
-    after soft-delete, which covers the default stats window.
+    Counts come from ``feed_daily_rollups`` rather than raw articles and states:
+    one row per (user, feed, UTC day) plus one running-total row per (user,
+    feed), so a window costs at most ``window_days + 1`` x feeds rows and
+    hard-purged articles keep their history. "Recent" means the
+    ``window_days`` UTC days ending today.
     """
 
-    if (
-        user_feed_subscriptions_collection is None
-        or feed_articles_collection is None
-        or user_article_states_collection is None
-    ):
+    if user_feed_subscriptions_collection is None or feed_daily_rollups_collection is None:
         return FeedStatsResponse(window_days=max(1, window_days), overall=FeedStatsOverall())
 
     normalized_window_days = max(1, int(window_days))
     now = utc_now()
-    cutoff = now - timedelta(days=normalized_window_days)
     day_keys = _build_day_keys(normalized_window_days, now)
 
     subscriptions = await list_user_subscription_docs(user_id)
@@ -4064,140 +7478,69 @@ async def get_feed_stats(user_id: str, window_days: int = 30) -> FeedStatsRespon
     if len(feed_ids) == 0:
         return FeedStatsResponse(window_days=normalized_window_days, overall=FeedStatsOverall())
 
-    categories = await list_category_documents(user_id)
-    categories_by_id = {
-        category.id: category
-        for category in categories
-        if category.id is not None
-    }
-    source_map = await load_sources_map(set(feed_ids))
-
-    # Stats must see soft-deleted articles; reader retention hides them from
-    # the main UI but they remain until hard purge.
-    subscribed_article_match: dict[str, Any] = {
-        "feed_id": {"$in": feed_ids},
-    }
-    subscribed_article_lookup_match: dict[str, Any] = {
+    # Feed-wide published rows carry user_id=None; engagement rows carry the user.
+    rollup_match: dict[str, Any] = {
+        "user_id": {"$in": [user_id, None]},
         "feed_id": {"$in": feed_ids},
     }
+    first_day = day_keys[0]
 
-    feed_article_stats: dict[ObjectId, dict[str, Any]] = {}
-    article_pipeline: list[dict[str, Any]] = [
-        {"$match": subscribed_article_match},
-        {
-            "$project": {
-                "feed_id": 1,
-                "event_at": {"$ifNull": ["$published_at", "$fetched_at"]},
-            }
-        },
+    # Running totals live on the day=None row; day keys sort after null.
+    def _windowed_sum(field: str) -> dict[str, Any]:
+        return {"$sum": {"$cond": [{"$gte": ["$day", first_day]}, f"${field}", 0]}}
+
+    def _total_sum(field: str) -> dict[str, Any]:
+        return {"$sum": {"$cond": [{"$gte": ["$day", first_day]}, 0, f"${field}"]}}
+
+    per_feed_pipeline: list[dict[str, Any]] = [
+        {"$match": {**rollup_match, "$or": [{"day": None}, {"day": {"$gte": first_day}}]}},
         {
             "$group": {
                 "_id": "$feed_id",
-                # All retained articles (including soft-deleted) so open/save
-                # rates stay coherent with windowed history.
-                "articles_total": {"$sum": 1},
-                "articles_recent": {
-                    "$sum": {
-                        "$cond": [
-                            {"$gte": ["$event_at", cutoff]},
-                            1,
-                            0,
-                        ]
-                    }
-                },
+                "articles_total": _total_sum("published"),
+                "articles_recent": _windowed_sum("published"),
+                "opened_total": _total_sum("opened"),
+                "opened_recent": _windowed_sum("opened"),
+                "saved_total": _total_sum("saved"),
+                "saved_recent": _windowed_sum("saved"),
             }
         },
     ]
-
-    async for doc in feed_articles_collection.aggregate(article_pipeline):
-        feed_id = doc.get("_id")
-        if not isinstance(feed_id, ObjectId):
-            continue
-        feed_article_stats[feed_id] = {
-            "articles_total": int(doc.get("articles_total", 0)),
-            "articles_recent": int(doc.get("articles_recent", 0)),
-        }
-
-    feed_state_stats: dict[ObjectId, dict[str, Any]] = {}
-    state_pipeline: list[dict[str, Any]] = [
-        {
-            "$match": {
-                "user_id": user_id,
-                "$or": [
-                    {"is_opened": True},
-                    {"saved_at": {"$exists": True, "$ne": None}},
-                ],
-            }
-        },
-        {
-            "$lookup": {
-                "from": feed_articles_collection.name,
-                "let": {"article_id": "$article_id"},
-                "pipeline": [
-                    {"$match": {"$expr": {"$eq": ["$_id", "$$article_id"]}}},
-                    {"$match": subscribed_article_lookup_match},
-                    {
-                        "$project": {
-                            "feed_id": 1,
-                        }
-                    },
-                ],
-                "as": "article_docs",
-            }
-        },
-        {"$unwind": "$article_docs"},
+    daily_pipeline: list[dict[str, Any]] = [
+        {"$match": {**rollup_match, "day": {"$gte": first_day}}},
         {
             "$group": {
-                "_id": "$article_docs.feed_id",
-                "opened_total": {
-                    "$sum": {"$cond": [{"$eq": ["$is_opened", True]}, 1, 0]}
-                },
-                "opened_recent": {
-                    "$sum": {
-                        "$cond": [
-                            {
-                                "$and": [
-                                    {"$eq": ["$is_opened", True]},
-                                    {"$gte": ["$opened_at", cutoff]},
-                                ]
-                            },
-                            1,
-                            0,
-                        ]
-                    }
-                },
-                "saved_total": {
-                    "$sum": {
-                        "$cond": [
-                            {"$ne": ["$saved_at", None]},
-                            1,
-                            0,
-                        ]
-                    }
-                },
-                "saved_recent": {
-                    "$sum": {
-                        "$cond": [
-                            {
-                                "$and": [
-                                    {"$ne": ["$saved_at", None]},
-                                    {"$gte": ["$saved_at", cutoff]},
-                                ]
-                            },
-                            1,
-                            0,
-                        ]
-                    }
-                },
+                "_id": "$day",
+                "published": {"$sum": "$published"},
+                "opened": {"$sum": "$opened"},
+                "saved": {"$sum": "$saved"},
             }
         },
     ]
 
-    async for doc in user_article_states_collection.aggregate(state_pipeline):
+    categories, source_map, per_feed_docs, daily_docs = await asyncio.gather(
+        list_category_documents(user_id),
+        load_sources_map(set(feed_ids)),
+        feed_daily_rollups_collection.aggregate(per_feed_pipeline).to_list(None),
+        feed_daily_rollups_collection.aggregate(daily_pipeline).to_list(None),
+    )
+    categories_by_id = {
+        category.id: category
+        for category in categories
+        if category.id is not None
+    }
+
+    feed_article_stats: dict[ObjectId, dict[str, Any]] = {}
+    feed_state_stats: dict[ObjectId, dict[str, Any]] = {}
+    for doc in per_feed_docs:
         feed_id = doc.get("_id")
         if not isinstance(feed_id, ObjectId):
             continue
 
+        feed_article_stats[feed_id] = {
+            "articles_total": int(doc.get("articles_total", 0)),
+            "articles_recent": int(doc.get("articles_recent", 0)),
+        }
         feed_state_stats[feed_id] = {
             "opened_total": int(doc.get("opened_total", 0)),
             "opened_recent": int(doc.get("opened_recent", 0)),
@@ -4209,135 +7552,14 @@ async def get_feed_stats(user_id: str, window_days: int = 30) -> FeedStatsRespon
         day: {"published": 0, "opened": 0, "saved": 0}
         for day in day_keys
     }
-
-    publish_daily_pipeline: list[dict[str, Any]] = [
-        {"$match": subscribed_article_match},
-        {
-            "$project": {
-                "event_at": {"$ifNull": ["$published_at", "$fetched_at"]},
-            }
-        },
-        {
-            "$match": {
-                "event_at": {"$gte": cutoff},
-            }
-        },
-        {
-            "$project": {
-                "day": {
-                    "$dateToString": {
-                        "format": "%Y-%m-%d",
-                        "date": "$event_at",
-                        "timezone": "UTC",
-                    }
-                }
-            }
-        },
-        {
-            "$group": {
-                "_id": "$day",
-                "count": {"$sum": 1},
-            }
-        },
-    ]
-
-    async for doc in feed_articles_collection.aggregate(publish_daily_pipeline):
-        day = str(doc.get("_id", "")).strip()
-        if day in daily_overall:
-            daily_overall[day]["published"] = int(doc.get("count", 0))
-
-    opened_daily_pipeline: list[dict[str, Any]] = [
-        {
-            "$match": {
-                "user_id": user_id,
-                "is_opened": True,
-                "opened_at": {"$gte": cutoff},
-            }
-        },
-        {
-            "$lookup": {
-                "from": feed_articles_collection.name,
-                "let": {"article_id": "$article_id"},
-                "pipeline": [
-                    {"$match": {"$expr": {"$eq": ["$_id", "$$article_id"]}}},
-                    {"$match": subscribed_article_lookup_match},
-                    {"$project": {"_id": 1}},
-                ],
-                "as": "article_docs",
-            }
-        },
-        {"$match": {"article_docs.0": {"$exists": True}}},
-        {
-            "$project": {
-                "day": {
-                    "$dateToString": {
-                        "format": "%Y-%m-%d",
-                        "date": "$opened_at",
-                        "timezone": "UTC",
-                    }
-                }
-            }
-        },
-        {
-            "$group": {
-                "_id": "$day",
-                "count": {"$sum": 1},
-            }
-        },
-    ]
-
-    async for doc in user_article_states_collection.aggregate(opened_daily_pipeline):
+    for doc in daily_docs:
         day = str(doc.get("_id", "")).strip()
         if day in daily_overall:
-            daily_overall[day]["opened"] = int(doc.get("count", 0))
-
-    saved_daily_pipeline: list[dict[str, Any]] = [
-        {
-            "$match": {
-                "user_id": user_id,
-                "saved_at": {
-                    "$exists": True,
-                    "$ne": None,
-                    "$gte": cutoff,
-                },
-            }
-        },
-        {
-            "$lookup": {
-                "from": feed_articles_collection.name,
-                "let": {"article_id": "$article_id"},
-                "pipeline": [
-                    {"$match": {"$expr": {"$eq": ["$_id", "$$article_id"]}}},
-                    {"$match": subscribed_article_lookup_match},
-                    {"$project": {"_id": 1}},
-                ],
-                "as": "article_docs",
-            }
-        },
-        {"$match": {"article_docs.0": {"$exists": True}}},
-        {
-            "$project": {
-                "day": {
-                    "$dateToString": {
-                        "format": "%Y-%m-%d",
-                        "date": "$saved_at",
-                        "timezone": "UTC",
-                    }
-                }
-            }
-        },
-        {
-            "$group": {
-                "_id": "$day",
-                "count": {"$sum": 1},
+            daily_overall[day] = {
+                "published": int(doc.get("published", 0)),
+                "opened": int(doc.get("opened", 0)),
+                "saved": int(doc.get("saved", 0)),
             }
-        },
-    ]
-
-    async for doc in user_article_states_collection.aggregate(saved_daily_pipeline):
-        day = str(doc.get("_id", "")).strip()
-        if day in daily_overall:
-            daily_overall[day]["saved"] = int(doc.get("count", 0))
 
     per_feed_rows: list[FeedStatsRow] = []
     category_accumulator: dict[ObjectId, dict[str, Any]] = {}
@@ -1,14 +1,22 @@
 from __future__ import annotations
 
+import asyncio
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
 from functools import lru_cache
 import hashlib
 import ipaddress
 import socket
+import time
+from typing import NamedTuple
 from urllib.parse import parse_qsl, urlencode, urlparse, urlunparse
 import xml.etree.ElementTree as ET
 
 from defusedxml import ElementTree as DefusedElementTree
 from defusedxml.common import DefusedXmlException
+import dns.asyncresolver
+import dns.exception
+import dns.rdatatype
 
 
 LOCAL_HOSTNAMES = {
@@ -17,6 +25,15 @@ LOCAL_HOSTNAMES = {
     "ip6-localhost",
 }
 
+DNS_CACHE_MAX_ENTRIES = 4096
+DNS_CACHE_MIN_TTL_SECONDS = 30.0
+DNS_CACHE_MAX_TTL_SECONDS = 3600.0
+DNS_CACHE_NEGATIVE_TTL_SECONDS = 30.0
+DNS_CACHE_STALE_SECONDS = 300.0
+DNS_LOOKUP_TIMEOUT_SECONDS = 5.0
+
+ResolvedAddress = ipaddress.IPv4Address | ipaddress.IPv6Address
+
 
 class _DnsResolutionUnavailable(LookupError):
     """DNS lookup failed or returned no usable addresses.
@@ -85,38 +102,174 @@ def _resolve_hostname_addresses(
         return ()
 
 
-def is_public_http_url(url: str) -> bool:
-    """Return True when URL is HTTP(S) and resolves to globally-routable hosts."""
+async def _resolve_hostname_with_dns(hostname: str) -> tuple[tuple[ResolvedAddress, ...], float]:
+    """Resolve A and AAAA records and return the addresses with the shortest record TTL."""
 
-    return explain_public_http_url_block(url) is None
+    resolver = dns.asyncresolver.get_default_resolver()
+    answers = await asyncio.gather(
+        resolver.resolve(hostname, dns.rdatatype.A, raise_on_no_answer=False),
+        resolver.resolve(hostname, dns.rdatatype.AAAA, raise_on_no_answer=False),
+        return_exceptions=True,
+    )
 
+    seen_addresses: set[str] = set()
+    resolved_addresses: list[ResolvedAddress] = []
+    ttl_seconds = DNS_CACHE_MAX_TTL_SECONDS
+    for answer in answers:
+        if isinstance(answer, BaseException) or answer.rrset is None:
+            continue
 
-def explain_public_http_url_block(url: str) -> str | None:
-    """Return a rejection reason, or None when the URL is allowed."""
+        ttl_seconds = min(ttl_seconds, float(answer.rrset.ttl))
+        for record in answer.rrset:
+            parsed_ip = _parse_ip_address(str(record.to_text()))
+            if parsed_ip is None or str(parsed_ip) in seen_addresses:
+                continue
+
+            seen_addresses.add(str(parsed_ip))
+            resolved_addresses.append(parsed_ip)
+
+    return tuple(resolved_addresses), ttl_seconds
+
+
+class _DnsCacheEntry(NamedTuple):
+    addresses: tuple[ResolvedAddress, ...]
+    expires_at: float
+    stale_until: float
+
+
+class AsyncDnsCache:
+    """Bounded async hostname cache with TTLs, negative caching and coalescing.
+
+    Successful lookups are kept for the record TTL (clamped to
+    ``min_ttl``..``max_ttl``); failed or empty lookups are kept for
+    ``negative_ttl``. Concurrent lookups of one hostname share a single
+    resolver call. Once a positive entry expires it is still served for
+    ``stale_seconds`` while a background refresh runs.
+    """
+
+    def __init__(
+        self,
+        resolver: Callable[[str], Awaitable[tuple[tuple[ResolvedAddress, ...], float]]] = (
+            _resolve_hostname_with_dns
+        ),
+        max_entries: int = DNS_CACHE_MAX_ENTRIES,
+        min_ttl: float = DNS_CACHE_MIN_TTL_SECONDS,
+        max_ttl: float = DNS_CACHE_MAX_TTL_SECONDS,
+        negative_ttl: float = DNS_CACHE_NEGATIVE_TTL_SECONDS,
+        stale_seconds: float = DNS_CACHE_STALE_SECONDS,
+        lookup_timeout: float = DNS_LOOKUP_TIMEOUT_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._resolver = resolver
+        self.max_entries = max(1, int(max_entries))
+        self.min_ttl = min_ttl
+        self.max_ttl = max_ttl
+        self.negative_ttl = negative_ttl
+        self.stale_seconds = stale_seconds
+        self.lookup_timeout = lookup_timeout
+        self._clock = clock
+        self._entries: OrderedDict[str, _DnsCacheEntry] = OrderedDict()
+        self._inflight: dict[str, asyncio.Task[tuple[ResolvedAddress, ...]]] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    async def resolve(self, hostname: str) -> tuple[ResolvedAddress, ...]:
+        """Return addresses for hostname; an empty tuple means the lookup failed."""
+
+        normalized_hostname = hostname.strip().rstrip(".").lower()
+        if normalized_hostname == "":
+            return ()
+
+        now = self._clock()
+        entry = self._entries.get(normalized_hostname)
+        if entry is not None:
+            if now < entry.expires_at:
+                self._entries.move_to_end(normalized_hostname)
+                return entry.addresses
+
+            if len(entry.addresses) > 0 and now < entry.stale_until:
+                self._lookup(normalized_hostname)
+                return entry.addresses
+
+        return await asyncio.shield(self._lookup(normalized_hostname))
+
+    def _lookup(self, hostname: str) -> asyncio.Task[tuple[ResolvedAddress, ...]]:
+        task = self._inflight.get(hostname)
+        if task is None:
+            task = asyncio.create_task(self._fetch(hostname), name=f"dns-lookup-{hostname}")
+            self._inflight[hostname] = task
+            task.add_done_callback(lambda _task: self._inflight.pop(hostname, None))
+        return task
+
+    async def _fetch(self, hostname: str) -> tuple[ResolvedAddress, ...]:
+        try:
+            addresses, ttl_seconds = await asyncio.wait_for(
+                self._resolver(hostname),
+                timeout=self.lookup_timeout,
+            )
+        except (asyncio.TimeoutError, dns.exception.DNSException, OSError, LookupError):
+            addresses, ttl_seconds = (), self.negative_ttl
+
+        now = self._clock()
+        if len(addresses) == 0:
+            expires_at = now + self.negative_ttl
+            stale_until = expires_at
+        else:
+            expires_at = now + min(self.max_ttl, max(self.min_ttl, ttl_seconds))
+            stale_until = expires_at + self.stale_seconds
+
+        self._entries[hostname] = _DnsCacheEntry(addresses, expires_at, stale_until)
+        self._entries.move_to_end(hostname)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+        return addresses
+
+
+dns_cache = AsyncDnsCache()
+
+
+def _explain_unresolved_url_block(url: str) -> tuple[str | None, str | None]:
+    """Run the checks that need no DNS lookup.
+
+    Returns:
+        Tuple of rejection reason (or None) and the hostname that still needs
+        resolving (None when the URL was decided without DNS).
+    """
 
     parsed = urlparse(str(url).strip())
     if parsed.scheme.lower() not in {"http", "https"}:
-        return f"Blocked unsupported URL scheme: {parsed.scheme or '(missing)'}"
+        return f"Blocked unsupported URL scheme: {parsed.scheme or '(missing)'}", None
 
     hostname = (parsed.hostname or "").strip().rstrip(".").lower()
     if hostname == "":
-        return "Blocked URL with missing hostname."
+        return "Blocked URL with missing hostname.", None
 
     if hostname in LOCAL_HOSTNAMES:
-        return f"Blocked local hostname: {hostname}"
+        return f"Blocked local hostname: {hostname}", None
 
     try:
         _ = parsed.port
     except ValueError:
-        return f"Blocked URL with invalid port: {url}"
+        return f"Blocked URL with invalid port: {url}", None
 
     parsed_ip = _parse_ip_address(hostname)
     if parsed_ip is not None:
         if parsed_ip.is_global:
-            return None
-        return f"Blocked non-public IP literal: {hostname}"
+            return None, None
+        return f"Blocked non-public IP literal: {hostname}", None
 
-    resolved_addresses = _resolve_hostname_addresses(hostname)
+    return None, hostname
+
+
+def _explain_resolved_address_block(
+    hostname: str,
+    resolved_addresses: tuple[ResolvedAddress, ...],
+) -> str | None:
     if len(resolved_addresses) == 0:
         return f"Blocked URL after DNS resolution failure: {hostname}"
 
@@ -127,6 +280,42 @@ def explain_public_http_url_block(url: str) -> str | None:
     return None
 
 
+def is_public_http_url(url: str) -> bool:
+    """Return True when URL is HTTP(S) and resolves to globally-routable hosts."""
+
+    return explain_public_http_url_block(url) is None
+
+
+def explain_public_http_url_block(url: str) -> str | None:
+    """Return a rejection reason, or None when the URL is allowed.
+
+    Resolves with blocking ``getaddrinfo``; async callers should use
+    :func:`explain_public_http_url_block_async` instead.
+    """
+
+    reason, hostname = _explain_unresolved_url_block(url)
+    if hostname is None:
+        return reason
+
+    return _explain_resolved_address_block(hostname, _resolve_hostname_addresses(hostname))
+
+
+async def is_public_http_url_async(url: str) -> bool:
+    """Async variant of :func:`is_public_http_url` backed by the DNS cache."""
+
+    return await explain_public_http_url_block_async(url) is None
+
+
+async def explain_public_http_url_block_async(url: str) -> str | None:
+    """Return a rejection reason, or None when the URL is allowed, without blocking the loop."""
+
+    reason, hostname = _explain_unresolved_url_block(url)
+    if hostname is None:
+        return reason
+
+    return _explain_resolved_address_block(hostname, await dns_cache.resolve(hostname))
+
+
 def normalize_feed_url(feed_url: str) -> str:
     """Normalize feed URL for deduplication and storage."""
 
@@ -262,3 +451,110 @@ def parse_opml_entries(opml_bytes: bytes) -> tuple[list[tuple[str, str, str]], l
         errors.append("No feed entries were found in the OPML document.")
 
     return entries, errors
+
+
+def _local_tag_name(tag: str) -> str:
+    return tag.rsplit("}", 1)[-1].lower()
+
+
+class _FeedHeaderTreeBuilder:
+    """Parser target that keeps only the feed header.
+
+    Element construction stops when the first ``item``/``entry`` starts if a
+    header-level ``title`` has already been seen, otherwise when that first
+    item closes (its title is the fallback) or the root closes.
+    """
+
+    def __init__(self) -> None:
+        self.root: ET.Element | None = None
+        self.complete = False
+        self._stack: list[ET.Element] = []
+        self._item_depth = 0
+        self._header_title_seen = False
+
+    def start(self, tag: str, attrib: dict[str, str]) -> None:
+        if self.complete:
+            return
+
+        if _local_tag_name(tag) in {"item", "entry"}:
+            if self._header_title_seen:
+                self.complete = True
+                return
+            self._item_depth += 1
+
+        element = ET.Element(tag, attrib)
+        if len(self._stack) > 0:
+            self._stack[-1].append(element)
+        else:
+            self.root = element
+        self._stack.append(element)
+
+    def end(self, tag: str) -> None:
+        if self.complete or len(self._stack) == 0:
+            return
+
+        element = self._stack.pop()
+        local_name = _local_tag_name(tag)
+        if local_name == "title" and self._item_depth == 0 and (element.text or "").strip() != "":
+            self._header_title_seen = True
+
+        if local_name in {"item", "entry"}:
+            self._item_depth -= 1
+            if self._item_depth == 0:
+                self.complete = True
+
+        if len(self._stack) == 0:
+            self.complete = True
+
+    def data(self, data: str) -> None:
+        if self.complete or len(self._stack) == 0:
+            return
+
+        element = self._stack[-1]
+        if len(element) > 0:
+            last_child = element[-1]
+            last_child.tail = (last_child.tail or "") + data
+        else:
+            element.text = (element.text or "") + data
+
+    def close(self) -> ET.Element | None:
+        return self.root
+
+
+class FeedHeaderParser:
+    """Incrementally parse feed XML until the channel/feed header is available.
+
+    Feed bytes are passed to :meth:`feed` chunk by chunk; once it returns True
+    the caller can stop reading the response. Entity expansion and DTDs are
+    rejected as in :func:`defusedxml.ElementTree.fromstring`, and parse errors
+    are raised as ``xml.etree.ElementTree.ParseError`` or
+    ``defusedxml.common.DefusedXmlException``.
+    """
+
+    def __init__(self) -> None:
+        self._target = _FeedHeaderTreeBuilder()
+        self._parser = DefusedElementTree.DefusedXMLParser(target=self._target)
+        self._closed = False
+
+    @property
+    def complete(self) -> bool:
+        return self._target.complete
+
+    def feed(self, chunk: bytes) -> bool:
+        """Parse another chunk and return whether the header is complete."""
+
+        if not self._target.complete:
+            self._parser.feed(chunk)
+        return self._target.complete
+
+    def close(self) -> ET.Element:
+        """Finish parsing and return the (possibly partial) root element."""
+
+        if not self._target.complete and not self._closed:
+            self._closed = True
+            self._parser.close()
+
+        if self._target.root is None:
+            raise ET.ParseError("no element found")
+
+        return self._target.root
@@ -0,0 +1,71 @@
+"""App-lifetime pooled HTTP client for outbound feed requests.
+
+One ``aiohttp.ClientSession`` is opened in the FastAPI ``lifespan`` hook and
+shared by feed validation and OPML imports, so repeated requests to the same
+host reuse kept-alive connections instead of paying DNS, TCP and TLS setup on
+every call.
+"""
+
+from __future__ import annotations
+
+import logging
+
+import aiohttp
+
+FEED_HTTP_CONNECTION_LIMIT = 64
+FEED_HTTP_CONNECTION_LIMIT_PER_HOST = 4
+FEED_HTTP_KEEPALIVE_SECONDS = 30.0
+FEED_HTTP_DNS_CACHE_SECONDS = 300
+
+_session: aiohttp.ClientSession | None = None
+
+
+async def start_feed_http_client() -> None:
+    """Open the shared feed HTTP session if it is not already running."""
+
+    global _session
+
+    if _session is not None and not _session.closed:
+        return
+
+    connector = aiohttp.TCPConnector(
+        limit=FEED_HTTP_CONNECTION_LIMIT,
+        limit_per_host=FEED_HTTP_CONNECTION_LIMIT_PER_HOST,
+        keepalive_timeout=FEED_HTTP_KEEPALIVE_SECONDS,
+        ttl_dns_cache=FEED_HTTP_DNS_CACHE_SECONDS,
+    )
+    _session = aiohttp.ClientSession(connector=connector)
+
+
+async def stop_feed_http_client() -> None:
+    """Close the shared feed HTTP session and its pooled connections."""
+
+    global _session
+
+    session = _session
+    _session = None
+    if session is None or session.closed:
+        return
+
+    try:
+        await session.close()
+    except Exception as exc:  # noqa: BLE001
+        logging.warning(f"Feed HTTP client shutdown failed: {exc}")
+
+
+def get_feed_http_session() -> aiohttp.ClientSession | None:
+    """Return the shared feed HTTP session, or None outside the app lifespan."""
+
+    if _session is None or _session.closed:
+        return None
+
+    return _session
+
+
+__all__ = [
+    "FEED_HTTP_CONNECTION_LIMIT",
+    "FEED_HTTP_CONNECTION_LIMIT_PER_HOST",
+    "get_feed_http_session",
+    "start_feed_http_client",
+    "stop_feed_http_client",
+]
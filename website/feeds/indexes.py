@@ -0,0 +1,292 @@
+"""Declared index set for the feeds collections.
+
+Every index the web app relies on is listed in :data:`FEED_INDEX_REGISTRY` and
+created once at startup by ``feed_db.ensure_feed_indexes``. Existing indexes are
+matched by key pattern rather than by name, so indexes created earlier (or by
+the ingest worker) under another name are not rebuilt. The article identity
+indexes (``canonical_url`` / ``external_id`` / ``dedupe_key``) belong to the
+ingest worker and are not declared here.
+
+The helpers below also read ``explain`` output so the hot query shapes can be
+checked for collection scans.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator, Mapping
+from dataclasses import dataclass, field
+from typing import Any
+
+from pymongo import ASCENDING, DESCENDING, TEXT
+
+
+@dataclass(frozen=True)
+class FeedIndexSpec:
+    """One declared index.
+
+    ``deferred`` indexes are reported but not created at startup; their owner
+    creates them once a precondition holds (for example, the unique source URL
+    index waits for duplicate-source consolidation).
+    """
+
+    collection: str
+    name: str
+    keys: tuple[tuple[str, Any], ...]
+    unique: bool = False
+    deferred: bool = False
+    options: Mapping[str, Any] = field(default_factory=dict)
+
+    @property
+    def is_text(self) -> bool:
+        return any(direction == TEXT for _, direction in self.keys)
+
+
+FEED_INDEX_REGISTRY: tuple[FeedIndexSpec, ...] = (
+    FeedIndexSpec(
+        "feed_sources",
+        "feed_source_normalized_url_unique",
+        (("normalized_url", ASCENDING),),
+        unique=True,
+        deferred=True,
+    ),
+    FeedIndexSpec(
+        "feed_sources",
+        "feed_source_last_fetched_at",
+        (("last_fetched_at", DESCENDING),),
+    ),
+    FeedIndexSpec(
+        "feed_articles",
+        "feed_article_feed_published",
+        (("feed_id", ASCENDING), ("published_at", ASCENDING)),
+    ),
+    FeedIndexSpec(
+        "feed_articles",
+        "feed_article_deleted",
+        (("is_deleted", ASCENDING), ("deleted_at", ASCENDING)),
+    ),
+    FeedIndexSpec(
+        "feed_articles",
+        "feed_article_id_feed",
+        (("_id", ASCENDING), ("feed_id", ASCENDING)),
+    ),
+    FeedIndexSpec(
+        "feed_articles",
+        "feed_article_fetched_at",
+        (("fetched_at", ASCENDING),),
+    ),
+    FeedIndexSpec(
+        "feed_articles",
+        "feed_article_published_at",
+        (("published_at", ASCENDING),),
+    ),
+    FeedIndexSpec(
+        "feed_articles",
+        "feed_article_feed_moved_at",
+        (("feed_moved_at", ASCENDING),),
+        options={"sparse": True},
+    ),
+    FeedIndexSpec(
+        "feed_articles",
+        "feed_article_text",
+        (("title", TEXT), ("summary_html", TEXT)),
+        options={"default_language": "english", "weights": {"title": 8, "summary_html": 2}},
+    ),
+    FeedIndexSpec(
+        "user_feed_subscriptions",
+        "user_feed_subscription_user_feed",
+        (("user_id", ASCENDING), ("feed_id", ASCENDING)),
+        unique=True,
+    ),
+    FeedIndexSpec(
+        "user_feed_subscriptions",
+        "user_feed_subscription_user_category",
+        (("user_id", ASCENDING), ("category_id", ASCENDING)),
+    ),
+    FeedIndexSpec(
+        "user_feed_subscriptions",
+        "user_feed_subscription_feed",
+        (("feed_id", ASCENDING),),
+    ),
+    FeedIndexSpec(
+        "feed_categories",
+        "feed_category_user_name",
+        (("user_id", ASCENDING), ("name", ASCENDING)),
+        unique=True,
+    ),
+    FeedIndexSpec(
+        "feed_categories",
+        "feed_category_user_muted_sort",
+        (("user_id", ASCENDING), ("muted", ASCENDING), ("sort_order", ASCENDING)),
+    ),
+    FeedIndexSpec(
+        "feed_categories",
+        "feed_category_user_color",
+        (("user_id", ASCENDING), ("color_hex", ASCENDING)),
+    ),
+    FeedIndexSpec(
+        "user_article_states",
+        "user_article_state_user_article",
+        (("user_id", ASCENDING), ("article_id", ASCENDING)),
+        unique=True,
+    ),
+    FeedIndexSpec(
+        "user_article_states",
+        "user_article_state_user_read_at",
+        (("user_id", ASCENDING), ("is_read", ASCENDING), ("read_at", DESCENDING)),
+    ),
+    FeedIndexSpec(
+        "user_article_states",
+        "user_article_state_user_saved_at",
+        (("user_id", ASCENDING), ("is_saved", ASCENDING), ("saved_at", DESCENDING)),
+    ),
+    FeedIndexSpec(
+        "user_article_states",
+        "user_article_state_article_read",
+        (("article_id", ASCENDING), ("is_read", ASCENDING)),
+    ),
+    FeedIndexSpec(
+        "user_article_states",
+        "user_article_state_user_article_read",
+        (("user_id", ASCENDING), ("article_id", ASCENDING), ("is_read", ASCENDING)),
+    ),
+    FeedIndexSpec(
+        "user_article_states",
+        "user_article_state_user_updated",
+        (("user_id", ASCENDING), ("updated_at", DESCENDING)),
+    ),
+    FeedIndexSpec(
+        "user_feed_unread_counters",
+        "feed_unread_counter_user_feed",
+        (("user_id", ASCENDING), ("feed_id", ASCENDING)),
+        unique=True,
+    ),
+    FeedIndexSpec(
+        "user_feed_unread_counters",
+        "feed_unread_counter_feed",
+        (("feed_id", ASCENDING),),
+    ),
+    FeedIndexSpec(
+        "feed_opml_import_jobs",
+        "feed_opml_import_job_expiry",
+        (("expires_at", ASCENDING),),
+        options={"expireAfterSeconds": 0},
+    ),
+    FeedIndexSpec(
+        "feed_daily_rollups",
+        "feed_daily_rollup_user_feed_day",
+        (("user_id", ASCENDING), ("feed_id", ASCENDING), ("day", ASCENDING)),
+        unique=True,
+    ),
+    FeedIndexSpec(
+        "feed_article_archive",
+        "feed_article_archive_feed_deleted",
+        (("feed_id", ASCENDING), ("deleted_at", DESCENDING)),
+    ),
+)
+
+
+def _normalized_key(keys: Iterable[Any]) -> tuple[tuple[str, Any], ...]:
+    normalized: list[tuple[str, Any]] = []
+    for key_pair in keys:
+        if not isinstance(key_pair, (list, tuple)) or len(key_pair) != 2:
+            continue
+        field_name, direction = key_pair
+        if isinstance(direction, (int, float)):
+            direction = 1 if direction > 0 else -1
+        normalized.append((str(field_name), direction))
+    return tuple(normalized)
+
+
+def index_matches_spec(spec: FeedIndexSpec, index_meta: Mapping[str, Any]) -> bool:
+    """Return True when an existing index serves *spec*.
+
+    Text indexes match any existing text index, since a collection can only
+    have one. Other indexes match on field order, with directions either
+    identical or all reversed, because a reversed index scans backwards just
+    as well.
+    """
+
+    existing = _normalized_key(index_meta.get("key", []))
+    if spec.is_text:
+        return any(direction == TEXT for _, direction in existing)
+
+    declared = _normalized_key(spec.keys)
+    if [name for name, _ in existing] != [name for name, _ in declared]:
+        return False
+
+    if all(existing_dir == declared_dir for (_, existing_dir), (_, declared_dir) in zip(existing, declared)):
+        return True
+
+    return all(
+        isinstance(existing_dir, int) and isinstance(declared_dir, int) and existing_dir == -declared_dir
+        for (_, existing_dir), (_, declared_dir) in zip(existing, declared)
+    )
+
+
+def missing_index_specs(
+    specs: Iterable[FeedIndexSpec],
+    index_information: Mapping[str, Mapping[str, Any]],
+) -> list[FeedIndexSpec]:
+    """Return the specs that no index in ``index_information()`` output serves."""
+
+    return [
+        spec
+        for spec in specs
+        if not any(index_matches_spec(spec, meta) for meta in index_information.values())
+    ]
+
+
+def _walk_plan(node: Any) -> Iterator[tuple[str, Any]]:
+    if isinstance(node, dict):
+        for key, value in node.items():
+            # Rejected candidate plans never run, so their scans do not count.
+            if key == "rejectedPlans":
+                continue
+            yield key, value
+            yield from _walk_plan(value)
+    elif isinstance(node, list):
+        for item in node:
+            yield from _walk_plan(item)
+
+
+def summarize_explain_plan(explain: Mapping[str, Any]) -> dict[str, Any]:
+    """Return the stages, index names and collection-scan flag of an explain document.
+
+    ``$lookup`` stages report their inner scans as ``collectionScans`` and
+    ``indexesUsed`` under ``executionStats`` verbosity, so those are folded in
+    alongside the winning plan's ``COLLSCAN`` stages.
+    """
+
+    stages: list[str] = []
+    indexes: list[str] = []
+    collection_scans = 0
+    for key, value in _walk_plan(dict(explain)):
+        if key == "stage" and isinstance(value, str):
+            if value not in stages:
+                stages.append(value)
+            if value == "COLLSCAN":
+                collection_scans += 1
+        elif key == "indexName" and isinstance(value, str):
+            if value not in indexes:
+                indexes.append(value)
+        elif key == "indexesUsed" and isinstance(value, list):
+            for index_name in value:
+                if isinstance(index_name, str) and index_name not in indexes:
+                    indexes.append(index_name)
+        elif key == "collectionScans" and isinstance(value, int):
+            collection_scans += value
+
+    return {
+        "stages": stages,
+        "indexes": indexes,
+        "collection_scan": collection_scans > 0,
+    }
+
+
+__all__ = [
+    "FEED_INDEX_REGISTRY",
+    "FeedIndexSpec",
+    "index_matches_spec",
+    "missing_index_specs",
+    "summarize_explain_plan",
+]
@@ -0,0 +1,367 @@
+"""Latency and query profiling for the feeds data layer.
+
+Three views are collected in-process, per worker:
+
+* per-function latency histograms for the data-access functions decorated
+  with :func:`profiled`;
+* Mongo round trips per feeds HTTP request, counted by a pymongo command
+  listener attached to the feeds client and grouped by route;
+* the slowest query shapes. Filters are reduced to their structure (field
+  names and operators, with values replaced by type names), so queries that
+  differ only in IDs or dates group together and no user data is retained.
+
+Queries slower than :data:`FEED_SLOW_QUERY_MS` are also logged.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict, deque
+from collections.abc import Awaitable, Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import UTC, datetime
+import functools
+import json
+import logging
+import os
+import threading
+import time
+from typing import Any, ParamSpec, TypeVar
+
+from pymongo import monitoring
+
+P = ParamSpec("P")
+R = TypeVar("R")
+
+try:
+    FEED_SLOW_QUERY_MS = float(os.getenv("FEEDS_SLOW_QUERY_MS", "100"))
+except ValueError:
+    FEED_SLOW_QUERY_MS = 100.0
+
+FEED_PROFILING_ENABLED = os.getenv("FEEDS_PROFILING_ENABLED", "1").strip() not in {"", "0", "false"}
+LATENCY_BUCKETS_MS: tuple[float, ...] = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000)
+QUERY_SHAPE_MAX_ENTRIES = 256
+SLOW_QUERY_LOG_SIZE = 50
+QUERY_SHAPE_MAX_DEPTH = 6
+
+_UNPROFILED_COMMANDS = {"hello", "ismaster", "isMaster", "ping", "saslStart", "saslContinue", "endSessions"}
+_COMMAND_FILTER_KEYS = {
+    "find": "filter",
+    "count": "query",
+    "distinct": "query",
+    "findAndModify": "query",
+}
+
+
+class LatencyHistogram:
+    """Fixed-bucket latency histogram in milliseconds."""
+
+    def __init__(self) -> None:
+        self.bucket_counts = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    def observe(self, duration_ms: float) -> None:
+        index = 0
+        while index < len(LATENCY_BUCKETS_MS) and duration_ms > LATENCY_BUCKETS_MS[index]:
+            index += 1
+        self.bucket_counts[index] += 1
+        self.count += 1
+        self.total_ms += duration_ms
+        self.max_ms = max(self.max_ms, duration_ms)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "count": self.count,
+            "total_ms": round(self.total_ms, 3),
+            "mean_ms": round(self.total_ms / self.count, 3) if self.count > 0 else 0.0,
+            "max_ms": round(self.max_ms, 3),
+            "buckets": [
+                {"le_ms": bound, "count": count}
+                for bound, count in zip((*LATENCY_BUCKETS_MS, None), self.bucket_counts)
+            ],
+        }
+
+
+class RequestRoundTrips:
+    """Mongo round-trip counter for one HTTP request."""
+
+    def __init__(self) -> None:
+        self.count = 0
+
+
+class RouteRoundTrips:
+    """Aggregate Mongo round trips for every request to one route."""
+
+    def __init__(self) -> None:
+        self.requests = 0
+        self.round_trips = 0
+        self.max_round_trips = 0
+
+    def observe(self, round_trips: int) -> None:
+        self.requests += 1
+        self.round_trips += round_trips
+        self.max_round_trips = max(self.max_round_trips, round_trips)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "requests": self.requests,
+            "round_trips": self.round_trips,
+            "mean_round_trips": round(self.round_trips / self.requests, 2) if self.requests > 0 else 0.0,
+            "max_round_trips": self.max_round_trips,
+        }
+
+
+_current_request: ContextVar[RequestRoundTrips | None] = ContextVar(
+    "feeds_current_request_round_trips",
+    default=None,
+)
+
+
+def query_shape(value: Any, depth: int = 0) -> Any:
+    """Return the structure of a filter with values replaced by type names."""
+
+    if depth >= QUERY_SHAPE_MAX_DEPTH:
+        return "..."
+
+    if isinstance(value, dict):
+        return {
+            str(key): (
+                "[array]"
+                if key in {"$in", "$nin", "$all"} and isinstance(item, list | tuple)
+                else query_shape(item, depth + 1)
+            )
+            for key, item in value.items()
+        }
+
+    if isinstance(value, list | tuple):
+        if len(value) == 0:
+            return []
+        return [query_shape(item, depth + 1) for item in value[:4]]
+
+    if value is None:
+        return None
+
+    return type(value).__name__
+
+
+def command_shape(command_name: str, command: Any) -> tuple[str, Any]:
+    """Return ``(collection, shape)`` for a Mongo command document."""
+
+    if command_name == "getMore":
+        return str(command.get("collection", "")), None
+
+    collection = str(command.get(command_name, ""))
+    if command_name == "aggregate":
+        stages = []
+        for stage in command.get("pipeline", []):
+            stage_name = next(iter(stage), "")
+            if stage_name == "$match":
+                stages.append({"$match": query_shape(stage[stage_name])})
+            else:
+                stages.append(stage_name)
+        return collection, stages
+
+    if command_name in {"update", "delete"}:
+        statements = command.get(f"{command_name}s") or []
+        if len(statements) == 0:
+            return collection, None
+        return collection, {"q": query_shape(statements[0].get("q")), "n": len(statements)}
+
+    filter_key = _COMMAND_FILTER_KEYS.get(command_name)
+    if filter_key is None:
+        return collection, None
+
+    return collection, query_shape(command.get(filter_key) or {})
+
+
+class _ShapeStats:
+    def __init__(self, command_name: str, collection: str, shape: Any) -> None:
+        self.command_name = command_name
+        self.collection = collection
+        self.shape = shape
+        self.histogram = LatencyHistogram()
+
+
+class FeedProfiler:
+    """Thread-safe collector for feeds latency, round-trip and query-shape stats.
+
+    The command listener runs on Motor's executor threads, so every update
+    takes :attr:`_lock`.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._started_at = datetime.now(UTC)
+        self._functions: dict[str, LatencyHistogram] = {}
+        self._requests: dict[str, RouteRoundTrips] = {}
+        self._shapes: OrderedDict[str, _ShapeStats] = OrderedDict()
+        self._slow_queries: deque[dict[str, Any]] = deque(maxlen=SLOW_QUERY_LOG_SIZE)
+        self._pending: dict[tuple[Any, int], tuple[str, str, Any]] = {}
+        self.command_listener = _FeedCommandListener(self)
+
+    def observe_function(self, name: str, duration_ms: float) -> None:
+        with self._lock:
+            histogram = self._functions.get(name)
+            if histogram is None:
+                histogram = self._functions[name] = LatencyHistogram()
+            histogram.observe(duration_ms)
+
+    def observe_request(self, route: str, round_trips: int) -> None:
+        with self._lock:
+            stats = self._requests.get(route)
+            if stats is None:
+                stats = self._requests[route] = RouteRoundTrips()
+            stats.observe(round_trips)
+
+    @contextmanager
+    def track_request(self, route_getter: Callable[[], str]) -> Iterator[RequestRoundTrips]:
+        """Count Mongo round trips made while the block runs in this context."""
+
+        round_trips = RequestRoundTrips()
+        token = _current_request.set(round_trips)
+        try:
+            yield round_trips
+        finally:
+            _current_request.reset(token)
+            self.observe_request(route_getter(), round_trips.count)
+
+    def command_started(self, event: monitoring.CommandStartedEvent) -> None:
+        if event.command_name in _UNPROFILED_COMMANDS:
+            return
+
+        round_trips = _current_request.get()
+        collection, shape = command_shape(event.command_name, event.command)
+        with self._lock:
+            # One request's gathered queries can start on several executor threads.
+            if round_trips is not None:
+                round_trips.count += 1
+            self._pending[(event.connection_id, event.request_id)] = (event.command_name, collection, shape)
+
+    def command_finished(self, event: monitoring.CommandSucceededEvent | monitoring.CommandFailedEvent) -> None:
+        with self._lock:
+            pending = self._pending.pop((event.connection_id, event.request_id), None)
+        if pending is None:
+            return
+
+        command_name, collection, shape = pending
+        duration_ms = event.duration_micros / 1000.0
+        shape_key = json.dumps([command_name, collection, shape], sort_keys=True, default=str)
+        with self._lock:
+            stats = self._shapes.get(shape_key)
+            if stats is None:
+                stats = self._shapes[shape_key] = _ShapeStats(command_name, collection, shape)
+                while len(self._shapes) > QUERY_SHAPE_MAX_ENTRIES:
+                    self._shapes.popitem(last=False)
+            else:
+                self._shapes.move_to_end(shape_key)
+            stats.histogram.observe(duration_ms)
+
+            if duration_ms >= FEED_SLOW_QUERY_MS:
+                self._slow_queries.append(
+                    {
+                        "at": datetime.now(UTC),
+                        "command": command_name,
+                        "collection": collection,
+                        "shape": shape,
+                        "duration_ms": round(duration_ms, 3),
+                    }
+                )
+
+        if duration_ms >= FEED_SLOW_QUERY_MS:
+            logging.warning(
+                f"Slow feeds query: {command_name} {collection} took {duration_ms:.1f} ms, shape {shape}"
+            )
+
+    def snapshot(self, shape_limit: int = 25) -> dict[str, Any]:
+        """Return a JSON-friendly copy of every collected view."""
+
+        with self._lock:
+            functions = [
+                {"name": name, **histogram.to_dict()}
+                for name, histogram in self._functions.items()
+            ]
+            requests = [
+                {"route": route, **stats.to_dict()}
+                for route, stats in self._requests.items()
+            ]
+            shapes = [
+                {
+                    "command": stats.command_name,
+                    "collection": stats.collection,
+                    "shape": stats.shape,
+                    **stats.histogram.to_dict(),
+                }
+                for stats in self._shapes.values()
+            ]
+            slow_queries = list(reversed(self._slow_queries))
+
+        functions.sort(key=lambda row: row["total_ms"], reverse=True)
+        requests.sort(key=lambda row: row["round_trips"], reverse=True)
+        shapes.sort(key=lambda row: row["max_ms"], reverse=True)
+        return {
+            "enabled": FEED_PROFILING_ENABLED,
+            "collecting_since": self._started_at,
+            "slow_query_ms": FEED_SLOW_QUERY_MS,
+            "functions": functions,
+            "requests": requests,
+            "query_shapes": shapes[:shape_limit],
+            "slow_queries": slow_queries,
+        }
+
+    def reset(self) -> None:
+        with self._lock:
+            self._started_at = datetime.now(UTC)
+            self._functions.clear()
+            self._requests.clear()
+            self._shapes.clear()
+            self._slow_queries.clear()
+
+
+class _FeedCommandListener(monitoring.CommandListener):
+    def __init__(self, profiler: FeedProfiler) -> None:
+        self._profiler = profiler
+
+    def started(self, event: monitoring.CommandStartedEvent) -> None:
+        self._profiler.command_started(event)
+
+    def succeeded(self, event: monitoring.CommandSucceededEvent) -> None:
+        self._profiler.command_finished(event)
+
+    def failed(self, event: monitoring.CommandFailedEvent) -> None:
+        self._profiler.command_finished(event)
+
+
+feed_profiler = FeedProfiler()
+
+
+def profiled(func: Callable[P, Awaitable[R]]) -> Callable[P, Awaitable[R]]:
+    """Record the wall-clock latency of an async data-access function."""
+
+    if not FEED_PROFILING_ENABLED:
+        return func
+
+    name = func.__name__
+
+    @functools.wraps(func)
+    async def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+        started = time.perf_counter()
+        try:
+            return await func(*args, **kwargs)
+        finally:
+            feed_profiler.observe_function(name, (time.perf_counter() - started) * 1000.0)
+
+    return wrapper
+
+
+__all__ = [
+    "FEED_PROFILING_ENABLED",
+    "FEED_SLOW_QUERY_MS",
+    "FeedProfiler",
+    "LatencyHistogram",
+    "command_shape",
+    "feed_profiler",
+    "profiled",
+    "query_shape",
+]
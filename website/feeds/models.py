@@ -101,6 +101,20 @@ class UserArticleStateDocument(BaseModel):
     updated_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
 
 
+class UserFeedUnreadCounterDocument(BaseModel):
+    """Materialized per-user unread article counter for one subscribed feed."""
+
+    model_config = ConfigDict(populate_by_name=True)
+
+    id: PyObjectId | None = Field(default=None, alias="_id")
+    user_id: str
+    feed_id: PyObjectId
+    unread_count: int = 0
+    source_marker: datetime | None = None
+    reconciled_at: datetime | None = None
+    updated_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+
+
 class FeedCategorySummary(BaseModel):
     """Category summary returned to the feed-reader sidebar."""
 
@@ -155,6 +169,7 @@ class FeedArticleListResponse(BaseModel):
     limit: int = 0
     has_more: bool = False
     next_offset: int = 0
+    next_cursor: str | None = None
 
 
 class FeedSidebarMetaResponse(BaseModel):
@@ -178,6 +193,7 @@ class FeedReaderSyncRequest(BaseModel):
     current_head_ids: list[str] = Field(default_factory=list)
     at_end: bool = False
     tail_offset: int = 0
+    tail_cursor: str | None = None
     page_size: int = 10
     require_search_query: bool = False
 
@@ -195,9 +211,74 @@ class FeedReaderSyncResponse(BaseModel):
     head_articles: list[FeedArticleCard] | None = None
     head_has_more: bool = False
     head_next_offset: int = 0
+    head_next_cursor: str | None = None
     tail_articles: list[FeedArticleCard] | None = None
     tail_has_more: bool | None = None
     tail_next_offset: int | None = None
+    tail_next_cursor: str | None = None
+
+
+class FeedSidebarVisibilityDelta(BaseModel):
+    """Feed IDs that appeared in or dropped out of one sidebar group."""
+
+    shown: list[str] = Field(default_factory=list)
+    hidden: list[str] = Field(default_factory=list)
+
+
+class FeedReaderPushDelta(BaseModel):
+    """Reader changes pushed over the event stream since the previous event.
+
+    Count fields are ``None`` when unchanged and ``categories`` only lists the
+    categories whose summary changed. ``head_article_ids`` is only sent with
+    the initial snapshot so the client can compare it with its rendered head.
+    """
+
+    all_unread_count: int | None = None
+    recently_read_count: int | None = None
+    saved_count: int | None = None
+    categories: list[FeedCategorySummary] = Field(default_factory=list)
+    removed_category_ids: list[str] = Field(default_factory=list)
+    new_article_ids: list[str] = Field(default_factory=list)
+    removed_article_ids: list[str] = Field(default_factory=list)
+    head_article_ids: list[str] | None = None
+    sidebar_visibility: dict[str, FeedSidebarVisibilityDelta] = Field(default_factory=dict)
+
+    def is_empty(self) -> bool:
+        return (
+            self.all_unread_count is None
+            and self.recently_read_count is None
+            and self.saved_count is None
+            and len(self.categories) == 0
+            and len(self.removed_category_ids) == 0
+            and len(self.new_article_ids) == 0
+            and len(self.removed_article_ids) == 0
+            and self.head_article_ids is None
+            and len(self.sidebar_visibility) == 0
+        )
+
+
+class FeedArticleBulkStateRequest(BaseModel):
+    """Request payload for changing read/saved state on many articles at once.
+
+    ``article_ids`` selects articles directly. Without IDs, the subscribed
+    articles in ``category`` (a category ID or ``"all"``) and/or ``feed_id``
+    are selected, optionally only those published before ``older_than``.
+    """
+
+    action: Literal["read", "unread", "save", "unsave"]
+    article_ids: list[str] = Field(default_factory=list)
+    category: str | None = None
+    feed_id: str | None = None
+    older_than: datetime | None = None
+
+
+class FeedArticleBulkStateResponse(BaseModel):
+    """Result of a bulk article state change."""
+
+    action: Literal["read", "unread", "save", "unsave"]
+    matched_count: int
+    changed_count: int
+    has_more: bool = False
 
 
 class FeedArticleStatusRequest(BaseModel):
@@ -293,6 +374,7 @@ class FeedOpmlImportOptions(BaseModel):
 
     duplicate_policy: Literal["skip", "refresh"] = "skip"
     default_category_name: str = "Imported"
+    validate_urls: bool = False
 
 
 class FeedOpmlImportResult(BaseModel):
@@ -305,6 +387,19 @@ class FeedOpmlImportResult(BaseModel):
     errors: list[str] = Field(default_factory=list)
 
 
+class FeedOpmlImportJob(BaseModel):
+    """Progress payload for a background OPML import job."""
+
+    job_id: str
+    status: Literal["pending", "running", "completed", "failed"] = "pending"
+    total_entries: int = 0
+    processed_entries: int = 0
+    result: FeedOpmlImportResult | None = None
+    error: str | None = None
+    created_at: datetime
+    updated_at: datetime
+
+
 class FeedSettingsViewModel(BaseModel):
     """Settings page model with user subscriptions and categories."""
 
@@ -332,6 +427,142 @@ class FeedAdminFeedListResponse(BaseModel):
     feeds: list[FeedAdminFeedRow] = Field(default_factory=list)
 
 
+class FeedSourceConsolidationCounts(BaseModel):
+    """Work counters for duplicate feed source consolidation."""
+
+    duplicate_urls: int = 0
+    sources_removed: int = 0
+    subscriptions_moved: int = 0
+    subscriptions_merged: int = 0
+    articles_moved: int = 0
+    articles_merged: int = 0
+    states_moved: int = 0
+    states_merged: int = 0
+    elapsed_seconds: float = 0.0
+
+
+class FeedSourceConsolidationStatus(BaseModel):
+    """Admin payload describing the duplicate-source consolidation service."""
+
+    last_run_at: datetime | None = None
+    last_run: FeedSourceConsolidationCounts = Field(default_factory=FeedSourceConsolidationCounts)
+    totals: FeedSourceConsolidationCounts = Field(default_factory=FeedSourceConsolidationCounts)
+    unique_url_index_ready: bool = False
+
+
+class FeedArticleArchiveCounts(BaseModel):
+    """Work counters for soft-deleted article archival."""
+
+    articles_archived: int = 0
+    body_bytes_removed: int = 0
+    archived_body_bytes: int = 0
+    orphans_removed: int = 0
+    elapsed_seconds: float = 0.0
+
+
+class FeedArticleArchiveStatus(BaseModel):
+    """Admin payload describing the article archival service."""
+
+    last_run_at: datetime | None = None
+    last_sweep_at: datetime | None = None
+    last_run: FeedArticleArchiveCounts = Field(default_factory=FeedArticleArchiveCounts)
+    totals: FeedArticleArchiveCounts = Field(default_factory=FeedArticleArchiveCounts)
+
+
+class FeedIndexStatus(BaseModel):
+    """One declared feeds index and whether the collection has it."""
+
+    collection: str
+    name: str
+    keys: list[str] = Field(default_factory=list)
+    unique: bool = False
+    deferred: bool = False
+    present: bool = False
+
+
+class FeedQueryPlan(BaseModel):
+    """Explain summary for one hot feeds query shape."""
+
+    name: str
+    collection: str
+    stages: list[str] = Field(default_factory=list)
+    indexes: list[str] = Field(default_factory=list)
+    collection_scan: bool = False
+    error: str | None = None
+
+
+class FeedIndexReport(BaseModel):
+    """Admin payload comparing the declared index set with the live plans."""
+
+    indexes: list[FeedIndexStatus] = Field(default_factory=list)
+    missing_count: int = 0
+    plans: list[FeedQueryPlan] = Field(default_factory=list)
+    collection_scan_count: int = 0
+
+
+class FeedProfileLatencyBucket(BaseModel):
+    """One latency histogram bucket; ``le_ms`` is None for the overflow bucket."""
+
+    le_ms: float | None = None
+    count: int = 0
+
+
+class FeedProfileLatency(BaseModel):
+    """Latency summary shared by function and query-shape rows."""
+
+    count: int = 0
+    total_ms: float = 0.0
+    mean_ms: float = 0.0
+    max_ms: float = 0.0
+    buckets: list[FeedProfileLatencyBucket] = Field(default_factory=list)
+
+
+class FeedProfileFunctionRow(FeedProfileLatency):
+    """Latency histogram for one profiled data-access function."""
+
+    name: str
+
+
+class FeedProfileRequestRow(BaseModel):
+    """Mongo round trips made by requests to one feeds route."""
+
+    route: str
+    requests: int = 0
+    round_trips: int = 0
+    mean_round_trips: float = 0.0
+    max_round_trips: int = 0
+
+
+class FeedProfileQueryShapeRow(FeedProfileLatency):
+    """Latency histogram for one query shape; values are replaced by type names."""
+
+    command: str
+    collection: str
+    shape: Any = None
+
+
+class FeedProfileSlowQuery(BaseModel):
+    """One query that exceeded the slow-query threshold."""
+
+    at: datetime
+    command: str
+    collection: str
+    shape: Any = None
+    duration_ms: float = 0.0
+
+
+class FeedProfileResponse(BaseModel):
+    """Admin payload describing feeds data-layer latency and query shapes."""
+
+    enabled: bool = False
+    collecting_since: datetime
+    slow_query_ms: float
+    functions: list[FeedProfileFunctionRow] = Field(default_factory=list)
+    requests: list[FeedProfileRequestRow] = Field(default_factory=list)
+    query_shapes: list[FeedProfileQueryShapeRow] = Field(default_factory=list)
+    slow_queries: list[FeedProfileSlowQuery] = Field(default_factory=list)
+
+
 class FeedStatsDailyPoint(BaseModel):
     """Daily aggregate point used by stats charts."""
 
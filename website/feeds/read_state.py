@@ -0,0 +1,196 @@
+"""Compact per-user read/saved article state.
+
+Read and saved article IDs are held as sorted runs of 12-byte ObjectId values
+in a ``bytearray`` with a parallel ``array`` of timestamps, so a heavy reader's
+history costs roughly 20 bytes per article instead of an ``ObjectId`` and a
+``datetime`` object each. Membership is a bisect over the buffer and
+``ObjectId`` / ``datetime`` objects are only created for the entries a caller
+actually reads.
+"""
+
+from __future__ import annotations
+
+from array import array
+from bisect import bisect_left
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from datetime import UTC, datetime
+import math
+from typing import Any
+
+from bson import ObjectId
+
+OBJECT_ID_BYTES = 12
+
+
+def _timestamp_from_datetime(value: Any) -> float:
+    if not isinstance(value, datetime):
+        return math.nan
+
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=UTC)
+
+    return value.timestamp()
+
+
+def _datetime_from_timestamp(value: float) -> datetime | None:
+    if math.isnan(value):
+        return None
+
+    # The driver hands back naive UTC datetimes, so keep returning those.
+    return datetime.fromtimestamp(value, UTC).replace(tzinfo=None)
+
+
+class ArticleTimestampColumn(Mapping[ObjectId, datetime | None]):
+    """Sorted ObjectId keys with one optional timestamp per key."""
+
+    def __init__(self) -> None:
+        self._ids = bytearray()
+        self._timestamps = array("d")
+
+    @classmethod
+    def from_items(cls, items: Iterable[tuple[ObjectId, Any]]) -> ArticleTimestampColumn:
+        """Build a column from ``(article_id, datetime | None)`` pairs."""
+
+        column = cls()
+        latest: dict[bytes, float] = {
+            article_id.binary: _timestamp_from_datetime(timestamp)
+            for article_id, timestamp in items
+        }
+        for key in sorted(latest):
+            column._ids += key
+            column._timestamps.append(latest[key])
+        return column
+
+    def __len__(self) -> int:
+        return len(self._timestamps)
+
+    def __iter__(self) -> Iterator[ObjectId]:
+        for start in range(0, len(self._ids), OBJECT_ID_BYTES):
+            yield ObjectId(bytes(self._ids[start : start + OBJECT_ID_BYTES]))
+
+    def __contains__(self, article_id: object) -> bool:
+        if not isinstance(article_id, ObjectId):
+            return False
+        return self._position(article_id.binary)[1]
+
+    def __getitem__(self, article_id: ObjectId) -> datetime | None:
+        if not isinstance(article_id, ObjectId):
+            raise KeyError(article_id)
+
+        position, found = self._position(article_id.binary)
+        if not found:
+            raise KeyError(article_id)
+        return _datetime_from_timestamp(self._timestamps[position])
+
+    @property
+    def nbytes(self) -> int:
+        return len(self._ids) + self._timestamps.itemsize * len(self._timestamps)
+
+    def set(self, article_id: ObjectId, timestamp: Any) -> None:
+        """Insert or update one key, keeping the buffer sorted."""
+
+        key = article_id.binary
+        position, found = self._position(key)
+        value = _timestamp_from_datetime(timestamp)
+        if found:
+            self._timestamps[position] = value
+            return
+
+        offset = position * OBJECT_ID_BYTES
+        self._ids[offset:offset] = key
+        self._timestamps.insert(position, value)
+
+    def discard(self, article_id: ObjectId) -> None:
+        """Remove one key when present."""
+
+        position, found = self._position(article_id.binary)
+        if not found:
+            return
+
+        offset = position * OBJECT_ID_BYTES
+        del self._ids[offset : offset + OBJECT_ID_BYTES]
+        del self._timestamps[position]
+
+    def ids_where(self, predicate: Callable[[datetime | None], bool]) -> ArticleTimestampColumn:
+        """Return a new column holding the entries whose timestamp matches."""
+
+        selected = ArticleTimestampColumn()
+        for position, timestamp in enumerate(self._timestamps):
+            if predicate(_datetime_from_timestamp(timestamp)):
+                offset = position * OBJECT_ID_BYTES
+                selected._ids += self._ids[offset : offset + OBJECT_ID_BYTES]
+                selected._timestamps.append(timestamp)
+        return selected
+
+    def _position(self, key: bytes) -> tuple[int, bool]:
+        ids = self._ids
+        position = bisect_left(
+            range(len(self._timestamps)),
+            key,
+            key=lambda index: ids[index * OBJECT_ID_BYTES : (index + 1) * OBJECT_ID_BYTES],
+        )
+        offset = position * OBJECT_ID_BYTES
+        found = position < len(self._timestamps) and ids[offset : offset + OBJECT_ID_BYTES] == key
+        return position, found
+
+
+class UserArticleStateSnapshot:
+    """A user's read and saved columns plus the state version they reflect.
+
+    ``marker`` is the time the columns were last refreshed; documents updated
+    since then are folded in when the version moves.
+    """
+
+    def __init__(self, version: int, marker: datetime | None) -> None:
+        self.version = version
+        self.marker = marker
+        self.read = ArticleTimestampColumn()
+        self.saved = ArticleTimestampColumn()
+
+    def apply_state_document(self, state_doc: dict[str, Any]) -> None:
+        """Fold one ``user_article_states`` document into the columns."""
+
+        article_id = state_doc.get("article_id")
+        if not isinstance(article_id, ObjectId):
+            return
+
+        if bool(state_doc.get("is_read")):
+            self.read.set(article_id, state_doc.get("read_at"))
+        else:
+            self.read.discard(article_id)
+
+        if bool(state_doc.get("is_saved")):
+            self.saved.set(article_id, state_doc.get("saved_at"))
+        else:
+            self.saved.discard(article_id)
+
+    @classmethod
+    def from_state_documents(
+        cls,
+        version: int,
+        marker: datetime | None,
+        state_docs: Iterable[dict[str, Any]],
+    ) -> UserArticleStateSnapshot:
+        """Build a snapshot from a full scan of the user's state documents."""
+
+        read_items: list[tuple[ObjectId, Any]] = []
+        saved_items: list[tuple[ObjectId, Any]] = []
+        for state_doc in state_docs:
+            article_id = state_doc.get("article_id")
+            if not isinstance(article_id, ObjectId):
+                continue
+            if bool(state_doc.get("is_read")):
+                read_items.append((article_id, state_doc.get("read_at")))
+            if bool(state_doc.get("is_saved")):
+                saved_items.append((article_id, state_doc.get("saved_at")))
+
+        snapshot = cls(version, marker)
+        snapshot.read = ArticleTimestampColumn.from_items(read_items)
+        snapshot.saved = ArticleTimestampColumn.from_items(saved_items)
+        return snapshot
+
+
+__all__ = [
+    "ArticleTimestampColumn",
+    "UserArticleStateSnapshot",
+]
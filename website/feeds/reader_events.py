@@ -0,0 +1,63 @@
+"""In-process wake-up bus for pushed reader updates.
+
+Open reader push streams register one ``asyncio.Event`` per connection under
+their user ID. Anything that changes what a reader would see calls
+:meth:`ReaderEventBus.notify`: read/saved state and subscription changes do so
+directly or through the cross-worker category-count invalidation channel, and
+article ingest through each worker's ``feed_sources.last_fetched_at`` watch.
+Every matching stream wakes up once to compute and send its delta. Repeated
+notifications before a stream runs collapse into a single wake-up.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+
+class ReaderEventBus:
+    """Per-user fan-out of coalescing wake-up events."""
+
+    def __init__(self) -> None:
+        self._subscribers: dict[str, set[asyncio.Event]] = {}
+
+    @contextmanager
+    def subscribe(self, user_id: str) -> Iterator[asyncio.Event]:
+        """Register a wake-up event for ``user_id`` for the life of the block."""
+
+        event = asyncio.Event()
+        self._subscribers.setdefault(user_id, set()).add(event)
+        try:
+            yield event
+        finally:
+            events = self._subscribers.get(user_id)
+            if events is not None:
+                events.discard(event)
+                if len(events) == 0:
+                    self._subscribers.pop(user_id, None)
+
+    def notify(self, user_id: str | None) -> None:
+        """Wake the streams for one user, or every stream when ``user_id`` is None."""
+
+        if user_id is None:
+            for events in self._subscribers.values():
+                for event in events:
+                    event.set()
+            return
+
+        for event in self._subscribers.get(user_id, ()):
+            event.set()
+
+    @property
+    def subscriber_count(self) -> int:
+        return sum(len(events) for events in self._subscribers.values())
+
+
+reader_event_bus = ReaderEventBus()
+
+
+__all__ = [
+    "ReaderEventBus",
+    "reader_event_bus",
+]
@@ -1,16 +1,20 @@
 from __future__ import annotations
 
+from collections.abc import AsyncIterator
+from contextlib import aclosing
 import os
 from pathlib import Path
 from typing import Any, Literal
 from urllib.parse import quote
 
 from fastapi import APIRouter, Depends, File, Form, HTTPException, Request, UploadFile, status
-from fastapi.responses import FileResponse, HTMLResponse, Response, RedirectResponse
+from fastapi.responses import FileResponse, HTMLResponse, Response, RedirectResponse, StreamingResponse
 from fastapi.templating import Jinja2Templates
 
 from ..account.csrf import validate_csrf
+from .instrumentation import FEED_PROFILING_ENABLED, feed_profiler
 from .feed_db import (
+    apply_bulk_article_state,
     create_or_update_subscription,
     delete_subscription,
     export_opml,
@@ -18,16 +22,21 @@ from .feed_db import (
     get_article_read_statuses,
     get_categories_with_counts,
     get_feed_admin_context,
+    get_feed_article_archive_status,
+    get_feed_index_report,
     get_feed_reader_context,
     get_feed_settings_context,
+    get_feed_source_consolidation_status,
     get_sidebar_feed_groups_for_reader,
     get_feed_stats,
     get_feed_stats_context,
+    get_opml_import_job,
     get_reader_live_sync,
     get_sidebar_meta_for_reader,
     get_subscription_source_metadata,
     list_feed_admin_rows,
     import_opml,
+    iter_reader_push_deltas,
     mark_article_opened,
     mark_article_read,
     mark_article_saved,
@@ -38,12 +47,16 @@ from .feed_db import (
     reorder_category_sort_order,
     set_category_color,
     set_category_muted,
+    start_opml_import_job,
     update_subscription_details,
     validate_feed_url,
 )
 from .models import (
     FeedAdminFeedRow,
     FeedAdminFeedListResponse,
+    FeedArticleArchiveStatus,
+    FeedArticleBulkStateRequest,
+    FeedArticleBulkStateResponse,
     FeedArticleListResponse,
     FeedArticleStatusRequest,
     FeedArticleStatusResponse,
@@ -51,11 +64,15 @@ from .models import (
     FeedCategoryListResponse,
     FeedCategoryOperationResponse,
     FeedCategoryReorderRequest,
+    FeedIndexReport,
+    FeedOpmlImportJob,
     FeedOpmlImportOptions,
     FeedOpmlImportResult,
+    FeedProfileResponse,
     FeedReaderSyncRequest,
     FeedReaderSyncResponse,
     FeedSidebarMetaResponse,
+    FeedSourceConsolidationStatus,
     FeedStatsResponse,
     FeedSubscriptionCreateRequest,
     FeedSubscriptionCreateResponse,
@@ -66,7 +83,23 @@ from .models import (
 
 TEMPLATES = Jinja2Templates("/app/templates")
 
-feeds_router = APIRouter(prefix="/feeds")
+
+async def _track_feed_request(request: Request) -> AsyncIterator[None]:
+    """Count the Mongo round trips made while serving one feeds request."""
+
+    if not FEED_PROFILING_ENABLED:
+        yield
+        return
+
+    def route_path() -> str:
+        route = request.scope.get("route")
+        return str(getattr(route, "path", None) or request.url.path)
+
+    with feed_profiler.track_request(route_path):
+        yield
+
+
+feeds_router = APIRouter(prefix="/feeds", dependencies=[Depends(_track_feed_request)])
 
 WEBSITE_ROOT = Path(__file__).resolve().parents[1]
 FEEDS_MANIFEST_PATH = WEBSITE_ROOT / "static" / "manifests" / "feeds" / "feeds.webmanifest"
@@ -411,6 +444,53 @@ async def sync_reader_live_state(
     return await get_reader_live_sync(username, payload)
 
 
+@feeds_router.get("/api/reader/events")
+@feeds_router.get("/api/reader/events/")
+async def stream_reader_events(
+    request: Request,
+    category: str = "all",
+    status_filter: Literal["unread", "read", "all"] = "unread",
+    feed_id: str | None = None,
+    search: str | None = None,
+    page_size: int = 10,
+    require_search_query: bool = False,
+) -> StreamingResponse:
+    """Push reader counter, head and sidebar deltas as server-sent events."""
+
+    username = _require_logged_in_user(request)
+    payload = FeedReaderSyncRequest(
+        category=category,
+        status_filter=status_filter,
+        feed_id=feed_id,
+        search=search,
+        page_size=page_size,
+        require_search_query=require_search_query,
+    )
+
+    async def event_stream() -> AsyncIterator[str]:
+        event_name = "snapshot"
+        async with aclosing(iter_reader_push_deltas(username, payload)) as deltas:
+            async for delta in deltas:
+                if await request.is_disconnected():
+                    break
+
+                if delta is None:
+                    yield ": keepalive\n\n"
+                    continue
+
+                yield f"event: {event_name}\ndata: {delta.model_dump_json(exclude_defaults=True)}\n\n"
+                event_name = "delta"
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-store",
+            "X-Accel-Buffering": "no",
+        },
+    )
+
+
 @feeds_router.get(
     "/api/admin/feeds",
     response_model=FeedAdminFeedListResponse,
@@ -436,6 +516,94 @@ async def get_admin_feeds(request: Request) -> FeedAdminFeedListResponse:
     )
 
 
+@feeds_router.get(
+    "/api/admin/consolidation",
+    response_model=FeedSourceConsolidationStatus,
+)
+@feeds_router.get(
+    "/api/admin/consolidation/",
+    response_model=FeedSourceConsolidationStatus,
+)
+async def get_admin_source_consolidation(request: Request) -> FeedSourceConsolidationStatus:
+    """Return duplicate-source consolidation metrics for admin users."""
+
+    _require_logged_in_user(request)
+
+    if not _request_can_use_tools(request):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Feeds admin API is only available to tool-enabled users.",
+        )
+
+    return await get_feed_source_consolidation_status()
+
+
+@feeds_router.get(
+    "/api/admin/archive",
+    response_model=FeedArticleArchiveStatus,
+)
+@feeds_router.get(
+    "/api/admin/archive/",
+    response_model=FeedArticleArchiveStatus,
+)
+async def get_admin_article_archive(request: Request) -> FeedArticleArchiveStatus:
+    """Return soft-deleted article archival metrics for admin users."""
+
+    _require_logged_in_user(request)
+
+    if not _request_can_use_tools(request):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Feeds admin API is only available to tool-enabled users.",
+        )
+
+    return await get_feed_article_archive_status()
+
+
+@feeds_router.get(
+    "/api/admin/indexes",
+    response_model=FeedIndexReport,
+)
+@feeds_router.get(
+    "/api/admin/indexes/",
+    response_model=FeedIndexReport,
+)
+async def get_admin_indexes(request: Request) -> FeedIndexReport:
+    """Return declared index status and hot-query plans for admin users."""
+
+    user_id = _require_logged_in_user(request)
+
+    if not _request_can_use_tools(request):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Feeds admin API is only available to tool-enabled users.",
+        )
+
+    return await get_feed_index_report(user_id)
+
+
+@feeds_router.get(
+    "/api/admin/profile",
+    response_model=FeedProfileResponse,
+)
+@feeds_router.get(
+    "/api/admin/profile/",
+    response_model=FeedProfileResponse,
+)
+async def get_admin_profile(request: Request, shape_limit: int = 25) -> FeedProfileResponse:
+    """Return data-layer latency histograms and slow query shapes for admin users."""
+
+    _require_logged_in_user(request)
+
+    if not _request_can_use_tools(request):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Feeds admin API is only available to tool-enabled users.",
+        )
+
+    return FeedProfileResponse.model_validate(feed_profiler.snapshot(shape_limit=max(1, min(shape_limit, 256))))
+
+
 @feeds_router.get(
     "/api/articles",
     response_model=FeedArticleListResponse,
@@ -453,6 +621,7 @@ async def get_articles(
     offset: int = 0,
     limit: int = 10,
     ids_only: bool = False,
+    cursor: str | None = None,
 ) -> FeedArticleListResponse:
     """Return feed article cards filtered by category and status."""
 
@@ -473,6 +642,7 @@ async def get_articles(
         offset=max(0, int(offset)),
         limit=max(1, min(100, int(limit))),
         ids_only=ids_only,
+        cursor=cursor,
     )
 
 
@@ -666,6 +836,32 @@ async def delete_subscription_route(
     return FeedSubscriptionDeleteResponse(subscription_id=subscription_id, deleted=True)
 
 
+@feeds_router.post(
+    "/api/articles/state",
+    response_model=FeedArticleBulkStateResponse,
+)
+@feeds_router.post(
+    "/api/articles/state/",
+    response_model=FeedArticleBulkStateResponse,
+)
+async def change_article_states(
+    request: Request,
+    payload: FeedArticleBulkStateRequest,
+    _: None = Depends(validate_csrf),
+) -> FeedArticleBulkStateResponse:
+    """Apply one read/saved state change to many articles for the authenticated user."""
+
+    username = _require_logged_in_user(request)
+
+    try:
+        return await apply_bulk_article_state(username, payload)
+    except ValueError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(exc),
+        ) from exc
+
+
 @feeds_router.post("/api/articles/{article_id}/read")
 @feeds_router.post("/api/articles/{article_id}/read/")
 async def mark_article_as_read(
@@ -893,6 +1089,26 @@ async def reorder_categories(
     return await get_categories_with_counts(username)
 
 
+async def _read_opml_upload(opml_file: UploadFile) -> bytes:
+    """Read an uploaded OPML file, enforcing the configured size limit."""
+
+    file_bytes = await opml_file.read(OPML_IMPORT_MAX_BYTES + 1)
+    if len(file_bytes) == 0:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Uploaded OPML file is empty.",
+        )
+
+    if len(file_bytes) > OPML_IMPORT_MAX_BYTES:
+        max_size_kib = OPML_IMPORT_MAX_BYTES // 1024
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Uploaded OPML file exceeds the {max_size_kib} KiB size limit.",
+        )
+
+    return file_bytes
+
+
 @feeds_router.post(
     "/api/opml/import",
     response_model=FeedOpmlImportResult,
@@ -906,33 +1122,60 @@ async def import_opml_data(
     opml_file: UploadFile = File(...),
     duplicate_policy: Literal["skip", "refresh"] = Form("skip"),
     default_category_name: str = Form("Imported"),
+    validate_urls: bool = Form(False),
     _: None = Depends(validate_csrf),
 ) -> FeedOpmlImportResult:
     """Import OPML subscriptions for the authenticated user."""
 
     username = _require_logged_in_user(request)
+    file_bytes = await _read_opml_upload(opml_file)
 
-    file_bytes = await opml_file.read(OPML_IMPORT_MAX_BYTES + 1)
-    if len(file_bytes) == 0:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Uploaded OPML file is empty.",
-        )
+    options = FeedOpmlImportOptions(
+        duplicate_policy=duplicate_policy,
+        default_category_name=default_category_name,
+        validate_urls=validate_urls,
+    )
 
-    if len(file_bytes) > OPML_IMPORT_MAX_BYTES:
-        max_size_kib = OPML_IMPORT_MAX_BYTES // 1024
+    try:
+        return await import_opml(username, file_bytes, options)
+    except ValueError as exc:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Uploaded OPML file exceeds the {max_size_kib} KiB size limit.",
-        )
+            detail=str(exc),
+        ) from exc
+
+
+@feeds_router.post(
+    "/api/opml/import/jobs",
+    response_model=FeedOpmlImportJob,
+    status_code=status.HTTP_202_ACCEPTED,
+)
+@feeds_router.post(
+    "/api/opml/import/jobs/",
+    response_model=FeedOpmlImportJob,
+    status_code=status.HTTP_202_ACCEPTED,
+)
+async def start_opml_import(
+    request: Request,
+    opml_file: UploadFile = File(...),
+    duplicate_policy: Literal["skip", "refresh"] = Form("skip"),
+    default_category_name: str = Form("Imported"),
+    validate_urls: bool = Form(False),
+    _: None = Depends(validate_csrf),
+) -> FeedOpmlImportJob:
+    """Start a background OPML import and return a job to poll for progress."""
+
+    username = _require_logged_in_user(request)
+    file_bytes = await _read_opml_upload(opml_file)
 
     options = FeedOpmlImportOptions(
         duplicate_policy=duplicate_policy,
         default_category_name=default_category_name,
+        validate_urls=validate_urls,
     )
 
     try:
-        return await import_opml(username, file_bytes, options)
+        return await start_opml_import_job(username, file_bytes, options)
     except ValueError as exc:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -940,6 +1183,28 @@ async def import_opml_data(
         ) from exc
 
 
+@feeds_router.get(
+    "/api/opml/import/jobs/{job_id}",
+    response_model=FeedOpmlImportJob,
+)
+@feeds_router.get(
+    "/api/opml/import/jobs/{job_id}/",
+    response_model=FeedOpmlImportJob,
+)
+async def get_opml_import_progress(request: Request, job_id: str) -> FeedOpmlImportJob:
+    """Return progress for an OPML import job owned by the authenticated user."""
+
+    username = _require_logged_in_user(request)
+    job = await get_opml_import_job(username, job_id)
+    if job is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Import job not found.",
+        )
+
+    return job
+
+
 @feeds_router.get("/api/opml/export")
 @feeds_router.get("/api/opml/export/")
 async def export_opml_data(request: Request) -> Response:
@@ -0,0 +1,412 @@
+"""In-process inverted index for feed article search.
+
+Each uvicorn worker keeps one :class:`ArticleSearchIndex` over article
+``title`` and ``summary_html`` text. Queries resolve term, prefix and phrase
+components against positional postings and rank matches with BM25 (or order
+them newest first), so search no longer regex-scans every subscribed
+article. The index can be written to a local segment file and loaded again
+on startup so a restarted worker only has to catch up on articles fetched
+since the segment was saved.
+"""
+
+from __future__ import annotations
+
+from array import array
+from bisect import bisect_left
+from collections.abc import Callable, Collection, Iterable
+from datetime import datetime
+from html import unescape
+import json
+import math
+import os
+from pathlib import Path
+import re
+from typing import Any, Literal, NamedTuple
+from uuid import uuid4
+import zlib
+
+SEGMENT_FORMAT = "feed-search-segment"
+SEGMENT_VERSION = 2
+TITLE_TERM_WEIGHT = 4
+BM25_K1 = 1.2
+BM25_B = 0.75
+PREFIX_EXPANSION_LIMIT = 256
+
+TOKEN_RE = re.compile(r"[A-Za-z0-9]+")
+HTML_TAG_RE = re.compile(r"<[^>]*>")
+
+SearchComponent = tuple[str, str]
+SearchOrder = Literal["score", "newest"]
+
+
+class _IndexedArticle(NamedTuple):
+    article_id: str
+    feed_id: str
+    title_length: int
+    weighted_length: int
+    terms: tuple[str, ...]
+    published_at: float | None = None
+
+
+def tokenize_search_text(value: str | None) -> list[str]:
+    """Return casefolded alphanumeric tokens in document order."""
+
+    return [token.casefold() for token in TOKEN_RE.findall(str(value or ""))]
+
+
+def html_to_search_text(value: str | None) -> str:
+    """Return the visible text of an article summary for indexing."""
+
+    return unescape(HTML_TAG_RE.sub(" ", str(value or "")))
+
+
+class ArticleSearchIndex:
+    """Positional inverted index with BM25 ranking over feed articles."""
+
+    def __init__(self) -> None:
+        self._slots: dict[str, int] = {}
+        self._articles: dict[int, _IndexedArticle] = {}
+        self._postings: dict[str, dict[int, array]] = {}
+        self._next_slot = 0
+        self._total_weighted_length = 0
+        self._sorted_terms: list[str] | None = None
+
+    def __len__(self) -> int:
+        return len(self._articles)
+
+    def __contains__(self, article_id: object) -> bool:
+        return article_id in self._slots
+
+    @property
+    def term_count(self) -> int:
+        return len(self._postings)
+
+    def add_article(
+        self,
+        article_id: str,
+        feed_id: str,
+        title: str | None,
+        summary_html: str | None,
+        published_at: datetime | None = None,
+    ) -> None:
+        """Index one article, replacing any previous version of it.
+
+        *published_at* is only used to order matches newest first.
+        """
+
+        self.remove_article(article_id)
+
+        title_tokens = tokenize_search_text(title)
+        summary_tokens = tokenize_search_text(html_to_search_text(summary_html))
+        if len(title_tokens) == 0 and len(summary_tokens) == 0:
+            return
+
+        # Summary positions start one past the title so phrases never span
+        # the two fields.
+        positions_by_term: dict[str, list[int]] = {}
+        for position, token in enumerate(title_tokens):
+            positions_by_term.setdefault(token, []).append(position)
+        summary_offset = len(title_tokens) + 1
+        for position, token in enumerate(summary_tokens, start=summary_offset):
+            positions_by_term.setdefault(token, []).append(position)
+
+        slot = self._next_slot
+        self._next_slot += 1
+        weighted_length = TITLE_TERM_WEIGHT * len(title_tokens) + len(summary_tokens)
+        self._slots[article_id] = slot
+        self._articles[slot] = _IndexedArticle(
+            article_id=article_id,
+            feed_id=feed_id,
+            title_length=len(title_tokens),
+            weighted_length=weighted_length,
+            terms=tuple(positions_by_term),
+            published_at=published_at.timestamp() if published_at is not None else None,
+        )
+        self._total_weighted_length += weighted_length
+
+        for term, positions in positions_by_term.items():
+            term_postings = self._postings.get(term)
+            if term_postings is None:
+                term_postings = {}
+                self._postings[term] = term_postings
+                self._sorted_terms = None
+            term_postings[slot] = array("I", positions)
+
+    def remove_article(self, article_id: str) -> bool:
+        """Drop one article from the index; return False when it was absent."""
+
+        slot = self._slots.pop(article_id, None)
+        if slot is None:
+            return False
+
+        article = self._articles.pop(slot)
+        self._total_weighted_length -= article.weighted_length
+        for term in article.terms:
+            term_postings = self._postings.get(term)
+            if term_postings is None:
+                continue
+            term_postings.pop(slot, None)
+            if len(term_postings) == 0:
+                del self._postings[term]
+                self._sorted_terms = None
+
+        return True
+
+    def search(
+        self,
+        components: Iterable[SearchComponent],
+        *,
+        expand_term: Callable[[str], Iterable[str]],
+        feed_ids: Collection[str] | None = None,
+        limit: int | None = None,
+        order: SearchOrder = "score",
+    ) -> list[tuple[str, float]]:
+        """Return ``(article_id, score)`` pairs matching every component.
+
+        Components are the ``("term" | "prefix" | "phrase", value)`` pairs
+        produced by the query parser. Term components match any form returned
+        by *expand_term*. Results are ordered by descending BM25 score, or with
+        ``order="newest"`` the way article listings show them: dated articles
+        newest first, then undated ones, each by descending ID. *limit* is
+        applied after ordering.
+        """
+
+        scores: dict[int, float] | None = None
+        for component_kind, component_value in components:
+            component_scores = self._score_component(component_kind, component_value, expand_term)
+            if scores is None:
+                if feed_ids is not None:
+                    component_scores = {
+                        slot: score
+                        for slot, score in component_scores.items()
+                        if self._articles[slot].feed_id in feed_ids
+                    }
+                scores = component_scores
+            else:
+                scores = {
+                    slot: score + component_scores[slot]
+                    for slot, score in scores.items()
+                    if slot in component_scores
+                }
+            if len(scores) == 0:
+                return []
+
+        if scores is None:
+            return []
+
+        if order == "newest":
+            ranked = sorted(scores.items(), key=self._newest_first_key, reverse=True)
+        else:
+            ranked = sorted(scores.items(), key=lambda item: (-item[1], item[0]))
+        if limit is not None:
+            ranked = ranked[: max(0, limit)]
+
+        return [(self._articles[slot].article_id, score) for slot, score in ranked]
+
+    def _newest_first_key(self, item: tuple[int, float]) -> tuple[bool, float, str]:
+        article = self._articles[item[0]]
+        published_at = article.published_at
+        return published_at is not None, published_at or 0.0, article.article_id
+
+    def _score_component(
+        self,
+        component_kind: str,
+        component_value: str,
+        expand_term: Callable[[str], Iterable[str]],
+    ) -> dict[int, float]:
+        if component_kind == "phrase":
+            return self._score_phrase(tokenize_search_text(component_value))
+
+        if component_kind == "prefix":
+            return self._score_terms(self._expand_prefix(component_value.casefold()))
+
+        terms = {term.casefold() for term in expand_term(component_value)}
+        terms.add(component_value.casefold())
+        return self._score_terms(terms)
+
+    def _expand_prefix(self, prefix: str) -> list[str]:
+        if prefix == "":
+            return []
+
+        if self._sorted_terms is None:
+            self._sorted_terms = sorted(self._postings)
+
+        terms: list[str] = []
+        start = bisect_left(self._sorted_terms, prefix)
+        for term in self._sorted_terms[start:]:
+            if not term.startswith(prefix):
+                break
+            terms.append(term)
+
+        if len(terms) > PREFIX_EXPANSION_LIMIT:
+            terms.sort(key=lambda term: len(self._postings[term]), reverse=True)
+            terms = terms[:PREFIX_EXPANSION_LIMIT]
+
+        return terms
+
+    def _score_terms(self, terms: Iterable[str]) -> dict[int, float]:
+        # Variants of one component take the best score rather than the sum so
+        # "run" and "running" in the same article do not double count.
+        scores: dict[int, float] = {}
+        for term in terms:
+            for slot, score in self._term_scores(term).items():
+                if score > scores.get(slot, 0.0):
+                    scores[slot] = score
+        return scores
+
+    def _score_phrase(self, tokens: list[str]) -> dict[int, float]:
+        if len(tokens) == 0:
+            return {}
+
+        token_postings = [self._postings.get(token) for token in tokens]
+        if any(postings is None for postings in token_postings):
+            return {}
+        postings_list = [postings for postings in token_postings if postings is not None]
+
+        candidate_slots = set(min(postings_list, key=len))
+        for postings in postings_list:
+            candidate_slots.intersection_update(postings)
+
+        if len(tokens) > 1:
+            candidate_slots = {
+                slot
+                for slot in candidate_slots
+                if self._phrase_occurs(slot, postings_list)
+            }
+
+        scores: dict[int, float] = {}
+        for token in dict.fromkeys(tokens):
+            for slot, score in self._term_scores(token, candidate_slots).items():
+                scores[slot] = scores.get(slot, 0.0) + score
+        return scores
+
+    @staticmethod
+    def _phrase_occurs(slot: int, postings_list: list[dict[int, array]]) -> bool:
+        starts = set(postings_list[0][slot])
+        for offset, postings in enumerate(postings_list[1:], start=1):
+            positions = set(postings[slot])
+            starts = {start for start in starts if start + offset in positions}
+            if len(starts) == 0:
+                return False
+        return True
+
+    def _term_scores(
+        self,
+        term: str,
+        restrict_to: Collection[int] | None = None,
+    ) -> dict[int, float]:
+        postings = self._postings.get(term)
+        if postings is None or len(self._articles) == 0:
+            return {}
+
+        article_count = len(self._articles)
+        document_frequency = len(postings)
+        idf = math.log(1.0 + (article_count - document_frequency + 0.5) / (document_frequency + 0.5))
+        average_length = max(1.0, self._total_weighted_length / article_count)
+
+        scores: dict[int, float] = {}
+        slots = postings if restrict_to is None else (slot for slot in restrict_to if slot in postings)
+        for slot in slots:
+            article = self._articles[slot]
+            positions = postings[slot]
+            title_hits = sum(1 for position in positions if position < article.title_length)
+            term_frequency = TITLE_TERM_WEIGHT * title_hits + (len(positions) - title_hits)
+            length_norm = 1.0 - BM25_B + BM25_B * article.weighted_length / average_length
+            scores[slot] = idf * term_frequency * (BM25_K1 + 1.0) / (term_frequency + BM25_K1 * length_norm)
+        return scores
+
+    def to_segment(self, watermark: datetime | None) -> dict[str, Any]:
+        """Return a JSON-serialisable snapshot of the index."""
+
+        # Slots are compacted so a reloaded index does not inherit gaps left
+        # by removed articles.
+        compact_slots = {slot: index for index, slot in enumerate(self._articles)}
+        return {
+            "format": SEGMENT_FORMAT,
+            "version": SEGMENT_VERSION,
+            "watermark": watermark.isoformat() if watermark is not None else None,
+            "articles": [
+                [
+                    article.article_id,
+                    article.feed_id,
+                    article.title_length,
+                    article.weighted_length,
+                    article.published_at,
+                ]
+                for article in self._articles.values()
+            ],
+            "postings": {
+                term: [[compact_slots[slot], list(positions)] for slot, positions in postings.items()]
+                for term, postings in self._postings.items()
+            },
+        }
+
+    @classmethod
+    def from_segment(cls, segment: dict[str, Any]) -> tuple[ArticleSearchIndex, datetime | None]:
+        """Rebuild an index and its watermark from :meth:`to_segment` output."""
+
+        if segment.get("format") != SEGMENT_FORMAT or segment.get("version") != SEGMENT_VERSION:
+            raise ValueError("Unsupported feed search segment format.")
+
+        index = cls()
+        article_rows = segment.get("articles") or []
+        article_terms: list[list[str]] = [[] for _ in article_rows]
+        for term, rows in (segment.get("postings") or {}).items():
+            postings: dict[int, array] = {}
+            for slot, positions in rows:
+                postings[int(slot)] = array("I", positions)
+                article_terms[int(slot)].append(term)
+            if len(postings) > 0:
+                index._postings[term] = postings
+
+        for slot, (article_id, feed_id, title_length, weighted_length, published_at) in enumerate(
+            article_rows
+        ):
+            index._slots[article_id] = slot
+            index._articles[slot] = _IndexedArticle(
+                article_id=article_id,
+                feed_id=feed_id,
+                title_length=int(title_length),
+                weighted_length=int(weighted_length),
+                terms=tuple(article_terms[slot]),
+                published_at=float(published_at) if published_at is not None else None,
+            )
+            index._total_weighted_length += int(weighted_length)
+        index._next_slot = len(article_rows)
+
+        raw_watermark = segment.get("watermark")
+        watermark = datetime.fromisoformat(raw_watermark) if isinstance(raw_watermark, str) else None
+        return index, watermark
+
+
+def write_segment_file(path: Path, index: ArticleSearchIndex, watermark: datetime | None) -> None:
+    """Atomically write a compressed index segment to *path*."""
+
+    payload = zlib.compress(
+        json.dumps(index.to_segment(watermark), separators=(",", ":")).encode("utf-8")
+    )
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = path.with_name(f".{path.name}.{uuid4().hex}.tmp")
+    try:
+        temp_path.write_bytes(payload)
+        os.replace(temp_path, path)
+    finally:
+        temp_path.unlink(missing_ok=True)
+
+
+def read_segment_file(path: Path) -> tuple[ArticleSearchIndex, datetime | None]:
+    """Load an index segment written by :func:`write_segment_file`."""
+
+    segment = json.loads(zlib.decompress(path.read_bytes()).decode("utf-8"))
+    if not isinstance(segment, dict):
+        raise ValueError("Feed search segment is not an object.")
+    return ArticleSearchIndex.from_segment(segment)
+
+
+__all__ = [
+    "ArticleSearchIndex",
+    "html_to_search_text",
+    "read_segment_file",
+    "tokenize_search_text",
+    "write_segment_file",
+]
@@ -2,6 +2,8 @@ from ..database.database import Database
 from .db_names import (
     LIVE_PL_TABLE_COLLECTION,
     PL_DATABASE,
+    PL_MATCH_INDEX_COLLECTION,
+    PL_MATCH_INDEX_STATE_COLLECTION,
     WC_DATABASE,
     WEB_DATABASE,
     pl_matches_collection_name,
@@ -15,6 +17,10 @@ pl_matches = mongodb.get_collection(
     pl_matches_collection_name(), db_name=PL_DATABASE
 )
 pl_table = mongodb.get_collection(LIVE_PL_TABLE_COLLECTION, db_name=PL_DATABASE)
+pl_matches_all = mongodb.get_collection(PL_MATCH_INDEX_COLLECTION, db_name=PL_DATABASE)
+pl_matches_all_state = mongodb.get_collection(
+    PL_MATCH_INDEX_STATE_COLLECTION, db_name=PL_DATABASE
+)
 team_primary_colours = mongodb.get_collection(
     "pl_team_primary_colours", db_name=PL_DATABASE
 )
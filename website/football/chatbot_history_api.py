@@ -16,14 +16,19 @@ from .chatbot_history_models import (
     FootballHistoryResponseModel,
     FootballHistoryStatus,
 )
+from .chatbot_history_store import (
+    NO_VALUE,
+    WINNER_AWAY,
+    WINNER_DRAW,
+    WINNER_HOME,
+    HistorySeasonColumns,
+    history_column_store,
+)
 from .football_db import (
     get_available_season_keys,
     get_competition_name_for_season,
-    get_table_db_for_season,
-    retreive_matches,
 )
-from .football_utils import update_match_timezone
-from .models import LiveTableItem, Match, Team
+from .models import Team
 
 
 football_history_api_router = APIRouter()
@@ -57,17 +62,6 @@ def _season_label_from_key(season_key: str) -> str:
     return f"{season_start}/{season_end[-2:]}"
 
 
-def _season_bounds_utc(season_key: str) -> tuple[datetime, datetime]:
-    season_start, season_end = season_key.split("_", maxsplit=1)
-    start_year = int(season_start)
-    end_year = int(season_end)
-
-    return (
-        datetime(start_year, 8, 1, tzinfo=UTC),
-        datetime(end_year, 8, 1, tzinfo=UTC),
-    )
-
-
 def _team_aliases(team: Team) -> set[str]:
     aliases: set[str] = set()
     if team.name is not None:
@@ -92,63 +86,79 @@ def _team_matches_name(team: Team, team_name: str) -> bool:
     return target in _team_aliases(team)
 
 
-def _match_is_draw(match: Match) -> bool:
-    winner = str(match.score.winner or "")
-    return winner.upper() == "DRAW"
+def _team_indices_matching_any(team_filters: set[str]) -> set[int]:
+    return {
+        index
+        for index, team in enumerate(history_column_store.teams)
+        if _team_matches_any(team, team_filters)
+    }
+
 
+def _team_indices_matching_name(team_name: str) -> set[int]:
+    return {
+        index
+        for index, team in enumerate(history_column_store.teams)
+        if _team_matches_name(team, team_name)
+    }
 
-def _home_team_won(match: Match) -> bool:
-    winner = str(match.score.winner or "")
-    return winner.upper() == "HOME_TEAM"
 
+def _optional_column_value(value: int) -> int | None:
+    return None if value == NO_VALUE else value
 
-def _away_team_won(match: Match) -> bool:
-    winner = str(match.score.winner or "")
-    return winner.upper() == "AWAY_TEAM"
 
+def _winner_label(columns: HistorySeasonColumns, index: int) -> str:
+    winner = columns.winner[index]
+    teams = history_column_store.teams
 
-def _winner_label(match: Match) -> str:
-    if _home_team_won(match):
-        return str(match.home_team.short_name)
-    if _away_team_won(match):
-        return str(match.away_team.short_name)
-    if _match_is_draw(match):
+    if winner == WINNER_HOME:
+        return str(teams[columns.home_team[index]].short_name)
+    if winner == WINNER_AWAY:
+        return str(teams[columns.away_team[index]].short_name)
+    if winner == WINNER_DRAW:
         return "Draw"
 
     return "Unknown"
 
 
-def _match_passes_team_filter(match: Match, team_filters: set[str], venue: str) -> bool:
-    if len(team_filters) == 0:
-        return True
+def _filtered_match_indices(
+    columns: HistorySeasonColumns,
+    team_indices: set[int] | None,
+    venue: str,
+) -> list[int]:
+    if team_indices is None:
+        return list(range(columns.match_count))
 
-    home_matches = _team_matches_any(match.home_team, team_filters)
-    away_matches = _team_matches_any(match.away_team, team_filters)
+    home_team = columns.home_team
+    away_team = columns.away_team
 
     if venue == "home":
-        return home_matches
+        return [index for index, team in enumerate(home_team) if team in team_indices]
     if venue == "away":
-        return away_matches
+        return [index for index, team in enumerate(away_team) if team in team_indices]
 
-    return home_matches or away_matches
+    return [
+        index
+        for index in range(columns.match_count)
+        if home_team[index] in team_indices or away_team[index] in team_indices
+    ]
 
 
-def _match_to_result_row(match: Match, season_key: str) -> dict[str, object]:
-    home_goals = match.score.full_time.home
-    away_goals = match.score.full_time.away
+def _match_to_result_row(columns: HistorySeasonColumns, index: int) -> dict[str, object]:
+    season_key = columns.season_key
+    teams = history_column_store.teams
 
     return {
         "season": _season_label_from_key(season_key),
         "season_key": season_key,
         "competition": get_competition_name_for_season(season_key),
-        "utc_date": match.utc_date.isoformat(),
-        "status": str(match.status),
-        "matchday": match.matchday,
-        "home_team": str(match.home_team.short_name),
-        "away_team": str(match.away_team.short_name),
-        "home_goals": home_goals,
-        "away_goals": away_goals,
-        "winner": _winner_label(match),
+        "utc_date": columns.utc_date[index],
+        "status": columns.status[index],
+        "matchday": _optional_column_value(columns.matchday[index]),
+        "home_team": str(teams[columns.home_team[index]].short_name),
+        "away_team": str(teams[columns.away_team[index]].short_name),
+        "home_goals": _optional_column_value(columns.home_goals[index]),
+        "away_goals": _optional_column_value(columns.away_goals[index]),
+        "winner": _winner_label(columns, index),
     }
 
 
@@ -263,19 +273,6 @@ async def _resolve_requested_seasons(
     ]
 
 
-async def _fetch_matches_by_season(season_keys: list[str]) -> dict[str, list[Match]]:
-    matches_by_season: dict[str, list[Match]] = {}
-
-    for season_key in season_keys:
-        date_from, date_to = _season_bounds_utc(season_key)
-        season_matches = await retreive_matches(date_from, date_to, season_key)
-        update_match_timezone(season_matches)
-
-        matches_by_season[season_key] = season_matches
-
-    return matches_by_season
-
-
 async def _build_match_results_data(
     payload: FootballHistoryRequestEnvelope,
     season_keys: list[str],
@@ -284,14 +281,12 @@ async def _build_match_results_data(
     venue = payload.request.filters.venue.value
 
     data: list[dict[str, object]] = []
-    matches_by_season = await _fetch_matches_by_season(season_keys)
-
-    for season_key, season_matches in matches_by_season.items():
-        for match in season_matches:
-            if not _match_passes_team_filter(match, team_filters, venue):
-                continue
+    seasons = await history_column_store.seasons(season_keys)
+    team_indices = _team_indices_matching_any(team_filters) if len(team_filters) > 0 else None
 
-            data.append(_match_to_result_row(match, season_key))
+    for columns in seasons:
+        for index in _filtered_match_indices(columns, team_indices, venue):
+            data.append(_match_to_result_row(columns, index))
 
     if payload.request.sort_by is None:
         data = _apply_sort_and_limit(
@@ -318,15 +313,18 @@ async def _build_league_table_data(
     team_filters = {_normalise_value(team) for team in payload.request.filters.teams}
 
     rows: list[dict[str, object]] = []
+    seasons = await history_column_store.seasons(season_keys)
+    team_indices = _team_indices_matching_any(team_filters) if len(team_filters) > 0 else None
+    teams = history_column_store.teams
 
-    for season_key in season_keys:
-        season_table = await get_table_db_for_season(season_key)
+    for columns in seasons:
+        season_key = columns.season_key
         competition = get_competition_name_for_season(season_key)
         season_label = _season_label_from_key(season_key)
         season_start_year = int(season_key.split("_", maxsplit=1)[0])
 
-        for item in season_table:
-            if len(team_filters) > 0 and not _team_matches_any(item.team, team_filters):
+        for index, team_index in enumerate(columns.table_team):
+            if team_indices is not None and team_index not in team_indices:
                 continue
 
             rows.append(
@@ -335,16 +333,16 @@ async def _build_league_table_data(
                     "season_key": season_key,
                     "competition": competition,
                     "season_start_year": season_start_year,
-                    "team": str(item.team.short_name),
-                    "position": item.position,
-                    "matches_played": item.played_games,
-                    "wins": item.won,
-                    "draws": item.draw,
-                    "losses": item.lost,
-                    "goals_for": item.goals_for,
-                    "goals_against": item.goals_against,
-                    "goal_difference": item.goal_difference,
-                    "points": item.points,
+                    "team": str(teams[team_index].short_name),
+                    "position": columns.table_position[index],
+                    "matches_played": columns.table_played[index],
+                    "wins": columns.table_won[index],
+                    "draws": columns.table_draw[index],
+                    "losses": columns.table_lost[index],
+                    "goals_for": columns.table_goals_for[index],
+                    "goals_against": columns.table_goals_against[index],
+                    "goal_difference": columns.table_goal_difference[index],
+                    "points": columns.table_points[index],
                 }
             )
 
@@ -371,15 +369,16 @@ async def _build_league_table_data(
 
 def _update_aggregate_bucket(
     bucket: dict[str, object],
-    table_item: LiveTableItem,
+    columns: HistorySeasonColumns,
+    index: int,
 ) -> None:
-    bucket["matches_played"] = _to_int(bucket.get("matches_played")) + table_item.played_games
-    bucket["wins"] = _to_int(bucket.get("wins")) + table_item.won
-    bucket["draws"] = _to_int(bucket.get("draws")) + table_item.draw
-    bucket["losses"] = _to_int(bucket.get("losses")) + table_item.lost
-    bucket["goals_for"] = _to_int(bucket.get("goals_for")) + table_item.goals_for
-    bucket["goals_against"] = _to_int(bucket.get("goals_against")) + table_item.goals_against
-    bucket["points"] = _to_int(bucket.get("points")) + table_item.points
+    bucket["matches_played"] = _to_int(bucket.get("matches_played")) + columns.table_played[index]
+    bucket["wins"] = _to_int(bucket.get("wins")) + columns.table_won[index]
+    bucket["draws"] = _to_int(bucket.get("draws")) + columns.table_draw[index]
+    bucket["losses"] = _to_int(bucket.get("losses")) + columns.table_lost[index]
+    bucket["goals_for"] = _to_int(bucket.get("goals_for")) + columns.table_goals_for[index]
+    bucket["goals_against"] = _to_int(bucket.get("goals_against")) + columns.table_goals_against[index]
+    bucket["points"] = _to_int(bucket.get("points")) + columns.table_points[index]
     bucket["goal_difference"] = _to_int(bucket.get("goals_for")) - _to_int(bucket.get("goals_against"))
 
 
@@ -409,21 +408,24 @@ async def _build_aggregate_stats_data(
     team_filters = {_normalise_value(team) for team in payload.request.filters.teams}
 
     grouped_rows: dict[tuple[str, ...], dict[str, object]] = {}
+    seasons = await history_column_store.seasons(season_keys)
+    team_indices = _team_indices_matching_any(team_filters) if len(team_filters) > 0 else None
+    teams = history_column_store.teams
 
-    for season_key in season_keys:
+    for columns in seasons:
+        season_key = columns.season_key
         season_label = _season_label_from_key(season_key)
         competition = get_competition_name_for_season(season_key)
-        season_table = await get_table_db_for_season(season_key)
 
-        for item in season_table:
-            if len(team_filters) > 0 and not _team_matches_any(item.team, team_filters):
+        for index, team_index in enumerate(columns.table_team):
+            if team_indices is not None and team_index not in team_indices:
                 continue
 
             group_values: dict[str, str] = {}
 
             for group_field in group_fields:
                 if group_field == "team":
-                    group_values["team"] = str(item.team.short_name)
+                    group_values["team"] = str(teams[team_index].short_name)
                 elif group_field == "season":
                     group_values["season"] = season_label
                 elif group_field == "competition":
@@ -446,9 +448,9 @@ async def _build_aggregate_stats_data(
                 },
             )
 
-            _update_aggregate_bucket(bucket, item)
+            _update_aggregate_bucket(bucket, columns, index)
 
-            if item.position == 1 and "team" in group_fields:
+            if columns.table_position[index] == 1 and "team" in group_fields:
                 bucket["league_titles"] = _to_int(bucket.get("league_titles")) + 1
 
     data = _normalise_metrics_fields(
@@ -495,7 +497,9 @@ async def _build_head_to_head_data(
 
     rows: list[dict[str, object]] = []
 
-    matches_by_season = await _fetch_matches_by_season(season_keys)
+    seasons = await history_column_store.seasons(season_keys)
+    team_a_indices = _team_indices_matching_name(team_a_name)
+    team_b_indices = _team_indices_matching_name(team_b_name)
 
     team_a_wins = 0
     team_b_wins = 0
@@ -503,18 +507,21 @@ async def _build_head_to_head_data(
     team_a_goals = 0
     team_b_goals = 0
 
-    for season_key, season_matches in matches_by_season.items():
-        for match in season_matches:
-            home_is_a = _team_matches_name(match.home_team, team_a_name)
-            away_is_a = _team_matches_name(match.away_team, team_a_name)
-            home_is_b = _team_matches_name(match.home_team, team_b_name)
-            away_is_b = _team_matches_name(match.away_team, team_b_name)
+    for columns in seasons:
+        for index in range(columns.match_count):
+            home_team = columns.home_team[index]
+            away_team = columns.away_team[index]
+            home_is_a = home_team in team_a_indices
+            away_is_a = away_team in team_a_indices
+            home_is_b = home_team in team_b_indices
+            away_is_b = away_team in team_b_indices
 
             if not ((home_is_a and away_is_b) or (home_is_b and away_is_a)):
                 continue
 
-            home_goals = int(match.score.full_time.home or 0)
-            away_goals = int(match.score.full_time.away or 0)
+            home_goals = max(columns.home_goals[index], 0)
+            away_goals = max(columns.away_goals[index], 0)
+            winner = columns.winner[index]
 
             if home_is_a:
                 team_a_goals += home_goals
@@ -523,14 +530,14 @@ async def _build_head_to_head_data(
                 team_a_goals += away_goals
                 team_b_goals += home_goals
 
-            if _match_is_draw(match):
+            if winner == WINNER_DRAW:
                 draws += 1
-            elif (home_is_a and _home_team_won(match)) or (away_is_a and _away_team_won(match)):
+            elif (home_is_a and winner == WINNER_HOME) or (away_is_a and winner == WINNER_AWAY):
                 team_a_wins += 1
             else:
                 team_b_wins += 1
 
-            rows.append(_match_to_result_row(match, season_key))
+            rows.append(_match_to_result_row(columns, index))
 
     if len(rows) == 0:
         return []
@@ -0,0 +1,171 @@
+"""Process-wide columnar copy of PL history for the football history API.
+
+Every season's matches and final table are held as parallel ``array`` columns
+(one :class:`HistorySeasonColumns` per season), with teams interned into one
+shared list. History queries pick the season segments they need and filter,
+aggregate and sort over those columns in memory, so a query does no Mongo reads
+once its seasons are loaded.
+
+Segments are keyed on the season fingerprints of the cross-season match store
+(``get_pl_match_index_versions``). A season is reloaded only when its
+fingerprint changes, which in practice means only the live season. Until the
+cross-season store has synced there are no fingerprints, and seasons are loaded
+per query as before.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from array import array
+from dataclasses import dataclass, field
+
+from .football_db import (
+    get_pl_match_index_versions,
+    get_table_db_for_season,
+    retreive_matches_for_seasons,
+)
+from .models import LiveTableItem, Match, Team
+
+NO_VALUE = -1
+WINNER_UNKNOWN = 0
+WINNER_HOME = 1
+WINNER_AWAY = 2
+WINNER_DRAW = 3
+
+_WINNER_CODES = {
+    "HOME_TEAM": WINNER_HOME,
+    "AWAY_TEAM": WINNER_AWAY,
+    "DRAW": WINNER_DRAW,
+}
+
+
+def _winner_code(match: Match) -> int:
+    return _WINNER_CODES.get(str(match.score.winner or "").upper(), WINNER_UNKNOWN)
+
+
+def _optional_int(value: int | None) -> int:
+    return NO_VALUE if value is None else value
+
+
+@dataclass
+class HistorySeasonColumns:
+    """One season's matches and final table as parallel columns.
+
+    Team columns hold indices into :attr:`HistoryColumnStore.teams`; missing
+    goals and matchdays are stored as ``NO_VALUE``.
+    """
+
+    season_key: str
+    version: str | None
+    utc_date: list[str] = field(default_factory=list)
+    status: list[str] = field(default_factory=list)
+    matchday: array = field(default_factory=lambda: array("h"))
+    home_team: array = field(default_factory=lambda: array("I"))
+    away_team: array = field(default_factory=lambda: array("I"))
+    home_goals: array = field(default_factory=lambda: array("h"))
+    away_goals: array = field(default_factory=lambda: array("h"))
+    winner: array = field(default_factory=lambda: array("B"))
+    table_team: array = field(default_factory=lambda: array("I"))
+    table_position: array = field(default_factory=lambda: array("h"))
+    table_played: array = field(default_factory=lambda: array("h"))
+    table_won: array = field(default_factory=lambda: array("h"))
+    table_draw: array = field(default_factory=lambda: array("h"))
+    table_lost: array = field(default_factory=lambda: array("h"))
+    table_goals_for: array = field(default_factory=lambda: array("h"))
+    table_goals_against: array = field(default_factory=lambda: array("h"))
+    table_goal_difference: array = field(default_factory=lambda: array("h"))
+    table_points: array = field(default_factory=lambda: array("h"))
+
+    @property
+    def match_count(self) -> int:
+        return len(self.home_team)
+
+    @property
+    def table_count(self) -> int:
+        return len(self.table_team)
+
+
+class HistoryColumnStore:
+    def __init__(self) -> None:
+        self.teams: list[Team] = []
+        self._team_indices: dict[tuple[object, ...], int] = {}
+        self._seasons: dict[str, HistorySeasonColumns] = {}
+        self._lock = asyncio.Lock()
+
+    def team_index(self, team: Team) -> int:
+        """Intern *team*; each distinct id/name spelling gets its own index."""
+
+        key = (team.id, team.name, team.short_name, team.tla)
+        index = self._team_indices.get(key)
+        if index is None:
+            index = len(self.teams)
+            self.teams.append(team)
+            self._team_indices[key] = index
+        return index
+
+    def build_season(
+        self,
+        season_key: str,
+        version: str | None,
+        matches: list[Match],
+        table: list[LiveTableItem],
+    ) -> HistorySeasonColumns:
+        columns = HistorySeasonColumns(season_key=season_key, version=version)
+
+        for match in matches:
+            columns.utc_date.append(match.utc_date.isoformat())
+            columns.status.append(str(match.status))
+            columns.matchday.append(_optional_int(match.matchday))
+            columns.home_team.append(self.team_index(match.home_team))
+            columns.away_team.append(self.team_index(match.away_team))
+            columns.home_goals.append(_optional_int(match.score.full_time.home))
+            columns.away_goals.append(_optional_int(match.score.full_time.away))
+            columns.winner.append(_winner_code(match))
+
+        for item in table:
+            columns.table_team.append(self.team_index(item.team))
+            columns.table_position.append(item.position)
+            columns.table_played.append(item.played_games)
+            columns.table_won.append(item.won)
+            columns.table_draw.append(item.draw)
+            columns.table_lost.append(item.lost)
+            columns.table_goals_for.append(item.goals_for)
+            columns.table_goals_against.append(item.goals_against)
+            columns.table_goal_difference.append(item.goal_difference)
+            columns.table_points.append(item.points)
+
+        return columns
+
+    async def seasons(self, season_keys: list[str]) -> list[HistorySeasonColumns]:
+        """Return the segments for *season_keys* in order, reloading any that changed."""
+
+        versions = await get_pl_match_index_versions()
+
+        async with self._lock:
+            stale_keys = [
+                season_key
+                for season_key in season_keys
+                if (cached := self._seasons.get(season_key)) is None
+                or cached.version is None
+                or cached.version != versions.get(season_key)
+            ]
+
+            if len(stale_keys) > 0:
+                matches_by_season = await retreive_matches_for_seasons(stale_keys)
+                for season_key in stale_keys:
+                    self._seasons[season_key] = self.build_season(
+                        season_key,
+                        versions.get(season_key),
+                        matches_by_season.get(season_key, []),
+                        await get_table_db_for_season(season_key),
+                    )
+
+            return [self._seasons[season_key] for season_key in season_keys]
+
+    def clear(self) -> None:
+        self.teams.clear()
+        self._team_indices.clear()
+        self._seasons.clear()
+
+
+history_column_store = HistoryColumnStore()
@@ -20,6 +20,10 @@ CURRENT_PL_SEASON = "2026_2027"
 
 LIVE_PL_TABLE_COLLECTION = "live_pl_table"
 
+# Every season's matches merged into one indexed store (see ``football_db``).
+PL_MATCH_INDEX_COLLECTION = "pl_matches_all_seasons"
+PL_MATCH_INDEX_STATE_COLLECTION = "pl_matches_all_seasons_state"
+
 
 def pl_matches_collection_name(season_key: str = CURRENT_PL_SEASON) -> str:
     return f"pl_matches_{season_key}"
@@ -1,14 +1,24 @@
+import asyncio
 from datetime import UTC, datetime
 import logging
 import re
+import time
 
-from pymongo import ASCENDING, DESCENDING
+from pymongo import ASCENDING, DESCENDING, ReplaceOne
 from pymongo.errors import DuplicateKeyError
 from motor.motor_asyncio import AsyncIOMotorCollection
 
 from ..database.database import get_data_by_date
 
-from . import pl_matches, pl_table, football_push, team_primary_colours, mongodb
+from . import (
+    pl_matches,
+    pl_matches_all,
+    pl_matches_all_state,
+    pl_table,
+    football_push,
+    team_primary_colours,
+    mongodb,
+)
 from .db_names import (
     CURRENT_PL_SEASON,
     PL_DATABASE,
@@ -23,6 +33,7 @@ from .models import (
     PushSubscription,
     PushSubscriptionDocument,
 )
+from .push_fanout import PushFanoutEngine, PushFanoutResult, PushTarget
 
 
 SEASON_KEY_PATTERN = re.compile(r"^\d{4}_\d{4}$")
@@ -37,6 +48,17 @@ FIRST_PREMIER_LEAGUE_SEASON_START_YEAR = 1992
 TEAM_CACHE: list[Team] = []
 TEAM_CACHE_INITIALISED = False
 SUBSCRIPTION_DOCUMENT_SORT = [("updated_at", DESCENDING), ("created_at", DESCENDING)]
+SEASON_KEYS_CACHE_SECONDS = 300.0
+PL_MATCH_INDEX_CHECK_SECONDS = 30.0
+PL_MATCH_INDEX_STALE_SECONDS = 4 * PL_MATCH_INDEX_CHECK_SECONDS
+
+_season_keys_cache: list[str] | None = None
+_season_keys_cached_at = 0.0
+_match_index_versions: dict[str, str] = {}
+_match_index_markers: dict[str, tuple[int, object]] = {}
+_match_index_checked_at: float | None = None
+_match_index_lock = asyncio.Lock()
+_match_index_task: asyncio.Task[None] | None = None
 
 
 def _season_matches_collection_name(season_key: str) -> str:
@@ -209,6 +231,30 @@ def infer_current_season_key(available_season_keys: list[str]) -> str:
 
 
 async def get_available_season_keys() -> list[str]:
+    """Return the stored PL season keys, newest first.
+
+    Discovery lists the PL database's collections, so the result is cached for
+    ``SEASON_KEYS_CACHE_SECONDS``; a new season collection shows up after that.
+    """
+    global _season_keys_cache, _season_keys_cached_at
+
+    now = time.monotonic()
+    if _season_keys_cache is not None and now - _season_keys_cached_at < SEASON_KEYS_CACHE_SECONDS:
+        return _season_keys_cache.copy()
+
+    season_keys = await _discover_season_keys()
+    _season_keys_cache = season_keys
+    _season_keys_cached_at = now
+    return season_keys.copy()
+
+
+def invalidate_available_season_keys() -> None:
+    global _season_keys_cache
+
+    _season_keys_cache = None
+
+
+async def _discover_season_keys() -> list[str]:
     pl_db = mongodb.get_database(PL_DATABASE)
     collection_names = await pl_db.list_collection_names()
     season_keys: list[str] = []
@@ -290,6 +336,269 @@ async def _get_table_collections(include_all_seasons: bool = False) -> list[Asyn
     return collections
 
 
+# Cross-season match store
+#
+# ``pl_matches_all_seasons`` holds a copy of every season's matches tagged with
+# ``season_key`` and an order-free ``team_pair`` key, so head-to-head and
+# multi-season queries are one indexed find instead of a scan per season. The
+# season collections are written by the backend worker, so the store is kept in
+# step here: each season's (count, latest ``last_updated``) fingerprint is
+# compared with the one recorded in ``pl_matches_all_seasons_state`` and only
+# seasons that changed are copied. A changed season only copies the matches
+# updated since its recorded ``last_updated``, falling back to a full re-copy
+# when the match counts then disagree. Every season is checked once per
+# process; after that only the live season (and newly discovered ones) are
+# re-checked every ``PL_MATCH_INDEX_CHECK_SECONDS`` by a background task, so
+# requests never wait on a copy. Until the first pass finishes, or if the task
+# falls behind by ``PL_MATCH_INDEX_STALE_SECONDS``, readers use the season
+# collections directly.
+
+
+def _team_pair_key(home_team_id: object, away_team_id: object) -> str | None:
+    if not isinstance(home_team_id, int) or not isinstance(away_team_id, int):
+        return None
+
+    low_id, high_id = sorted((home_team_id, away_team_id))
+    return f"{low_id}:{high_id}"
+
+
+def _match_index_document(season_key: str, document: dict) -> dict:
+    home_team = document.get("home_team") or {}
+    away_team = document.get("away_team") or {}
+
+    indexed = {key: value for key, value in document.items() if key != "_id"}
+    indexed["_id"] = f"{season_key}:{document.get('id')}"
+    indexed["season_key"] = season_key
+    indexed["team_pair"] = _team_pair_key(home_team.get("id"), away_team.get("id"))
+    return indexed
+
+
+async def _season_match_summary(collection: AsyncIOMotorCollection) -> tuple[int, object]:
+    summary = await collection.aggregate(
+        [
+            {
+                "$group": {
+                    "_id": None,
+                    "count": {"$sum": 1},
+                    "last_updated": {"$max": "$last_updated"},
+                }
+            }
+        ]
+    ).to_list(length=1)
+
+    match_count = summary[0].get("count", 0) if len(summary) > 0 else 0
+    last_updated = summary[0].get("last_updated") if len(summary) > 0 else None
+    return match_count, last_updated
+
+
+def _season_match_version(summary: tuple[int, object]) -> str:
+    return repr(summary)
+
+
+async def _copy_season_matches(season_key: str, query: dict) -> list[str]:
+    assert pl_matches_all is not None
+
+    collection = _get_match_collection_for_season(season_key)
+    documents = (
+        [_match_index_document(season_key, item) async for item in collection.find(query)]
+        if collection is not None
+        else []
+    )
+
+    if len(documents) > 0:
+        await pl_matches_all.bulk_write(
+            [ReplaceOne({"_id": document["_id"]}, document, upsert=True) for document in documents],
+            ordered=False,
+        )
+    return [document["_id"] for document in documents]
+
+
+async def _sync_season_into_match_index(season_key: str, summary: tuple[int, object]) -> None:
+    assert pl_matches_all is not None and pl_matches_all_state is not None
+
+    previous = _match_index_markers.get(season_key)
+    copied_in_full = True
+    if previous is not None and previous[1] is not None:
+        # Only matches updated since the last copy; anything else (a removed or
+        # back-dated match) shows up as a count mismatch and forces a full copy.
+        await _copy_season_matches(season_key, {"last_updated": {"$gt": previous[1]}})
+        indexed_count = await pl_matches_all.count_documents({"season_key": season_key})
+        copied_in_full = indexed_count != summary[0]
+
+    if copied_in_full:
+        copied_ids = await _copy_season_matches(season_key, {})
+        await pl_matches_all.delete_many({"season_key": season_key, "_id": {"$nin": copied_ids}})
+
+    version = _season_match_version(summary)
+    await pl_matches_all_state.replace_one(
+        {"_id": season_key},
+        {
+            "_id": season_key,
+            "version": version,
+            "match_count": summary[0],
+            "last_updated": summary[1],
+            "synced_at": datetime.now(tz=UTC),
+        },
+        upsert=True,
+    )
+    _match_index_versions[season_key] = version
+    _match_index_markers[season_key] = summary
+
+
+async def _refresh_pl_match_index_locked(force: bool) -> list[str]:
+    global _match_index_checked_at
+
+    assert pl_matches_all is not None and pl_matches_all_state is not None
+
+    season_keys = await get_available_season_keys()
+    first_pass = _match_index_checked_at is None or force
+
+    if first_pass:
+        _match_index_versions.clear()
+        _match_index_markers.clear()
+        async for state in pl_matches_all_state.find({}):
+            if isinstance(state.get("version"), str):
+                _match_index_versions[state["_id"]] = state["version"]
+            if not force and isinstance(state.get("match_count"), int):
+                _match_index_markers[state["_id"]] = (state["match_count"], state.get("last_updated"))
+
+        # Drop seasons whose source collection has gone.
+        await pl_matches_all.delete_many({"season_key": {"$nin": season_keys}})
+        await pl_matches_all_state.delete_many({"_id": {"$nin": season_keys}})
+        seasons_to_check = season_keys
+    else:
+        seasons_to_check = [
+            season_key
+            for season_key in season_keys
+            if season_key == CURRENT_PL_SEASON or season_key not in _match_index_versions
+        ]
+
+    refreshed: list[str] = []
+    for season_key in seasons_to_check:
+        collection = _get_match_collection_for_season(season_key)
+        if collection is None:
+            continue
+
+        summary = await _season_match_summary(collection)
+        if not force and _match_index_versions.get(season_key) == _season_match_version(summary):
+            continue
+
+        await _sync_season_into_match_index(season_key, summary)
+        refreshed.append(season_key)
+
+    _match_index_checked_at = time.monotonic()
+
+    if len(refreshed) > 0:
+        logging.info(f"PL match index refreshed for {', '.join(refreshed)}")
+    return refreshed
+
+
+async def refresh_pl_match_index(*, force: bool = False) -> list[str]:
+    """Copy changed season collections into the cross-season store.
+
+    ``force`` re-checks and re-copies every season. Returns the seasons copied.
+    """
+
+    if pl_matches_all is None or pl_matches_all_state is None:
+        logging.error("No DB connection")
+        return []
+
+    async with _match_index_lock:
+        return await _refresh_pl_match_index_locked(force)
+
+
+async def _get_current_match_index() -> AsyncIOMotorCollection | None:
+    """Return the cross-season store, or None to fall back to per-season scans.
+
+    The store is kept current by the background sync task; this never copies.
+    """
+
+    if pl_matches_all is None or pl_matches_all_state is None:
+        return None
+
+    if (
+        _match_index_checked_at is None
+        or time.monotonic() - _match_index_checked_at >= PL_MATCH_INDEX_STALE_SECONDS
+    ):
+        return None
+
+    return pl_matches_all
+
+
+async def get_pl_match_index_versions() -> dict[str, str]:
+    """Return each season's fingerprint in the cross-season store (empty until it has synced).
+
+    A season's fingerprint changes whenever its stored matches do, so callers can
+    key their own derived caches on it.
+    """
+
+    if await _get_current_match_index() is None:
+        return {}
+
+    return dict(_match_index_versions)
+
+
+async def ensure_pl_match_index() -> None:
+    if pl_matches_all is None:
+        logging.error("No DB connection")
+        return
+
+    await pl_matches_all.create_index(
+        [("team_pair", ASCENDING), ("utc_date", DESCENDING)],
+        name="pl_matches_all_team_pair_utc_date",
+    )
+    await pl_matches_all.create_index(
+        [("home_team.id", ASCENDING), ("utc_date", DESCENDING)],
+        name="pl_matches_all_home_team_utc_date",
+    )
+    await pl_matches_all.create_index(
+        [("away_team.id", ASCENDING), ("utc_date", DESCENDING)],
+        name="pl_matches_all_away_team_utc_date",
+    )
+    await pl_matches_all.create_index(
+        [("season_key", ASCENDING), ("utc_date", ASCENDING)],
+        name="pl_matches_all_season_utc_date",
+    )
+
+
+async def _pl_match_index_sync_loop() -> None:
+    while True:
+        try:
+            await refresh_pl_match_index()
+        except Exception as exc:
+            logging.warning(f"PL match index refresh failed: {exc}")
+        await asyncio.sleep(PL_MATCH_INDEX_CHECK_SECONDS)
+
+
+async def start_pl_match_index_sync() -> None:
+    global _match_index_task
+
+    if pl_matches_all is None or pl_matches_all_state is None:
+        logging.error("No DB connection")
+        return
+
+    if _match_index_task is None or _match_index_task.done():
+        _match_index_task = asyncio.create_task(
+            _pl_match_index_sync_loop(),
+            name="football-match-index-sync",
+        )
+
+
+async def stop_pl_match_index_sync() -> None:
+    global _match_index_task
+
+    task = _match_index_task
+    _match_index_task = None
+    if task is None:
+        return
+
+    task.cancel()
+    try:
+        await task
+    except asyncio.CancelledError:
+        pass
+
+
 def _sort_teams(teams_by_id: dict[int, Team]) -> list[Team]:
     return sorted(teams_by_id.values(), key=lambda team: str(team.short_name).lower())
 
@@ -315,7 +624,12 @@ async def _load_all_teams_from_tables() -> list[Team]:
 
 async def _load_all_teams_from_matches() -> list[Team]:
     teams_by_id: dict[int, Team] = {}
-    match_collections = await _get_match_collections(include_all_seasons=True)
+    match_index = await _get_current_match_index()
+    match_collections = (
+        [match_index]
+        if match_index is not None
+        else await _get_match_collections(include_all_seasons=True)
+    )
 
     for collection in match_collections:
         from_db_cursor = collection.find({}, {"home_team": 1, "away_team": 1, "_id": 0})
@@ -440,6 +754,13 @@ async def retreive_head_to_head_matches_by_id(
 ) -> list[Match]:
     matches: list[Match] = []
 
+    match_index = await _get_current_match_index()
+    if match_index is not None:
+        from_db_cursor = match_index.find(
+            {"team_pair": _team_pair_key(team_a_id, team_b_id)}
+        ).sort("utc_date", DESCENDING)
+        return [Match.model_validate(item) async for item in from_db_cursor]
+
     match_collections = await _get_match_collections(include_all_seasons=True)
 
     if len(match_collections) == 0:
@@ -469,6 +790,34 @@ async def retreive_head_to_head_matches_by_id(
     return matches
 
 
+async def retreive_matches_for_seasons(season_keys: list[str]) -> dict[str, list[Match]]:
+    """Return each season's matches in date order, keyed in *season_keys* order."""
+
+    matches_by_season: dict[str, list[Match]] = {season_key: [] for season_key in season_keys}
+
+    match_index = await _get_current_match_index()
+    if match_index is not None:
+        from_db_cursor = match_index.find({"season_key": {"$in": season_keys}}).sort(
+            "utc_date", ASCENDING
+        )
+        async for item in from_db_cursor:
+            season_matches = matches_by_season.get(item.get("season_key"))
+            if season_matches is not None:
+                season_matches.append(Match.model_validate(item))
+        return matches_by_season
+
+    for season_key in season_keys:
+        collection = _get_match_collection_for_season(season_key)
+        if collection is None:
+            logging.error("No DB connection")
+            continue
+
+        from_db_cursor = collection.find({}).sort("utc_date", ASCENDING)
+        matches_by_season[season_key] = [Match.model_validate(item) async for item in from_db_cursor]
+
+    return matches_by_season
+
+
 async def retreive_all_teams() -> list[Team]:
     if not TEAM_CACHE_INITIALISED:
         await initialise_teams_cache()
@@ -624,6 +973,10 @@ async def ensure_push_subscription_indexes() -> None:
         name="football_push_username_client_id",
         sparse=True,
     )
+    await football_push.create_index(
+        [("team_ids", ASCENDING)],
+        name="football_push_team_ids",
+    )
 
 
 async def upsert_push_subscription(subscription_doc: PushSubscriptionDocument) -> bool:
@@ -839,3 +1192,89 @@ async def get_push_subscriptions_for_team_ids(
         subscriptions.append(subscription_doc)
 
     return subscriptions
+
+
+async def get_push_targets_for_team_ids(team_ids: list[int]) -> list[PushTarget]:
+    """Return one push target per endpoint subscribed to any of *team_ids*.
+
+    Endpoints are deduplicated in the database, keeping the most recently
+    updated keys, and only the endpoint and keys are read back.
+    """
+
+    if football_push is None:
+        logging.error("No DB connection")
+        return []
+
+    unique_team_ids = sorted(set(team_ids))
+
+    if len(unique_team_ids) == 0:
+        return []
+
+    cursor = football_push.aggregate(
+        [
+            {"$match": {"team_ids": {"$in": unique_team_ids}}},
+            {"$sort": {"updated_at": DESCENDING}},
+            {
+                "$group": {
+                    # Legacy documents store the raw PushSubscription at the top level.
+                    "_id": {"$ifNull": ["$subscription.endpoint", "$endpoint"]},
+                    "keys": {"$first": {"$ifNull": ["$subscription.keys", "$keys"]}},
+                }
+            },
+        ]
+    )
+
+    targets: list[PushTarget] = []
+    async for item in cursor:
+        endpoint = item.get("_id")
+        keys = item.get("keys") or {}
+
+        if not isinstance(endpoint, str) or not isinstance(keys, dict):
+            continue
+
+        p256dh = keys.get("p256dh")
+        auth = keys.get("auth")
+        if not isinstance(p256dh, str) or not isinstance(auth, str):
+            continue
+
+        targets.append(PushTarget(endpoint=endpoint, p256dh=p256dh, auth=auth))
+
+    return targets
+
+
+async def delete_push_subscriptions_for_endpoints(endpoints: list[str]) -> int:
+    """Delete every subscription whose endpoint the push service reported as gone."""
+
+    if football_push is None:
+        logging.error("No DB connection")
+        return 0
+
+    unique_endpoints = sorted(set(endpoints))
+
+    if len(unique_endpoints) == 0:
+        return 0
+
+    result = await football_push.delete_many(
+        {
+            "$or": [
+                {"subscription.endpoint": {"$in": unique_endpoints}},
+                {"endpoint": {"$in": unique_endpoints}},
+            ]
+        }
+    )
+    return int(result.deleted_count)
+
+
+async def send_team_push_notification(
+    engine: PushFanoutEngine,
+    team_ids: list[int],
+    payload: str | bytes | dict,
+) -> PushFanoutResult:
+    """Fan *payload* out to every endpoint subscribed to *team_ids*, pruning gone ones."""
+
+    targets = await get_push_targets_for_team_ids(team_ids)
+    return await engine.send(
+        targets,
+        payload,
+        prune=delete_push_subscriptions_for_endpoints,
+    )
@@ -0,0 +1,157 @@
+"""Shared live-score broadcast for the football WebSocket.
+
+Sockets subscribe to a :data:`LiveScoreKey` (competition, season or edition,
+current-day-only). Each key with at least one subscriber has one poll task that
+loads its matches, serializes every match once and compares the result with
+the previous poll. New subscribers get the cached snapshot. When the set of
+matches is unchanged but some of them changed, every subscriber is sent the
+same delta string holding only those matches. Otherwise they get the full
+snapshot. Mongo therefore sees one query per key per interval however many
+sockets are open.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import UTC, datetime, timedelta
+import logging
+from typing import Literal
+
+from .models import Match, MatchStatus
+
+LIVE_SCORE_POLL_INTERVAL_SECONDS = 1.0
+LIVE_SCORE_IDLE_POLL_INTERVAL_SECONDS = 30.0
+LIVE_SCORE_KICKOFF_LOOKAHEAD = timedelta(minutes=5)
+LIVE_SCORE_SUBSCRIBER_QUEUE_SIZE = 8
+LIVE_SCORE_ACTIVE_STATUSES = frozenset({MatchStatus.in_play, MatchStatus.paused, MatchStatus.suspended})
+LIVE_SCORE_PENDING_STATUSES = frozenset({MatchStatus.scheduled, MatchStatus.timed})
+
+LiveScoreCompetition = Literal["premier-league", "world-cup"]
+LiveScoreKey = tuple[LiveScoreCompetition, str | None, bool]
+LiveScoreLoader = Callable[[LiveScoreKey], Awaitable[list[Match]]]
+
+
+def live_score_snapshot_message(match_json: list[str]) -> str:
+    return '{"matches":[' + ",".join(match_json) + "]}"
+
+
+def live_score_delta_message(match_json: list[str]) -> str:
+    return '{"matches":[' + ",".join(match_json) + '],"delta":true}'
+
+
+def live_score_poll_interval(matches: list[Match], now: datetime | None = None) -> float:
+    """Poll quickly while a match is live or about to kick off, slowly otherwise."""
+
+    current_time = now or datetime.now(tz=UTC)
+    for match in matches:
+        if match.status in LIVE_SCORE_ACTIVE_STATUSES:
+            return LIVE_SCORE_POLL_INTERVAL_SECONDS
+
+        kickoff = match.utc_date if match.utc_date.tzinfo is not None else match.utc_date.replace(tzinfo=UTC)
+        if match.status in LIVE_SCORE_PENDING_STATUSES and kickoff <= current_time + LIVE_SCORE_KICKOFF_LOOKAHEAD:
+            return LIVE_SCORE_POLL_INTERVAL_SECONDS
+
+    return LIVE_SCORE_IDLE_POLL_INTERVAL_SECONDS
+
+
+@dataclass
+class _LiveScoreChannel:
+    subscribers: set[asyncio.Queue[str]] = field(default_factory=set)
+    match_json: dict[int, str] = field(default_factory=dict)
+    snapshot: str | None = None
+    ready: asyncio.Event = field(default_factory=asyncio.Event)
+    task: asyncio.Task[None] | None = None
+
+
+class LiveScoreHub:
+    """One shared poll and serialized snapshot per live-score key."""
+
+    def __init__(self, loader: LiveScoreLoader) -> None:
+        self._loader = loader
+        self._channels: dict[LiveScoreKey, _LiveScoreChannel] = {}
+
+    @contextmanager
+    def subscribe(self, key: LiveScoreKey) -> Iterator[asyncio.Queue[str]]:
+        """Register a message queue for *key* for the life of the block."""
+
+        channel = self._channels.get(key)
+        if channel is None:
+            channel = self._channels[key] = _LiveScoreChannel()
+
+        queue: asyncio.Queue[str] = asyncio.Queue(maxsize=LIVE_SCORE_SUBSCRIBER_QUEUE_SIZE)
+        channel.subscribers.add(queue)
+        if channel.task is None or channel.task.done():
+            channel.task = asyncio.create_task(self._run_channel(key, channel), name="football-live-scores")
+
+        try:
+            yield queue
+        finally:
+            channel.subscribers.discard(queue)
+
+    async def snapshot(self, key: LiveScoreKey) -> str:
+        """Return the current snapshot for a subscribed *key*, waiting for its first poll."""
+
+        channel = self._channels.get(key)
+        if channel is None:
+            raise KeyError(key)
+
+        await channel.ready.wait()
+        return channel.snapshot or live_score_snapshot_message([])
+
+    @property
+    def subscriber_count(self) -> int:
+        return sum(len(channel.subscribers) for channel in self._channels.values())
+
+    async def _run_channel(self, key: LiveScoreKey, channel: _LiveScoreChannel) -> None:
+        try:
+            while len(channel.subscribers) > 0:
+                interval = LIVE_SCORE_IDLE_POLL_INTERVAL_SECONDS
+                try:
+                    matches = await self._loader(key)
+                    interval = live_score_poll_interval(matches)
+                    message = self._refresh(channel, matches)
+                    channel.ready.set()
+                    if message is not None:
+                        self._broadcast(channel, message)
+                except Exception as exc:
+                    logging.warning(f"Football live score refresh failed for {key}: {exc}")
+                    channel.ready.set()
+
+                await asyncio.sleep(interval)
+        finally:
+            if len(channel.subscribers) == 0 and self._channels.get(key) is channel:
+                self._channels.pop(key, None)
+
+    def _refresh(self, channel: _LiveScoreChannel, matches: list[Match]) -> str | None:
+        """Update the channel's cached serialization and return the message to push, if any."""
+
+        match_json = {match.id: match.model_dump_json() for match in matches}
+        previous = channel.match_json
+        was_ready = channel.ready.is_set()
+        channel.match_json = match_json
+        channel.snapshot = live_score_snapshot_message(list(match_json.values()))
+
+        # Subscribers read the first snapshot themselves, so only later changes are pushed.
+        if not was_ready or previous == match_json:
+            return None
+
+        if previous.keys() != match_json.keys():
+            return channel.snapshot
+
+        changed = [encoded for match_id, encoded in match_json.items() if previous[match_id] != encoded]
+        return live_score_delta_message(changed)
+
+    def _broadcast(self, channel: _LiveScoreChannel, message: str) -> None:
+        for queue in list(channel.subscribers):
+            if queue.full():
+                # A socket that fell behind skips its backlog and resyncs from the snapshot.
+                while not queue.empty():
+                    queue.get_nowait()
+                if channel.snapshot is not None:
+                    queue.put_nowait(channel.snapshot)
+                continue
+
+            queue.put_nowait(message)
@@ -0,0 +1,311 @@
+"""Batched WebPush fan-out for football notifications.
+
+Targets are sent in batches with a bounded number of requests in flight over
+one shared HTTP session. VAPID headers are signed once per push-service origin
+and reused until shortly before they expire, rather than re-signed for every
+endpoint. Transient failures (timeouts, 429 and 5xx) are retried per endpoint
+with exponential backoff, endpoints the push service reports as gone (404/410)
+are handed to a bulk prune callback after each batch, and every batch records
+its throughput and latency. A subscription that cannot be sent to at all (for
+example a malformed p256dh or auth key) is recorded as failed without affecting
+the rest of its batch.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from collections.abc import Awaitable, Callable, Iterable, Mapping
+from dataclasses import dataclass, field
+import json
+import logging
+from pathlib import Path
+import time
+from typing import Any, Literal
+from urllib.parse import urlparse
+
+import aiohttp
+from py_vapid import Vapid, Vapid01
+from pywebpush import WebPusher
+
+PUSH_FANOUT_CONCURRENCY = 64
+PUSH_FANOUT_BATCH_SIZE = 500
+PUSH_FANOUT_MAX_RETRIES = 2
+PUSH_FANOUT_RETRY_DELAY_SECONDS = 0.5
+PUSH_FANOUT_TIMEOUT = aiohttp.ClientTimeout(total=10)
+PUSH_FANOUT_TTL_SECONDS = 15 * 60
+PUSH_FANOUT_METRICS_SIZE = 50
+VAPID_TOKEN_LIFETIME_SECONDS = 12 * 60 * 60
+VAPID_REFRESH_MARGIN_SECONDS = 10 * 60
+PUSH_GONE_STATUSES = frozenset({404, 410})
+PUSH_RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+PushOutcome = Literal["sent", "gone", "failed"]
+
+
+@dataclass(frozen=True)
+class PushTarget:
+    """One deduplicated push endpoint and its encryption keys."""
+
+    endpoint: str
+    p256dh: str
+    auth: str
+
+    @property
+    def origin(self) -> str:
+        url = urlparse(self.endpoint)
+        return f"{url.scheme}://{url.netloc}"
+
+    @property
+    def subscription_info(self) -> dict[str, Any]:
+        return {"endpoint": self.endpoint, "keys": {"p256dh": self.p256dh, "auth": self.auth}}
+
+
+@dataclass
+class PushDelivery:
+    endpoint: str
+    outcome: PushOutcome
+    attempts: int
+    status: int | None = None
+    latency_ms: float = 0.0
+    error: str | None = None
+
+
+@dataclass
+class PushBatchMetrics:
+    batch_index: int
+    endpoints: int = 0
+    sent: int = 0
+    gone: int = 0
+    failed: int = 0
+    retries: int = 0
+    pruned: int = 0
+    elapsed_seconds: float = 0.0
+    mean_latency_ms: float = 0.0
+    max_latency_ms: float = 0.0
+
+    @property
+    def throughput_per_second(self) -> float:
+        if self.elapsed_seconds <= 0:
+            return 0.0
+        return self.endpoints / self.elapsed_seconds
+
+
+@dataclass
+class PushFanoutResult:
+    batches: list[PushBatchMetrics] = field(default_factory=list)
+    retried_endpoints: dict[str, int] = field(default_factory=dict)
+
+    @property
+    def sent(self) -> int:
+        return sum(batch.sent for batch in self.batches)
+
+    @property
+    def gone(self) -> int:
+        return sum(batch.gone for batch in self.batches)
+
+    @property
+    def failed(self) -> int:
+        return sum(batch.failed for batch in self.batches)
+
+    @property
+    def pruned(self) -> int:
+        return sum(batch.pruned for batch in self.batches)
+
+
+class VapidHeaderCache:
+    """Signed VAPID headers per push-service origin, reused until close to expiry."""
+
+    def __init__(self, vapid: Vapid01, claims: Mapping[str, Any]) -> None:
+        self._vapid = vapid
+        self._claims = {key: value for key, value in claims.items() if key not in {"aud", "exp"}}
+        self._headers: dict[str, tuple[int, dict[str, str]]] = {}
+
+    def headers_for(self, origin: str, now: float | None = None) -> dict[str, str]:
+        current_time = time.time() if now is None else now
+        cached = self._headers.get(origin)
+        if cached is not None and cached[0] - VAPID_REFRESH_MARGIN_SECONDS > current_time:
+            return dict(cached[1])
+
+        expires_at = int(current_time) + VAPID_TOKEN_LIFETIME_SECONDS
+        headers = dict(self._vapid.sign({**self._claims, "aud": origin, "exp": expires_at}))
+        self._headers[origin] = (expires_at, headers)
+        return dict(headers)
+
+
+class PushFanoutEngine:
+    """Bounded-concurrency WebPush sender with per-batch metrics."""
+
+    def __init__(
+        self,
+        vapid_headers: VapidHeaderCache,
+        *,
+        concurrency: int = PUSH_FANOUT_CONCURRENCY,
+        batch_size: int = PUSH_FANOUT_BATCH_SIZE,
+        max_retries: int = PUSH_FANOUT_MAX_RETRIES,
+        retry_delay_seconds: float = PUSH_FANOUT_RETRY_DELAY_SECONDS,
+        ttl_seconds: int = PUSH_FANOUT_TTL_SECONDS,
+    ) -> None:
+        self._vapid_headers = vapid_headers
+        self._concurrency = max(1, concurrency)
+        self._batch_size = max(1, batch_size)
+        self._max_retries = max(0, max_retries)
+        self._retry_delay_seconds = max(0.0, retry_delay_seconds)
+        self._ttl_seconds = ttl_seconds
+        self.recent_batches: deque[PushBatchMetrics] = deque(maxlen=PUSH_FANOUT_METRICS_SIZE)
+
+    @classmethod
+    def from_files(
+        cls,
+        private_key_path: str | Path,
+        claims_path: str | Path,
+        **kwargs: Any,
+    ) -> PushFanoutEngine:
+        """Build an engine from the VAPID private key PEM and claims JSON files."""
+
+        vapid = Vapid.from_file(private_key_file=str(private_key_path))
+        with open(claims_path, encoding="utf8") as claims_file:
+            claims = json.load(claims_file)
+        return cls(VapidHeaderCache(vapid, claims), **kwargs)
+
+    async def send(
+        self,
+        targets: Iterable[PushTarget],
+        payload: str | bytes | Mapping[str, Any],
+        *,
+        prune: Callable[[list[str]], Awaitable[int]] | None = None,
+        session: aiohttp.ClientSession | None = None,
+    ) -> PushFanoutResult:
+        """Deliver *payload* to every unique target endpoint.
+
+        *prune* receives the gone endpoints of each batch in one call and
+        returns how many subscriptions it removed.
+        """
+
+        body = _encode_payload(payload)
+        unique_targets = list({target.endpoint: target for target in targets}.values())
+        result = PushFanoutResult()
+        if len(unique_targets) == 0:
+            return result
+
+        if session is None:
+            connector = aiohttp.TCPConnector(limit=self._concurrency)
+            async with aiohttp.ClientSession(connector=connector, timeout=PUSH_FANOUT_TIMEOUT) as owned_session:
+                await self._send_batches(owned_session, unique_targets, body, prune, result)
+        else:
+            await self._send_batches(session, unique_targets, body, prune, result)
+
+        return result
+
+    async def _send_batches(
+        self,
+        session: aiohttp.ClientSession,
+        targets: list[PushTarget],
+        body: bytes,
+        prune: Callable[[list[str]], Awaitable[int]] | None,
+        result: PushFanoutResult,
+    ) -> None:
+        semaphore = asyncio.Semaphore(self._concurrency)
+        for batch_index, start in enumerate(range(0, len(targets), self._batch_size)):
+            batch = targets[start : start + self._batch_size]
+            started = time.perf_counter()
+            deliveries = await asyncio.gather(
+                *(self._deliver(session, semaphore, target, body) for target in batch)
+            )
+            metrics = _batch_metrics(batch_index, deliveries, time.perf_counter() - started)
+
+            for delivery in deliveries:
+                if delivery.attempts > 1:
+                    result.retried_endpoints[delivery.endpoint] = delivery.attempts - 1
+
+            gone_endpoints = [delivery.endpoint for delivery in deliveries if delivery.outcome == "gone"]
+            if prune is not None and len(gone_endpoints) > 0:
+                try:
+                    metrics.pruned = await prune(gone_endpoints)
+                except Exception as exc:
+                    logging.warning(f"Football push prune failed: {exc}")
+
+            result.batches.append(metrics)
+            self.recent_batches.append(metrics)
+            logging.info(
+                f"Football push batch {batch_index}: {metrics.sent}/{metrics.endpoints} sent, "
+                f"{metrics.gone} gone, {metrics.failed} failed, {metrics.retries} retries, "
+                f"{metrics.throughput_per_second:.1f}/s, max {metrics.max_latency_ms:.0f} ms"
+            )
+
+    async def _deliver(
+        self,
+        session: aiohttp.ClientSession,
+        semaphore: asyncio.Semaphore,
+        target: PushTarget,
+        body: bytes,
+    ) -> PushDelivery:
+        started = time.perf_counter()
+        attempts = 0
+        while True:
+            attempts += 1
+            status: int | None = None
+            error: str | None = None
+            transient = True
+            try:
+                async with semaphore:
+                    status = await self._post(session, target, body)
+            except (aiohttp.ClientError, asyncio.TimeoutError) as exc:
+                error = str(exc) or type(exc).__name__
+            except Exception as exc:  # noqa: BLE001
+                # Bad subscription keys raise WebPushException/ValueError and fail identically on retry.
+                error = str(exc) or type(exc).__name__
+                transient = False
+
+            latency_ms = (time.perf_counter() - started) * 1000.0
+            if status is not None and status < 300:
+                return PushDelivery(target.endpoint, "sent", attempts, status, latency_ms)
+
+            if status in PUSH_GONE_STATUSES:
+                return PushDelivery(target.endpoint, "gone", attempts, status, latency_ms)
+
+            retryable = transient and (status is None or status in PUSH_RETRY_STATUSES)
+            if not retryable or attempts > self._max_retries:
+                return PushDelivery(target.endpoint, "failed", attempts, status, latency_ms, error)
+
+            # Back off outside the semaphore so waiting retries do not block other sends.
+            await asyncio.sleep(self._retry_delay_seconds * (2 ** (attempts - 1)))
+
+    async def _post(self, session: aiohttp.ClientSession, target: PushTarget, body: bytes) -> int:
+        pusher = WebPusher(target.subscription_info, aiohttp_session=session)
+        response = await pusher.send_async(
+            body,
+            self._vapid_headers.headers_for(target.origin),
+            ttl=self._ttl_seconds,
+            timeout=PUSH_FANOUT_TIMEOUT,
+        )
+        return int(response.status)
+
+
+def _encode_payload(payload: str | bytes | Mapping[str, Any]) -> bytes:
+    if isinstance(payload, bytes):
+        return payload
+
+    if isinstance(payload, str):
+        return payload.encode("utf-8")
+
+    return json.dumps(payload, separators=(",", ":")).encode("utf-8")
+
+
+def _batch_metrics(
+    batch_index: int,
+    deliveries: list[PushDelivery],
+    elapsed_seconds: float,
+) -> PushBatchMetrics:
+    latencies = [delivery.latency_ms for delivery in deliveries]
+    return PushBatchMetrics(
+        batch_index=batch_index,
+        endpoints=len(deliveries),
+        sent=sum(1 for delivery in deliveries if delivery.outcome == "sent"),
+        gone=sum(1 for delivery in deliveries if delivery.outcome == "gone"),
+        failed=sum(1 for delivery in deliveries if delivery.outcome == "failed"),
+        retries=sum(delivery.attempts - 1 for delivery in deliveries),
+        elapsed_seconds=elapsed_seconds,
+        mean_latency_ms=sum(latencies) / len(latencies) if len(latencies) > 0 else 0.0,
+        max_latency_ms=max(latencies, default=0.0),
+    )
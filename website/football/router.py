@@ -1,5 +1,6 @@
 import asyncio
 from calendar import monthrange, month_name
+from contextlib import ExitStack
 from datetime import UTC, date, datetime, timedelta
 import json
 import logging
@@ -67,7 +68,7 @@ from .chatbot_history_models import (
 
 from .models import (
     FootballBetList,
-    MatchList,
+    Match,
     LiveTableList,
     LiveTableItem,
     WorldCupStandingsList,
@@ -88,6 +89,7 @@ from .world_cup_db import (
     retrieve_live_group_standings,
 )
 from .world_cup_utils import WC_CURRENT_EDITION
+from .live_scores_hub import LiveScoreHub, LiveScoreKey
 
 TEMPLATES = Jinja2Templates("/app/templates")
 TEMPLATES.env.filters["kickoff_utc_iso"] = kickoff_utc_iso
@@ -1494,15 +1496,55 @@ async def get_simplified_matches(request: Request) -> SimplifiedFootballData:
     return simplified_football_data
 
 
+async def _load_live_score_matches(key: LiveScoreKey) -> list[Match]:
+    competition, scope, current_day_only = key
+    if competition == "world-cup":
+        return await retrieve_live_score_matches(
+            scope or WC_CURRENT_EDITION,
+            current_day_only=current_day_only,
+        )
+
+    if current_day_only:
+        start_date, end_date = _today_scores_window()
+    else:
+        start_date, end_date = _live_scores_window()
+
+    return await retreive_matches(start_date, end_date, scope)
+
+
+live_score_hub = LiveScoreHub(_load_live_score_matches)
+
+
+def _live_score_key(msg: dict, websocket: WebSocket) -> LiveScoreKey:
+    current_day_only = bool(msg.get("currentDayOnly", False))
+    if msg.get("competition") == "world-cup":
+        edition = (
+            msg.get("edition")
+            or websocket.query_params.get("edition")
+            or WC_CURRENT_EDITION
+        )
+        return ("world-cup", str(edition), current_day_only)
+
+    return ("premier-league", websocket.query_params.get("season"), current_day_only)
+
+
+async def _forward_live_scores(websocket: WebSocket, queue: asyncio.Queue[str]) -> None:
+    while True:
+        await websocket.send_text(await queue.get())
+
+
 @football_router.websocket("/ws/")
 async def websocket_endpoint(websocket: WebSocket):
     await websocket.accept()
 
     logging.info("Football Websocket Opened")
 
-    try:
-        selected_season_key = websocket.query_params.get("season")
+    subscription = ExitStack()
+    forward_task: asyncio.Task[None] | None = None
+    subscribed_key: LiveScoreKey | None = None
+    queue: asyncio.Queue[str] | None = None
 
+    try:
         while True:
             # Wait for a message from the client
             recv = await websocket.receive_text()
@@ -1513,34 +1555,34 @@ async def websocket_endpoint(websocket: WebSocket):
             if msg["messageType"] == "get_scores":
                 logging.debug("Football Websocket")
 
-                if msg.get("competition") == "world-cup":
-                    edition = (
-                        msg.get("edition")
-                        or websocket.query_params.get("edition")
-                        or WC_CURRENT_EDITION
-                    )
-                    matches = await retrieve_live_score_matches(
-                        edition,
-                        current_day_only=bool(msg.get("currentDayOnly", False)),
+                key = _live_score_key(msg, websocket)
+                if key != subscribed_key or queue is None:
+                    if forward_task is not None:
+                        forward_task.cancel()
+                    subscription.close()
+
+                    # Later updates for this key are pushed by the shared poll.
+                    subscription = ExitStack()
+                    queue = subscription.enter_context(live_score_hub.subscribe(key))
+                    subscribed_key = key
+                    forward_task = asyncio.create_task(
+                        _forward_live_scores(websocket, queue),
+                        name="football-live-scores-socket",
                     )
-                else:
-                    if bool(msg.get("currentDayOnly", False)):
-                        start_date, end_date = _today_scores_window()
-                    else:
-                        start_date, end_date = _live_scores_window()
-
-                    matches = await retreive_matches(
-                        start_date, end_date, selected_season_key
-                    )
-
-                logging.debug("Got matches")
 
-                match_list = MatchList(matches=matches)
+                snapshot = await live_score_hub.snapshot(key)
 
-                await websocket.send_text(match_list.model_dump_json())
+                # Sends go through the queue so only the forward task writes to the socket.
+                while queue.full():
+                    queue.get_nowait()
+                queue.put_nowait(snapshot)
 
     except WebSocketDisconnect:
         logging.info("Football Socket Closed")
+    finally:
+        if forward_task is not None:
+            forward_task.cancel()
+        subscription.close()
 
 
 @football_router.websocket("/ws/world-cup-table/")
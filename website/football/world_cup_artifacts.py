@@ -0,0 +1,307 @@
+"""Precomputed page view models for historic World Cup editions.
+
+Historic editions never change once imported, so their group tables, overview
+sections, summaries and knockout bracket are rendered once by
+:func:`build_world_cup_edition_artifact` and stored as one zlib-compressed JSON
+document per edition in ``wc_edition_artifacts``. The router serves historic
+pages from that artifact, which is read from Mongo once per process and then
+held in memory.
+
+Each artifact records the edition snapshot fingerprint it was built from. The
+startup build rebuilds any artifact that is missing, was built with an older
+schema, or no longer matches its edition (for example after a re-import).
+"""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import UTC, datetime
+import logging
+import os
+import zlib
+
+from bson import Binary
+from pydantic import BaseModel, Field
+
+from . import mongodb
+from .db_names import WC_DATABASE
+from .models import Match, TableItem, Team
+from .world_cup_db import (
+    KnockoutBracketDiagram,
+    WorldCupGroupPlayoffSection,
+    WorldCupGroupStageSummarySection,
+    WorldCupKnockoutRound,
+    WorldCupOverviewGroupStageSection,
+    _world_cup_edition_version,
+    build_knockout_bracket_diagram,
+    build_overview_group_playoff_sections,
+    build_overview_group_stage_sections,
+    build_overview_knockout_sections,
+    edition_has_group_playoff_matches,
+    get_available_wc_editions,
+    get_world_cup_edition_snapshot,
+    invalidate_world_cup_edition_snapshot,
+    list_group_stage_summary_sections,
+    prepare_group_table_for_display,
+    retrieve_distinct_teams,
+    retrieve_knockout_matches,
+)
+from .world_cup_utils import (
+    WC_KNOCKOUT_ROUNDS,
+    edition_has_group_stage,
+    edition_has_knockout_stage,
+    edition_is_historic,
+    filter_confirmed_knockout_matches,
+)
+
+WC_ARTIFACT_COLLECTION = "wc_edition_artifacts"
+WC_ARTIFACT_SCHEMA_VERSION = 1
+WC_ARTIFACT_FOOTBALL_ROOT = "/football/"
+WC_ARTIFACT_BUILD_ENABLED = os.getenv("WC_ARTIFACT_BUILD_ENABLED", "1").strip().lower() not in {
+    "",
+    "0",
+    "false",
+}
+
+wc_edition_artifacts = mongodb.get_collection(WC_ARTIFACT_COLLECTION, db_name=WC_DATABASE)
+
+_world_cup_artifacts: dict[str, WorldCupEditionArtifact] = {}
+_world_cup_artifact_build_task: asyncio.Task[None] | None = None
+
+
+class WorldCupGroupPage(BaseModel):
+    slug: str
+    label: str
+    table: list[TableItem] = Field(default_factory=list)
+    matches: list[Match] = Field(default_factory=list)
+
+
+class WorldCupEditionArtifact(BaseModel):
+    edition: str
+    schema_version: int = WC_ARTIFACT_SCHEMA_VERSION
+    source_version: str
+    built_at: datetime
+    has_group_playoffs: bool = False
+    overview_knockout_sections: list[WorldCupKnockoutRound] = Field(default_factory=list)
+    overview_group_stage_sections: list[WorldCupOverviewGroupStageSection] = Field(default_factory=list)
+    group_playoff_sections: list[WorldCupGroupPlayoffSection] = Field(default_factory=list)
+    group_stage_summary_sections: list[WorldCupGroupStageSummarySection] = Field(default_factory=list)
+    group_pages: dict[str, WorldCupGroupPage] = Field(default_factory=dict)
+    knockout_round_matches: dict[str, list[Match]] = Field(default_factory=dict)
+    knockout_bracket: KnockoutBracketDiagram | None = None
+    teams: list[Team] = Field(default_factory=list)
+
+    def knockout_bracket_for_root(self, football_root: str) -> KnockoutBracketDiagram | None:
+        """Return the bracket with its round links pointed at *football_root*."""
+
+        if self.knockout_bracket is None or football_root == WC_ARTIFACT_FOOTBALL_ROOT:
+            return self.knockout_bracket
+
+        rounds = [
+            bracket_round.model_copy(
+                update={
+                    "round_url": football_root
+                    + bracket_round.round_url.removeprefix(WC_ARTIFACT_FOOTBALL_ROOT)
+                }
+            )
+            for bracket_round in self.knockout_bracket.rounds
+        ]
+        return self.knockout_bracket.model_copy(update={"rounds": rounds})
+
+
+def _source_version(version: tuple | None) -> str:
+    return repr(version)
+
+
+async def build_world_cup_edition_artifact(edition: str) -> WorldCupEditionArtifact:
+    """Render every derived view model of *edition* with the regular page builders."""
+
+    snapshot = await get_world_cup_edition_snapshot(edition)
+
+    group_pages: dict[str, WorldCupGroupPage] = {}
+    if edition_has_group_stage(edition):
+        for group in snapshot.group_standings():
+            matches = snapshot.group_matches(group.group_slug)
+            table = await prepare_group_table_for_display(
+                edition,
+                group.group_slug,
+                group.table,
+                matches,
+                all_edition_matches=snapshot.matches,
+            )
+            group_pages[group.group_slug] = WorldCupGroupPage(
+                slug=group.group_slug,
+                label=group.group_label,
+                table=table,
+                matches=matches,
+            )
+
+    knockout_round_matches: dict[str, list[Match]] = {}
+    knockout_bracket: KnockoutBracketDiagram | None = None
+    if edition_has_knockout_stage(edition):
+        for stage, _, _ in WC_KNOCKOUT_ROUNDS:
+            matches = filter_confirmed_knockout_matches(
+                await retrieve_knockout_matches(edition, stage)
+            )
+            if len(matches) > 0:
+                knockout_round_matches[stage] = matches
+
+        knockout_bracket = await build_knockout_bracket_diagram(
+            edition,
+            football_root=WC_ARTIFACT_FOOTBALL_ROOT,
+        )
+
+    return WorldCupEditionArtifact(
+        edition=edition,
+        source_version=_source_version(snapshot.version),
+        built_at=datetime.now(tz=UTC),
+        has_group_playoffs=await edition_has_group_playoff_matches(edition),
+        overview_knockout_sections=await build_overview_knockout_sections(edition),
+        overview_group_stage_sections=await build_overview_group_stage_sections(edition),
+        group_playoff_sections=await build_overview_group_playoff_sections(edition),
+        group_stage_summary_sections=await list_group_stage_summary_sections(edition),
+        group_pages=group_pages,
+        knockout_round_matches=knockout_round_matches,
+        knockout_bracket=knockout_bracket,
+        teams=await retrieve_distinct_teams(edition),
+    )
+
+
+def _encode_artifact(artifact: WorldCupEditionArtifact) -> dict:
+    return {
+        "edition": artifact.edition,
+        "schema_version": artifact.schema_version,
+        "source_version": artifact.source_version,
+        "built_at": artifact.built_at,
+        "payload_z": Binary(zlib.compress(artifact.model_dump_json().encode("utf-8"), 6)),
+    }
+
+
+def _decode_artifact(document: dict | None) -> WorldCupEditionArtifact | None:
+    if document is None or document.get("schema_version") != WC_ARTIFACT_SCHEMA_VERSION:
+        return None
+
+    payload = document.get("payload_z")
+    if not isinstance(payload, bytes | bytearray):
+        return None
+
+    try:
+        return WorldCupEditionArtifact.model_validate_json(zlib.decompress(bytes(payload)))
+    except (zlib.error, ValueError) as exc:
+        logging.warning(f"World Cup artifact for {document.get('edition')} is unreadable: {exc}")
+        return None
+
+
+async def store_world_cup_edition_artifact(artifact: WorldCupEditionArtifact) -> None:
+    if wc_edition_artifacts is None:
+        logging.error("No DB connection")
+        return
+
+    await wc_edition_artifacts.replace_one(
+        {"edition": artifact.edition},
+        _encode_artifact(artifact),
+        upsert=True,
+    )
+    _world_cup_artifacts[artifact.edition] = artifact
+
+
+async def retrieve_world_cup_edition_artifact(edition: str) -> WorldCupEditionArtifact | None:
+    """Return the stored artifact for a historic *edition*, or None to build pages live."""
+
+    if not edition_is_historic(edition):
+        return None
+
+    cached = _world_cup_artifacts.get(edition)
+    if cached is not None:
+        return cached
+
+    if wc_edition_artifacts is None:
+        return None
+
+    artifact = _decode_artifact(await wc_edition_artifacts.find_one({"edition": edition}))
+    if artifact is not None:
+        _world_cup_artifacts[edition] = artifact
+    return artifact
+
+
+async def build_historic_world_cup_artifacts(*, force: bool = False) -> list[str]:
+    """Build and store artifacts for historic editions that lack a current one.
+
+    Editions are checked against their cheap fingerprint, so only editions that
+    need rebuilding load a snapshot, and that snapshot is dropped again once the
+    artifact is stored. Returns the editions that were (re)built.
+    """
+
+    if wc_edition_artifacts is None:
+        logging.error("No DB connection")
+        return []
+
+    stored_versions = {
+        document["edition"]: (document.get("schema_version"), document.get("source_version"))
+        async for document in wc_edition_artifacts.find(
+            {}, {"edition": 1, "schema_version": 1, "source_version": 1}
+        )
+    }
+
+    built: list[str] = []
+    for edition in await get_available_wc_editions():
+        if not edition_is_historic(edition):
+            continue
+
+        current = (
+            WC_ARTIFACT_SCHEMA_VERSION,
+            _source_version(await _world_cup_edition_version(edition)),
+        )
+        if not force and stored_versions.get(edition) == current:
+            continue
+
+        try:
+            artifact = await build_world_cup_edition_artifact(edition)
+            await store_world_cup_edition_artifact(artifact)
+        except Exception as exc:
+            logging.warning(f"World Cup artifact build failed for {edition}: {exc}")
+            continue
+        finally:
+            # Pages for this edition are served from the artifact from now on.
+            invalidate_world_cup_edition_snapshot(edition)
+
+        built.append(edition)
+
+    if len(built) > 0:
+        logging.info(f"Built World Cup artifacts for {', '.join(built)}")
+    return built
+
+
+async def _world_cup_artifact_build() -> None:
+    try:
+        await build_historic_world_cup_artifacts()
+    except Exception as exc:
+        logging.warning(f"World Cup artifact build failed: {exc}")
+
+
+async def start_world_cup_artifact_build() -> None:
+    global _world_cup_artifact_build_task
+
+    if not WC_ARTIFACT_BUILD_ENABLED:
+        return
+
+    if _world_cup_artifact_build_task is None or _world_cup_artifact_build_task.done():
+        _world_cup_artifact_build_task = asyncio.create_task(
+            _world_cup_artifact_build(),
+            name="world-cup-artifact-build",
+        )
+
+
+async def stop_world_cup_artifact_build() -> None:
+    global _world_cup_artifact_build_task
+
+    task = _world_cup_artifact_build_task
+    _world_cup_artifact_build_task = None
+    if task is None:
+        return
+
+    task.cancel()
+    try:
+        await task
+    except asyncio.CancelledError:
+        pass
@@ -1,10 +1,14 @@
 from __future__ import annotations
 
+import asyncio
+import hashlib
 import logging
 import re
+import time
 from collections.abc import Mapping, Sequence
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import UTC, datetime, timedelta
+from typing import Any
 
 from pydantic import BaseModel, Field
 from pymongo import ASCENDING
@@ -13,6 +17,13 @@ from ..database.database import get_data_by_date
 from . import live_wc_standings, mongodb
 from .db_names import WC_DATABASE
 from .models import LiveTableItem, Match, MatchStatus, Table, TableItem, Team
+from .world_cup_scenarios import (
+    WC_SCENARIO_MAX_FIXTURES,
+    GroupScenarioOutcome,
+    GroupScenarioState,
+    group_scenarios,
+    group_scenarios_async,
+)
 from .world_cup_utils import (
     WC_CURRENT_EDITION,
     WC_FORMAT_EDITION_2026,
@@ -77,6 +88,7 @@ WC_CURRENT_GROUP_QUALIFICATION_SPOTS = 2
 WC_BEST_THIRD_PLACE_SPOTS = 8
 WC_CURRENT_EDITION_GROUP_SIZE = 4
 WC_WORST_CASE_LOSS_GOALS = 3
+WC_SNAPSHOT_VERSION_CHECK_SECONDS = 2.0
 
 
 @dataclass(frozen=True)
@@ -298,28 +310,236 @@ async def retrieve_live_score_matches(
     return await retrieve_matches_in_window(edition, start_date, end_date)
 
 
-async def retrieve_all_edition_matches(edition: str) -> list[Match]:
-    collection = _get_matches_collection(edition)
-    if collection is None:
-        logging.error("No WC match collection for edition %s", edition)
-        return []
+def _group_match_sort_key(match: Match) -> tuple[bool, int, datetime]:
+    # Same order as the Mongo sort on (matchday, utc_date), where a null matchday sorts first.
+    return (match.matchday is not None, match.matchday or 0, match.utc_date)
 
-    cursor = collection.find({}).sort("utc_date", ASCENDING)
-    return [Match.model_validate(item) async for item in cursor]
 
+def _placeholder_group_standings(
+    edition: str, matches: Sequence[Match]
+) -> list[WorldCupGroupStandings]:
+    discovered_slugs: set[str] = set()
+    for match in matches:
+        if match.stage == WC_GROUP_STAGE and isinstance(match.group, str):
+            discovered_slugs.add(group_enum_to_slug(match.group))
 
-async def retrieve_group_matches(edition: str, group_slug: str) -> list[Match]:
-    collection = _get_matches_collection(edition)
-    if collection is None:
-        logging.error("No WC match collection for edition %s", edition)
-        return []
+    edition_group_order = group_order_for_edition(edition)
+    ordered_slugs = [slug for slug in edition_group_order if slug in discovered_slugs]
+    ordered_slugs.extend(sorted(discovered_slugs - set(ordered_slugs)))
+
+    return [
+        WorldCupGroupStandings(
+            edition=edition,
+            group_slug=slug,
+            group_label=group_slug_to_label(slug),
+            group_enum=group_slug_to_enum(slug),
+            table=[],
+        )
+        for slug in ordered_slugs
+    ]
+
+
+@dataclass
+class WorldCupEditionSnapshot:
+    """Every match and the official group standings of one edition, loaded once.
+
+    The page builders derive what they need from the snapshot instead of
+    querying per group. Matches are shared by every request and must not be
+    mutated (``update_match_timezone`` only sets ``local_date``, which is the
+    same for every request); standings are deep-copied on the way out because
+    the table builders re-sort and label their rows.
+    """
+
+    edition: str
+    version: tuple[Any, ...] | None
+    matches: list[Match]
+    official_standings: list[WorldCupGroupStandings]
+    checked_at: float = field(default_factory=time.monotonic)
+    group_matches_by_slug: dict[str, list[Match]] = field(init=False)
+    _qualification_tables: dict[str, list[TableItem]] | None = field(
+        default=None, init=False
+    )
 
-    group_enum = group_slug_to_enum(group_slug)
-    cursor = collection.find(
-        {"stage": WC_GROUP_STAGE, "group": group_enum}
-    ).sort([("matchday", ASCENDING), ("utc_date", ASCENDING)])
+    def __post_init__(self) -> None:
+        group_matches: dict[str, list[Match]] = {}
+        for match in self.matches:
+            if match.stage == WC_GROUP_STAGE and isinstance(match.group, str):
+                group_matches.setdefault(group_enum_to_slug(match.group), []).append(match)
 
-    return [Match.model_validate(item) async for item in cursor]
+        for matches in group_matches.values():
+            matches.sort(key=_group_match_sort_key)
+        self.group_matches_by_slug = group_matches
+
+    def group_matches(self, group_slug: str) -> list[Match]:
+        return list(self.group_matches_by_slug.get(normalise_group_slug(group_slug), []))
+
+    def group_standings(self) -> list[WorldCupGroupStandings]:
+        """Official standings, or empty tables for the groups seen in the matches."""
+
+        if len(self.official_standings) == 0:
+            return _placeholder_group_standings(self.edition, self.matches)
+        return [group.model_copy(deep=True) for group in self.official_standings]
+
+    def official_group_standings(self, group_slug: str) -> WorldCupGroupStandings | None:
+        slug = normalise_group_slug(group_slug)
+        for group in self.official_standings:
+            if group.group_slug == slug:
+                return group.model_copy(deep=True)
+        return None
+
+    def knockout_stages(self) -> set[str]:
+        knockout_stages = {stage for stage, _, _ in WC_KNOCKOUT_ROUNDS}
+        return {match.stage for match in self.matches if match.stage in knockout_stages}
+
+    def stage_matches(self, stage: str) -> list[Match]:
+        return [match for match in self.matches if match.stage == stage]
+
+    def team_matches(self, team_id: int) -> list[Match]:
+        return [
+            match
+            for match in self.matches
+            if match.home_team.id == team_id or match.away_team.id == team_id
+        ]
+
+    def qualification_tables(self) -> dict[str, list[TableItem]]:
+        """Sorted official group tables, computed once per snapshot.
+
+        Callers get fresh row copies so they can apply their own labels.
+        """
+
+        if self._qualification_tables is None:
+            tables: dict[str, list[TableItem]] = {}
+            for group in self.group_standings():
+                matches = self.group_matches_by_slug.get(group.group_slug, [])
+                prepared = normalise_group_table(group.table, matches)
+                if _group_has_results(prepared):
+                    prepared = sort_group_table_rows(
+                        prepared,
+                        self.edition,
+                        group_slug=group.group_slug,
+                        edition_matches=matches,
+                    )
+                tables[group.group_slug] = prepared
+            self._qualification_tables = tables
+
+        return {
+            slug: [row.model_copy() for row in table]
+            for slug, table in self._qualification_tables.items()
+        }
+
+
+_world_cup_snapshots: dict[str, WorldCupEditionSnapshot] = {}
+_world_cup_snapshot_locks: dict[str, asyncio.Lock] = {}
+
+
+async def _world_cup_edition_version(edition: str) -> tuple[Any, ...] | None:
+    """Cheap fingerprint of an edition: match count, latest update and raw standings."""
+
+    matches_collection = _get_matches_collection(edition)
+    standings_collection = _get_standings_collection(edition)
+    if matches_collection is None or standings_collection is None:
+        return None
+
+    summary = await matches_collection.aggregate(
+        [
+            {
+                "$group": {
+                    "_id": None,
+                    "count": {"$sum": 1},
+                    "last_updated": {"$max": "$last_updated"},
+                }
+            }
+        ]
+    ).to_list(length=1)
+    standings_cursor = standings_collection.find({"edition": edition}, {"_id": 0}).sort(
+        "group_slug", ASCENDING
+    )
+    standings = [document async for document in standings_cursor]
+
+    match_count = summary[0].get("count", 0) if len(summary) > 0 else 0
+    last_updated = summary[0].get("last_updated") if len(summary) > 0 else None
+    standings_digest = hashlib.sha1(repr(standings).encode("utf-8")).hexdigest()
+    return (match_count, last_updated, standings_digest)
+
+
+async def _load_world_cup_edition_snapshot(
+    edition: str, version: tuple[Any, ...]
+) -> WorldCupEditionSnapshot:
+    matches_collection = _get_matches_collection(edition)
+    matches: list[Match] = []
+    if matches_collection is not None:
+        cursor = matches_collection.find({}).sort("utc_date", ASCENDING)
+        matches = [Match.model_validate(item) async for item in cursor]
+
+    standings = await _retrieve_group_standings_from_collection(
+        _get_standings_collection(edition),
+        edition,
+    )
+    return WorldCupEditionSnapshot(
+        edition=edition,
+        version=version,
+        matches=matches,
+        official_standings=standings,
+    )
+
+
+def _snapshot_is_current(snapshot: WorldCupEditionSnapshot) -> bool:
+    # Historic editions never change; the live one is re-fingerprinted every few seconds.
+    if not edition_is_live(snapshot.edition):
+        return True
+    return time.monotonic() - snapshot.checked_at < WC_SNAPSHOT_VERSION_CHECK_SECONDS
+
+
+async def get_world_cup_edition_snapshot(edition: str) -> WorldCupEditionSnapshot:
+    cached = _world_cup_snapshots.get(edition)
+    if cached is not None and _snapshot_is_current(cached):
+        return cached
+
+    lock = _world_cup_snapshot_locks.setdefault(edition, asyncio.Lock())
+    async with lock:
+        cached = _world_cup_snapshots.get(edition)
+        if cached is not None and _snapshot_is_current(cached):
+            return cached
+
+        version = await _world_cup_edition_version(edition)
+        if version is None:
+            logging.error("No WC match collection for edition %s", edition)
+            return WorldCupEditionSnapshot(
+                edition=edition,
+                version=None,
+                matches=[],
+                official_standings=[],
+            )
+
+        if cached is not None and cached.version == version:
+            cached.checked_at = time.monotonic()
+            return cached
+
+        snapshot = await _load_world_cup_edition_snapshot(edition, version)
+        if len(snapshot.matches) > 0 or len(snapshot.official_standings) > 0:
+            _world_cup_snapshots[edition] = snapshot
+        else:
+            _world_cup_snapshots.pop(edition, None)
+        return snapshot
+
+
+def invalidate_world_cup_edition_snapshot(edition: str | None = None) -> None:
+    """Drop the cached snapshot for *edition*, or for every edition."""
+
+    if edition is None:
+        _world_cup_snapshots.clear()
+    else:
+        _world_cup_snapshots.pop(edition, None)
+
+
+async def retrieve_all_edition_matches(edition: str) -> list[Match]:
+    snapshot = await get_world_cup_edition_snapshot(edition)
+    return list(snapshot.matches)
+
+
+async def retrieve_group_matches(edition: str, group_slug: str) -> list[Match]:
+    snapshot = await get_world_cup_edition_snapshot(edition)
+    return snapshot.group_matches(group_slug)
 
 
 async def get_wc_live_group_standings_db(edition: str) -> list[WorldCupGroupStandings]:
@@ -339,67 +559,22 @@ async def get_wc_live_group_standings_db(edition: str) -> list[WorldCupGroupStan
 async def retrieve_group_standings(
     edition: str, group_slug: str
 ) -> WorldCupGroupStandings | None:
-    slug = normalise_group_slug(group_slug)
-
-    collection = _get_standings_collection(edition)
-    if collection is None:
-        logging.error("No WC standings collection for edition %s", edition)
-        return None
-
-    document = await collection.find_one({"group_slug": slug, "edition": edition})
-    if document is None:
-        return None
-
-    return WorldCupGroupStandings.model_validate(document)
+    snapshot = await get_world_cup_edition_snapshot(edition)
+    return snapshot.official_group_standings(group_slug)
 
 
 async def retrieve_all_group_standings(edition: str) -> list[WorldCupGroupStandings]:
     if not edition_has_group_stage(edition):
         return []
 
-    standings = await _retrieve_group_standings_from_collection(
-        _get_standings_collection(edition),
-        edition,
-    )
-
-    if len(standings) > 0:
-        return standings
-
-    return await _compute_group_standings_from_matches(edition)
+    snapshot = await get_world_cup_edition_snapshot(edition)
+    return snapshot.group_standings()
 
 
 async def retrieve_live_group_standings(edition: str) -> list[WorldCupGroupStandings]:
     return await get_wc_live_group_standings_db(edition)
 
 
-async def _compute_group_standings_from_matches(edition: str) -> list[WorldCupGroupStandings]:
-    collection = _get_matches_collection(edition)
-    if collection is None:
-        return []
-
-    discovered_slugs: set[str] = set()
-    cursor = collection.find({"stage": WC_GROUP_STAGE, "group": {"$ne": None}})
-    async for item in cursor:
-        group_value = item.get("group")
-        if isinstance(group_value, str):
-            discovered_slugs.add(group_enum_to_slug(group_value))
-
-    edition_group_order = group_order_for_edition(edition)
-    ordered_slugs = [slug for slug in edition_group_order if slug in discovered_slugs]
-    ordered_slugs.extend(sorted(discovered_slugs - set(ordered_slugs)))
-
-    return [
-        WorldCupGroupStandings(
-            edition=edition,
-            group_slug=slug,
-            group_label=group_slug_to_label(slug),
-            group_enum=group_slug_to_enum(slug),
-            table=[],
-        )
-        for slug in ordered_slugs
-    ]
-
-
 def _unique_teams(teams: list[Team]) -> list[Team]:
     teams_by_id: dict[int, Team] = {}
 
@@ -623,6 +798,13 @@ def _apply_guaranteed_qualification_labels(
             ):
                 table_item.position_label = "Q"
 
+    scenarios = _group_scenario_outcome(table, group_matches)
+    if scenarios is not None:
+        for table_item in table[:qualification_spots]:
+            team_id = table_item.team.id
+            if team_id is not None and scenarios.is_clinched(team_id, qualification_spots):
+                table_item.position_label = "Q"
+
     if group_matches is not None:
         in_progress_team_ids = _teams_in_progress_from_matches(group_matches)
         for table_item in table[:qualification_spots]:
@@ -632,6 +814,79 @@ def _apply_guaranteed_qualification_labels(
     return list(table)
 
 
+def _group_scenario_state(
+    table: Sequence[TableItem],
+    group_matches: list[Match] | None,
+) -> GroupScenarioState | None:
+    """Points from finished group matches plus the fixtures still to be decided.
+
+    Returns None unless every pair of teams meets exactly once, since a missing
+    fixture would make the enumerated outcomes look more settled than they are.
+    """
+    if group_matches is None or len(group_matches) == 0:
+        return None
+
+    points_by_team_id: dict[int, int] = {}
+    for table_item in table:
+        if table_item.team.id is None or table_item.team.id in points_by_team_id:
+            return None
+        points_by_team_id[table_item.team.id] = 0
+
+    fixtures: list[tuple[int, int]] = []
+    seen_pairs: set[frozenset[int]] = set()
+    for match in group_matches:
+        if match.stage != WC_GROUP_STAGE or match.status == MatchStatus.cancelled:
+            continue
+
+        home_id = match.home_team.id
+        away_id = match.away_team.id
+        if home_id not in points_by_team_id or away_id not in points_by_team_id:
+            return None
+
+        pair = frozenset((home_id, away_id))
+        if len(pair) != 2 or pair in seen_pairs:
+            return None
+        seen_pairs.add(pair)
+
+        if match.status not in _TERMINAL_MATCH_STATUSES:
+            fixtures.append((home_id, away_id))
+            continue
+
+        home_goals = match.score.full_time.home
+        away_goals = match.score.full_time.away
+        if home_goals is None or away_goals is None:
+            return None
+        if home_goals > away_goals:
+            points_by_team_id[home_id] += 3
+        elif home_goals < away_goals:
+            points_by_team_id[away_id] += 3
+        else:
+            points_by_team_id[home_id] += 1
+            points_by_team_id[away_id] += 1
+
+    team_count = len(points_by_team_id)
+    if len(seen_pairs) != team_count * (team_count - 1) // 2:
+        return None
+
+    if len(fixtures) > WC_SCENARIO_MAX_FIXTURES:
+        return None
+
+    return GroupScenarioState(
+        points=tuple(sorted(points_by_team_id.items())),
+        fixtures=tuple(fixtures),
+    )
+
+
+def _group_scenario_outcome(
+    table: Sequence[TableItem],
+    group_matches: list[Match] | None,
+) -> GroupScenarioOutcome | None:
+    state = _group_scenario_state(table, group_matches)
+    if state is None:
+        return None
+    return group_scenarios(state)
+
+
 def _team_remaining_group_matches(table_item: TableItem, team_count: int) -> int:
     return max(team_count - 1 - table_item.played_games, 0)
 
@@ -741,13 +996,24 @@ def _best_possible_third_place_stats(
     if _group_is_complete(table, team_count, group_matches=group_matches):
         return _third_place_stats_from_row(table[2])
 
+    # No team can finish third on more points than the best third place in any scenario.
+    scenarios = _group_scenario_outcome(table, group_matches)
+    third_points_ceiling = (
+        scenarios.third_place_points[1]
+        if scenarios is not None and scenarios.third_place_points is not None
+        else None
+    )
+
     candidate_stats: list[_ThirdPlaceStats] = []
     for row in table[1:team_count]:
         remaining_matches = _team_remaining_group_matches(row, team_count)
         max_goal_difference, max_goals_for = _team_max_goal_projection(row, remaining_matches)
+        max_points = _team_max_points_in_group(row, team_count)
+        if third_points_ceiling is not None:
+            max_points = min(max_points, third_points_ceiling)
         candidate_stats.append(
             _ThirdPlaceStats(
-                points=_team_max_points_in_group(row, team_count),
+                points=max_points,
                 goal_difference=max_goal_difference,
                 goals_for=max_goals_for,
                 team_name=row.team.display_name,
@@ -806,6 +1072,9 @@ def _build_third_place_group_profile(
         group_matches=group_matches,
     )
     is_third_locked = _is_locked_in_group_position(table, 2, team_count)
+    if not is_third_locked and third_row.team.id is not None:
+        scenarios = _group_scenario_outcome(table, group_matches)
+        is_third_locked = scenarios is not None and scenarios.is_clinched(third_row.team.id, 3)
     best_third_stats = _best_possible_third_place_stats(
         table,
         team_count,
@@ -960,26 +1229,18 @@ async def _fetch_official_group_tables_for_qualification(
     edition: str,
 ) -> tuple[dict[str, list[TableItem]], dict[str, list[Match]]]:
     """Official wc_standings snapshot only — never the live overlay collection."""
-    collection = _get_standings_collection(edition)
-
-    standings = await _retrieve_group_standings_from_collection(collection, edition)
-    if len(standings) == 0:
-        standings = await _compute_group_standings_from_matches(edition)
+    snapshot = await get_world_cup_edition_snapshot(edition)
+    group_tables = snapshot.qualification_tables()
+    group_matches = {slug: snapshot.group_matches(slug) for slug in group_tables}
 
-    group_tables: dict[str, list[TableItem]] = {}
-    group_matches: dict[str, list[Match]] = {}
-    for group in standings:
-        matches = await retrieve_group_matches(edition, group.group_slug)
-        group_matches[group.group_slug] = matches
-        prepared = normalise_group_table(group.table, matches)
-        if _group_has_results(prepared):
-            prepared = sort_group_table_rows(
-                prepared,
-                edition,
-                group_slug=group.group_slug,
-                edition_matches=matches,
-            )
-        group_tables[group.group_slug] = prepared
+    if edition_is_live(edition):
+        # Solve uncached group scenarios off the event loop before the sync label pass reads them.
+        states = [
+            state
+            for slug, table in group_tables.items()
+            if (state := _group_scenario_state(table, group_matches[slug])) is not None
+        ]
+        await asyncio.gather(*(group_scenarios_async(state) for state in states))
 
     return group_tables, group_matches
 
@@ -1254,36 +1515,13 @@ async def apply_live_qualification_labels(
 
 
 async def retrieve_distinct_knockout_stages(edition: str) -> set[str]:
-    collection = _get_matches_collection(edition)
-    if collection is None:
-        return set()
-
-    knockout_stages = [stage for stage, _, _ in WC_KNOCKOUT_ROUNDS]
-    cursor = collection.find({"stage": {"$in": knockout_stages}}, {"stage": 1})
-    stages: set[str] = set()
-    async for item in cursor:
-        stage_value = item.get("stage")
-        if isinstance(stage_value, str):
-            stages.add(stage_value)
-
-    return stages
+    snapshot = await get_world_cup_edition_snapshot(edition)
+    return snapshot.knockout_stages()
 
 
 async def retrieve_team_matches(edition: str, team_id: int) -> tuple[str, list[Match]]:
-    collection = _get_matches_collection(edition)
-    if collection is None:
-        logging.error("No WC match collection for edition %s", edition)
-        return ("", [])
-
-    cursor = collection.find(
-        {
-            "$or": [
-                {"home_team.id": team_id},
-                {"away_team.id": team_id},
-            ]
-        }
-    ).sort("utc_date", ASCENDING)
-    matches = [Match.model_validate(item) async for item in cursor]
+    snapshot = await get_world_cup_edition_snapshot(edition)
+    matches = snapshot.team_matches(team_id)
     if len(matches) == 0:
         return ("", [])
 
@@ -1305,19 +1543,13 @@ async def retrieve_knockout_matches(
     *,
     supersede_replays: bool = True,
 ) -> list[Match]:
-    collection = _get_matches_collection(edition)
-    if collection is None:
-        logging.error("No WC match collection for edition %s", edition)
-        return []
-
-    cursor = collection.find({"stage": stage}).sort("utc_date", ASCENDING)
-    matches = [Match.model_validate(item) async for item in cursor]
+    snapshot = await get_world_cup_edition_snapshot(edition)
+    matches = snapshot.stage_matches(stage)
     if stage == "LAST_16":
-        all_matches = await retrieve_all_edition_matches(edition)
         matches = filter_group_playoffs_from_knockout_matches(
             edition,
             matches,
-            all_matches,
+            snapshot.matches,
         )
     if supersede_replays:
         matches = filter_superseded_knockout_replays(matches)
@@ -1843,23 +2075,12 @@ async def build_knockout_bracket_diagram(
 
 
 async def retrieve_distinct_teams(edition: str) -> list[Team]:
-    collection = _get_matches_collection(edition)
-    if collection is None:
-        return []
-
+    snapshot = await get_world_cup_edition_snapshot(edition)
     teams_by_id: dict[int, Team] = {}
-    cursor = collection.find({}, {"home_team": 1, "away_team": 1})
 
-    async for document in cursor:
-        for field_name in ("home_team", "away_team"):
-            team_data = document.get(field_name)
-            if not isinstance(team_data, dict):
-                continue
-
-            team_id = team_data.get("id")
-            if not isinstance(team_id, int) or team_id <= 0:
-                continue
-
-            teams_by_id[team_id] = Team.model_validate(team_data)
+    for match in snapshot.matches:
+        for team in (match.home_team, match.away_team):
+            if isinstance(team.id, int) and team.id > 0:
+                teams_by_id[team.id] = team
 
     return sorted(teams_by_id.values(), key=lambda team: team.display_name.casefold())
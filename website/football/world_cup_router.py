@@ -12,7 +12,9 @@ from .models import (
     PushSubscriptionDocument,
 )
 from .subscription_scope import get_wc_subscribable_team_ids, merge_subscription_team_ids
+from .world_cup_artifacts import retrieve_world_cup_edition_artifact
 from .world_cup_db import (
+    WorldCupGroupStandings,
     build_knockout_bracket_diagram,
     build_overview_group_playoff_sections,
     build_overview_group_stage_sections,
@@ -47,6 +49,7 @@ from .world_cup_utils import (
     standings_rules_visitor_lines,
     group_order_for_edition,
     filter_confirmed_knockout_matches,
+    group_slug_to_enum,
     group_slug_to_label,
     is_valid_round_slug,
     knockout_match_has_confirmed_teams,
@@ -138,7 +141,12 @@ async def _build_world_cup_context(
     is_live_edition = edition_is_live(selected_edition)
     has_group_stage = edition_has_group_stage(selected_edition)
     has_knockout_stage = edition_has_knockout_stage(selected_edition)
-    has_group_playoffs = await edition_has_group_playoff_matches(selected_edition)
+    artifact = await retrieve_world_cup_edition_artifact(selected_edition)
+    has_group_playoffs = (
+        artifact.has_group_playoffs
+        if artifact is not None
+        else await edition_has_group_playoff_matches(selected_edition)
+    )
     edition_query = world_cup_edition_query(selected_edition)
 
     context = {
@@ -336,11 +344,17 @@ async def get_world_cup_overview(
     context = await _build_world_cup_context(request, edition)
     selected_edition = context["selected_edition"]
 
-    knockout_rounds = await build_overview_knockout_sections(selected_edition)
-    group_stage_sections = await build_overview_group_stage_sections(selected_edition)
-    group_playoff_sections = await build_overview_group_playoff_sections(
-        selected_edition,
-    )
+    artifact = await retrieve_world_cup_edition_artifact(selected_edition)
+    if artifact is not None:
+        knockout_rounds = artifact.overview_knockout_sections
+        group_stage_sections = artifact.overview_group_stage_sections
+        group_playoff_sections = artifact.group_playoff_sections
+    else:
+        knockout_rounds = await build_overview_knockout_sections(selected_edition)
+        group_stage_sections = await build_overview_group_stage_sections(selected_edition)
+        group_playoff_sections = await build_overview_group_playoff_sections(
+            selected_edition,
+        )
 
     overview_knockout_sections: list[dict] = []
     for round_section in knockout_rounds:
@@ -447,7 +461,11 @@ async def get_world_cup_groups_index(
     if not context["has_group_stage"]:
         return _redirect_to_world_cup_overview(context)
 
-    group_stage_sections = await list_group_stage_summary_sections(selected_edition)
+    artifact = await retrieve_world_cup_edition_artifact(selected_edition)
+    if artifact is not None:
+        group_stage_sections = artifact.group_stage_summary_sections
+    else:
+        group_stage_sections = await list_group_stage_summary_sections(selected_edition)
 
     _assign_edition_switch_path(
         context,
@@ -478,7 +496,11 @@ async def get_world_cup_playoffs(
         return _redirect_to_world_cup_overview(context)
 
     selected_edition = context["selected_edition"]
-    playoff_sections = await build_overview_group_playoff_sections(selected_edition)
+    artifact = await retrieve_world_cup_edition_artifact(selected_edition)
+    if artifact is not None:
+        playoff_sections = artifact.group_playoff_sections
+    else:
+        playoff_sections = await build_overview_group_playoff_sections(selected_edition)
     playoff_groups: list[dict] = []
 
     for playoff_section in playoff_sections:
@@ -526,22 +548,37 @@ async def get_world_cup_group(
     if slug is None:
         return _redirect_to_world_cup_overview(context)
 
-    standings = await retrieve_group_standings(selected_edition, slug)
-    if standings is None:
-        all_groups = await retrieve_all_group_standings(selected_edition)
-        if not any(group.group_slug == slug for group in all_groups):
+    artifact = await retrieve_world_cup_edition_artifact(selected_edition)
+    if artifact is not None:
+        group_page = artifact.group_pages.get(slug)
+        if group_page is None:
             return _redirect_to_world_cup_overview(context)
-        standings = next(group for group in all_groups if group.group_slug == slug)
 
-    matches = await retrieve_group_matches(selected_edition, slug)
-    matches = update_match_timezone(matches)
-    prepared_table = await prepare_group_table_for_display(
-        selected_edition,
-        slug,
-        standings.table,
-        matches,
-    )
-    standings = standings.model_copy(update={"table": prepared_table})
+        matches = update_match_timezone(list(group_page.matches))
+        standings = WorldCupGroupStandings.model_construct(
+            edition=selected_edition,
+            group_slug=slug,
+            group_label=group_page.label,
+            group_enum=group_slug_to_enum(slug),
+            table=group_page.table,
+        )
+    else:
+        standings = await retrieve_group_standings(selected_edition, slug)
+        if standings is None:
+            all_groups = await retrieve_all_group_standings(selected_edition)
+            if not any(group.group_slug == slug for group in all_groups):
+                return _redirect_to_world_cup_overview(context)
+            standings = next(group for group in all_groups if group.group_slug == slug)
+
+        matches = await retrieve_group_matches(selected_edition, slug)
+        matches = update_match_timezone(matches)
+        prepared_table = await prepare_group_table_for_display(
+            selected_edition,
+            slug,
+            standings.table,
+            matches,
+        )
+        standings = standings.model_copy(update={"table": prepared_table})
     matchday_groups = _build_matchday_groups(matches)
 
     _assign_edition_switch_path(
@@ -633,10 +670,16 @@ async def get_world_cup_knockout_index(
         return _redirect_to_world_cup_overview(context)
 
     selected_edition = context["selected_edition"]
-    knockout_bracket = await build_knockout_bracket_diagram(
-        selected_edition,
-        football_root=str(context["football_root_path"]),
-    )
+    artifact = await retrieve_world_cup_edition_artifact(selected_edition)
+    if artifact is not None:
+        knockout_bracket = artifact.knockout_bracket_for_root(
+            str(context["football_root_path"])
+        )
+    else:
+        knockout_bracket = await build_knockout_bracket_diagram(
+            selected_edition,
+            football_root=str(context["football_root_path"]),
+        )
 
     _assign_edition_switch_path(
         context,
@@ -667,7 +710,11 @@ async def get_world_cup_summary(
         return _redirect_to_world_cup_overview(context)
 
     selected_edition = context["selected_edition"]
-    teams = await retrieve_distinct_teams(selected_edition)
+    artifact = await retrieve_world_cup_edition_artifact(selected_edition)
+    if artifact is not None:
+        teams = artifact.teams
+    else:
+        teams = await retrieve_distinct_teams(selected_edition)
     synopsis = edition_summary_synopsis(selected_edition)
     rules_sections = edition_summary_rules_sections(selected_edition)
 
@@ -845,9 +892,13 @@ async def get_world_cup_knockout_round(
     selected_edition = context["selected_edition"]
     stage = round_slug_to_stage(slug)
 
-    matches = filter_confirmed_knockout_matches(
-        await retrieve_knockout_matches(selected_edition, stage)
-    )
+    artifact = await retrieve_world_cup_edition_artifact(selected_edition)
+    if artifact is not None:
+        matches = list(artifact.knockout_round_matches.get(stage, []))
+    else:
+        matches = filter_confirmed_knockout_matches(
+            await retrieve_knockout_matches(selected_edition, stage)
+        )
     if len(matches) == 0:
         return _redirect_to_world_cup_overview(context)
 
@@ -0,0 +1,199 @@
+"""Exact finishing-position bounds for live World Cup groups.
+
+A group's state is the points each team already has plus its remaining
+fixtures. :func:`solve_group_scenarios` plays every remaining fixture as a
+home win, draw or away win (3^n final tables), merging branches that reach
+the same partial standings so each distinct table is expanded once. For every
+team it reports the best and worst rank it can finish on points alone. Ties
+count in the team's favour for the best rank and against it for the worst, so
+a team whose worst rank is within the qualifying places has qualified whatever
+the tie-breakers say.
+
+Results are cached per state, so repeat renders cost nothing until a score or
+status changes. Uncached states are solved in a process pool when called from
+async code, keeping the enumeration off the event loop; sync callers solve
+inline.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+import logging
+import multiprocessing
+
+WC_SCENARIO_MAX_FIXTURES = 12
+WC_SCENARIO_CACHE_SIZE = 512
+WC_SCENARIO_POOL_WORKERS = 1
+_FIXTURE_OUTCOMES = ((3, 0), (1, 1), (0, 3))
+
+
+@dataclass(frozen=True)
+class GroupScenarioState:
+    """Points so far per team (sorted by team id) and the fixtures still to finish."""
+
+    points: tuple[tuple[int, int], ...]
+    fixtures: tuple[tuple[int, int], ...]
+
+
+@dataclass(frozen=True)
+class GroupScenarioOutcome:
+    scenario_count: int
+    best_ranks: tuple[tuple[int, int], ...]
+    worst_ranks: tuple[tuple[int, int], ...]
+    third_place_points: tuple[int, int] | None = None
+
+    def best_rank(self, team_id: int) -> int | None:
+        return dict(self.best_ranks).get(team_id)
+
+    def worst_rank(self, team_id: int) -> int | None:
+        return dict(self.worst_ranks).get(team_id)
+
+    def is_clinched(self, team_id: int, places: int) -> bool:
+        """True when the team finishes within *places* in every scenario."""
+
+        worst_rank = self.worst_rank(team_id)
+        return worst_rank is not None and worst_rank <= places
+
+    def is_eliminated(self, team_id: int, places: int) -> bool:
+        """True when the team finishes outside *places* in every scenario."""
+
+        best_rank = self.best_rank(team_id)
+        return best_rank is not None and best_rank > places
+
+
+# (scenario count, best rank per team, worst rank per team, lowest and highest third-place points)
+_Aggregate = tuple[int, tuple[int, ...], tuple[int, ...], int | None, int | None]
+
+
+def _final_table_aggregate(points: tuple[int, ...]) -> _Aggregate:
+    best = tuple(1 + sum(1 for other in points if other > own) for own in points)
+    worst = tuple(sum(1 for other in points if other >= own) for own in points)
+    third = sorted(points, reverse=True)[2] if len(points) >= 3 else None
+    return (1, best, worst, third, third)
+
+
+def _merge_aggregates(left: _Aggregate | None, right: _Aggregate) -> _Aggregate:
+    if left is None:
+        return right
+
+    third_min = right[3] if left[3] is None else left[3] if right[3] is None else min(left[3], right[3])
+    third_max = right[4] if left[4] is None else left[4] if right[4] is None else max(left[4], right[4])
+    return (
+        left[0] + right[0],
+        tuple(min(a, b) for a, b in zip(left[1], right[1])),
+        tuple(max(a, b) for a, b in zip(left[2], right[2])),
+        third_min,
+        third_max,
+    )
+
+
+def solve_group_scenarios(state: GroupScenarioState) -> GroupScenarioOutcome:
+    team_ids = [team_id for team_id, _ in state.points]
+    index_by_team_id = {team_id: index for index, team_id in enumerate(team_ids)}
+    fixtures = [(index_by_team_id[home], index_by_team_id[away]) for home, away in state.fixtures]
+    memo: dict[tuple[int, tuple[int, ...]], _Aggregate] = {}
+
+    def explore(position: int, points: tuple[int, ...]) -> _Aggregate:
+        key = (position, points)
+        cached = memo.get(key)
+        if cached is not None:
+            return cached
+
+        if position == len(fixtures):
+            result = _final_table_aggregate(points)
+        else:
+            home, away = fixtures[position]
+            merged: _Aggregate | None = None
+            for home_points, away_points in _FIXTURE_OUTCOMES:
+                next_points = list(points)
+                next_points[home] += home_points
+                next_points[away] += away_points
+                merged = _merge_aggregates(merged, explore(position + 1, tuple(next_points)))
+            assert merged is not None
+            result = merged
+
+        memo[key] = result
+        return result
+
+    count, best, worst, third_min, third_max = explore(0, tuple(points for _, points in state.points))
+    return GroupScenarioOutcome(
+        scenario_count=count,
+        best_ranks=tuple(zip(team_ids, best)),
+        worst_ranks=tuple(zip(team_ids, worst)),
+        third_place_points=(third_min, third_max) if third_min is not None and third_max is not None else None,
+    )
+
+
+_scenario_cache: OrderedDict[GroupScenarioState, GroupScenarioOutcome] = OrderedDict()
+_scenario_pool: ProcessPoolExecutor | None = None
+
+
+def _remember(state: GroupScenarioState, outcome: GroupScenarioOutcome) -> GroupScenarioOutcome:
+    _scenario_cache[state] = outcome
+    _scenario_cache.move_to_end(state)
+    while len(_scenario_cache) > WC_SCENARIO_CACHE_SIZE:
+        _scenario_cache.popitem(last=False)
+    return outcome
+
+
+def cached_group_scenarios(state: GroupScenarioState) -> GroupScenarioOutcome | None:
+    outcome = _scenario_cache.get(state)
+    if outcome is not None:
+        _scenario_cache.move_to_end(state)
+    return outcome
+
+
+def group_scenarios(state: GroupScenarioState) -> GroupScenarioOutcome:
+    """Return the cached outcome for *state*, solving it inline on a miss."""
+
+    outcome = cached_group_scenarios(state)
+    if outcome is not None:
+        return outcome
+    return _remember(state, solve_group_scenarios(state))
+
+
+def _get_scenario_pool() -> ProcessPoolExecutor:
+    global _scenario_pool
+
+    if _scenario_pool is None:
+        # Spawned workers avoid forking the app's Mongo client threads.
+        _scenario_pool = ProcessPoolExecutor(
+            max_workers=WC_SCENARIO_POOL_WORKERS,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+    return _scenario_pool
+
+
+async def group_scenarios_async(state: GroupScenarioState) -> GroupScenarioOutcome:
+    """Return the outcome for *state*, solving a cache miss in the process pool."""
+
+    outcome = cached_group_scenarios(state)
+    if outcome is not None:
+        return outcome
+
+    global _scenario_pool
+    try:
+        outcome = await asyncio.get_running_loop().run_in_executor(
+            _get_scenario_pool(),
+            solve_group_scenarios,
+            state,
+        )
+    except (BrokenProcessPool, OSError, RuntimeError) as exc:
+        logging.warning(f"World Cup scenario pool failed, solving inline: {exc}")
+        _scenario_pool = None
+        outcome = solve_group_scenarios(state)
+
+    return _remember(state, outcome)
+
+
+def shutdown_group_scenario_pool() -> None:
+    global _scenario_pool
+
+    pool = _scenario_pool
+    _scenario_pool = None
+    if pool is not None:
+        pool.shutdown(wait=False, cancel_futures=True)
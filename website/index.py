@@ -30,8 +30,33 @@ from .blog.router import blog_router
 
 from .football.router import football_router, wc_versioned_asset_response
 from .account.system_push_db import ensure_system_push_subscription_indexes
-from .football.football_db import ensure_push_subscription_indexes, initialise_teams_cache
-
+from .football.football_db import (
+    ensure_pl_match_index,
+    ensure_push_subscription_indexes,
+    initialise_teams_cache,
+    start_pl_match_index_sync,
+    stop_pl_match_index_sync,
+)
+from .football.world_cup_artifacts import start_world_cup_artifact_build, stop_world_cup_artifact_build
+from .football.world_cup_scenarios import shutdown_group_scenario_pool
+
+from .feeds.feed_db import (
+    ensure_feed_indexes,
+    ensure_feed_source_indexes,
+    start_category_counts_invalidation_listener,
+    start_feed_article_archival,
+    start_feed_daily_rollup_maintenance,
+    start_feed_ingest_watch,
+    start_feed_search_index_sync,
+    start_feed_source_consolidation,
+    stop_category_counts_invalidation_listener,
+    stop_feed_article_archival,
+    stop_feed_daily_rollup_maintenance,
+    stop_feed_ingest_watch,
+    stop_feed_search_index_sync,
+    stop_feed_source_consolidation,
+)
+from .feeds.http_client import start_feed_http_client, stop_feed_http_client
 from .feeds.router import feeds_router
 from .media.router import media_router
 
@@ -186,10 +211,32 @@ COLLECTION = MONGODB.get_collection("item_collection")
 # Close the connection when the app shuts down
 @asynccontextmanager
 async def lifespan(app: FastAPI):
+    await ensure_pl_match_index()
+    await start_pl_match_index_sync()
     await initialise_teams_cache()
     await ensure_push_subscription_indexes()
     await ensure_system_push_subscription_indexes()
+    await ensure_feed_indexes()
+    await ensure_feed_source_indexes()
+    await start_category_counts_invalidation_listener()
+    await start_feed_ingest_watch()
+    await start_feed_http_client()
+    await start_feed_daily_rollup_maintenance()
+    await start_feed_search_index_sync()
+    await start_feed_source_consolidation()
+    await start_feed_article_archival()
+    await start_world_cup_artifact_build()
     yield
+    await stop_world_cup_artifact_build()
+    await stop_pl_match_index_sync()
+    shutdown_group_scenario_pool()
+    await stop_feed_article_archival()
+    await stop_feed_source_consolidation()
+    await stop_feed_search_index_sync()
+    await stop_feed_daily_rollup_maintenance()
+    await stop_feed_http_client()
+    await stop_feed_ingest_watch()
+    await stop_category_counts_invalidation_listener()
     logging.debug("Closing DB Connection")
     MONGODB.client.close()
     logging.info("Closed DB Connection")
@@ -30,6 +30,8 @@
     const articlesEndpoint = root.dataset.articlesEndpoint || "/feeds/api/articles/";
     /** @type {string} */
     const articleStatusesEndpoint = root.dataset.articleStatusesEndpoint || "/feeds/api/articles/statuses/";
+    /** @type {string} */
+    const articleStateEndpoint = root.dataset.articleStateEndpoint || "/feeds/api/articles/state/";
 
     /** @type {HTMLElement} */
     const scrollContainer = (() => {
@@ -49,6 +51,7 @@
 
     const sidebarEndpoint = root.dataset.sidebarEndpoint || "/feeds/api/sidebar/";
     const readerSyncEndpoint = root.dataset.readerSyncEndpoint || "/feeds/api/reader/sync/";
+    const readerEventsEndpoint = root.dataset.readerEventsEndpoint || "";
     /** @type {boolean} */
     const isWebApp = String(root.dataset.isWebApp || "false").toLowerCase() === "true";
     /** @type {boolean} */
@@ -114,6 +117,8 @@
     const pageSize = Math.max(1, Number(root.dataset.pageSize || 10));
     /** @type {number} */
     let nextOffset = Math.max(0, Number(root.dataset.nextOffset || 0));
+    /** @type {string} */
+    let nextCursor = String(root.dataset.nextCursor || "").trim();
     /** @type {boolean} */
     let hasMorePages = String(root.dataset.hasMore || "false").toLowerCase() === "true";
     /** @type {number} */
@@ -127,6 +132,8 @@
     /** @type {number} */
     const HEAD_PROBE_MAX_LIMIT = 20;
     /** @type {number} */
+    const readerPushSafetyPollMs = 30000;
+    /** @type {number} */
     const headProbeLimit = Math.min(
         Math.max(pageSize * 2, pageSize),
         HEAD_PROBE_MAX_LIMIT
@@ -134,6 +141,21 @@
     /** @type {boolean} */
     let liveSyncInFlight = false;
     /** @type {boolean} */
+    let liveSyncQueued = false;
+    /** @type {boolean} */
+    let markAllReadInFlight = false;
+    /** @type {number} */
+    let lastLiveSyncAt = 0;
+    /** @type {boolean} */
+    let readerPushConnected = false;
+    /** @type {{ all_unread_count: number, recently_read_count: number, saved_count: number, categories: Map<string, Record<string, any>> }} */
+    const pushedCounts = {
+        all_unread_count: 0,
+        recently_read_count: 0,
+        saved_count: 0,
+        categories: new Map(),
+    };
+    /** @type {boolean} */
     let pageLoadInFlight = false;
     /** @type {boolean} */
     let pagePrefetchScheduled = false;
@@ -359,7 +381,7 @@
      *
      * @returns {string}
      */
-    function buildArticlesUrl(offset = 0, limitOverride = pageSize, statusOverride = selectedStatus, idsOnly = false) {
+    function buildArticlesUrl(offset = 0, limitOverride = pageSize, statusOverride = selectedStatus, idsOnly = false, cursor = "") {
         const params = new URLSearchParams();
         params.set("category", selectedCategory);
         if (isSearchPage || selectedSearch !== "") {
@@ -374,6 +396,9 @@
         if (idsOnly) {
             params.set("ids_only", "true");
         }
+        if (cursor !== "") {
+            params.set("cursor", cursor);
+        }
         return `${articlesEndpoint}?${params.toString()}`;
     }
 
@@ -2034,6 +2059,15 @@
         return getCards().filter(isCardIncludedByCurrentFilter).length;
     }
 
+    /**
+     * Store the keyset cursor returned by the server for the next page request.
+     *
+     * @param {unknown} cursor
+     */
+    function setNextCursor(cursor) {
+        nextCursor = typeof cursor === "string" ? cursor.trim() : "";
+    }
+
     /**
      * Build or return the paging sentinel element anchored at list end.
      *
@@ -2128,12 +2162,13 @@
     /**
      * Append one fetched page of article cards without replacing existing list state.
      *
-     * @param {{ articles?: Array<Record<string, any>>, has_more?: boolean, next_offset?: number }} payload
+     * @param {{ articles?: Array<Record<string, any>>, has_more?: boolean, next_offset?: number, next_cursor?: string | null }} payload
      * @param {number} requestOffset
      * @returns {number}
      */
     function appendArticlePage(payload, requestOffset) {
         const incomingArticles = Array.isArray(payload.articles) ? payload.articles : [];
+        setNextCursor(payload.next_cursor);
 
         if (incomingArticles.length === 0) {
             hasMorePages = Boolean(payload.has_more);
@@ -2221,7 +2256,7 @@
         const requestOffset = getPagingRequestOffset();
 
         try {
-            const response = await readerFetch(buildArticlesUrl(requestOffset, pageSize), {
+            const response = await readerFetch(buildArticlesUrl(requestOffset, pageSize, selectedStatus, false, nextCursor), {
                 method: "GET",
                 cache: "no-store",
             });
@@ -2780,6 +2815,7 @@
                 } else {
                     nextOffset = Math.max(0, getPagingRequestOffset());
                 }
+                setNextCursor(payload.head_next_cursor);
 
                 refreshPagingSentinelObserver();
                 scheduleTouchScrollReadCheck();
@@ -2794,6 +2830,7 @@
                     articles: payload.tail_articles,
                     has_more: payload.tail_has_more,
                     next_offset: payload.tail_next_offset,
+                    next_cursor: payload.tail_next_cursor,
                 },
                 requestOffset
             );
@@ -2804,6 +2841,9 @@
             if (typeof payload.tail_next_offset === "number") {
                 nextOffset = Math.max(0, payload.tail_next_offset);
             }
+            if (typeof payload.tail_next_cursor === "string") {
+                setNextCursor(payload.tail_next_cursor);
+            }
             if (hasMorePages) {
                 schedulePagePrefetchCheck();
             }
@@ -2898,6 +2938,7 @@
             } else {
                 nextOffset = Math.max(0, getPagingRequestOffset());
             }
+            setNextCursor(articlePayload.next_cursor);
 
             refreshPagingSentinelObserver();
             schedulePagePrefetchCheck();
@@ -2906,6 +2947,57 @@
         }
     }
 
+    /**
+     * Mark every unread article in the current category/feed view as read.
+     *
+     * One bulk request per batch covers the whole view; articles that arrive
+     * after the prompt are left unread.
+     *
+     * @returns {Promise<void>}
+     */
+    async function markAllRead() {
+        if (markAllReadInFlight || isSearchPage || ["saved", "recently-read"].includes(selectedCategory)) {
+            return;
+        }
+
+        if (!window.confirm("Mark all articles in this view as read?")) {
+            return;
+        }
+
+        markAllReadInFlight = true;
+        const olderThan = new Date().toISOString();
+
+        try {
+            let hasMore = true;
+            while (hasMore) {
+                const response = await readerFetch(articleStateEndpoint, {
+                    method: "POST",
+                    headers: {
+                        "Content-Type": "application/json",
+                        "X-CSRF-Token": csrfToken,
+                    },
+                    body: JSON.stringify({
+                        action: "read",
+                        category: selectedCategory,
+                        feed_id: selectedFeedId === "" ? null : selectedFeedId,
+                        older_than: olderThan,
+                    }),
+                });
+                if (!response.ok) {
+                    return;
+                }
+
+                const payload = await response.json();
+                hasMore = Boolean(payload.has_more) && Number(payload.changed_count || 0) > 0;
+            }
+        } catch (_error) {
+            // Keep current reader state; the next sync reconciles partial progress.
+        } finally {
+            markAllReadInFlight = false;
+            requestLiveReaderSync();
+        }
+    }
+
     /**
      * Refresh current view contents without a full page reload.
      *
@@ -3051,6 +3143,7 @@
                     current_head_ids: getCurrentHeadIds(),
                     at_end: !hasMorePages,
                     tail_offset: getPagingRequestOffset(),
+                    tail_cursor: nextCursor === "" ? null : nextCursor,
                     page_size: pageSize,
                 }),
             });
@@ -3060,13 +3153,136 @@
 
             const payload = await response.json();
             await applyReaderSyncPayload(payload);
+            lastLiveSyncAt = Date.now();
         } catch (_error) {
             // Keep existing reader state when sync fails.
         } finally {
             liveSyncInFlight = false;
+            if (liveSyncQueued) {
+                liveSyncQueued = false;
+                void refreshLiveReaderState();
+            }
         }
     }
 
+    /**
+     * Sync now, or straight after the sync already in flight finishes.
+     */
+    function requestLiveReaderSync() {
+        if (liveSyncInFlight) {
+            liveSyncQueued = true;
+            return;
+        }
+
+        void refreshLiveReaderState();
+    }
+
+    /**
+     * Apply one pushed reader event and run a full sync when cards may differ.
+     *
+     * Counter changes are applied straight away from the merged push state; new
+     * or removed head cards, sidebar visibility changes and counter changes (a
+     * read on another device) then trigger one consolidated sync.
+     *
+     * @param {string} eventName
+     * @param {Record<string, any>} delta
+     */
+    function applyReaderPushEvent(eventName, delta) {
+        if (!delta || typeof delta !== "object") {
+            return;
+        }
+
+        if (eventName === "snapshot") {
+            pushedCounts.categories.clear();
+        }
+
+        ["all_unread_count", "recently_read_count", "saved_count"].forEach(key => {
+            if (typeof delta[key] === "number") {
+                pushedCounts[key] = delta[key];
+            }
+        });
+
+        const changedCategories = Array.isArray(delta.categories) ? delta.categories : [];
+        changedCategories.forEach(category => {
+            pushedCounts.categories.set(String(category.category_id || ""), category);
+        });
+
+        const removedCategoryIds = Array.isArray(delta.removed_category_ids) ? delta.removed_category_ids : [];
+        removedCategoryIds.forEach(categoryId => {
+            pushedCounts.categories.delete(String(categoryId));
+        });
+
+        updateSidebarCounts({
+            all_unread_count: pushedCounts.all_unread_count,
+            recently_read_count: pushedCounts.recently_read_count,
+            saved_count: pushedCounts.saved_count,
+            categories: Array.from(pushedCounts.categories.values()),
+        });
+
+        if (eventName === "snapshot") {
+            const pushedHeadIds = Array.isArray(delta.head_article_ids) ? delta.head_article_ids.map(String) : [];
+            if (pushedHeadIds.join(",") !== getCurrentHeadIds().join(",")) {
+                requestLiveReaderSync();
+            }
+            lastLiveSyncAt = Date.now();
+            return;
+        }
+
+        requestLiveReaderSync();
+    }
+
+    /**
+     * Open the server-sent reader event stream, falling back to polling.
+     */
+    function startReaderPush() {
+        if (readerEventsEndpoint === "" || typeof window.EventSource !== "function") {
+            return;
+        }
+
+        const params = new URLSearchParams({
+            category: selectedCategory,
+            status_filter: selectedStatus,
+            page_size: String(pageSize),
+            require_search_query: String(isSearchPage && selectedSearch === ""),
+        });
+        if (selectedFeedId !== "") {
+            params.set("feed_id", selectedFeedId);
+        }
+        if (selectedSearch !== "") {
+            params.set("search", selectedSearch);
+        }
+
+        const source = new EventSource(`${readerEventsEndpoint}?${params.toString()}`);
+        source.addEventListener("open", () => {
+            readerPushConnected = true;
+        });
+        source.addEventListener("error", () => {
+            // EventSource reconnects on its own; poll until it does.
+            readerPushConnected = false;
+        });
+        ["snapshot", "delta"].forEach(eventName => {
+            source.addEventListener(eventName, event => {
+                try {
+                    applyReaderPushEvent(eventName, JSON.parse(String(event.data || "{}")));
+                } catch (_error) {
+                    // Ignore malformed events; the safety poll keeps state fresh.
+                }
+            });
+        });
+        window.addEventListener("pagehide", () => source.close());
+    }
+
+    /**
+     * Poll live state every tick without a push stream, or as a slow safety net with one.
+     */
+    function pollLiveReaderState() {
+        if (readerPushConnected && Date.now() - lastLiveSyncAt < readerPushSafetyPollMs) {
+            return;
+        }
+
+        void refreshLiveReaderState();
+    }
+
     /**
      * Handle keyboard shortcuts for article navigation.
      *
@@ -3085,6 +3301,12 @@
             return;
         }
 
+        if (event.key === "A" && event.shiftKey) {
+            event.preventDefault();
+            void markAllRead();
+            return;
+        }
+
         const cards = getCards();
         if (cards.length === 0) {
             return;
@@ -3305,5 +3527,6 @@
     scheduleTouchScrollReadCheck();
     schedulePagePrefetchCheck();
 
-    window.setInterval(refreshLiveReaderState, 2000);
+    startReaderPush();
+    window.setInterval(pollLiveReaderState, 2000);
 })();
@@ -64,6 +64,10 @@
     /** @type {string} */
     const opmlImportEndpoint = root.dataset.opmlImportEndpoint || "/feeds/api/opml/import/";
     /** @type {string} */
+    const opmlImportJobsEndpoint = root.dataset.opmlImportJobsEndpoint || "/feeds/api/opml/import/jobs/";
+    /** @type {number} */
+    const opmlImportPollIntervalMs = 1000;
+    /** @type {string} */
     const categoryMuteTemplate = root.dataset.categoryMuteTemplate || "";
     /** @type {string} */
     const categoryUnmuteTemplate = root.dataset.categoryUnmuteTemplate || "";
@@ -1364,11 +1368,12 @@
 
         formData.append("duplicate_policy", "skip");
         formData.append("default_category_name", "Imported");
+        formData.set("validate_urls", formData.get("validate_urls") === "on" ? "true" : "false");
 
         setStatus("Importing OPML...");
 
         try {
-            const response = await fetch(opmlImportEndpoint, {
+            const response = await fetch(opmlImportJobsEndpoint || opmlImportEndpoint, {
                 method: "POST",
                 headers: {
                     "X-CSRF-Token": csrfToken,
@@ -1381,8 +1386,12 @@
                 throw new Error(typeof payload.detail === "string" ? payload.detail : "OPML import failed.");
             }
 
-            const createdCount = Number(payload.created_subscriptions || 0);
-            const skippedCount = Number(payload.skipped_duplicates || 0);
+            const result = typeof payload.job_id === "string"
+                ? await waitForOpmlImportJob(payload.job_id)
+                : payload;
+
+            const createdCount = Number(result.created_subscriptions || 0);
+            const skippedCount = Number(result.skipped_duplicates || 0);
             setStatus(`Import complete: ${createdCount} created, ${skippedCount} skipped.`);
             reloadPageSoon();
         } catch (error) {
@@ -1390,6 +1399,33 @@
         }
     }
 
+    /**
+     * Poll a background OPML import job until it finishes.
+     *
+     * @param {string} jobId
+     * @returns {Promise<Record<string, any>>} Final import result payload.
+     */
+    async function waitForOpmlImportJob(jobId) {
+        const jobUrl = `${opmlImportJobsEndpoint}${encodeURIComponent(jobId)}/`;
+
+        for (;;) {
+            await new Promise(resolve => window.setTimeout(resolve, opmlImportPollIntervalMs));
+
+            const job = await requestJson(jobUrl, "GET");
+            if (job.status === "completed") {
+                return job.result || {};
+            }
+
+            if (job.status === "failed") {
+                throw new Error(typeof job.error === "string" && job.error ? job.error : "OPML import failed.");
+            }
+
+            const processed = Number(job.processed_entries || 0);
+            const total = Number(job.total_entries || 0);
+            setStatus(`Importing OPML... ${processed} of ${total} feeds processed.`);
+        }
+    }
+
     /**
      * Remove temporary drop-target highlighting from category items.
      */
@@ -145,8 +145,11 @@ function openWebSocket() {
             }
         });
 
-        shouldPollForUpdates = hasRefreshableMatchToday(matches.matches);
-        syncPollingInterval();
+        // Deltas only hold the matches that changed, so keep the watch state from the last full list
+        if (!matches.delta) {
+            shouldPollForUpdates = hasRefreshableMatchToday(matches.matches);
+            syncPollingInterval();
+        }
     };
 
     // Add the event listener
@@ -162,18 +165,11 @@ function openWebSocket() {
 };
 
 function checkSocketAndSendMessage(event) {
-    // Send the messsage, checking that the socket is open
-    // If the socket is not open, open a new one and wait for it to be ready
+    // The server pushes score changes while the socket is open, so only reopen a closed socket
+    // The open handler asks for a fresh snapshot once the new socket is ready
     if (ws.readyState != WebSocket.OPEN) {
         // Open the new socket
         openWebSocket();
-    } else {
-        if (!shouldPollForUpdates) {
-            return;
-        }
-
-        // If the socket is already open, just send the message
-        sendMessage(true);
     }
 };
 
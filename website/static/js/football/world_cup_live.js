@@ -97,8 +97,11 @@ function openWorldCupWebSocket() {
         if (typeof applyWorldCupKnockoutFeederWinners === "function") {
             applyWorldCupKnockoutFeederWinners();
         }
-        worldCupShouldPoll = hasRefreshableWorldCupMatchToday(matches);
-        syncWorldCupPollingInterval();
+        // Deltas only hold the matches that changed, so keep the watch state from the last full list.
+        if (payload?.delta !== true) {
+            worldCupShouldPoll = hasRefreshableWorldCupMatchToday(matches);
+            syncWorldCupPollingInterval();
+        }
     };
 
     worldCupSocket.addEventListener("open", () => {
@@ -120,14 +123,9 @@ function openWorldCupWebSocket() {
 function checkWorldCupSocketAndSendMessage() {
     if (!worldCupSocket || worldCupSocket.readyState !== WebSocket.OPEN) {
         openWorldCupWebSocket();
-        return;
-    }
-
-    if (!worldCupShouldPoll) {
-        return;
     }
 
-    sendWorldCupMessage(true);
+    // An open socket receives pushed score changes, so there is nothing to request.
 }
 
 function sendWorldCupMessage(currentDayOnly) {
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import importlib
 import importlib.util
 import ipaddress
@@ -8,6 +9,8 @@ import sys
 import unittest
 from unittest.mock import patch
 
+from defusedxml.common import DefusedXmlException
+
 
 WEBSITE_ROOT = Path(__file__).resolve().parents[2]
 FEED_UTILS_PATH = WEBSITE_ROOT / "feeds" / "feed_utils.py"
@@ -36,7 +39,9 @@ if html_sanitizer_spec is None or html_sanitizer_spec.loader is None:
 html_sanitizer = importlib.util.module_from_spec(html_sanitizer_spec)
 html_sanitizer_spec.loader.exec_module(html_sanitizer)
 
+AsyncDnsCache = feed_utils.AsyncDnsCache
 deterministic_category_color = feed_utils.deterministic_category_color
+FeedHeaderParser = feed_utils.FeedHeaderParser
 is_public_http_url = feed_utils.is_public_http_url
 normalize_color_hex = feed_utils.normalize_color_hex
 normalize_feed_url = feed_utils.normalize_feed_url
@@ -149,6 +154,129 @@ class FeedHelperTests(unittest.TestCase):
         self.assertEqual(entries, [("https://example.com/feed.xml", "Example Feed", "Tech")])
 
 
+    def test_feed_header_parser_stops_before_items_once_title_is_known(self) -> None:
+        head = b"""<?xml version=\"1.0\" encoding=\"UTF-8\"?>
+<rss version=\"2.0\"><channel><title>Example Feed</title>
+<description>About</description><item><title>First</title>"""
+        tail = b"<description>" + b"x" * 100_000 + b"</description></item></channel></rss>"
+
+        parser = FeedHeaderParser()
+        self.assertFalse(parser.feed(head[:40]))
+        self.assertTrue(parser.feed(head[40:]))
+        self.assertTrue(parser.feed(tail))
+
+        root = parser.close()
+        channel = root.find("channel")
+        self.assertIsNotNone(channel)
+        self.assertEqual(channel.findtext("title"), "Example Feed")
+        self.assertEqual(channel.findtext("description"), "About")
+        self.assertEqual(channel.findall("item"), [])
+
+    def test_feed_header_parser_keeps_first_entry_when_header_has_no_title(self) -> None:
+        parser = FeedHeaderParser()
+        self.assertTrue(
+            parser.feed(
+                b"<feed xmlns=\"http://www.w3.org/2005/Atom\"><entry><title>Only</title></entry>"
+            )
+        )
+
+        root = parser.close()
+        entries = list(root)
+        self.assertEqual(len(entries), 1)
+        self.assertEqual(entries[0][0].text, "Only")
+
+    def test_feed_header_parser_rejects_entity_expansion(self) -> None:
+        feed_content = b"""<?xml version=\"1.0\"?>
+<!DOCTYPE rss [<!ENTITY xxe SYSTEM \"file:///etc/passwd\">]>
+<rss><channel><title>&xxe;</title></channel></rss>"""
+
+        parser = FeedHeaderParser()
+        with self.assertRaises(DefusedXmlException):
+            parser.feed(feed_content)
+
+    def test_rollup_day_key_uses_utc_calendar_day(self) -> None:
+        from datetime import UTC, datetime, timedelta, timezone
+
+        from website.feeds.feed_db import _rollup_day_key
+
+        self.assertEqual(_rollup_day_key(datetime(2026, 3, 4, 23, 30)), "2026-03-04")
+        self.assertEqual(
+            _rollup_day_key(datetime(2026, 3, 4, 23, 30, tzinfo=timezone(timedelta(hours=-2)))),
+            "2026-03-05",
+        )
+        self.assertEqual(_rollup_day_key(datetime(2026, 3, 5, 0, 0, tzinfo=UTC)), "2026-03-05")
+        self.assertIsNone(_rollup_day_key(None))
+
+
+class AsyncDnsCacheTests(unittest.IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        self.now = 0.0
+        self.calls: list[str] = []
+        self.responses: dict[str, tuple[tuple[ipaddress.IPv4Address, ...], float]] = {}
+
+    async def _resolver(self, hostname: str) -> tuple[tuple[ipaddress.IPv4Address, ...], float]:
+        self.calls.append(hostname)
+        await asyncio.sleep(0)
+        addresses, ttl = self.responses.get(hostname, ((), 0.0))
+        if len(addresses) == 0:
+            raise LookupError(hostname)
+        return addresses, ttl
+
+    def _cache(self) -> AsyncDnsCache:
+        return AsyncDnsCache(
+            resolver=self._resolver,
+            min_ttl=10.0,
+            max_ttl=100.0,
+            negative_ttl=5.0,
+            stale_seconds=20.0,
+            clock=lambda: self.now,
+        )
+
+    async def test_coalesces_concurrent_lookups_and_honours_record_ttl(self) -> None:
+        address = ipaddress.ip_address("8.8.8.8")
+        self.responses["public.example"] = ((address,), 60.0)
+        cache = self._cache()
+
+        results = await asyncio.gather(*(cache.resolve("Public.Example.") for _ in range(5)))
+
+        self.assertEqual(results, [(address,)] * 5)
+        self.assertEqual(self.calls, ["public.example"])
+
+        self.now = 59.0
+        await cache.resolve("public.example")
+        self.assertEqual(len(self.calls), 1)
+
+        self.now = 90.0
+        await cache.resolve("public.example")
+        self.assertEqual(len(self.calls), 2)
+
+    async def test_caches_failures_for_negative_ttl(self) -> None:
+        cache = self._cache()
+
+        self.assertEqual(await cache.resolve("missing.example"), ())
+        self.assertEqual(await cache.resolve("missing.example"), ())
+        self.assertEqual(len(self.calls), 1)
+
+        self.now = 5.0
+        self.assertEqual(await cache.resolve("missing.example"), ())
+        self.assertEqual(len(self.calls), 2)
+
+    async def test_serves_stale_entry_while_refreshing_in_background(self) -> None:
+        old_address = ipaddress.ip_address("8.8.8.8")
+        new_address = ipaddress.ip_address("1.1.1.1")
+        self.responses["public.example"] = ((old_address,), 10.0)
+        cache = self._cache()
+        await cache.resolve("public.example")
+
+        self.responses["public.example"] = ((new_address,), 10.0)
+        self.now = 15.0
+        self.assertEqual(await cache.resolve("public.example"), (old_address,))
+
+        await asyncio.wait_for(cache._inflight["public.example"], timeout=1.0)
+        self.assertEqual(await cache.resolve("public.example"), (new_address,))
+        self.assertEqual(len(self.calls), 2)
+
+
 class TruncateHtmlToParagraphsTests(unittest.TestCase):
     def test_returns_unchanged_when_five_or_fewer_paragraphs(self) -> None:
         html = "<p>One</p><p>Two</p><p>Three</p><p>Four</p><p>Five</p>"
@@ -184,8 +312,8 @@ class FeedDbHelperTests(unittest.TestCase):
         from website.feeds import feed_db
         from website.feeds.models import FeedCategoryListResponse
 
-        feed_db._category_counts_cache["test-user"] = (
-            feed_db.utc_now(),
+        feed_db._category_counts_cache.set(
+            "test-user",
             FeedCategoryListResponse(
                 all_unread_count=1,
                 recently_read_count=0,
@@ -195,7 +323,646 @@ class FeedDbHelperTests(unittest.TestCase):
         )
 
         feed_db.invalidate_category_counts_cache("test-user")
-        self.assertNotIn("test-user", feed_db._category_counts_cache)
+        self.assertIsNone(feed_db._category_counts_cache.get("test-user"))
+
+    def test_lru_ttl_cache_evicts_least_recently_used_and_expired_entries(self) -> None:
+        from datetime import timedelta
+
+        from website.feeds.counts_cache import LruTtlCache
+
+        now = [0.0]
+        cache: LruTtlCache[str, int] = LruTtlCache(
+            max_entries=2,
+            ttl=timedelta(seconds=10),
+            clock=lambda: now[0],
+        )
+
+        cache.set("a", 1)
+        cache.set("b", 2)
+        self.assertEqual(cache.get("a"), 1)
+        cache.set("c", 3)
+
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.get("a"), 1)
+        self.assertEqual(cache.get("c"), 3)
+
+        now[0] = 10.0
+        self.assertIsNone(cache.get("a"))
+        self.assertEqual(len(cache), 1)
+
+    def test_article_cursor_round_trips_dated_and_undated_positions(self) -> None:
+        from datetime import UTC, datetime
+
+        from bson import ObjectId
+
+        from website.feeds.feed_db import decode_article_cursor, encode_article_cursor
+
+        article_id = ObjectId()
+        published_at = datetime(2026, 3, 4, 5, 6, 7, 123000)
+
+        dated_cursor = encode_article_cursor("dated", published_at, article_id)
+        self.assertEqual(
+            decode_article_cursor(dated_cursor),
+            ("dated", published_at.replace(tzinfo=UTC), article_id),
+        )
+
+        undated_cursor = encode_article_cursor("undated", None, article_id)
+        self.assertEqual(decode_article_cursor(undated_cursor), ("undated", None, article_id))
+
+        self.assertIsNone(decode_article_cursor(""))
+        self.assertIsNone(decode_article_cursor("not-a-cursor"))
+
+    def test_unread_counter_is_current_requires_matching_marker_and_recent_reconcile(self) -> None:
+        from datetime import timedelta
+
+        from bson import ObjectId
+
+        from website.feeds.feed_db import (
+            UNREAD_COUNTER_RECONCILE_INTERVAL,
+            unread_counter_is_current,
+            utc_now,
+        )
+        from website.feeds.models import UserFeedUnreadCounterDocument
+
+        now = utc_now()
+        fetched_at = now - timedelta(minutes=5)
+        counter_doc = UserFeedUnreadCounterDocument.model_validate(
+            {
+                "user_id": "reader",
+                "feed_id": ObjectId(),
+                "unread_count": 4,
+                "source_marker": fetched_at,
+                "reconciled_at": now - timedelta(minutes=1),
+            }
+        )
+
+        self.assertTrue(unread_counter_is_current(counter_doc, fetched_at, now))
+        self.assertFalse(unread_counter_is_current(None, fetched_at, now))
+        self.assertFalse(unread_counter_is_current(counter_doc, now, now))
+        self.assertFalse(
+            unread_counter_is_current(
+                counter_doc,
+                fetched_at,
+                now + UNREAD_COUNTER_RECONCILE_INTERVAL,
+            )
+        )
+
+    def test_reader_scope_feed_ids_are_unique_and_ordered(self) -> None:
+        from bson import ObjectId
+
+        from website.feeds.feed_db import ReaderScope
+
+        first_feed_id = ObjectId()
+        second_feed_id = ObjectId()
+        scope = ReaderScope(
+            user_id="test-user",
+            categories=[],
+            subscriptions=[
+                {"feed_id": first_feed_id},
+                {"feed_id": second_feed_id},
+                {"feed_id": first_feed_id},
+                {"feed_id": "not-an-object-id"},
+            ],
+            sources_map={},
+            unread_counters={},
+        )
+
+        self.assertEqual(scope.feed_ids, [first_feed_id, second_feed_id])
+        self.assertEqual(scope.categories_map, {})
+
+    def test_dedupe_opml_entries_normalizes_urls_and_applies_default_category(self) -> None:
+        from website.feeds.feed_db import _dedupe_opml_entries
+        from website.feeds.models import FeedOpmlImportOptions, FeedOpmlImportResult
+
+        result = FeedOpmlImportResult()
+        entries = _dedupe_opml_entries(
+            [
+                ("https://Example.com/feed/", " Example ", "Tech"),
+                ("https://example.com/feed", "Example again", "News"),
+                ("ftp://example.com/feed.xml", "Bad", "Tech"),
+                ("https://other.example/rss", "Other", " "),
+            ],
+            FeedOpmlImportOptions(default_category_name="Inbox"),
+            result,
+        )
+
+        self.assertEqual(
+            entries,
+            [
+                ("https://example.com/feed", "Example", "Tech"),
+                ("https://other.example/rss", "Other", "Inbox"),
+            ],
+        )
+        self.assertEqual(result.skipped_duplicates, 1)
+        self.assertEqual(len(result.errors), 1)
+
+    def test_dedupe_opml_entries_lets_the_last_repeat_win_under_refresh(self) -> None:
+        from website.feeds.feed_db import _dedupe_opml_entries
+        from website.feeds.models import FeedOpmlImportOptions, FeedOpmlImportResult
+
+        result = FeedOpmlImportResult()
+        entries = _dedupe_opml_entries(
+            [
+                ("https://example.com/feed", "Example", "Tech"),
+                ("https://other.example/rss", "Other", "News"),
+                ("https://Example.com/feed/", "Example renamed", "News"),
+                ("https://example.com/feed", "", "Science"),
+            ],
+            FeedOpmlImportOptions(duplicate_policy="refresh"),
+            result,
+        )
+
+        self.assertEqual(
+            entries,
+            [
+                ("https://example.com/feed", "Example renamed", "Science"),
+                ("https://other.example/rss", "Other", "News"),
+            ],
+        )
+        self.assertEqual((result.skipped_duplicates, result.existing_subscriptions), (0, 2))
+
+    def test_duplicate_article_merge_helpers_prefer_strongest_identity(self) -> None:
+        from datetime import UTC, datetime
+
+        from website.feeds.feed_db import _article_identity, _merged_article_state
+
+        self.assertEqual(
+            _article_identity({"canonical_url": " https://example.com/a ", "external_id": "x", "dedupe_key": "k"}),
+            ("url", "https://example.com/a"),
+        )
+        self.assertEqual(_article_identity({"external_id": "null", "dedupe_key": "k"}), ("dedupe_key", "k"))
+        self.assertIsNone(_article_identity({}))
+
+        older = datetime(2026, 3, 1, tzinfo=UTC)
+        newer = datetime(2026, 3, 2, tzinfo=UTC)
+        merged = _merged_article_state(
+            {"is_read": True, "read_at": older},
+            {"is_read": True, "read_at": newer, "is_saved": True, "saved_at": older},
+        )
+        self.assertEqual(merged["read_at"], newer)
+        self.assertTrue(merged["is_saved"])
+        self.assertFalse(merged["is_opened"])
+
+    def test_parse_search_components_marks_trailing_star_as_prefix(self) -> None:
+        from website.feeds.feed_db import parse_article_search_components
+
+        self.assertEqual(
+            parse_article_search_components('econom* "black hole" run'),
+            [("prefix", "econom"), ("phrase", "black hole"), ("term", "run")],
+        )
+
+    def test_reader_push_diff_sends_only_changes(self) -> None:
+        from website.feeds.feed_db import ReaderPushState, diff_reader_push_state
+        from website.feeds.models import FeedCategorySummary
+
+        def category(unread_count: int) -> FeedCategorySummary:
+            return FeedCategorySummary(
+                category_id="c1",
+                name="News",
+                unread_count=unread_count,
+                muted=False,
+                color_hex="#1F6FEB",
+                sort_order=0,
+            )
+
+        previous = ReaderPushState(
+            all_unread_count=3,
+            recently_read_count=1,
+            saved_count=0,
+            categories={"c1": category(3)},
+            head_article_ids=["a2", "a1"],
+            visible_feed_ids_by_group={"all": {"f1"}, "c1": {"f1"}},
+        )
+        current = ReaderPushState(
+            all_unread_count=4,
+            recently_read_count=1,
+            saved_count=0,
+            categories={"c1": category(4)},
+            head_article_ids=["a3", "a2"],
+            visible_feed_ids_by_group={"all": {"f1", "f2"}, "c1": {"f1"}},
+        )
+
+        delta = diff_reader_push_state(previous, current)
+
+        self.assertEqual(delta.all_unread_count, 4)
+        self.assertIsNone(delta.saved_count)
+        self.assertEqual([item.unread_count for item in delta.categories], [4])
+        self.assertEqual(delta.new_article_ids, ["a3"])
+        self.assertEqual(delta.removed_article_ids, ["a1"])
+        self.assertEqual(list(delta.sidebar_visibility), ["all"])
+        self.assertEqual(delta.sidebar_visibility["all"].shown, ["f2"])
+        self.assertTrue(diff_reader_push_state(current, current).is_empty())
+        self.assertEqual(diff_reader_push_state(None, current).head_article_ids, ["a3", "a2"])
+
+    def test_rendered_article_content_is_reused_until_content_changes(self) -> None:
+        from bson import ObjectId
+
+        from website.feeds.feed_db import render_article_content
+
+        article_doc = {
+            "_id": ObjectId(),
+            "title": "Cached",
+            "link": "https://example.com/post",
+            "summary_html": "<p>One</p><p>Two</p>",
+        }
+
+        first = render_article_content(article_doc)
+        self.assertIs(render_article_content(dict(article_doc)), first)
+        self.assertIsNot(render_article_content(article_doc, truncate_on_display=True), first)
+
+        edited = render_article_content({**article_doc, "summary_html": "<p>Edited</p>"})
+        self.assertIsNot(edited, first)
+        self.assertIn("Edited", edited.summary_html or "")
+
+    def test_bulk_state_stages_select_articles_the_action_changes(self) -> None:
+        from website.feeds.feed_db import _bulk_state_change_stages, build_unread_article_join_stages
+
+        self.assertEqual(_bulk_state_change_stages("u", "read"), build_unread_article_join_stages("u"))
+
+        unread_stages = _bulk_state_change_stages("u", "unread")
+        self.assertEqual(unread_stages[0]["$lookup"]["pipeline"][0]["$match"], {"user_id": "u", "is_read": True})
+        self.assertEqual(unread_stages[1], {"$match": {"matching_states.0": {"$exists": True}}})
+
+        save_stages = _bulk_state_change_stages("u", "save")
+        self.assertEqual(save_stages[0]["$lookup"]["pipeline"][0]["$match"], {"user_id": "u", "is_saved": True})
+        self.assertEqual(save_stages[1], {"$match": {"matching_states.0": {"$exists": False}}})
+
+    def test_archive_operations_move_compressed_body_out_of_stub(self) -> None:
+        from datetime import UTC, datetime
+
+        from bson import ObjectId
+
+        from website.feeds.feed_db import (
+            FeedArticleArchiveMetrics,
+            _build_archive_operations,
+            _decompress_article_body,
+        )
+
+        article_id = ObjectId()
+        archived_at = datetime(2026, 3, 4, tzinfo=UTC)
+        metrics = FeedArticleArchiveMetrics()
+        archive_operations, stub_operations = _build_archive_operations(
+            [{"_id": article_id, "feed_id": ObjectId(), "summary_html": "<p>Body</p>"}],
+            archived_at,
+            metrics,
+        )
+
+        archive_doc = archive_operations[0]._doc["$set"]
+        self.assertEqual(_decompress_article_body(archive_doc["summary_z"]), "<p>Body</p>")
+        self.assertEqual(archive_doc["archived_at"], archived_at)
+        self.assertEqual(stub_operations[0]._filter, {"_id": article_id, "archived_at": {"$exists": False}})
+        self.assertEqual(stub_operations[0]._doc["$unset"], {"summary_html": ""})
+        self.assertEqual(metrics.body_bytes_removed, len("<p>Body</p>"))
+
+
+class ArticleStateColumnTests(unittest.TestCase):
+    def test_column_keeps_sorted_ids_with_timestamps(self) -> None:
+        from datetime import datetime
+
+        from bson import ObjectId
+
+        from website.feeds.read_state import ArticleTimestampColumn
+
+        first, second, third = sorted(ObjectId() for _ in range(3))
+        read_at = datetime(2026, 3, 4, 12, 30, 15, 250000)
+        column = ArticleTimestampColumn.from_items([(third, None), (first, read_at)])
+
+        self.assertEqual(list(column), [first, third])
+        self.assertEqual(column[first], read_at)
+        self.assertIsNone(column[third])
+        self.assertNotIn(second, column)
+
+        column.set(second, read_at)
+        column.discard(first)
+        self.assertEqual(list(column), [second, third])
+        self.assertEqual(column.nbytes, 2 * 20)
+
+    def test_snapshot_applies_state_document_deltas(self) -> None:
+        from datetime import datetime
+
+        from bson import ObjectId
+
+        from website.feeds.read_state import UserArticleStateSnapshot
+
+        article_id = ObjectId()
+        state_at = datetime(2026, 3, 4, 8, 0)
+        snapshot = UserArticleStateSnapshot.from_state_documents(
+            1,
+            state_at,
+            [{"article_id": article_id, "is_read": True, "read_at": state_at}],
+        )
+        snapshot.apply_state_document(
+            {"article_id": article_id, "is_read": False, "is_saved": True, "saved_at": state_at}
+        )
+
+        self.assertNotIn(article_id, snapshot.read)
+        self.assertEqual(dict(snapshot.saved), {article_id: state_at})
+
+
+class UserArticleStateSnapshotCacheTests(unittest.IsolatedAsyncioTestCase):
+    async def test_snapshot_refreshes_when_version_moves_at_same_updated_at(self) -> None:
+        from datetime import UTC, datetime
+
+        from bson import ObjectId
+
+        from website.feeds import feed_db
+
+        article_id = ObjectId()
+        updated_at = datetime(2026, 3, 4, 8, 0, tzinfo=UTC)
+        state_doc = {"article_id": article_id, "is_read": True, "read_at": updated_at}
+        version_doc = {"version": 1}
+        finds: list[dict] = []
+
+        class _Cursor:
+            def __init__(self, docs: list[dict]) -> None:
+                self._docs = iter(docs)
+
+            def __aiter__(self):
+                return self
+
+            async def __anext__(self) -> dict:
+                try:
+                    return dict(next(self._docs))
+                except StopIteration:
+                    raise StopAsyncIteration from None
+
+        class _States:
+            def find(self, query: dict, projection: dict) -> _Cursor:
+                finds.append(query)
+                return _Cursor([state_doc])
+
+        class _Versions:
+            async def find_one(self, query: dict, projection: dict) -> dict:
+                return version_doc
+
+        feed_db._user_article_state_cache.clear()
+        self.addCleanup(feed_db._user_article_state_cache.clear)
+        with (
+            patch.object(feed_db, "user_article_states_collection", _States()),
+            patch.object(feed_db, "user_article_state_versions_collection", _Versions()),
+        ):
+            first = await feed_db.get_user_article_state_snapshot("alice")
+            self.assertIn(article_id, first.read)
+
+            # The write keeps the same updated_at, so only the version says it changed.
+            state_doc["is_read"] = False
+            self.assertIs(await feed_db.get_user_article_state_snapshot("alice"), first)
+            self.assertEqual(len(finds), 1)
+
+            version_doc["version"] = 2
+            second = await feed_db.get_user_article_state_snapshot("alice")
+
+        self.assertIs(second, first)
+        self.assertNotIn(article_id, second.read)
+        self.assertEqual(len(finds), 2)
+
+
+class FeedDailyRollupTotalsTests(unittest.IsolatedAsyncioTestCase):
+    async def test_bulk_adjust_also_moves_running_totals(self) -> None:
+        from types import SimpleNamespace
+
+        from bson import ObjectId
+
+        from website.feeds import feed_db
+
+        feed_id = ObjectId()
+        writes: list = []
+
+        class _Rollups:
+            async def bulk_write(self, operations: list, ordered: bool) -> SimpleNamespace:
+                writes.extend(operations)
+                return SimpleNamespace(upserted_count=0)
+
+        with patch.object(feed_db, "feed_daily_rollups_collection", _Rollups()):
+            await feed_db._bulk_adjust_feed_daily_rollups(
+                "alice",
+                {
+                    (feed_id, "2026-03-04", "read"): 2,
+                    (feed_id, "2026-03-05", "read"): -1,
+                    (feed_id, "2026-03-05", "saved"): 1,
+                },
+            )
+
+        totals = {
+            tuple(operation._doc["$inc"].items())[0]: operation._filter
+            for operation in writes
+            if operation._filter["day"] is None
+        }
+        self.assertEqual(set(totals), {("read", 1), ("saved", 1)})
+        self.assertEqual(len(writes), 5)
+
+
+class ArticleSearchIndexTests(unittest.TestCase):
+    def _build_index(self):
+        from website.feeds.search_index import ArticleSearchIndex
+
+        index = ArticleSearchIndex()
+        index.add_article("a1", "f1", "Black hole imaged", "<p>Astronomers imaged a <b>black</b> hole</p>")
+        index.add_article("a2", "f1", "Economy grows", "<p>The economics of running</p>")
+        index.add_article("a3", "f2", "Black cat", "<p>A hole in the fence</p>")
+        return index
+
+    def test_search_supports_terms_phrases_prefixes_and_feed_scope(self) -> None:
+        from website.feeds.feed_db import build_search_term_variants
+
+        index = self._build_index()
+
+        def search(components, feed_ids=None):
+            return [
+                article_id
+                for article_id, _ in index.search(
+                    components,
+                    expand_term=build_search_term_variants,
+                    feed_ids=feed_ids,
+                )
+            ]
+
+        self.assertEqual(search([("term", "black"), ("term", "hole")]), ["a1", "a3"])
+        self.assertEqual(search([("phrase", "black hole")]), ["a1"])
+        self.assertEqual(search([("term", "black"), ("term", "hole")], {"f2"}), ["a3"])
+        self.assertEqual(search([("prefix", "econom")]), ["a2"])
+        self.assertEqual(search([("term", "run")]), ["a2"])
+
+        index.remove_article("a1")
+        self.assertEqual(search([("phrase", "black hole")]), [])
+        self.assertNotIn("a1", index)
+
+    def test_segment_round_trip_preserves_matches_and_watermark(self) -> None:
+        from datetime import UTC, datetime
+        import tempfile
+
+        from website.feeds.search_index import read_segment_file, write_segment_file
+
+        index = self._build_index()
+        index.remove_article("a2")
+        watermark = datetime(2026, 3, 4, 12, 0, tzinfo=UTC)
+        with tempfile.TemporaryDirectory() as temp_dir:
+            segment_path = Path(temp_dir) / "feeds.segment"
+            write_segment_file(segment_path, index, watermark)
+            loaded_index, loaded_watermark = read_segment_file(segment_path)
+
+        self.assertEqual(loaded_watermark, watermark)
+        self.assertEqual(len(loaded_index), 2)
+        self.assertEqual(
+            loaded_index.search([("phrase", "black hole")], expand_term=lambda term: {term}),
+            index.search([("phrase", "black hole")], expand_term=lambda term: {term}),
+        )
+
+    def test_newest_order_caps_matches_by_date_not_score(self) -> None:
+        from datetime import UTC, datetime
+        import tempfile
+
+        from website.feeds.search_index import ArticleSearchIndex, read_segment_file, write_segment_file
+
+        index = ArticleSearchIndex()
+        index.add_article("a1", "f1", "Storm storm storm", None, datetime(2026, 1, 1, tzinfo=UTC))
+        index.add_article("a2", "f1", "Storm warning", "<p>Wind and rain</p>", datetime(2026, 3, 1, tzinfo=UTC))
+        index.add_article("a3", "f1", "Storm", None, datetime(2026, 2, 1, tzinfo=UTC))
+        index.add_article("a4", "f1", "Storm", None)
+
+        def newest(search_index, limit=None):
+            return [
+                article_id
+                for article_id, _ in search_index.search(
+                    [("term", "storm")],
+                    expand_term=lambda term: {term},
+                    limit=limit,
+                    order="newest",
+                )
+            ]
+
+        self.assertEqual(index.search([("term", "storm")], expand_term=lambda term: {term}, limit=1)[0][0], "a1")
+        self.assertEqual(newest(index), ["a2", "a3", "a1", "a4"])
+        self.assertEqual(newest(index, limit=2), ["a2", "a3"])
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            segment_path = Path(temp_dir) / "feeds.segment"
+            write_segment_file(segment_path, index, None)
+            loaded_index, _ = read_segment_file(segment_path)
+
+        self.assertEqual(newest(loaded_index), ["a2", "a3", "a1", "a4"])
+
+
+class FeedProfilerTests(unittest.TestCase):
+    def test_query_shape_drops_values(self) -> None:
+        from datetime import UTC, datetime
+
+        from bson import ObjectId
+
+        from website.feeds.instrumentation import command_shape, query_shape
+
+        shape = query_shape(
+            {
+                "user_id": "alice",
+                "article_id": {"$in": [ObjectId(), ObjectId()]},
+                "read_at": {"$gte": datetime(2026, 1, 1, tzinfo=UTC)},
+            }
+        )
+
+        self.assertEqual(
+            shape,
+            {"user_id": "str", "article_id": {"$in": "[array]"}, "read_at": {"$gte": "datetime"}},
+        )
+        self.assertEqual(
+            command_shape(
+                "aggregate",
+                {"aggregate": "feed_articles", "pipeline": [{"$match": {"feed_id": ObjectId()}}, {"$limit": 5}]},
+            ),
+            ("feed_articles", [{"$match": {"feed_id": "ObjectId"}}, "$limit"]),
+        )
+
+    def test_request_round_trips_and_histograms_aggregate(self) -> None:
+        from website.feeds.instrumentation import FeedProfiler, LatencyHistogram, _current_request
+
+        histogram = LatencyHistogram()
+        for duration_ms in (0.5, 3.0, 7000.0):
+            histogram.observe(duration_ms)
+        summary = histogram.to_dict()
+        self.assertEqual(summary["count"], 3)
+        self.assertEqual(summary["buckets"][0], {"le_ms": 1, "count": 1})
+        self.assertEqual(summary["buckets"][-1], {"le_ms": None, "count": 1})
+
+        profiler = FeedProfiler()
+        with profiler.track_request(lambda: "/feeds/api/articles") as round_trips:
+            round_trips.count += 3
+        with profiler.track_request(lambda: "/feeds/api/articles"):
+            pass
+
+        self.assertIsNone(_current_request.get())
+        self.assertEqual(
+            profiler.snapshot()["requests"],
+            [
+                {
+                    "route": "/feeds/api/articles",
+                    "requests": 2,
+                    "round_trips": 3,
+                    "mean_round_trips": 1.5,
+                    "max_round_trips": 3,
+                }
+            ],
+        )
+
+
+class FeedIndexRegistryTests(unittest.TestCase):
+    def test_missing_specs_match_by_key_pattern(self) -> None:
+        from website.feeds.indexes import FEED_INDEX_REGISTRY, missing_index_specs
+
+        state_specs = [spec for spec in FEED_INDEX_REGISTRY if spec.collection == "user_article_states"]
+        index_info = {
+            "_id_": {"key": [("_id", 1)]},
+            "user_id_1_article_id_1": {"key": [("user_id", 1), ("article_id", 1)], "unique": True},
+            # A reversed index serves the declared (user_id, is_read, read_at DESC) index.
+            "legacy_read_at": {"key": [("user_id", -1), ("is_read", -1), ("read_at", 1)]},
+        }
+
+        missing_names = {spec.name for spec in missing_index_specs(state_specs, index_info)}
+
+        self.assertNotIn("user_article_state_user_article", missing_names)
+        self.assertNotIn("user_article_state_user_read_at", missing_names)
+        self.assertIn("user_article_state_user_saved_at", missing_names)
+        self.assertIn("user_article_state_user_updated", missing_names)
+
+    def test_text_spec_matches_any_text_index(self) -> None:
+        from website.feeds.indexes import FEED_INDEX_REGISTRY, index_matches_spec
+
+        text_spec = next(spec for spec in FEED_INDEX_REGISTRY if spec.is_text)
+
+        self.assertTrue(index_matches_spec(text_spec, {"key": [("_fts", "text"), ("_ftsx", 1)]}))
+        self.assertFalse(index_matches_spec(text_spec, {"key": [("title", 1)]}))
+
+    def test_explain_summary_flags_collection_scans(self) -> None:
+        from website.feeds.indexes import summarize_explain_plan
+
+        index_plan = {
+            "stages": [
+                {
+                    "$cursor": {
+                        "queryPlanner": {
+                            "winningPlan": {
+                                "stage": "FETCH",
+                                "inputStage": {"stage": "IXSCAN", "indexName": "feed_article_feed_published"},
+                            },
+                            "rejectedPlans": [{"stage": "COLLSCAN"}],
+                        }
+                    }
+                },
+                {"$lookup": {}, "collectionScans": 0, "indexesUsed": ["user_article_state_user_article_read"]},
+            ]
+        }
+        lookup_scan = {
+            "queryPlanner": {"winningPlan": {"stage": "IXSCAN", "indexName": "user_article_state_user_read_at"}},
+            "stages": [{"$lookup": {}, "collectionScans": 3, "indexesUsed": []}],
+        }
+
+        summary = summarize_explain_plan(index_plan)
+        self.assertFalse(summary["collection_scan"])
+        self.assertEqual(summary["stages"], ["FETCH", "IXSCAN"])
+        self.assertEqual(
+            summary["indexes"],
+            ["feed_article_feed_published", "user_article_state_user_article_read"],
+        )
+        self.assertTrue(summarize_explain_plan(lookup_scan)["collection_scan"])
+        self.assertTrue(summarize_explain_plan({"queryPlanner": {"winningPlan": {"stage": "COLLSCAN"}}})["collection_scan"])
 
 
 class HtmlSanitizerTests(unittest.TestCase):
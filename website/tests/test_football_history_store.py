@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+import unittest
+from unittest.mock import AsyncMock, patch
+
+from website.football import chatbot_history_store
+from website.football.chatbot_history_api import _build_head_to_head_data
+from website.football.chatbot_history_models import FootballHistoryRequestEnvelope
+from website.football.chatbot_history_store import NO_VALUE, WINNER_HOME, history_column_store
+from website.tests.test_world_cup_tiebreakers import _group_match, _table_row, _team
+
+ARSENAL = _team(57, "Arsenal")
+CHELSEA = _team(61, "Chelsea")
+SPURS = _team(73, "Tottenham")
+
+
+def _season_matches():
+    return [
+        _group_match(match_id=1, group=None, home=ARSENAL, away=CHELSEA, home_score=2, away_score=0),
+        _group_match(match_id=2, group=None, home=CHELSEA, away=ARSENAL, home_score=1, away_score=1),
+        _group_match(match_id=3, group=None, home=SPURS, away=ARSENAL, home_score=0, away_score=1),
+        _group_match(
+            match_id=4,
+            group=None,
+            home=ARSENAL,
+            away=SPURS,
+            home_score=None,
+            away_score=None,
+            finished=False,
+        ),
+    ]
+
+
+def _season_table():
+    return [
+        _table_row(position=1, team=ARSENAL, played_games=3, won=2, draw=1, lost=0, goals_for=4, goals_against=1),
+        _table_row(position=2, team=CHELSEA, played_games=2, won=0, draw=1, lost=1, goals_for=1, goals_against=3),
+    ]
+
+
+class HistoryColumnStoreTests(unittest.IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        history_column_store.clear()
+        self.load_matches = AsyncMock(side_effect=lambda keys: {key: _season_matches() for key in keys})
+        self.load_table = AsyncMock(side_effect=lambda key: _season_table())
+        self.versions = AsyncMock(return_value={"2024_2025": "v1"})
+        self.patches = [
+            patch.object(chatbot_history_store, "retreive_matches_for_seasons", self.load_matches),
+            patch.object(chatbot_history_store, "get_table_db_for_season", self.load_table),
+            patch.object(chatbot_history_store, "get_pl_match_index_versions", self.versions),
+        ]
+        for patcher in self.patches:
+            patcher.start()
+
+    def tearDown(self) -> None:
+        for patcher in self.patches:
+            patcher.stop()
+        history_column_store.clear()
+
+    async def test_season_is_held_as_columns(self) -> None:
+        (columns,) = await history_column_store.seasons(["2024_2025"])
+
+        self.assertEqual(columns.match_count, 4)
+        self.assertEqual(list(columns.home_goals), [2, 1, 0, NO_VALUE])
+        self.assertEqual(columns.winner[0], WINNER_HOME)
+        self.assertEqual(
+            [history_column_store.teams[index].name for index in columns.table_team],
+            ["Arsenal", "Chelsea"],
+        )
+        self.assertEqual(list(columns.table_points), [7, 1])
+
+    async def test_season_reloads_only_when_its_version_changes(self) -> None:
+        first = await history_column_store.seasons(["2024_2025"])
+        second = await history_column_store.seasons(["2024_2025"])
+        self.versions.return_value = {"2024_2025": "v2"}
+        third = await history_column_store.seasons(["2024_2025"])
+
+        self.assertIs(first[0], second[0])
+        self.assertIsNot(first[0], third[0])
+        self.assertEqual(self.load_matches.await_count, 2)
+
+    async def test_unversioned_seasons_are_not_cached(self) -> None:
+        self.versions.return_value = {}
+
+        await history_column_store.seasons(["2024_2025"])
+        await history_column_store.seasons(["2024_2025"])
+
+        self.assertEqual(self.load_matches.await_count, 2)
+
+    async def test_head_to_head_runs_over_columns(self) -> None:
+        payload = FootballHistoryRequestEnvelope.model_validate(
+            {
+                "request": {
+                    "action": "get_head_to_head",
+                    "filters": {"teams": ["arsenal", "CHELSEA"]},
+                }
+            }
+        )
+
+        summary, *matches = await _build_head_to_head_data(payload, ["2024_2025"])
+
+        self.assertEqual(
+            (summary["matches_played"], summary["wins"], summary["draws"], summary["losses"]),
+            (2, 1, 1, 0),
+        )
+        self.assertEqual((summary["goals_for"], summary["goals_against"]), (3, 1))
+        self.assertEqual({row["winner"] for row in matches}, {"Arsenal", "Draw"})
+
+
+if __name__ == "__main__":
+    unittest.main()
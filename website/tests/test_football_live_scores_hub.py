@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+import json
+import unittest
+
+from website.football.live_scores_hub import (
+    LIVE_SCORE_IDLE_POLL_INTERVAL_SECONDS,
+    LIVE_SCORE_POLL_INTERVAL_SECONDS,
+    LIVE_SCORE_SUBSCRIBER_QUEUE_SIZE,
+    LiveScoreHub,
+    live_score_poll_interval,
+)
+from website.football.models import MatchStatus
+
+
+@dataclass
+class _Match:
+    id: int
+    status: MatchStatus
+    home: int | None = None
+    utc_date: datetime = datetime(2026, 6, 11, 19, 0, tzinfo=UTC)
+
+    def model_dump_json(self) -> str:
+        return json.dumps({"id": self.id, "status": self.status.value, "home": self.home})
+
+
+KEY = ("world-cup", "2026", True)
+
+
+class LiveScorePollIntervalTests(unittest.TestCase):
+    def test_polls_fast_only_near_or_during_live_matches(self) -> None:
+        now = datetime(2026, 6, 11, 18, 0, tzinfo=UTC)
+
+        self.assertEqual(
+            live_score_poll_interval([_Match(1, MatchStatus.in_play)], now),
+            LIVE_SCORE_POLL_INTERVAL_SECONDS,
+        )
+        self.assertEqual(
+            live_score_poll_interval([_Match(1, MatchStatus.timed, utc_date=now + timedelta(minutes=3))], now),
+            LIVE_SCORE_POLL_INTERVAL_SECONDS,
+        )
+        self.assertEqual(
+            live_score_poll_interval(
+                [_Match(1, MatchStatus.timed), _Match(2, MatchStatus.finished, utc_date=now)], now
+            ),
+            LIVE_SCORE_IDLE_POLL_INTERVAL_SECONDS,
+        )
+
+
+class LiveScoreHubTests(unittest.IsolatedAsyncioTestCase):
+    async def test_subscribers_share_one_poll_and_receive_deltas(self) -> None:
+        loads: list[tuple] = []
+        matches = [_Match(1, MatchStatus.in_play, 0), _Match(2, MatchStatus.timed)]
+
+        async def loader(key):
+            loads.append(key)
+            return list(matches)
+
+        hub = LiveScoreHub(loader)
+        with hub.subscribe(KEY) as first, hub.subscribe(KEY) as second:
+            snapshot = json.loads(await hub.snapshot(KEY))
+            self.assertEqual([match["id"] for match in snapshot["matches"]], [1, 2])
+            self.assertNotIn("delta", snapshot)
+            self.assertEqual(len(loads), 1)
+            self.assertTrue(first.empty())
+
+            channel = hub._channels[KEY]
+            matches[0] = _Match(1, MatchStatus.in_play, 1)
+            hub._broadcast(channel, hub._refresh(channel, matches))
+            delta = json.loads(first.get_nowait())
+            self.assertEqual(delta, {"matches": [{"id": 1, "status": "IN_PLAY", "home": 1}], "delta": True})
+            self.assertEqual(json.loads(second.get_nowait()), delta)
+
+            self.assertIsNone(hub._refresh(channel, matches))
+
+            matches.append(_Match(3, MatchStatus.timed))
+            full = json.loads(hub._refresh(channel, matches))
+            self.assertEqual([match["id"] for match in full["matches"]], [1, 2, 3])
+            self.assertNotIn("delta", full)
+            self.assertEqual(hub.subscriber_count, 2)
+
+        self.assertEqual(hub.subscriber_count, 0)
+        await asyncio.sleep(0)
+
+    async def test_slow_subscriber_resyncs_from_snapshot(self) -> None:
+        async def loader(key):
+            return [_Match(1, MatchStatus.in_play, 0)]
+
+        hub = LiveScoreHub(loader)
+        with hub.subscribe(KEY) as queue:
+            await hub.snapshot(KEY)
+            channel = hub._channels[KEY]
+            for _ in range(LIVE_SCORE_SUBSCRIBER_QUEUE_SIZE + 1):
+                hub._broadcast(channel, "delta")
+
+            self.assertEqual(queue.qsize(), 1)
+            self.assertEqual(queue.get_nowait(), channel.snapshot)
+
+            channel.task.cancel()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+import unittest
+from unittest.mock import AsyncMock, patch
+
+from website.football import football_db
+from website.football.football_db import (
+    _match_index_document,
+    _team_pair_key,
+    get_available_season_keys,
+    invalidate_available_season_keys,
+)
+from website.football.models import Match
+from website.tests.test_world_cup_tiebreakers import _group_match, _team
+
+
+class PlMatchIndexDocumentTests(unittest.TestCase):
+    def test_team_pair_ignores_home_and_away(self) -> None:
+        self.assertEqual(_team_pair_key(57, 61), "57:61")
+        self.assertEqual(_team_pair_key(61, 57), "57:61")
+        self.assertIsNone(_team_pair_key(57, None))
+
+    def test_document_is_keyed_by_season_and_match(self) -> None:
+        match = _group_match(
+            match_id=42,
+            group=None,
+            home=_team(61, "Chelsea"),
+            away=_team(57, "Arsenal"),
+            home_score=1,
+            away_score=1,
+        )
+        document = {"_id": "source-object-id", **match.model_dump(mode="python")}
+
+        indexed = _match_index_document("2024_2025", document)
+
+        self.assertEqual(indexed["_id"], "2024_2025:42")
+        self.assertEqual(indexed["season_key"], "2024_2025")
+        self.assertEqual(indexed["team_pair"], "57:61")
+        self.assertEqual(Match.model_validate(indexed), match)
+
+
+class SeasonKeyDiscoveryCacheTests(unittest.IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        invalidate_available_season_keys()
+
+    def tearDown(self) -> None:
+        invalidate_available_season_keys()
+
+    async def test_collection_listing_is_cached(self) -> None:
+        discover = AsyncMock(return_value=["2025_2026", "2024_2025"])
+
+        with patch.object(football_db, "_discover_season_keys", discover):
+            first = await get_available_season_keys()
+            first.append("mutated")
+            second = await get_available_season_keys()
+            invalidate_available_season_keys()
+            await get_available_season_keys()
+
+        self.assertEqual(second, ["2025_2026", "2024_2025"])
+        self.assertEqual(discover.await_count, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
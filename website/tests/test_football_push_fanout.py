@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+import base64
+import os
+import unittest
+
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import ec
+from py_vapid import Vapid
+
+from website.football.push_fanout import (
+    VAPID_REFRESH_MARGIN_SECONDS,
+    VAPID_TOKEN_LIFETIME_SECONDS,
+    PushFanoutEngine,
+    PushTarget,
+    VapidHeaderCache,
+)
+
+
+class _CountingVapid(Vapid):
+    def __init__(self) -> None:
+        super().__init__()
+        self.generate_keys()
+        self.signed_audiences: list[str] = []
+
+    def sign(self, claims, crypto_key=None):
+        self.signed_audiences.append(claims["aud"])
+        return super().sign(claims, crypto_key)
+
+
+class _ScriptedEngine(PushFanoutEngine):
+    def __init__(self, statuses: dict[str, list[int]], **kwargs) -> None:
+        vapid = _CountingVapid()
+        super().__init__(VapidHeaderCache(vapid, {"sub": "mailto:test@example.test"}), **kwargs)
+        self.vapid = vapid
+        self.statuses = statuses
+
+    async def _post(self, session, target, body) -> int:
+        self._vapid_headers.headers_for(target.origin)
+        return self.statuses[target.endpoint].pop(0)
+
+
+class _RecordingResponse:
+    status = 201
+
+    async def text(self) -> str:
+        return ""
+
+
+class _RecordingSession:
+    def __init__(self) -> None:
+        self.posted: list[str] = []
+
+    async def post(self, endpoint, **kwargs) -> _RecordingResponse:
+        self.posted.append(endpoint)
+        return _RecordingResponse()
+
+
+def _target(endpoint: str) -> PushTarget:
+    return PushTarget(endpoint=endpoint, p256dh="key", auth="auth")
+
+
+def _subscribed_target(endpoint: str) -> PushTarget:
+    public_key = ec.generate_private_key(ec.SECP256R1()).public_key()
+    raw_key = public_key.public_bytes(serialization.Encoding.X962, serialization.PublicFormat.UncompressedPoint)
+    return PushTarget(
+        endpoint=endpoint,
+        p256dh=base64.urlsafe_b64encode(raw_key).decode().rstrip("="),
+        auth=base64.urlsafe_b64encode(os.urandom(16)).decode().rstrip("="),
+    )
+
+
+class VapidHeaderCacheTests(unittest.TestCase):
+    def test_headers_are_signed_once_per_origin_until_near_expiry(self) -> None:
+        vapid = _CountingVapid()
+        cache = VapidHeaderCache(vapid, {"sub": "mailto:test@example.test", "aud": "ignored"})
+
+        first = cache.headers_for("https://fcm.googleapis.com", now=1000.0)
+        second = cache.headers_for("https://fcm.googleapis.com", now=2000.0)
+        cache.headers_for("https://updates.push.services.mozilla.com", now=2000.0)
+        refresh_at = 1000.0 + VAPID_TOKEN_LIFETIME_SECONDS - VAPID_REFRESH_MARGIN_SECONDS
+        cache.headers_for("https://fcm.googleapis.com", now=refresh_at)
+
+        self.assertEqual(first, second)
+        self.assertIn("Authorization", first)
+        self.assertEqual(
+            vapid.signed_audiences,
+            [
+                "https://fcm.googleapis.com",
+                "https://updates.push.services.mozilla.com",
+                "https://fcm.googleapis.com",
+            ],
+        )
+
+
+class PushFanoutEngineTests(unittest.IsolatedAsyncioTestCase):
+    async def test_retries_transient_failures_and_prunes_gone_endpoints_per_batch(self) -> None:
+        statuses = {
+            "https://push.example/a": [201],
+            "https://push.example/b": [503, 201],
+            "https://push.example/c": [410],
+            "https://push.example/d": [404],
+            "https://push.example/e": [429, 429, 429],
+            "https://push.example/f": [400],
+        }
+        engine = _ScriptedEngine(statuses, batch_size=3, max_retries=2, retry_delay_seconds=0.0)
+        pruned_batches: list[list[str]] = []
+
+        async def prune(endpoints: list[str]) -> int:
+            pruned_batches.append(sorted(endpoints))
+            return len(endpoints)
+
+        result = await engine.send(
+            [_target(endpoint) for endpoint in statuses] + [_target("https://push.example/a")],
+            {"title": "Goal!"},
+            prune=prune,
+            session=object(),  # type: ignore[arg-type]
+        )
+
+        self.assertEqual((result.sent, result.gone, result.failed, result.pruned), (2, 2, 2, 2))
+        self.assertEqual(pruned_batches, [["https://push.example/c"], ["https://push.example/d"]])
+        self.assertEqual(result.retried_endpoints, {"https://push.example/b": 1, "https://push.example/e": 2})
+        self.assertEqual([batch.endpoints for batch in result.batches], [3, 3])
+        self.assertEqual([batch.retries for batch in result.batches], [1, 2])
+        self.assertEqual(engine.vapid.signed_audiences, ["https://push.example"])
+        self.assertEqual(len(engine.recent_batches), 2)
+
+    async def test_malformed_subscription_fails_alone_without_retry(self) -> None:
+        vapid = _CountingVapid()
+        engine = PushFanoutEngine(
+            VapidHeaderCache(vapid, {"sub": "mailto:test@example.test"}),
+            retry_delay_seconds=0.0,
+        )
+        session = _RecordingSession()
+        targets = [
+            _subscribed_target("https://push.example/a"),
+            PushTarget(endpoint="https://push.example/bad", p256dh="!", auth="auth"),
+            _subscribed_target("https://push.example/b"),
+        ]
+
+        result = await engine.send(targets, {"title": "Goal!"}, session=session)  # type: ignore[arg-type]
+
+        self.assertEqual((result.sent, result.gone, result.failed), (2, 0, 1))
+        self.assertEqual(sorted(session.posted), ["https://push.example/a", "https://push.example/b"])
+        self.assertEqual(result.retried_endpoints, {})
+
+
+if __name__ == "__main__":
+    unittest.main()
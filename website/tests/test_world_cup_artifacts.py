@@ -0,0 +1,145 @@
+from __future__ import annotations
+
+from datetime import UTC, datetime
+import unittest
+from unittest.mock import AsyncMock, Mock, patch
+
+from website.football import world_cup_artifacts
+from website.football.world_cup_artifacts import (
+    WC_ARTIFACT_SCHEMA_VERSION,
+    WorldCupEditionArtifact,
+    WorldCupGroupPage,
+    _decode_artifact,
+    _encode_artifact,
+    _source_version,
+    build_historic_world_cup_artifacts,
+)
+from website.football.world_cup_db import BracketRoundColumn, KnockoutBracketDiagram
+from website.tests.test_world_cup_tiebreakers import _group_match, _table_row, _team
+
+TEAMS = [_team(team_id, f"Team {team_id}") for team_id in range(1, 3)]
+
+
+def _artifact() -> WorldCupEditionArtifact:
+    match = _group_match(
+        match_id=1,
+        group="GROUP_A",
+        home=TEAMS[0],
+        away=TEAMS[1],
+        home_score=2,
+        away_score=0,
+    )
+    table = [
+        _table_row(
+            position=position,
+            team=team,
+            played_games=1,
+            won=1 if position == 1 else 0,
+            draw=0,
+            lost=0 if position == 1 else 1,
+            goals_for=2 if position == 1 else 0,
+            goals_against=0 if position == 1 else 2,
+        )
+        for position, team in enumerate(TEAMS, start=1)
+    ]
+    table[0].position_label = "Q"
+    return WorldCupEditionArtifact(
+        edition="1998",
+        source_version="(1, None, 'abc')",
+        built_at=datetime(2026, 1, 1, tzinfo=UTC),
+        group_pages={"a": WorldCupGroupPage(slug="a", label="Group A", table=table, matches=[match])},
+        knockout_bracket=KnockoutBracketDiagram(
+            rounds=[
+                BracketRoundColumn(
+                    slug="final",
+                    label="Final",
+                    round_url="/football/world-cup/knockout/final/?edition=1998",
+                )
+            ]
+        ),
+        teams=TEAMS,
+    )
+
+
+class WorldCupEditionArtifactTests(unittest.TestCase):
+    def test_round_trips_through_the_compressed_document(self) -> None:
+        artifact = _artifact()
+        document = _encode_artifact(artifact)
+
+        self.assertEqual(document["schema_version"], WC_ARTIFACT_SCHEMA_VERSION)
+        decoded = _decode_artifact(document)
+
+        self.assertEqual(decoded, artifact)
+        self.assertEqual(decoded.group_pages["a"].table[0].position_label, "Q")
+        self.assertEqual(decoded.group_pages["a"].matches[0].id, 1)
+
+    def test_outdated_or_corrupt_documents_are_ignored(self) -> None:
+        document = _encode_artifact(_artifact())
+
+        self.assertIsNone(_decode_artifact({**document, "schema_version": WC_ARTIFACT_SCHEMA_VERSION - 1}))
+        self.assertIsNone(_decode_artifact({**document, "payload_z": b"not zlib"}))
+        self.assertIsNone(_decode_artifact(None))
+
+    def test_bracket_links_follow_the_request_root(self) -> None:
+        artifact = _artifact()
+
+        self.assertIs(artifact.knockout_bracket_for_root("/football/"), artifact.knockout_bracket)
+        bracket = artifact.knockout_bracket_for_root("/")
+        self.assertEqual(bracket.rounds[0].round_url, "/world-cup/knockout/final/?edition=1998")
+        self.assertEqual(
+            artifact.knockout_bracket.rounds[0].round_url,
+            "/football/world-cup/knockout/final/?edition=1998",
+        )
+
+
+class _StoredArtifacts:
+    def __init__(self, documents: list[dict]) -> None:
+        self.documents = documents
+
+    async def _iterate(self):
+        for document in self.documents:
+            yield document
+
+    def find(self, query: dict, projection: dict):
+        return self._iterate()
+
+
+class HistoricArtifactBuildTests(unittest.IsolatedAsyncioTestCase):
+    async def test_only_stale_editions_load_a_snapshot(self) -> None:
+        # 1998 is current; 2002 was built from an older import.
+        versions = {"1998": (64, None, "a"), "2002": (64, None, "b")}
+        stored = _StoredArtifacts(
+            [
+                {
+                    "edition": edition,
+                    "schema_version": WC_ARTIFACT_SCHEMA_VERSION,
+                    "source_version": _source_version(version),
+                }
+                for edition, version in (("1998", versions["1998"]), ("2002", (63, None, "b")))
+            ]
+        )
+        editions = AsyncMock(return_value=list(versions))
+        edition_version = AsyncMock(side_effect=versions.get)
+        build = AsyncMock(return_value=_artifact())
+        snapshot = AsyncMock()
+        invalidate = Mock()
+
+        with (
+            patch.object(world_cup_artifacts, "wc_edition_artifacts", stored),
+            patch.object(world_cup_artifacts, "get_available_wc_editions", editions),
+            patch.object(world_cup_artifacts, "_world_cup_edition_version", edition_version),
+            patch.object(world_cup_artifacts, "get_world_cup_edition_snapshot", snapshot),
+            patch.object(world_cup_artifacts, "build_world_cup_edition_artifact", build),
+            patch.object(world_cup_artifacts, "store_world_cup_edition_artifact", AsyncMock()),
+            patch.object(world_cup_artifacts, "invalidate_world_cup_edition_snapshot", invalidate),
+        ):
+            built = await build_historic_world_cup_artifacts()
+
+        self.assertEqual(built, ["2002"])
+        build.assert_awaited_once_with("2002")
+        snapshot.assert_not_awaited()
+        invalidate.assert_called_once_with("2002")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+import unittest
+
+from website.football import world_cup_scenarios
+from website.football.world_cup_db import _apply_guaranteed_qualification_labels, _group_scenario_state
+from website.football.world_cup_scenarios import (
+    GroupScenarioState,
+    cached_group_scenarios,
+    group_scenarios_async,
+    shutdown_group_scenario_pool,
+    solve_group_scenarios,
+)
+from website.football.world_cup_utils import sort_group_table_rows
+from website.tests.test_world_cup_tiebreakers import _group_match, _table_row, _team
+
+TEAMS = {name: _team(team_id, f"Team {name}") for team_id, name in enumerate("ABCD", start=1)}
+
+# A 5 pts and D 1 pt have finished; B (3 pts) v C (4 pts) is the last fixture.
+LAST_FIXTURE_STATE = GroupScenarioState(
+    points=((1, 5), (2, 3), (3, 4), (4, 1)),
+    fixtures=((2, 3),),
+)
+
+
+def _last_fixture_group():
+    results = [
+        ("A", "B", 1, 0, True),
+        ("C", "D", 1, 0, True),
+        ("A", "C", 0, 0, True),
+        ("B", "D", 1, 0, True),
+        ("A", "D", 0, 0, True),
+        ("B", "C", 0, 0, False),
+    ]
+    matches = [
+        _group_match(
+            match_id=index,
+            group="GROUP_A",
+            home=TEAMS[home],
+            away=TEAMS[away],
+            home_score=home_score,
+            away_score=away_score,
+            finished=finished,
+        )
+        for index, (home, away, home_score, away_score, finished) in enumerate(results, start=1)
+    ]
+    table = [
+        _table_row(position=0, team=TEAMS["A"], played_games=3, won=1, draw=2, lost=0, goals_for=1, goals_against=0),
+        _table_row(position=0, team=TEAMS["C"], played_games=2, won=1, draw=1, lost=0, goals_for=1, goals_against=0),
+        _table_row(position=0, team=TEAMS["B"], played_games=2, won=1, draw=0, lost=1, goals_for=1, goals_against=1),
+        _table_row(position=0, team=TEAMS["D"], played_games=3, won=0, draw=1, lost=2, goals_for=0, goals_against=2),
+    ]
+    return sort_group_table_rows(table, "2026", group_slug="a", edition_matches=matches), matches
+
+
+class GroupScenarioSolverTests(unittest.TestCase):
+    def test_last_fixture_bounds(self) -> None:
+        outcome = solve_group_scenarios(LAST_FIXTURE_STATE)
+
+        self.assertEqual(outcome.scenario_count, 3)
+        self.assertTrue(outcome.is_clinched(1, 2))
+        self.assertEqual((outcome.best_rank(3), outcome.worst_rank(3)), (1, 3))
+        self.assertTrue(outcome.is_eliminated(4, 3))
+        self.assertEqual(outcome.third_place_points, (3, 4))
+
+    def test_enumerates_every_outcome_of_an_unplayed_group(self) -> None:
+        fixtures = ((1, 2), (3, 4), (1, 3), (2, 4), (1, 4), (2, 3))
+        outcome = solve_group_scenarios(
+            GroupScenarioState(points=((1, 0), (2, 0), (3, 0), (4, 0)), fixtures=fixtures)
+        )
+
+        self.assertEqual(outcome.scenario_count, 3**6)
+        self.assertEqual(outcome.best_ranks, ((1, 1), (2, 1), (3, 1), (4, 1)))
+        self.assertEqual(outcome.worst_ranks, ((1, 4), (2, 4), (3, 4), (4, 4)))
+
+    def test_clinch_that_points_bounds_miss_is_labelled(self) -> None:
+        table, matches = _last_fixture_group()
+
+        # B can still reach 6 points, so only the fixture-aware enumeration proves A's top-two place.
+        _apply_guaranteed_qualification_labels(table, group_slug="a", group_matches=matches)
+
+        self.assertEqual([(row.team.name, row.position_label) for row in table][0], ("Team A", "Q"))
+        self.assertEqual([row.position_label for row in table[1:]], [None, None, None])
+
+    def test_incomplete_fixture_list_has_no_scenario_state(self) -> None:
+        table, matches = _last_fixture_group()
+
+        self.assertIsNotNone(_group_scenario_state(table, matches))
+        # Without B v C the listed matches alone would prove more than the real group does.
+        self.assertIsNone(_group_scenario_state(table, matches[:-1]))
+        self.assertIsNone(_group_scenario_state(table, matches + matches[-1:]))
+
+
+class GroupScenarioPoolTests(unittest.IsolatedAsyncioTestCase):
+    async def asyncTearDown(self) -> None:
+        shutdown_group_scenario_pool()
+        world_cup_scenarios._scenario_cache.clear()
+
+    async def test_pool_result_is_cached_per_state(self) -> None:
+        world_cup_scenarios._scenario_cache.clear()
+
+        outcome = await group_scenarios_async(LAST_FIXTURE_STATE)
+
+        self.assertEqual(outcome, solve_group_scenarios(LAST_FIXTURE_STATE))
+        self.assertIs(cached_group_scenarios(LAST_FIXTURE_STATE), outcome)
+        self.assertIs(await group_scenarios_async(LAST_FIXTURE_STATE), outcome)
+
+
+if __name__ == "__main__":
+    unittest.main()
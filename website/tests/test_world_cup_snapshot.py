@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+import unittest
+from unittest.mock import patch
+
+from website.football import world_cup_db, world_cup_utils
+from website.football.models import LiveTableItem
+from website.football.world_cup_db import (
+    WorldCupEditionSnapshot,
+    WorldCupGroupStandings,
+    get_world_cup_edition_snapshot,
+    invalidate_world_cup_edition_snapshot,
+)
+from website.tests.test_world_cup_tiebreakers import _group_match, _table_row, _team
+
+TEAMS = [_team(team_id, f"Team {team_id}") for team_id in range(1, 5)]
+
+
+def _snapshot(version: tuple = (1,)) -> WorldCupEditionSnapshot:
+    matches = []
+    for index, matchday in enumerate((2, 1, None)):
+        match = _group_match(
+            match_id=index + 1,
+            group="GROUP_A",
+            home=TEAMS[index],
+            away=TEAMS[index + 1],
+            home_score=1,
+            away_score=0,
+        )
+        match.matchday = matchday
+        matches.append(match)
+
+    standings = [
+        WorldCupGroupStandings(
+            edition="2026",
+            group_slug="a",
+            group_label="Group A",
+            group_enum="GROUP_A",
+            table=[
+                LiveTableItem.model_validate(
+                    _table_row(
+                        position=position,
+                        team=team,
+                        played_games=1,
+                        won=1 if position == 1 else 0,
+                        draw=0,
+                        lost=0 if position == 1 else 1,
+                        goals_for=1 if position == 1 else 0,
+                        goals_against=0 if position == 1 else 1,
+                    ).model_dump()
+                )
+                for position, team in enumerate(TEAMS, start=1)
+            ],
+        )
+    ]
+    return WorldCupEditionSnapshot(
+        edition="2026",
+        version=version,
+        matches=matches,
+        official_standings=standings,
+    )
+
+
+class WorldCupEditionSnapshotTests(unittest.TestCase):
+    def test_derives_group_matches_and_copies_standings(self) -> None:
+        snapshot = _snapshot()
+
+        self.assertEqual([match.matchday for match in snapshot.group_matches("GROUP_A")], [None, 1, 2])
+        self.assertEqual(snapshot.group_matches("b"), [])
+        self.assertEqual(len(snapshot.team_matches(2)), 2)
+
+        standings = snapshot.group_standings()
+        standings[0].table[0].position_label = "Q"
+        self.assertIsNone(snapshot.official_standings[0].table[0].position_label)
+        self.assertIsNone(snapshot.official_group_standings("a").table[0].position_label)
+
+        tables = snapshot.qualification_tables()
+        tables["a"][0].position_label = "Q"
+        self.assertIsNone(snapshot.qualification_tables()["a"][0].position_label)
+
+
+class WorldCupSnapshotCacheTests(unittest.IsolatedAsyncioTestCase):
+    def tearDown(self) -> None:
+        invalidate_world_cup_edition_snapshot()
+
+    async def test_live_edition_reloads_only_when_its_version_changes(self) -> None:
+        versions = [(1,), (1,), (2,)]
+        loads: list[tuple] = []
+
+        async def version(edition):
+            return versions.pop(0)
+
+        async def load(edition, current_version):
+            loads.append(current_version)
+            return _snapshot(current_version)
+
+        with (
+            patch.object(world_cup_db, "_world_cup_edition_version", version),
+            patch.object(world_cup_db, "_load_world_cup_edition_snapshot", load),
+            patch.object(world_cup_utils, "WC_LIVE_EDITION", "2026"),
+        ):
+            first = await get_world_cup_edition_snapshot("2026")
+            self.assertIs(await get_world_cup_edition_snapshot("2026"), first)
+
+            first.checked_at -= world_cup_db.WC_SNAPSHOT_VERSION_CHECK_SECONDS
+            self.assertIs(await get_world_cup_edition_snapshot("2026"), first)
+
+            first.checked_at -= world_cup_db.WC_SNAPSHOT_VERSION_CHECK_SECONDS
+            second = await get_world_cup_edition_snapshot("2026")
+
+        self.assertIsNot(second, first)
+        self.assertEqual(loads, [(1,), (2,)])
+
+    async def test_historic_edition_is_loaded_once(self) -> None:
+        loads: list[tuple] = []
+
+        async def version(edition):
+            return (len(loads),)
+
+        async def load(edition, current_version):
+            loads.append(current_version)
+            return _snapshot(current_version)
+
+        with (
+            patch.object(world_cup_db, "_world_cup_edition_version", version),
+            patch.object(world_cup_db, "_load_world_cup_edition_snapshot", load),
+        ):
+            first = await get_world_cup_edition_snapshot("2026")
+            first.checked_at -= 3600
+            self.assertIs(await get_world_cup_edition_snapshot("2026"), first)
+
+        self.assertEqual(loads, [(0,)])
+
+
+if __name__ == "__main__":
+    unittest.main()